@@ -16,6 +16,7 @@ from app.models.enhanced_models import Base
 # Import auth models to ensure they're included in migrations
 from app.auth.models import AuthUser, RefreshToken, LoginAttempt
 from app.core.config import settings
+from app.services.partition_maintenance_service import PARTITION_NAME_PATTERN
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -66,6 +67,13 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
+def include_object(obj, name, type_, reflected, compare_to) -> bool:
+    """Skip monthly partitions: they are managed at runtime, not by migrations"""
+    if type_ == "table" and reflected and compare_to is None:
+        return not (PARTITION_NAME_PATTERN.match(name) or name.endswith("_default"))
+    return True
+
+
 def do_run_migrations(connection: Connection) -> None:
     """Run migrations with database connection."""
     context.configure(
@@ -76,6 +84,7 @@ def do_run_migrations(connection: Connection) -> None:
         render_as_batch=False,
         # Enable PostgreSQL-specific features
         postgresql_include_object=lambda obj, name, type_, reflected, compare_to: True,
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -0,0 +1,50 @@
+# backend/alembic/script.py.mako - Migration Template
+
+"""maintain weighted entry search_vector with a trigger
+
+Revision ID: 8c41d2e7a9f3
+Revises: 3241efe46832
+Create Date: 2025-08-12 09:30:12.418230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '8c41d2e7a9f3'
+down_revision: Union[str, None] = '3241efe46832'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Title terms weigh more than content terms (A > B) so ts_rank favours title hits.
+    # A trigger is used instead of a stored generated column so that existing rows
+    # are not rewritten under an exclusive lock; scripts/backfill_search_vectors.py
+    # recomputes them afterwards in throttled keyset batches.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION entries_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector :=
+                setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A') ||
+                setweight(to_tsvector('english', coalesce(NEW.content, '')), 'B');
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_entries_search_vector
+        BEFORE INSERT OR UPDATE OF title, content ON entries
+        FOR EACH ROW EXECUTE FUNCTION entries_search_vector_update()
+    """)
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_entries_search_vector ON entries USING gin (search_vector)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.execute("DROP TRIGGER IF EXISTS trg_entries_search_vector ON entries")
+    op.execute("DROP FUNCTION IF EXISTS entries_search_vector_update()")
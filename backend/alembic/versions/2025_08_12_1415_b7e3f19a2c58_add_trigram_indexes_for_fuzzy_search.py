@@ -0,0 +1,51 @@
+# backend/alembic/script.py.mako - Migration Template
+
+"""add trigram indexes for operator-based fuzzy search
+
+Revision ID: b7e3f19a2c58
+Revises: 8c41d2e7a9f3
+Create Date: 2025-08-12 14:15:37.902114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e3f19a2c58'
+down_revision: Union[str, None] = '8c41d2e7a9f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # The title GIN trigram index already exists under its old name
+    op.execute("ALTER INDEX IF EXISTS ix_entries_title_text RENAME TO ix_entries_title_trgm")
+
+    # Built concurrently so entry writes are not blocked on large tables
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_entries_title_trgm "
+            "ON entries USING gin (title gin_trgm_ops)"
+        )
+        # Serves `query <% content` / `query <<% content`
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_entries_content_trgm "
+            "ON entries USING gin (content gin_trgm_ops)"
+        )
+        # Serves KNN ordering `title <-> query`
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_entries_title_trgm_gist "
+            "ON entries USING gist (title gist_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_entries_title_trgm_gist")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_entries_content_trgm")
+    op.execute("ALTER INDEX IF EXISTS ix_entries_title_trgm RENAME TO ix_entries_title_text")
@@ -0,0 +1,40 @@
+# backend/alembic/script.py.mako - Migration Template
+
+"""newest-first message index for the session list
+
+Revision ID: 5d9a3c61e2f4
+Revises: b7e3f19a2c58
+Create Date: 2025-08-14 10:20:11.384920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '5d9a3c61e2f4'
+down_revision: Union[str, None] = 'b7e3f19a2c58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # (session_id, timestamp DESC) serves the per-session LATERAL "latest N"
+    # lookup and, scanned backwards, the chronological reads the old index served
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_messages_session_timestamp_desc "
+            "ON chat_messages (session_id, timestamp DESC)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_messages_session_timestamp")
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_messages_session_timestamp "
+            "ON chat_messages (session_id, timestamp)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_messages_session_timestamp_desc")
@@ -0,0 +1,120 @@
+# backend/alembic/script.py.mako - Migration Template
+
+"""partition chat_messages by month
+
+Revision ID: 9e4b2d7c1a60
+Revises: 5d9a3c61e2f4
+Create Date: 2025-08-18 09:30:42.517306
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4b2d7c1a60'
+down_revision: Union[str, None] = '5d9a3c61e2f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Months created ahead of now; partition_maintenance_service keeps this window
+# rolling afterwards
+PARTITION_MONTHS_AHEAD = 3
+
+# Indexes on the parent cascade to every partition, current and future
+MESSAGE_INDEXES = (
+    ("ix_messages_session_timestamp_desc", ["session_id", sa.text("timestamp DESC")], {}),
+    ("ix_messages_role_timestamp", ["role", "timestamp"], {}),
+    ("ix_messages_sentiment", ["sentiment_score"], {}),
+    ("ix_messages_psychology_gin", ["psychology_context"], {"postgresql_using": "gin"}),
+    ("ix_chat_messages_created_at", ["created_at"], {}),
+    ("ix_chat_messages_deleted_at", ["deleted_at"], {}),
+)
+
+
+def _rename_to_staging(staging: str) -> None:
+    """Move the current table aside, freeing the names the new one takes over"""
+    op.execute(f"ALTER TABLE chat_messages RENAME TO {staging}")
+    op.execute(f"ALTER TABLE {staging} RENAME CONSTRAINT chat_messages_pkey TO {staging}_pkey")
+    # Rebuilt after the copy: maintaining them during it only slows the load
+    for name, _, _ in MESSAGE_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def _create_indexes() -> None:
+    for name, columns, options in MESSAGE_INDEXES:
+        op.create_index(name, "chat_messages", columns, unique=False, **options)
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Rewrites the table under an exclusive lock: run in a maintenance window.
+    # A partitioned table's primary key must contain the partition key, so
+    # the key becomes (id, timestamp).
+    _rename_to_staging("chat_messages_unpartitioned")
+
+    op.execute(
+        "CREATE TABLE chat_messages ("
+        "LIKE chat_messages_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING STORAGE"
+        ") PARTITION BY RANGE (timestamp)"
+    )
+    op.execute("ALTER TABLE chat_messages ADD CONSTRAINT chat_messages_pkey PRIMARY KEY (id, timestamp)")
+    op.execute(
+        "ALTER TABLE chat_messages ADD CONSTRAINT chat_messages_session_id_fkey "
+        "FOREIGN KEY (session_id) REFERENCES chat_sessions (id) ON DELETE CASCADE"
+    )
+
+    # One partition per UTC month from the oldest message to a few months ahead
+    op.execute(f"""
+        DO $$
+        DECLARE
+            month_start timestamp;
+        BEGIN
+            FOR month_start IN
+                SELECT generate_series(
+                    date_trunc('month', COALESCE(
+                        (SELECT min(timestamp) FROM chat_messages_unpartitioned), now()
+                    ) AT TIME ZONE 'UTC'),
+                    date_trunc('month', now() AT TIME ZONE 'UTC') + interval '{PARTITION_MONTHS_AHEAD} months',
+                    interval '1 month'
+                )
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF chat_messages FOR VALUES FROM (%L) TO (%L)',
+                    'chat_messages_p' || to_char(month_start, 'YYYY_MM'),
+                    to_char(month_start, 'YYYY-MM-DD') || ' 00:00:00+00',
+                    to_char(month_start + interval '1 month', 'YYYY-MM-DD') || ' 00:00:00+00'
+                );
+            END LOOP;
+        END $$;
+    """)
+    # Catches writes past the premade window if maintenance stops running
+    op.execute("CREATE TABLE chat_messages_default PARTITION OF chat_messages DEFAULT")
+
+    op.execute("INSERT INTO chat_messages SELECT * FROM chat_messages_unpartitioned")
+    op.execute("DROP TABLE chat_messages_unpartitioned")
+    _create_indexes()
+    op.execute("ANALYZE chat_messages")
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    _rename_to_staging("chat_messages_partitioned")
+
+    op.execute(
+        "CREATE TABLE chat_messages ("
+        "LIKE chat_messages_partitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING STORAGE"
+        ")"
+    )
+    op.execute("ALTER TABLE chat_messages ADD CONSTRAINT chat_messages_pkey PRIMARY KEY (id)")
+    op.execute(
+        "ALTER TABLE chat_messages ADD CONSTRAINT chat_messages_session_id_fkey "
+        "FOREIGN KEY (session_id) REFERENCES chat_sessions (id) ON DELETE CASCADE"
+    )
+
+    op.execute("INSERT INTO chat_messages SELECT * FROM chat_messages_partitioned")
+    # Drops every partition with it
+    op.execute("DROP TABLE chat_messages_partitioned")
+    _create_indexes()
+    op.execute("ANALYZE chat_messages")
@@ -0,0 +1,50 @@
+# backend/alembic/script.py.mako - Migration Template
+
+"""entry revision history
+
+Revision ID: 4b7e2f9a8c13
+Revises: c3f8a1d6e9b2
+Create Date: 2025-08-22 14:10:42.518306
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '4b7e2f9a8c13'
+down_revision: Union[str, None] = 'c3f8a1d6e9b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Superseded entry content as reverse deltas and periodic snapshots,
+    # written by entry_revision_service
+    op.create_table(
+        'entry_revisions',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('entry_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('kind', sa.String(length=10), nullable=False),
+        sa.Column('payload', sa.LargeBinary(), nullable=False),
+        sa.Column('content_length', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+        sa.CheckConstraint("kind IN ('snapshot', 'delta')", name='ck_entry_revisions_kind'),
+        sa.CheckConstraint('version >= 1', name='ck_entry_revisions_version_positive'),
+        sa.ForeignKeyConstraint(['entry_id'], ['entries.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('entry_id', 'version', name='uq_entry_revisions_entry_version')
+    )
+    # Payloads are zlib-compressed already: no second pass through pglz
+    op.execute("ALTER TABLE entry_revisions ALTER COLUMN payload SET STORAGE EXTERNAL")
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_table('entry_revisions')
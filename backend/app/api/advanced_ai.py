@@ -13,7 +13,7 @@ Provides sophisticated AI capabilities including:
 import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
-from fastapi import APIRouter, HTTPException, Depends, Query, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Depends, Query, BackgroundTasks, Response
 from pydantic import BaseModel, Field
 import json
 
@@ -28,6 +28,7 @@ from app.services.advanced_ai_service import (
     PredictiveAnalysis
 )
 from app.services.unified_database_service import unified_db_service
+from app.services.insight_precompute_service import insight_precompute_service, SnapshotType
 from app.core.exceptions import JournalingAIException
 
 logger = logging.getLogger(__name__)
@@ -238,7 +239,7 @@ async def get_comprehensive_analysis(
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
 @router.post("/analysis/personality", response_model=PersonalityResponse)
-async def get_personality_analysis(request: PersonalityAnalysisRequest) -> PersonalityResponse:
+async def get_personality_analysis(request: PersonalityAnalysisRequest, response: Response) -> PersonalityResponse:
     """
     Generate detailed personality profile from journal entries
     
@@ -248,10 +249,16 @@ async def get_personality_analysis(request: PersonalityAnalysisRequest) -> Perso
     - Communication style
     - Emotional profile
     - Strengths and growth areas
+    
+    Serves the precomputed snapshot when one exists (freshness in X-Snapshot-* headers).
     """
     try:
         logger.info(f"🎭 Starting personality analysis for user {request.user_id}")
         
+        snapshot = await _read_snapshot(request.user_id, SnapshotType.PERSONALITY, response)
+        if snapshot:
+            return PersonalityResponse(**snapshot["data"])
+        
         # Fetch user entries
         entries = await _fetch_user_entries(request.user_id, 200)  # More entries for personality analysis
         
@@ -261,6 +268,9 @@ async def get_personality_analysis(request: PersonalityAnalysisRequest) -> Perso
                 detail=f"Insufficient data for personality analysis. Found {len(entries)} entries, minimum {request.min_entries_required} required."
             )
         
+        # Read before computing: edits made meanwhile leave the stored snapshot stale
+        content_version = await insight_precompute_service.get_content_version(request.user_id)
+        
         # Generate personality profile
         personality_profile = await advanced_ai_service.generate_personality_profile(
             request.user_id, entries
@@ -276,7 +286,7 @@ async def get_personality_analysis(request: PersonalityAnalysisRequest) -> Perso
             raise HTTPException(status_code=500, detail="Invalid personality profile format")
         
         # Build response
-        response = PersonalityResponse(
+        result = PersonalityResponse(
             dimensions={dim.name.lower(): score for dim, score in personality_profile.dimensions.items()},
             traits=personality_profile.traits,
             behavioral_patterns=personality_profile.behavioral_patterns,
@@ -288,8 +298,13 @@ async def get_personality_analysis(request: PersonalityAnalysisRequest) -> Perso
             last_updated=personality_profile.last_updated
         )
         
+        # Materialize so the next request reads the snapshot
+        await insight_precompute_service.store_personality_snapshot(
+            request.user_id, personality_profile, content_version
+        )
+        
         logger.info(f"✅ Personality analysis completed for user {request.user_id} (confidence: {personality_profile.confidence_score:.2f})")
-        return response
+        return result
         
     except HTTPException:
         raise
@@ -298,7 +313,7 @@ async def get_personality_analysis(request: PersonalityAnalysisRequest) -> Perso
         raise HTTPException(status_code=500, detail=f"Personality analysis failed: {str(e)}")
 
 @router.post("/analysis/predictive", response_model=PredictionResponse)
-async def get_predictive_analysis(request: PredictiveAnalysisRequest) -> PredictionResponse:
+async def get_predictive_analysis(request: PredictiveAnalysisRequest, response: Response) -> PredictionResponse:
     """
     Generate predictive analysis and forecasts
     
@@ -312,6 +327,17 @@ async def get_predictive_analysis(request: PredictiveAnalysisRequest) -> Predict
     try:
         logger.info(f"🔮 Starting predictive analysis for user {request.user_id}")
         
+        snapshot = None
+        if request.prediction_horizon == insight_precompute_service.schedule.prediction_horizon:
+            snapshot = await _read_snapshot(request.user_id, SnapshotType.PREDICTIVE, response)
+        if snapshot:
+            data = dict(snapshot["data"])
+            if not request.include_risk_assessment:
+                data["risk_factors"] = []
+            if not request.include_opportunities:
+                data["opportunity_windows"] = []
+            return PredictionResponse(**data)
+        
         # Fetch user entries (more recent entries weighted higher)
         entries = await _fetch_user_entries(request.user_id, 150)
         
@@ -327,7 +353,7 @@ async def get_predictive_analysis(request: PredictiveAnalysisRequest) -> Predict
         )
         
         # Build response
-        response = PredictionResponse(
+        result = PredictionResponse(
             predicted_mood_trends=predictive_analysis.predicted_mood_trends,
             risk_factors=predictive_analysis.risk_factors if request.include_risk_assessment else [],
             opportunity_windows=predictive_analysis.opportunity_windows if request.include_opportunities else [],
@@ -338,7 +364,7 @@ async def get_predictive_analysis(request: PredictiveAnalysisRequest) -> Predict
         )
         
         logger.info(f"✅ Predictive analysis completed for user {request.user_id} ({request.prediction_horizon} day horizon)")
-        return response
+        return result
         
     except HTTPException:
         raise
@@ -350,6 +376,7 @@ async def get_predictive_analysis(request: PredictiveAnalysisRequest) -> Predict
 
 @router.get("/insights/temporal")
 async def get_temporal_insights(
+    response: Response,
     user_id: str = Query(..., description="User identifier"),
     timeframe: AnalysisTimeframe = Query(default=AnalysisTimeframe.MONTHLY, description="Analysis timeframe"),
     insight_types: List[InsightType] = Query(default=None, description="Specific insight types to generate"),
@@ -358,11 +385,21 @@ async def get_temporal_insights(
     """
     Get temporal insights for specific timeframes and types
     
-    Allows fine-grained control over insight generation
+    Allows fine-grained control over insight generation. The default monthly
+    view is served from the precomputed snapshot when one exists.
     """
     try:
         logger.info(f"📊 Getting temporal insights for user {user_id} ({timeframe.value})")
         
+        if timeframe == AnalysisTimeframe.MONTHLY:
+            snapshot = await _read_snapshot(user_id, SnapshotType.TEMPORAL, response)
+            if snapshot:
+                insight_type_values = {it.value for it in insight_types} if insight_types else None
+                return [
+                    InsightResponse(**insight) for insight in snapshot["data"]
+                    if insight_type_values is None or insight["insight_type"] in insight_type_values
+                ]
+        
         # Fetch entries
         entries = await _fetch_user_entries(user_id, max_entries)
         
@@ -510,8 +547,56 @@ async def get_service_statistics() -> Dict[str, Any]:
             "service_version": "2.0.0"
         }
 
+@router.get("/snapshots/{user_id}")
+async def get_insight_snapshots(user_id: str) -> Dict[str, Any]:
+    """
+    Get freshness information for a user's precomputed insight snapshots
+    """
+    snapshots = {}
+    for snapshot_type in SnapshotType:
+        snapshot = await insight_precompute_service.get_snapshot(user_id, snapshot_type)
+        snapshots[snapshot_type.value] = None if snapshot is None else {
+            "computed_at": snapshot.get("computed_at"),
+            "age_seconds": snapshot["age_seconds"],
+            "content_version": snapshot.get("content_version"),
+            "current_version": snapshot["current_version"],
+            "stale": snapshot["stale"]
+        }
+    
+    return {
+        "user_id": user_id,
+        "snapshots": snapshots,
+        "scheduler": insight_precompute_service.get_stats()
+    }
+
 # ==================== UTILITY FUNCTIONS ====================
 
+async def _read_snapshot(user_id: str, snapshot_type: SnapshotType, response: Optional[Response]) -> Optional[Dict[str, Any]]:
+    """
+    Read a precomputed snapshot and stamp its freshness on the response
+    
+    Stale snapshots are still served; a deduplicated background refresh is enqueued.
+    """
+    try:
+        snapshot = await insight_precompute_service.get_snapshot(user_id, snapshot_type)
+    except Exception as e:
+        logger.warning(f"⚠️ Snapshot read failed for user {user_id}: {e}")
+        return None
+    
+    if snapshot is None:
+        return None
+    
+    if snapshot["stale"]:
+        await insight_precompute_service.request_refresh(user_id)
+    
+    if response is not None:
+        response.headers["X-Snapshot-Computed-At"] = str(snapshot.get("computed_at"))
+        response.headers["X-Snapshot-Age"] = str(snapshot["age_seconds"])
+        response.headers["X-Snapshot-Stale"] = "true" if snapshot["stale"] else "false"
+    
+    return snapshot
+
+
 async def _fetch_user_entries(user_id: str, max_entries: int = 100) -> List[Dict[str, Any]]:
     """
     Fetch user entries for analysis
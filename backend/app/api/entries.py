@@ -9,8 +9,10 @@ import logging
 from app.core.exceptions import ValidationException, NotFoundException, DatabaseException
 from app.models.entry import Entry, EntryCreate, EntryUpdate, EntryResponse, MoodType
 from app.services.unified_database_service import unified_db_service
+from app.services.entry_revision_service import entry_revision_service
 from app.auth.dependencies import CurrentUser, CurrentUserOptional
 from app.services.vector_service import vector_service
+from app.services.hybrid_search_service import hybrid_search_service, SearchLeg
 from app.services.ai_emotion_service import ai_emotion_service
 from app.services.ai_intervention_service import ai_intervention_service  
 from app.services.llm_service import llm_service
@@ -171,22 +173,12 @@ async def create_entry(
         
         final_tags = all_tags[:8]  # Limit to 8 tags
         
-        # Create entry using unified service
-        async with performance_monitor.timed_operation("unified_create_entry", {"user_id": str(current_user.id)}):
-            db_entry = await unified_db_service.create_entry(
-                title=entry.title,
-                content=entry.content,
-                user_id=str(current_user.id),  # Use authenticated user ID
-                topic_id=entry.topic_id,
-                mood=mood if mood else None,
-                sentiment_score=sentiment_score,
-                tags=final_tags
-            )
-        
-        # Store detailed AI analysis results if available
+        # Serialize the AI analysis up front so the entry is written once,
+        # instead of inserted and then immediately updated
+        emotion_data = None
+        crisis_data = None
         if emotion_analysis:
             try:
-                # Convert emotion analysis to serializable format
                 emotion_data = {
                     "primary_emotion": emotion_analysis.primary_emotion.emotion,
                     "confidence": emotion_analysis.primary_emotion.confidence,
@@ -200,11 +192,7 @@ async def create_entry(
                     "analysis_timestamp": datetime.utcnow().isoformat()
                 }
                 
-                # Store emotion analysis in database by updating the db_entry object
-                db_entry.emotion_analysis = emotion_data
-                
                 # Also store crisis assessment if available
-                crisis_data = None
                 if intervention_assessment:
                     # Convert InterventionRecommendation objects to dictionaries
                     immediate_interventions_dict = []
@@ -228,25 +216,34 @@ async def create_entry(
                         "professional_referral_urgent": intervention_assessment.professional_referral_urgent,
                         "assessment_timestamp": datetime.utcnow().isoformat()
                     }
-                    db_entry.ai_analysis = crisis_data
-                    logger.info(f"✅ Stored crisis assessment for entry {db_entry.id}: {intervention_assessment.crisis_level.name}")
-                
-                # Update the entry in database with emotion analysis data
-                await unified_db_service.update_entry(
-                    str(db_entry.id),
-                    emotion_analysis=emotion_data,
-                    ai_analysis=crisis_data
-                )
-                
-                logger.info(f"✅ Added emotion analysis to entry {db_entry.id}")
                 
             except Exception as e:
-                logger.warning(f"Failed to store emotion analysis: {e}")
+                logger.warning(f"Failed to serialize emotion analysis: {e}")
+                emotion_data = None
+                crisis_data = None
+        
+        # Create entry using unified service
+        async with performance_monitor.timed_operation("unified_create_entry", {"user_id": str(current_user.id)}):
+            db_entry = await unified_db_service.create_entry(
+                title=entry.title,
+                content=entry.content,
+                user_id=str(current_user.id),  # Use authenticated user ID
+                topic_id=entry.topic_id,
+                mood=mood if mood else None,
+                sentiment_score=sentiment_score,
+                tags=final_tags,
+                emotion_analysis=emotion_data,
+                ai_analysis=crisis_data
+            )
+        
+        if crisis_data:
+            logger.info(f"✅ Stored crisis assessment for entry {db_entry.id}: {intervention_assessment.crisis_level.name}")
         
         # Add to vector database for search
         try:
             metadata = {
                 'entry_id': str(db_entry.id),
+                'user_id': str(current_user.id),
                 'title': db_entry.title or '',
                 'mood': db_entry.mood or 'neutral',
                 'sentiment_score': db_entry.sentiment_score or 0.0,
@@ -372,6 +369,40 @@ async def search_entries(
         logger.error(f"Error searching entries: {e}")
         raise HTTPException(status_code=500, detail="Failed to search entries")
 
+@router.get("/search/hybrid")
+async def hybrid_search_entries(
+    current_user: CurrentUser,
+    query: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1, le=50),
+    offset: int = Query(0, ge=0),
+    legs: Optional[List[SearchLeg]] = Query(None, description="Restrict to specific search legs")
+):
+    """Search entries with full-text, trigram and vector results fused into one ranking"""
+    try:
+        async with performance_monitor.timed_operation("hybrid_search", {"query_length": len(query)}):
+            search_result = await hybrid_search_service.search(
+                str(current_user.id), query, limit=limit, offset=offset, legs=legs
+            )
+        
+        return {
+            'results': [
+                {
+                    'entry': EntryResponse.model_validate(_convert_entry_to_response(item['entry'])),
+                    'score': item['score'],
+                    'ranks': item['ranks']
+                }
+                for item in search_result['results']
+            ],
+            'total_found': search_result['total_found'],
+            'legs': search_result['legs'],
+            'cached': search_result['cached'],
+            'query': query
+        }
+        
+    except Exception as e:
+        logger.error(f"Error in hybrid search: {e}")
+        raise HTTPException(status_code=500, detail="Failed to search entries")
+
 @router.get("/favorites")
 @CachePatterns.ENTRY_READ
 async def get_favorite_entries(limit: int = Query(50, ge=1, le=100)):
@@ -413,6 +444,48 @@ async def get_entry(entry_id: str):
         logger.error(f"Error getting entry {entry_id}: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve entry")
 
+async def _get_owned_entry(entry_id: str, current_user):
+    """The caller's live entry; 404 for missing, deleted or someone else's entries"""
+    entry = await unified_db_service.get_entry(entry_id, use_cache=False)
+    if not entry or entry.deleted_at is not None or str(entry.user_id) != str(current_user.id):
+        raise HTTPException(status_code=404, detail="Entry not found")
+    return entry
+
+@router.get("/{entry_id}/revisions")
+async def get_entry_revisions(entry_id: str, current_user: CurrentUser):
+    """List the stored versions of an entry's content, newest first"""
+    try:
+        entry = await _get_owned_entry(entry_id, current_user)
+        
+        revisions = await entry_revision_service.list_revisions(entry_id)
+        return {"entry_id": entry_id, "current_version": entry.version, "revisions": revisions}
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error listing revisions of entry {entry_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to list entry revisions")
+
+@router.get("/{entry_id}/versions/{version}")
+async def get_entry_version(entry_id: str, version: int, current_user: CurrentUser):
+    """Get the content of one version of an entry, rebuilt from its revision history"""
+    try:
+        await _get_owned_entry(entry_id, current_user)
+        
+        async with performance_monitor.timed_operation("get_entry_version", {"entry_id": entry_id}):
+            content = await entry_revision_service.get_version(entry_id, version)
+        
+        if content is None:
+            raise HTTPException(status_code=404, detail="Entry version not found")
+        
+        return {"entry_id": entry_id, "version": version, "content": content}
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting version {version} of entry {entry_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve entry version")
+
 @router.put("/{entry_id}", response_model=EntryResponse)
 @CachePatterns.INVALIDATE_ENTRIES
 @timed_operation("update_entry_api", track_errors=True)
@@ -482,6 +555,7 @@ async def update_entry(
             content_to_index = entry_update.content or existing_entry.content
             metadata = {
                 'entry_id': str(updated_entry.id),
+                'user_id': str(updated_entry.user_id),
                 'title': updated_entry.title or '',
                 'mood': updated_entry.mood or 'neutral',
                 'sentiment_score': updated_entry.sentiment_score or 0.0,
@@ -5,7 +5,8 @@ from typing import Dict, Any
 from app.services.unified_database_service import unified_db_service
 from app.core.performance_monitor import performance_monitor
 from app.decorators.cache_decorators import get_cache_stats
-from app.services.redis_service_simple import simple_redis_service as redis_service
+from app.services.redis_service import redis_service
+from app.auth.principal_cache import principal_cache
 import logging
 from datetime import datetime
 
@@ -127,6 +128,7 @@ async def cache_status():
                 "total_operations": redis_metrics.hits + redis_metrics.misses,
                 "errors": redis_metrics.errors
             },
+            "principal_cache": principal_cache.get_stats(),
             "phase_0b_compliance": {
                 "cache_hit_rate_met": redis_metrics.hit_rate >= 0.80,
                 "response_time_met": redis_metrics.avg_response_time <= 0.005,
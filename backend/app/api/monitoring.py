@@ -7,13 +7,18 @@ Provides comprehensive monitoring data, metrics, and observability features
 from fastapi import APIRouter, HTTPException, Depends, Query
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
+import asyncio
 import logging
 
 from app.core.performance_monitor import performance_monitor
+from app.core.query_profiler import query_profiler
 from app.core.request_tracing import get_request_tracer, trace_metrics
 from app.core.logging_config import logging_metrics
 from app.services.unified_database_service import unified_db_service
-from app.services.redis_service_simple import simple_redis_service as redis_service
+from app.services.redis_service import redis_service
+from app.services.celery_service import celery_service
+from app.services.celery_autoscaler import queue_probe
+from app.services.index_review_service import index_review_service
 from app.auth.dependencies import get_current_user
 
 logger = logging.getLogger(__name__)
@@ -146,6 +151,99 @@ async def get_trace_by_id(request_id: str):
         logger.error(f"Error retrieving trace {request_id}: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to retrieve trace: {str(e)}")
 
+@router.get("/queries")
+async def get_query_statistics(
+    limit: int = Query(50, ge=1, le=500, description="Maximum number of statements to return"),
+    sort_by: str = Query("total_ms", pattern="^(total_ms|count|p95_ms|max_ms)$", description="Sort key"),
+    _user = Depends(get_current_user)
+):
+    """Get per-fingerprint SQL statement statistics"""
+    try:
+        return query_profiler.get_statistics(limit=limit, sort_by=sort_by)
+    except Exception as e:
+        logger.error(f"Error retrieving query statistics: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to retrieve query statistics: {str(e)}")
+
+@router.get("/queries/slow")
+async def get_slow_queries(
+    limit: int = Query(50, ge=1, le=500, description="Maximum number of slow statements to return"),
+    _user = Depends(get_current_user)
+):
+    """Get the most recent slow SQL statements"""
+    return {
+        "threshold_ms": query_profiler.slow_query_threshold_ms,
+        "slow_queries": query_profiler.get_slow_queries(limit)
+    }
+
+@router.get("/queries/n-plus-one")
+async def get_n_plus_one_incidents(
+    limit: int = Query(50, ge=1, le=500, description="Maximum number of incidents to return"),
+    _user = Depends(get_current_user)
+):
+    """Get recent requests that repeated one statement more than the N+1 threshold"""
+    incidents = query_profiler.get_n_plus_one_incidents(limit)
+    by_route: Dict[str, int] = {}
+    for incident in incidents:
+        by_route[incident["route"]] = by_route.get(incident["route"], 0) + 1
+    return {
+        "threshold": query_profiler.n_plus_one_threshold,
+        "incidents": incidents,
+        "routes": dict(sorted(by_route.items(), key=lambda item: item[1], reverse=True))
+    }
+
+@router.post("/queries/reset")
+async def reset_query_statistics(_user = Depends(get_current_user)):
+    """Clear collected SQL statement statistics"""
+    query_profiler.reset()
+    return {"status": "reset", "timestamp": datetime.utcnow().isoformat()}
+
+@router.get("/indexes")
+async def get_index_review(
+    table: Optional[str] = Query(None, description="Only review this table's indexes"),
+    _user = Depends(get_current_user)
+):
+    """Get per-index usage, write cost and size with drop and tuning candidates"""
+    try:
+        return await index_review_service.review(table)
+    except Exception as e:
+        logger.error(f"Error reviewing indexes: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to review indexes: {str(e)}")
+
+@router.get("/redis")
+async def get_redis_statistics(_user = Depends(get_current_user)):
+    """Get Redis pool state, per-command latency histograms and near-cache hit rates"""
+    return {
+        "connection": await redis_service.get_connection_stats(),
+        "commands": redis_service.get_command_latency(),
+        "near_cache": redis_service.get_near_cache_stats()
+    }
+
+@router.post("/redis/reset")
+async def reset_redis_statistics(_user = Depends(get_current_user)):
+    """Clear collected Redis command latency histograms"""
+    redis_service.reset_command_latency()
+    return {"status": "reset", "timestamp": datetime.utcnow().isoformat()}
+
+@router.get("/queues")
+async def get_queue_lag(_user = Depends(get_current_user)):
+    """Get Celery queue depth, backlog age and throughput from the broker"""
+    stats = await celery_service.get_queue_statistics()
+    if "error" in stats:
+        raise HTTPException(status_code=503, detail=f"Broker unavailable: {stats['error']}")
+    return stats
+
+@router.get("/autoscaler")
+async def get_autoscaler_decisions(
+    limit: int = Query(50, ge=1, le=200),
+    _user = Depends(get_current_user)
+):
+    """Get live worker autoscaler state and its most recent scaling decisions"""
+    try:
+        return await asyncio.to_thread(queue_probe.read_autoscalers, limit)
+    except Exception as e:
+        logger.error(f"Error reading autoscaler state: {e}")
+        raise HTTPException(status_code=503, detail=f"Broker unavailable: {str(e)}")
+
 @router.get("/performance/targets")
 async def get_performance_targets():
     """Get current performance targets and compliance"""
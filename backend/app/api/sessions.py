@@ -1,14 +1,16 @@
 ### app/api/sessions.py
 
 from fastapi import APIRouter, HTTPException, Query
-from typing import List, Optional
+from fastapi.responses import JSONResponse
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 from app.models.session import (
     Session, SessionCreate, SessionUpdate, SessionResponse,
     MessageCreate, MessageResponse, MessageRole, SessionStatus, SessionType
 )
 from app.services.session_service import session_service
 from app.services.conversation_service import conversation_service
-from app.services.llm_service import llm_service
+from app.services.conversation_tagging_service import conversation_tagging_service
 from app.services.entry_analytics_processor import entry_analytics_processor
 import logging
 
@@ -16,51 +18,6 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-async def auto_tag_conversation(session_id: str):
-    """Automatically generate tags for a conversation based on its content"""
-    try:
-        # Get session and messages
-        session = await session_service.get_session(session_id)
-        if not session:
-            return
-        
-        messages = await session_service.get_session_messages(session_id)
-        if not messages:
-            return
-        
-        # Extract user messages for tagging
-        user_messages = [msg for msg in messages if msg.role == MessageRole.USER]
-        if len(user_messages) < 2:  # Need at least 2 user messages
-            return
-        
-        # Combine user messages for analysis
-        conversation_text = " ".join([msg.content for msg in user_messages])
-        
-        # Generate tags if we have enough content
-        if len(conversation_text.strip()) > 20:
-            auto_tags = await llm_service.generate_automatic_tags(conversation_text, "conversation")
-            
-            if auto_tags:
-                # Get existing session tags
-                existing_tags = session.tags if hasattr(session, 'tags') and session.tags else []
-                existing_tags_lower = [tag.lower() for tag in existing_tags]
-                
-                # Add new tags that don't already exist
-                new_tags = []
-                for tag in auto_tags:
-                    if tag.lower() not in existing_tags_lower:
-                        new_tags.append(tag)
-                
-                if new_tags:
-                    # Update session with new tags
-                    all_tags = existing_tags + new_tags
-                    update_data = SessionUpdate(tags=all_tags[:8])  # Limit to 8 tags
-                    await session_service.update_session(session_id, update_data)
-                    logger.info(f"Auto-tagged session {session_id} with tags: {new_tags}")
-    
-    except Exception as e:
-        logger.error(f"Error auto-tagging conversation {session_id}: {e}")
-
 @router.post("/", response_model=SessionResponse)
 async def create_session(session_data: SessionCreate):
     """Create a new conversation session"""
@@ -102,60 +59,71 @@ async def get_sessions(
     limit: int = Query(20, ge=1, le=100),
     status: Optional[SessionStatus] = Query(None)
 ):
-    """Get conversation sessions with optimized bulk loading"""
+    """Get conversation sessions with their latest messages in a single query"""
     try:
-        # Get sessions directly from repository
         from app.core.database import database
         from app.repositories.session_repository import SessionRepository
         
         async with database.session_factory() as db:
             session_repo = SessionRepository(db)
-            sessions = await session_repo.get_user_sessions(
+            sessions = await session_repo.get_user_sessions_with_recent_messages(
                 user_id="00000000-0000-0000-0000-000000000001",  # Use correct user ID from database
-                limit=limit
+                limit=limit,
+                message_count=3,
+                status=status.value if status else None
             )
         
+        # Most frequently hit endpoint: rows are shaped into the SessionResponse
+        # layout directly instead of re-validating every session and message
         session_responses = []
         for session in sessions:
-            # Get recent messages for this session
-            recent_messages = await session_repo.get_recent_messages(session.id, count=3)
-            
-            try:
-                session_response = SessionResponse(
-                    id=str(session.id),
-                    session_type=SessionType(session.session_type),
-                    title=session.title or f"Chat Session {str(session.id)[:8]}",
-                    description=session.description,
-                    status=SessionStatus(session.status),
-                    created_at=session.created_at,
-                    updated_at=session.updated_at,
-                    last_activity=session.last_activity,
-                    message_count=session.message_count or 0,
-                    tags=session.tags or [],
-                    metadata=session.session_metadata or {},
-                    recent_messages=[
-                        MessageResponse(
-                            id=str(msg.id),
-                            session_id=str(session.id),
-                            content=msg.content or "",
-                            role=MessageRole(msg.role),
-                            timestamp=msg.created_at,
-                            metadata=msg.message_metadata or {}
-                        )
-                        for msg in recent_messages if msg.content  # Only include messages with content
-                    ]
-                )
-                session_responses.append(session_response)
-            except Exception as validation_error:
-                logger.warning(f"Skipping session {session.id} due to validation error: {validation_error}")
+            if session["session_type"] not in _SESSION_TYPES or session["status"] not in _SESSION_STATUSES:
+                logger.warning(f"Skipping session {session['id']} with unknown type/status")
                 continue
+            session_responses.append(_session_list_item(session))
         
-        return session_responses
+        return JSONResponse(session_responses)
         
     except Exception as e:
         logger.error(f"Error getting sessions: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve sessions")
 
+_SESSION_TYPES = frozenset(session_type.value for session_type in SessionType)
+_SESSION_STATUSES = frozenset(session_status.value for session_status in SessionStatus)
+_MESSAGE_ROLES = frozenset(role.value for role in MessageRole)
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+def _session_list_item(session: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON-ready SessionResponse for a row from get_user_sessions_with_recent_messages"""
+    session_id = str(session["id"])
+    return {
+        "id": session_id,
+        "session_type": session["session_type"],
+        "title": session["title"] or f"Chat Session {session_id[:8]}",
+        "description": session["description"],
+        "status": session["status"],
+        "created_at": _isoformat(session["created_at"]),
+        "updated_at": _isoformat(session["updated_at"]),
+        "last_activity": _isoformat(session["last_activity"]),
+        "message_count": session["message_count"] or 0,
+        "tags": session["tags"] or [],
+        "metadata": session["session_metadata"] or {},
+        "recent_messages": [
+            {
+                "id": str(msg["id"]),
+                "session_id": session_id,
+                "content": msg["content"],
+                "role": msg["role"],
+                "timestamp": _isoformat(msg["timestamp"]),
+                "metadata": msg["message_metadata"] or {}
+            }
+            for msg in session["recent_messages"]
+            if msg["content"] and msg["role"] in _MESSAGE_ROLES  # Only include messages with content
+        ]
+    }
+
 @router.get("/{session_id}", response_model=SessionResponse)
 async def get_session(session_id: str):
     """Get a specific session with recent messages"""
@@ -286,16 +254,6 @@ async def send_message(session_id: str, message_data: MessageCreate):
             MessageCreate(content=ai_response_text, role=MessageRole.ASSISTANT)  # ← FIXED: Pass string directly
         )
         
-        # Auto-tag conversation every 6 messages (3 exchanges)
-        try:
-            all_messages = await session_service.get_session_messages(session_id)
-            message_count = len(all_messages)
-            
-            if message_count >= 6 and message_count % 6 == 0:
-                await auto_tag_conversation(session_id)
-        except Exception as e:
-            logger.warning(f"Failed to auto-tag conversation {session_id}: {e}")
-        
         # Invalidate analytics cache for session update
         try:
             # Get user_id for cache invalidation (assuming default user for now)
@@ -532,8 +490,8 @@ async def trigger_auto_tag(session_id: str):
         if not session:
             raise HTTPException(status_code=404, detail="Session not found")
         
-        # Trigger auto-tagging
-        await auto_tag_conversation(session_id)
+        # Tag the messages since the last run now, instead of in the background
+        await conversation_tagging_service.tag_new_messages(session_id)
         
         # Return updated session
         updated_session = await session_service.get_session(session_id)
@@ -33,6 +33,7 @@ from .security import (
     token_generator,
     security_utils
 )
+from .principal_cache import PrincipalCache, principal_cache
 from .dependencies import (
     get_auth_service,
     get_current_user,
@@ -75,6 +76,10 @@ __all__ = [
     "token_generator",
     "security_utils",
     
+    # Principal cache
+    "PrincipalCache",
+    "principal_cache",
+    
     # Dependencies
     "get_auth_service",
     "get_current_user",
@@ -12,6 +12,7 @@ import uuid
 from .models import AuthUser
 from .service import AuthService, TokenExpiredError
 from .security import jwt_manager
+from .principal_cache import principal_cache
 from ..core.database import get_db
 
 
@@ -24,13 +25,13 @@ async def get_auth_service(db: AsyncSession = Depends(get_db)) -> AuthService:
 
 
 async def get_current_user_optional(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
-    auth_service: AuthService = Depends(get_auth_service)
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
 ) -> Optional[AuthUser]:
     """
     Get current user from token (optional - returns None if not authenticated).
     
-    Used for endpoints that work with or without authentication.
+    Used for endpoints that work with or without authentication. The user is
+    resolved through the principal cache and is not attached to a DB session.
     """
     if not credentials:
         return None
@@ -44,7 +45,7 @@ async def get_current_user_optional(
         if not user_id:
             return None
         
-        user = await auth_service.get_user_by_id(user_id)
+        user = await principal_cache.get_principal(user_id)
         if not user or not user.is_active:
             return None
         
@@ -55,13 +56,14 @@ async def get_current_user_optional(
 
 
 async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    auth_service: AuthService = Depends(get_auth_service)
+    credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> AuthUser:
     """
     Get current user from token (required - raises exception if not authenticated).
     
-    Used for protected endpoints that require authentication.
+    Used for protected endpoints that require authentication. The user is
+    resolved through the principal cache and is not attached to a DB session;
+    load it through the request's session before modifying it.
     """
     if not credentials:
         raise HTTPException(
@@ -87,7 +89,7 @@ async def get_current_user(
                 headers={"WWW-Authenticate": "Bearer"},
             )
         
-        user = await auth_service.get_user_by_id(user_id)
+        user = await principal_cache.get_principal(user_id)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -0,0 +1,181 @@
+# backend/app/auth/principal_cache.py
+"""
+Principal cache for authenticated requests
+Resolves the AuthUser behind an access token without a Postgres round trip
+on every request: a short-TTL in-process LRU in front of Redis, both keyed by
+user id plus a per-user security version.
+
+Logout, password changes, role/status changes and profile edits bump the
+version in Redis, so every process misses on its next lookup and reloads the
+user. When Redis is unavailable the cache is bypassed rather than trusted,
+because version bumps could not be observed.
+"""
+
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import DateTime, select
+
+from .models import AuthUser, UserRole
+from ..core.cache_patterns import CachePatterns
+from ..core.config import settings
+from ..core.database import database
+from ..services.redis_service import redis_service
+
+logger = logging.getLogger(__name__)
+
+# Columns carried by a cached principal; credentials and one-time tokens are never cached
+PRINCIPAL_FIELDS = (
+    "id", "username", "email", "is_active", "is_verified", "is_superuser", "role",
+    "password_changed_at", "failed_login_attempts", "locked_until", "last_login",
+    "last_login_ip", "display_name", "timezone", "language", "created_at", "updated_at"
+)
+
+_DATETIME_FIELDS = frozenset(
+    name for name in PRINCIPAL_FIELDS if isinstance(AuthUser.__table__.columns[name].type, DateTime)
+)
+
+
+class PrincipalCache:
+    """Two-tier (process LRU + Redis) cache of authenticated users"""
+
+    def __init__(self, max_entries: Optional[int] = None, local_ttl: Optional[int] = None,
+                 redis_ttl: Optional[int] = None):
+        self.max_entries = settings.security.principal_cache_max_entries if max_entries is None else max_entries
+        self.local_ttl = settings.security.principal_cache_local_ttl if local_ttl is None else local_ttl
+        self.redis_ttl = settings.security.principal_cache_redis_ttl if redis_ttl is None else redis_ttl
+        # user_id -> (security_version, expires_at, principal fields)
+        self._local: "OrderedDict[str, Tuple[int, float, Dict[str, Any]]]" = OrderedDict()
+        self.stats = {
+            "lookups": 0,
+            "local_hits": 0,
+            "redis_hits": 0,
+            "db_loads": 0,
+            "bypassed": 0,
+            "invalidations": 0
+        }
+
+    # ==================== SECURITY VERSION ====================
+
+    async def get_security_version(self, user_id: str) -> int:
+        version = await redis_service.get(CachePatterns.user_security_version(user_id))
+        try:
+            return int(version or 0)
+        except (TypeError, ValueError):
+            return 0
+
+    async def bump_security_version(self, user_id: str) -> int:
+        """Invalidate every cached principal of a user, in all processes"""
+        user_id = str(user_id)
+        self._local.pop(user_id, None)
+        self.stats["invalidations"] += 1
+        version = await redis_service.increment(CachePatterns.user_security_version(user_id))
+        logger.debug(f"🔐 Security version for user {user_id} bumped to {version}")
+        return version
+
+    # ==================== LOOKUP ====================
+
+    async def get_principal(self, user_id: str) -> Optional[AuthUser]:
+        """
+        Resolve a user by id, from cache when possible
+
+        Returns a fresh, session-detached AuthUser per call (callers may mutate it),
+        or None if the user does not exist.
+        """
+        self.stats["lookups"] += 1
+        user_id = str(user_id)
+        try:
+            uuid.UUID(user_id)
+        except ValueError:
+            return None
+
+        if not redis_service.is_available:
+            self.stats["bypassed"] += 1
+            data = await self._load_from_db(user_id)
+            return self._to_user(data) if data else None
+
+        version = await self.get_security_version(user_id)
+
+        cached = self._local.get(user_id)
+        if cached and cached[0] == version and cached[1] > time.monotonic():
+            self._local.move_to_end(user_id)
+            self.stats["local_hits"] += 1
+            return self._to_user(cached[2])
+
+        redis_key = CachePatterns.user_principal(user_id, version)
+        data = await redis_service.get(redis_key)
+        if isinstance(data, dict):
+            self.stats["redis_hits"] += 1
+        else:
+            data = await self._load_from_db(user_id)
+            if not data:
+                return None
+            if self.redis_ttl:
+                await redis_service.set(redis_key, data, ttl=self.redis_ttl)
+
+        self._store_local(user_id, version, data)
+        return self._to_user(data)
+
+    def _store_local(self, user_id: str, version: int, data: Dict[str, Any]) -> None:
+        if not self.local_ttl or not self.max_entries:
+            return
+        self._local[user_id] = (version, time.monotonic() + self.local_ttl, data)
+        self._local.move_to_end(user_id)
+        while len(self._local) > self.max_entries:
+            self._local.popitem(last=False)
+
+    async def _load_from_db(self, user_id: str) -> Optional[Dict[str, Any]]:
+        self.stats["db_loads"] += 1
+        async with database.get_session() as session:
+            user = await session.scalar(select(AuthUser).where(AuthUser.id == uuid.UUID(user_id)))
+            return self._to_data(user) if user else None
+
+    # ==================== SERIALIZATION ====================
+
+    @staticmethod
+    def _to_data(user: AuthUser) -> Dict[str, Any]:
+        """JSON-safe principal fields"""
+        data = {}
+        for name in PRINCIPAL_FIELDS:
+            value = getattr(user, name)
+            if isinstance(value, uuid.UUID):
+                value = str(value)
+            elif isinstance(value, UserRole):
+                value = value.value
+            elif isinstance(value, datetime):
+                value = value.isoformat()
+            data[name] = value
+        return data
+
+    @staticmethod
+    def _to_user(data: Dict[str, Any]) -> AuthUser:
+        values = dict(data)
+        values["id"] = uuid.UUID(values["id"])
+        values["role"] = UserRole(values["role"])
+        for name in _DATETIME_FIELDS:
+            if values.get(name):
+                values[name] = datetime.fromisoformat(values[name])
+        return AuthUser(**values)
+
+    def clear_local(self) -> None:
+        self._local.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Lookup counters and hit rates"""
+        lookups = self.stats["lookups"]
+        hits = self.stats["local_hits"] + self.stats["redis_hits"]
+        return {
+            **self.stats,
+            "local_entries": len(self._local),
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "local_hit_rate": self.stats["local_hits"] / lookups if lookups else 0.0,
+            "db_load_rate": self.stats["db_loads"] / lookups if lookups else 0.0
+        }
+
+
+# Global principal cache instance
+principal_cache = PrincipalCache()
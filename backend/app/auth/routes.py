@@ -20,7 +20,8 @@ from .service import (
     AuthService, UserExistsError, InvalidCredentialsError, 
     AccountLockedError, TokenExpiredError
 )
-from .models import UserRole
+from .models import AuthUser, UserRole
+from .principal_cache import principal_cache
 from .dependencies import (
     get_auth_service, get_current_user, get_current_user_optional,
     get_current_verified_user, get_current_superuser,
@@ -88,7 +89,8 @@ async def register_user(
     responses={
         401: {"model": ApiError, "description": "Invalid credentials"},
         423: {"model": ApiError, "description": "Account locked"},
-        429: {"model": ApiError, "description": "Too many login attempts"}
+        429: {"model": ApiError, "description": "Too many login attempts"},
+        503: {"model": ApiError, "description": "Password hashing capacity exhausted"}
     }
 )
 async def login_user(
@@ -239,18 +241,27 @@ async def update_current_user(
     - **timezone**: User timezone (optional)
     - **language**: Preferred language (optional)
     """
+    # The cached principal is detached; modify the session-bound row
+    user = await db.get(AuthUser, current_user.id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found"
+        )
+    
     # Update user fields
     if user_update.display_name is not None:
-        current_user.display_name = user_update.display_name
+        user.display_name = user_update.display_name
     if user_update.timezone is not None:
-        current_user.timezone = user_update.timezone
+        user.timezone = user_update.timezone
     if user_update.language is not None:
-        current_user.language = user_update.language
+        user.language = user_update.language
     
     await db.commit()
-    await db.refresh(current_user)
+    await db.refresh(user)
+    await principal_cache.bump_security_version(str(user.id))
     
-    return UserResponse.from_orm(current_user)
+    return UserResponse.from_orm(user)
 
 
 @router.post(
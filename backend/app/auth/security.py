@@ -8,15 +8,11 @@ from typing import Optional, Union, Any
 import secrets
 import string
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from passlib.hash import bcrypt
 import re
 
 from ..core.config import settings
-
-
-# Password hashing context using bcrypt
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from ..core.password_hashing import pwd_context, password_hash_pool
 
 
 class PasswordValidator:
@@ -104,6 +100,26 @@ class PasswordHasher:
         """
         return pwd_context.verify(plain_password, hashed_password)
     
+    @staticmethod
+    async def hash_password_async(password: str) -> str:
+        """
+        Hash a password on the bounded hashing pool without blocking the event loop.
+        
+        Raises:
+            PasswordHashingOverloadedError: If the pool is at its in-flight limit
+        """
+        return await password_hash_pool.hash_password(password)
+    
+    @staticmethod
+    async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+        """
+        Verify a password on the bounded hashing pool without blocking the event loop.
+        
+        Raises:
+            PasswordHashingOverloadedError: If the pool is at its in-flight limit
+        """
+        return await password_hash_pool.verify_password(plain_password, hashed_password)
+    
     @staticmethod
     def needs_update(hashed_password: str) -> bool:
         """
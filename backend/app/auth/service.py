@@ -20,6 +20,7 @@ from .security import (
     token_generator,
     security_utils
 )
+from .principal_cache import principal_cache
 from ..core.config import settings
 
 
@@ -92,7 +93,7 @@ class AuthService:
                 raise UserExistsError("Email already exists")
         
         # Create new user
-        password_hash = password_hasher.hash_password(user_data.password)
+        password_hash = await password_hasher.hash_password_async(user_data.password)
         verification_token = token_generator.generate_verification_token()
         
         new_user = AuthUser(
@@ -180,7 +181,7 @@ class AuthService:
             raise AccountLockedError(f"Account is locked until {user.locked_until}")
         
         # Verify password
-        if not password_hasher.verify_password(login_data.password, user.password_hash):
+        if not await password_hasher.verify_password_async(login_data.password, user.password_hash):
             await self._handle_failed_login(user, ip_address)
             await self._log_login_attempt(
                 username_or_email=login_data.username_or_email,
@@ -289,6 +290,7 @@ class AuthService:
         
         result = await self.db.execute(stmt)
         await self.db.commit()
+        await principal_cache.bump_security_version(user_id)
         
         return result.rowcount > 0
     
@@ -316,7 +318,7 @@ class AuthService:
             raise InvalidCredentialsError("User not found")
         
         # Verify current password
-        if not password_hasher.verify_password(
+        if not await password_hasher.verify_password_async(
             password_data.current_password, user.password_hash
         ):
             raise InvalidCredentialsError("Current password is incorrect")
@@ -327,13 +329,14 @@ class AuthService:
             raise ValueError(f"New password validation failed: {', '.join(errors)}")
         
         # Update password
-        user.password_hash = password_hasher.hash_password(password_data.new_password)
+        user.password_hash = await password_hasher.hash_password_async(password_data.new_password)
         user.password_changed_at = datetime.utcnow()
         
         # Revoke all refresh tokens (force re-login on all devices)
         await self.logout_user(user_id)
         
         await self.db.commit()
+        await principal_cache.bump_security_version(user_id)
         return True
     
     async def request_password_reset(self, email: str) -> Optional[str]:
@@ -392,7 +395,7 @@ class AuthService:
             raise ValueError(f"Password validation failed: {', '.join(errors)}")
         
         # Update password and clear reset token
-        user.password_hash = password_hasher.hash_password(reset_data.new_password)
+        user.password_hash = await password_hasher.hash_password_async(reset_data.new_password)
         user.password_changed_at = datetime.utcnow()
         user.reset_token = None
         user.reset_token_expires = None
@@ -403,6 +406,7 @@ class AuthService:
         await self.logout_user(str(user.id))
         
         await self.db.commit()
+        await principal_cache.bump_security_version(str(user.id))
         return True
     
     async def verify_email(self, token: str) -> bool:
@@ -433,6 +437,7 @@ class AuthService:
         user.verification_token_expires = None
         
         await self.db.commit()
+        await principal_cache.bump_security_version(str(user.id))
         return True
     
     async def get_user_by_id(self, user_id: str) -> Optional[AuthUser]:
@@ -644,7 +649,7 @@ class AuthService:
                 raise UserExistsError("Email already exists")
         
         # Create new user with specified role
-        password_hash = password_hasher.hash_password(user_data.password)
+        password_hash = await password_hasher.hash_password_async(user_data.password)
         
         new_user = AuthUser(
             username=user_data.username.lower(),
@@ -706,6 +711,8 @@ class AuthService:
         
         await self.db.commit()
         await self.db.refresh(user)
+        # Role and status changes must not be served from cached principals
+        await principal_cache.bump_security_version(str(user.id))
         return user
     
     async def list_users_admin(
@@ -167,7 +167,29 @@ class CachePatterns:
             CacheDomain.PSYCHOLOGY, "patterns", 
             {"user": user_id, "type": pattern_type}
         )
-    
+
+    @staticmethod
+    def psychology_content_version(user_id: str) -> str:
+        """Per-user content version counter (bumped on every entry write)"""
+        return CacheKeyBuilder.build_key(
+            CacheDomain.PSYCHOLOGY, "content_version", {"user": user_id}
+        )
+
+    @staticmethod
+    def psychology_snapshot(user_id: str, snapshot_type: str) -> str:
+        """Precomputed insight snapshot cache key"""
+        return CacheKeyBuilder.build_key(
+            CacheDomain.PSYCHOLOGY, "snapshot",
+            {"type": snapshot_type, "user": user_id}
+        )
+
+    @staticmethod
+    def psychology_snapshot_meta(user_id: str) -> str:
+        """Snapshot refresh bookkeeping (version and time of last refresh)"""
+        return CacheKeyBuilder.build_key(
+            CacheDomain.PSYCHOLOGY, "snapshot_meta", {"user": user_id}
+        )
+
     # =============================================================================
     # CRISIS DOMAIN PATTERNS
     # =============================================================================
@@ -247,6 +269,39 @@ class CachePatterns:
         """User session preferences cache key"""
         return CacheKeyBuilder.build_key(CacheDomain.SESSION, "preferences", {"user": user_id})
     
+    @staticmethod
+    def session_tagging_pending(session_id: str) -> str:
+        """Dedupe marker for an enqueued conversation auto-tagging job"""
+        return CacheKeyBuilder.build_key(CacheDomain.SESSION, "tagging_pending", {"id": session_id})
+    
+    # =============================================================================
+    # USER DOMAIN PATTERNS
+    # =============================================================================
+    
+    @staticmethod
+    def user_security_version(user_id: str) -> str:
+        """Per-user security version (bumped on logout, password, role or status changes)"""
+        return CacheKeyBuilder.build_key(CacheDomain.USER, "security_version", {"user": user_id})
+    
+    @staticmethod
+    def user_principal(user_id: str, security_version: int) -> str:
+        """Resolved authentication principal for one security version"""
+        return CacheKeyBuilder.build_key(
+            CacheDomain.USER, "principal", {"user": user_id, "version": security_version}
+        )
+    
+    # =============================================================================
+    # CONTENT DOMAIN PATTERNS
+    # =============================================================================
+    
+    @staticmethod
+    def content_hybrid_search(user_id: str, query_hash: str, content_version: int) -> str:
+        """Fused hybrid search ranking, invalidated by bumping the content version"""
+        return CacheKeyBuilder.build_key(
+            CacheDomain.CONTENT, "hybrid_search",
+            {"user": user_id, "query": query_hash, "version": content_version}
+        )
+    
     # =============================================================================
     # AI MODEL DOMAIN PATTERNS
     # =============================================================================
@@ -275,6 +330,17 @@ class CachePatterns:
             {"hash": text_hash, "model": model}
         )
     
+    # =============================================================================
+    # SYSTEM DOMAIN PATTERNS
+    # =============================================================================
+    
+    @staticmethod
+    def system_rate_limit_bucket(policy: str, bucket_id: str) -> str:
+        """Token bucket state for one rate limit policy and client"""
+        return CacheKeyBuilder.build_key(
+            CacheDomain.SYSTEM, "rate_limit", {"policy": policy}, suffix=bucket_id
+        )
+    
     # =============================================================================
     # CELERY DOMAIN PATTERNS  
     # =============================================================================
@@ -293,6 +359,21 @@ class CachePatterns:
     def celery_recent_events(event_type: str) -> str:
         """Celery recent events cache key"""
         return CacheKeyBuilder.build_key(CacheDomain.CELERY, "recent_events", {"type": event_type})
+    
+    @staticmethod
+    def celery_task_stats() -> str:
+        """Cumulative per-task-name Celery event counters (hash)"""
+        return CacheKeyBuilder.build_key(CacheDomain.CELERY, "task_stats")
+    
+    @staticmethod
+    def celery_stats_publisher() -> str:
+        """Lock naming the one process that publishes Celery event deltas"""
+        return CacheKeyBuilder.build_key(CacheDomain.CELERY, "task_stats_publisher")
+    
+    @staticmethod
+    def celery_monitoring_snapshot() -> str:
+        """Latest Celery monitoring snapshot"""
+        return CacheKeyBuilder.build_key(CacheDomain.CELERY, "monitoring_snapshot")
 
 
 class CacheInvalidationPatterns:
@@ -53,8 +53,22 @@ class RedisSettings(BaseSettings):
     
     # Connection pool settings
     max_connections: int = Field(default=20, ge=1, le=100)
+    socket_timeout: float = Field(default=5.0, gt=0, le=60)
+    socket_connect_timeout: float = Field(default=5.0, gt=0, le=60)
     retry_on_timeout: bool = Field(default=True)
     health_check_interval: int = Field(default=30, ge=10, le=300)
+    use_hiredis: bool = Field(default=True)  # Only takes effect when hiredis is installed
+    
+    # Reconnect with exponential backoff after a lost connection
+    reconnect_backoff_base: float = Field(default=0.5, gt=0)
+    reconnect_backoff_max: float = Field(default=30.0, gt=0)
+    
+    # Coalesce concurrent cache commands into one pipeline
+    auto_batching: bool = Field(default=True)
+    max_batch_size: int = Field(default=128, ge=1, le=10000)
+    
+    # In-process near cache for hot domains (per-domain limits in services/near_cache.py)
+    near_cache_enabled: bool = Field(default=False)
     
     class Config:
         env_prefix = "REDIS_"
@@ -91,6 +105,15 @@ class SecuritySettings(BaseSettings):
     password_require_lowercase: bool = Field(default=True)
     password_require_numbers: bool = Field(default=True)
     
+    # Password hashing pool (bcrypt runs off the event loop)
+    password_hash_workers: int = Field(default=2, ge=1, le=32)
+    password_hash_max_pending: int = Field(default=32, ge=1, le=1024)  # In-flight hashes before shedding load
+    
+    # Principal cache for authenticated requests
+    principal_cache_local_ttl: int = Field(default=30, ge=0, le=600)  # In-process LRU, seconds
+    principal_cache_redis_ttl: int = Field(default=300, ge=0, le=3600)
+    principal_cache_max_entries: int = Field(default=10000, ge=0)
+    
     class Config:
         env_prefix = "SECURITY_"
 
@@ -130,6 +153,28 @@ class Settings(BaseSettings):
     # Performance Targets
     DB_PERFORMANCE_TARGET_MS: int = 50
     DB_SLOW_QUERY_THRESHOLD: float = 0.1
+    DB_QUERY_PROFILER_ENABLED: bool = True
+    DB_N_PLUS_ONE_THRESHOLD: int = 10  # Executions of one statement shape per request
+    
+    # Time-partitioned tables
+    DB_PARTITION_PREMAKE_MONTHS: int = Field(
+        default_factory=lambda: int(os.getenv("DB_PARTITION_PREMAKE_MONTHS", "3")),
+        description="Monthly partitions kept created ahead of the current month"
+    )
+    CHAT_MESSAGE_RETENTION_MONTHS: int = Field(
+        default_factory=lambda: int(os.getenv("CHAT_MESSAGE_RETENTION_MONTHS", "0")),
+        description="Whole months of chat messages kept before their partition is dropped (0, the default, keeps all)"
+    )
+    
+    # Entry revision history
+    ENTRY_REVISION_COALESCE_SECONDS: int = Field(
+        default_factory=lambda: int(os.getenv("ENTRY_REVISION_COALESCE_SECONDS", "600")),
+        description="Content saves within this many seconds of a version's first save stay in that version"
+    )
+    ENTRY_REVISION_SNAPSHOT_INTERVAL: int = Field(
+        default_factory=lambda: int(os.getenv("ENTRY_REVISION_SNAPSHOT_INTERVAL", "20")),
+        description="Every Nth revision stores the full compressed text, bounding delta replay"
+    )
     
     # Migration Configuration
     ENABLE_DUAL_WRITE: bool = True
@@ -212,6 +257,22 @@ class Settings(BaseSettings):
         ),
         description="Celery result backend with authentication for Docker Redis"
     )
+    CELERY_WORKER_PROFILE: Optional[str] = Field(
+        default_factory=lambda: os.getenv("CELERY_WORKER_PROFILE"),
+        description="Worker profile (crisis, psychology, maintenance) whose queues and models this worker serves"
+    )
+    CELERY_WORKER_READY_DIR: str = Field(
+        default_factory=lambda: os.getenv("CELERY_WORKER_READY_DIR", "/tmp"),
+        description="Directory for the readiness file written once a worker's models are warm"
+    )
+    CELERY_AUTOSCALE_INTERVAL: float = Field(
+        default_factory=lambda: float(os.getenv("CELERY_AUTOSCALE_INTERVAL", "5")),
+        description="Seconds between queue lag samples taken by the worker autoscaler"
+    )
+    CELERY_CRISIS_MIN_CONCURRENCY: int = Field(
+        default_factory=lambda: int(os.getenv("CELERY_CRISIS_MIN_CONCURRENCY", "4")),
+        description="Concurrency the autoscaler never takes a crisis-queue worker below"
+    )
     
     # === LOGGING & MONITORING ===
     LOG_LEVEL: str = "INFO"
@@ -17,6 +17,8 @@ import psutil
 from datetime import datetime, timedelta
 
 from app.core.config import settings
+from app.core.query_profiler import query_profiler
+from app.core.request_timing import instrument_engine
 
 logger = logging.getLogger(__name__)
 
@@ -214,6 +216,11 @@ class DatabaseConfig:
             
         # Note: 'timeout' event doesn't exist for connection pools in SQLAlchemy
         # Pool timeouts are handled internally and logged through other means
+        
+        # Per-request database time for the Server-Timing breakdown
+        instrument_engine(self.engine.sync_engine)
+        # Statement fingerprints, N+1 detection and slow-query capture
+        query_profiler.instrument(self.engine.sync_engine)
     
     async def _validate_connection(self) -> None:
         """Validate database connection and basic functionality."""
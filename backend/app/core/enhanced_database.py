@@ -23,6 +23,8 @@ import logging
 import time
 from dataclasses import dataclass
 
+from app.core.query_profiler import query_profiler
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -118,17 +120,8 @@ class DatabaseManager:
                 cursor.execute("SET lock_timeout = '10s'")
                 cursor.execute("SET idle_in_transaction_session_timeout = '30s'")
         
-        @event.listens_for(self.engine.sync_engine, "before_cursor_execute")
-        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
-            """Log slow queries for optimization."""
-            context._query_start_time = time.time()
-        
-        @event.listens_for(self.engine.sync_engine, "after_cursor_execute")
-        def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
-            """Monitor query performance."""
-            total = time.time() - context._query_start_time
-            if total > 0.1:  # Log queries taking more than 100ms
-                logger.warning(f"Slow query ({total:.3f}s): {statement[:100]}...")
+        # Statement fingerprints, N+1 detection and slow-query capture
+        query_profiler.instrument(self.engine.sync_engine)
     
     @asynccontextmanager
     async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
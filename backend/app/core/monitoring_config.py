@@ -28,6 +28,8 @@ class MonitoringSettings(BaseSettings):
     enable_request_tracing: bool = Field(default=True, description="Enable request tracing")
     enable_detailed_request_logging: bool = Field(default=True, description="Enable detailed request logging")
     max_trace_history: int = Field(default=1000, description="Maximum number of traces to keep in memory")
+    enable_server_timing: bool = Field(default=True, description="Send per-request latency breakdown as a Server-Timing header")
+    slow_request_log_sample_rate: float = Field(default=0.1, description="Share of slow requests logged with their latency breakdown")
     
     # Performance Monitoring Configuration
     enable_performance_monitoring: bool = Field(default=True, description="Enable performance monitoring")
@@ -85,7 +87,9 @@ def get_monitoring_config() -> Dict[str, Any]:
             "enabled": monitoring_settings.enable_request_tracing,
             "detailed_logging": monitoring_settings.enable_detailed_request_logging,
             "max_history": monitoring_settings.max_trace_history,
-            "retention_hours": monitoring_settings.trace_retention_hours
+            "retention_hours": monitoring_settings.trace_retention_hours,
+            "server_timing": monitoring_settings.enable_server_timing,
+            "slow_request_log_sample_rate": monitoring_settings.slow_request_log_sample_rate
         },
         "performance": {
             "monitoring_enabled": monitoring_settings.enable_performance_monitoring,
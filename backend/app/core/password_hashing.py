@@ -0,0 +1,174 @@
+# backend/app/core/password_hashing.py
+"""
+Bounded process pool for bcrypt password hashing
+A bcrypt round costs ~250 ms of CPU; running it inline blocks the event loop
+for every other request on the worker. Hashing and verification are shipped
+to a small dedicated process pool instead (not limited by the GIL), and the
+number of in-flight operations is capped so a login burst is shed with a
+retryable error instead of growing an unbounded backlog.
+
+This module is deliberately light: spawned pool workers import it to resolve
+the worker functions, so it must not pull in the database or API layers.
+"""
+
+import asyncio
+import logging
+import math
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+
+from passlib.context import CryptContext
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Password hashing context using bcrypt
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+def _hash_password(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify_password(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def _warm_up() -> bool:
+    return True
+
+
+class PasswordHashingOverloadedError(Exception):
+    """Raised when the hashing pool is at its in-flight limit"""
+
+    def __init__(self, retry_after: int):
+        self.retry_after = retry_after
+        super().__init__(f"Password hashing capacity exhausted, retry after {retry_after}s")
+
+
+class PasswordHashPool:
+    """
+    Async front-end to a process pool running bcrypt
+
+    Admission is checked before submitting: once ``max_pending`` operations are
+    queued or running, new calls fail fast with PasswordHashingOverloadedError.
+    The in-flight count is released when the worker finishes, not when the
+    awaiting request goes away, so cancelled requests still count until their
+    hash is done.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_pending: Optional[int] = None):
+        self.max_workers = max_workers or settings.security.password_hash_workers
+        self.max_pending = max_pending or settings.security.password_hash_max_pending
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+        self._avg_duration = 0.25  # Seconds per bcrypt operation, smoothed
+        self.stats = {
+            "submitted": 0,
+            "completed": 0,
+            "rejected": 0,
+            "pool_restarts": 0,
+            "peak_pending": 0
+        }
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                # spawn: forking a process that already runs an event loop and
+                # driver threads can deadlock the child
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+                logger.info(f"🔐 Password hashing pool started with {self.max_workers} workers "
+                            f"(max {self.max_pending} in flight)")
+            return self._executor
+
+    async def start(self) -> None:
+        """Spawn every worker up front so the first logins don't pay process start-up"""
+        executor = self._get_executor()
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(executor, _warm_up) for _ in range(self.max_workers)))
+
+    def shutdown(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+                logger.info("✅ Password hashing pool stopped")
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def retry_after_seconds(self) -> int:
+        """Estimated time for the current backlog to drain"""
+        backlog = self._pending / self.max_workers * self._avg_duration
+        return max(1, math.ceil(backlog))
+
+    def _acquire(self) -> None:
+        with self._pending_lock:
+            if self._pending >= self.max_pending:
+                self.stats["rejected"] += 1
+                raise PasswordHashingOverloadedError(self.retry_after_seconds())
+            self._pending += 1
+            self.stats["submitted"] += 1
+            self.stats["peak_pending"] = max(self.stats["peak_pending"], self._pending)
+
+    def _release(self, started: float) -> None:
+        with self._pending_lock:
+            self._pending -= 1
+            self.stats["completed"] += 1
+            self._avg_duration = 0.9 * self._avg_duration + 0.1 * (time.monotonic() - started)
+
+    async def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        self._acquire()
+        started = time.monotonic()
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BaseException as e:
+            self._release(started)
+            if isinstance(e, BrokenProcessPool):
+                self._reset_executor()
+            raise
+        future.add_done_callback(lambda _: self._release(started))
+
+        try:
+            return await asyncio.wrap_future(future)
+        except BrokenProcessPool:
+            self._reset_executor()
+            raise
+
+    def _reset_executor(self) -> None:
+        # A worker died (e.g. OOM kill); replace the pool for later calls
+        with self._executor_lock:
+            if self._executor is not None:
+                logger.error("❌ Password hashing pool broken, restarting")
+                self._executor = None
+                self.stats["pool_restarts"] += 1
+
+    async def hash_password(self, password: str) -> str:
+        return await self._run(_hash_password, password)
+
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(_verify_password, plain_password, hashed_password)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "pending": self._pending,
+            "max_pending": self.max_pending,
+            "workers": self.max_workers,
+            "avg_duration_ms": round(self._avg_duration * 1000, 1)
+        }
+
+
+# Global password hashing pool instance
+password_hash_pool = PasswordHashPool()
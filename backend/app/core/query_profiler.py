@@ -0,0 +1,338 @@
+# backend/app/core/query_profiler.py
+"""
+SQL Statement Profiler
+Aggregates every statement executed through an instrumented engine by
+fingerprint (literals and bind parameters stripped), detects likely N+1
+patterns per request and keeps a bounded log of slow statements.
+
+- Per fingerprint: count, total/mean/max and p95 over recent executions
+- N+1: one fingerprint executed more than n_plus_one_threshold times in one
+  request (QueryProfilingStage scopes statements to the current request)
+- Test mode: query_budget() fails a block of code, typically test-client
+  calls, when any request in it runs more statements than allowed
+- Parameters are never stored, only the statement text
+"""
+
+import logging
+import math
+import re
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+from app.core.request_pipeline import PipelineStage, RequestContext
+
+logger = logging.getLogger(__name__)
+
+# Statements beyond max_fingerprints distinct shapes are counted here
+OVERFLOW_FINGERPRINT = "<other statements>"
+
+_COMMENT = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_BIND_PARAMETER = re.compile(r"%\([^)]+\)s|%s|\$\d+|(?<![:\w]):\w+|\?")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:::\w+)?(?:\s*,\s*\?(?:::\w+)?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(statement: str) -> str:
+    """
+    Normalize a statement so executions differing only in values share a key
+
+    SELECT * FROM entries WHERE id = $1 AND tags @> '{x}' LIMIT 20
+    -> SELECT * FROM entries WHERE id = ? AND tags @> ? LIMIT ?
+    IN lists and multi-row VALUES of any length collapse to (...).
+    """
+    normalized = _COMMENT.sub(" ", statement)
+    normalized = _STRING_LITERAL.sub("?", normalized)
+    normalized = _BIND_PARAMETER.sub("?", normalized)
+    normalized = _NUMBER.sub("?", normalized)
+    normalized = _VALUE_LIST.sub("(...)", normalized)
+    normalized = re.sub(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+", "(...)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+class QueryBudgetExceeded(AssertionError):
+    """A request (or block of code) ran more statements than its query budget"""
+
+
+class FingerprintStats:
+    """Running statistics for one statement fingerprint"""
+
+    __slots__ = ("fingerprint", "example", "count", "total_ms", "max_ms", "recent_ms",
+                 "slow_count", "n_plus_one_requests", "last_seen")
+
+    def __init__(self, fingerprint: str, example: str, sample_size: int):
+        self.fingerprint = fingerprint
+        self.example = example
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.recent_ms: Deque[float] = deque(maxlen=sample_size)
+        self.slow_count = 0
+        self.n_plus_one_requests = 0
+        self.last_seen: Optional[datetime] = None
+
+    def record(self, duration_ms: float, slow: bool) -> None:
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.recent_ms.append(duration_ms)
+        if slow:
+            self.slow_count += 1
+        self.last_seen = datetime.utcnow()
+
+    @property
+    def p95_ms(self) -> float:
+        if not self.recent_ms:
+            return 0.0
+        ordered = sorted(self.recent_ms)
+        return ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "example": self.example,
+            "count": self.count,
+            "total_ms": round(self.total_ms, 2),
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p95_ms": round(self.p95_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+            "slow_count": self.slow_count,
+            "n_plus_one_requests": self.n_plus_one_requests,
+            "last_seen": self.last_seen.isoformat() if self.last_seen else None
+        }
+
+
+class RequestQueries:
+    """Statements executed while handling one request (or one budget block)"""
+
+    __slots__ = ("request_id", "route", "total", "by_fingerprint")
+
+    def __init__(self, request_id: Optional[str] = None, route: Optional[str] = None):
+        self.request_id = request_id
+        self.route = route
+        self.total = 0
+        self.by_fingerprint: Dict[str, int] = {}
+
+    def record(self, key: str) -> None:
+        self.total += 1
+        self.by_fingerprint[key] = self.by_fingerprint.get(key, 0) + 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Fingerprints executed more than threshold times, most repeated first"""
+        return sorted(
+            ((key, count) for key, count in self.by_fingerprint.items() if count > threshold),
+            key=lambda item: -item[1]
+        )
+
+
+class QueryBudget:
+    """Query limits checked per request when the block using it exits"""
+
+    def __init__(self, max_queries: Optional[int] = None, max_per_fingerprint: Optional[int] = None):
+        self.max_queries = max_queries
+        self.max_per_fingerprint = max_per_fingerprint
+        self.requests: List[RequestQueries] = []
+        # Statements executed in the block but outside any request
+        self.direct = RequestQueries(request_id="<no request>")
+
+    def violations(self) -> List[str]:
+        problems = []
+        for usage in self.requests + [self.direct]:
+            label = f"{usage.route or usage.request_id}"
+            if self.max_queries is not None and usage.total > self.max_queries:
+                problems.append(f"{label}: {usage.total} queries (budget {self.max_queries})")
+            if self.max_per_fingerprint is not None:
+                for key, count in usage.repeated(self.max_per_fingerprint):
+                    problems.append(f"{label}: {count}x {key[:200]} (budget {self.max_per_fingerprint} per statement)")
+        return problems
+
+
+_request_queries_var: ContextVar[Optional[RequestQueries]] = ContextVar("request_queries", default=None)
+_budgets_var: ContextVar[Tuple[QueryBudget, ...]] = ContextVar("query_budgets", default=())
+
+
+class QueryProfiler:
+    """Statement statistics, N+1 incidents and slow statements for instrumented engines"""
+
+    def __init__(self, n_plus_one_threshold: int = 10, slow_query_threshold_ms: float = 100.0,
+                 max_fingerprints: int = 500, sample_size: int = 200, history_size: int = 100):
+        self.enabled = True
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.slow_query_threshold_ms = slow_query_threshold_ms
+        self.max_fingerprints = max_fingerprints
+        self.sample_size = sample_size
+        self.stats: Dict[str, FingerprintStats] = {}
+        self.slow_queries: Deque[Dict[str, Any]] = deque(maxlen=history_size)
+        self.n_plus_one_incidents: Deque[Dict[str, Any]] = deque(maxlen=history_size)
+        self.started_at = datetime.utcnow()
+
+    # ==================== INSTRUMENTATION ====================
+
+    def instrument(self, sync_engine) -> None:
+        """Profile every statement executed on an engine"""
+        from sqlalchemy import event
+
+        @event.listens_for(sync_engine, "before_cursor_execute")
+        def _start_statement(conn, cursor, statement, parameters, context, executemany):
+            if self.enabled:
+                conn.info.setdefault("query_profiler_starts", []).append(time.perf_counter())
+
+        @event.listens_for(sync_engine, "after_cursor_execute")
+        def _finish_statement(conn, cursor, statement, parameters, context, executemany):
+            starts = conn.info.get("query_profiler_starts")
+            if starts:
+                self.record(statement, (time.perf_counter() - starts.pop()) * 1000)
+
+        @event.listens_for(sync_engine, "handle_error")
+        def _finish_failed_statement(exception_context):
+            connection = exception_context.connection
+            starts = connection.info.get("query_profiler_starts") if connection is not None else None
+            if starts and exception_context.statement:
+                self.record(exception_context.statement, (time.perf_counter() - starts.pop()) * 1000)
+
+    def record(self, statement: str, duration_ms: float) -> None:
+        """Account one executed statement"""
+        key = fingerprint(statement)
+        stats = self.stats.get(key)
+        if stats is None:
+            if len(self.stats) >= self.max_fingerprints:
+                key = OVERFLOW_FINGERPRINT
+                stats = self.stats.get(key)
+            if stats is None:
+                stats = self.stats[key] = FingerprintStats(key, statement[:500], self.sample_size)
+
+        slow = duration_ms >= self.slow_query_threshold_ms
+        stats.record(duration_ms, slow)
+
+        request = _request_queries_var.get()
+        if request is not None:
+            request.record(key)
+        else:
+            for budget in _budgets_var.get():
+                budget.direct.record(key)
+
+        if slow:
+            self.slow_queries.append({
+                "fingerprint": key,
+                "statement": statement[:1000],
+                "duration_ms": round(duration_ms, 2),
+                "request_id": request.request_id if request else None,
+                "timestamp": datetime.utcnow().isoformat()
+            })
+            logger.warning(f"🐌 Slow query ({duration_ms:.0f}ms): {key[:200]}")
+
+    # ==================== REQUEST SCOPE ====================
+
+    def begin_request(self, request_id: str) -> Tuple[RequestQueries, Any]:
+        usage = RequestQueries(request_id=request_id)
+        return usage, _request_queries_var.set(usage)
+
+    def end_request(self, usage: RequestQueries, token: Any, route: Optional[str] = None) -> None:
+        """Close a request scope: flag N+1 patterns and hand usage to active budgets"""
+        _request_queries_var.reset(token)
+        usage.route = route
+
+        for key, count in usage.repeated(self.n_plus_one_threshold):
+            stats = self.stats.get(key)
+            if stats is not None:
+                stats.n_plus_one_requests += 1
+            self.n_plus_one_incidents.append({
+                "route": route,
+                "request_id": usage.request_id,
+                "fingerprint": key,
+                "executions": count,
+                "request_queries": usage.total,
+                "timestamp": datetime.utcnow().isoformat()
+            })
+            logger.warning(f"🔁 Likely N+1 on {route}: {count}x {key[:200]}")
+
+        for budget in _budgets_var.get():
+            budget.requests.append(usage)
+
+    # ==================== REPORTING ====================
+
+    def get_statistics(self, limit: int = 50, sort_by: str = "total_ms") -> Dict[str, Any]:
+        if sort_by not in ("total_ms", "count", "p95_ms", "max_ms"):
+            raise ValueError(f"Unsupported sort key: {sort_by}")
+        entries = [stats.to_dict() for stats in list(self.stats.values())]
+        entries.sort(key=lambda entry: entry[sort_by], reverse=True)
+        return {
+            "since": self.started_at.isoformat(),
+            "fingerprints": len(entries),
+            "total_queries": sum(entry["count"] for entry in entries),
+            "total_ms": round(sum(entry["total_ms"] for entry in entries), 2),
+            "n_plus_one_threshold": self.n_plus_one_threshold,
+            "slow_query_threshold_ms": self.slow_query_threshold_ms,
+            "statements": entries[:limit]
+        }
+
+    def get_slow_queries(self, limit: int = 50) -> List[Dict[str, Any]]:
+        return list(self.slow_queries)[-limit:][::-1]
+
+    def get_n_plus_one_incidents(self, limit: int = 50) -> List[Dict[str, Any]]:
+        return list(self.n_plus_one_incidents)[-limit:][::-1]
+
+    def reset(self) -> None:
+        self.stats.clear()
+        self.slow_queries.clear()
+        self.n_plus_one_incidents.clear()
+        self.started_at = datetime.utcnow()
+
+    # ==================== TEST MODE ====================
+
+    @contextmanager
+    def query_budget(self, max_queries: Optional[int] = None,
+                     max_per_fingerprint: Optional[int] = None) -> Iterator[QueryBudget]:
+        """
+        Fail when any request handled inside the block exceeds the budget
+
+            with query_profiler.query_budget(max_queries=5, max_per_fingerprint=1):
+                await client.get("/api/v1/sessions/")
+
+        Statements run directly in the block (no request) are checked as one
+        unit. Raises QueryBudgetExceeded on exit, listing every violation.
+        """
+        budget = QueryBudget(max_queries, max_per_fingerprint)
+        token = _budgets_var.set(_budgets_var.get() + (budget,))
+        try:
+            yield budget
+        finally:
+            _budgets_var.reset(token)
+        problems = budget.violations()
+        if problems:
+            raise QueryBudgetExceeded("Query budget exceeded:\n  " + "\n  ".join(problems))
+
+
+class QueryProfilingStage(PipelineStage):
+    """Request pipeline stage scoping profiled statements to the current request"""
+
+    def __init__(self, profiler: Optional[QueryProfiler] = None):
+        self.profiler = profiler or query_profiler
+
+    async def on_request(self, ctx: RequestContext) -> None:
+        ctx.state["queries"], ctx.state["queries_token"] = self.profiler.begin_request(ctx.request_id)
+        return None
+
+    async def on_complete(self, ctx: RequestContext) -> None:
+        self.profiler.end_request(ctx.state["queries"], ctx.state["queries_token"], ctx.route_template)
+
+
+def _create_query_profiler() -> QueryProfiler:
+    from app.core.config import settings
+    profiler = QueryProfiler(
+        n_plus_one_threshold=settings.DB_N_PLUS_ONE_THRESHOLD,
+        slow_query_threshold_ms=settings.DB_SLOW_QUERY_THRESHOLD * 1000
+    )
+    profiler.enabled = settings.DB_QUERY_PROFILER_ENABLED
+    return profiler
+
+
+# Global profiler instance
+query_profiler = _create_query_profiler()
@@ -0,0 +1,291 @@
+# backend/app/core/rate_limiter.py
+"""
+Distributed token-bucket rate limiter
+Buckets live in Redis and are updated by one atomic Lua script, so limits hold
+across every worker process. Each process leases a few extra tokens when it
+talks to Redis and spends them locally, so most requests never leave the
+process. When Redis is unavailable or slow the limiter fails open.
+
+Worst-case overshoot is one unused lease per process per bucket; leases expire
+after ``lease_ttl`` seconds so an idle process cannot hoard tokens.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.core.cache_patterns import CachePatterns
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1] bucket hash; ARGV capacity, refill per second, cost, tokens wanted (cost + lease)
+# Returns {granted, tokens left, retry after seconds} as strings (Lua numbers
+# would be truncated to integers in the reply)
+TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local want = tonumber(ARGV[4])
+
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil then
+  tokens = capacity
+  ts = now
+end
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+local granted = 0
+local retry_after = 0
+if tokens >= cost then
+  granted = math.min(tokens, want)
+  tokens = tokens - granted
+else
+  retry_after = (cost - tokens) / rate
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000) + 1000)
+return {tostring(granted), tostring(tokens), tostring(retry_after)}
+"""
+
+KEY_DIMENSIONS = ("user", "ip", "route")
+
+
+@dataclass
+class RateLimitPolicy:
+    """
+    A token bucket applied to requests grouped by ``key_by`` dimensions
+
+    Args:
+        name: Policy name, part of the bucket key and reported on 429s
+        capacity: Bucket size (burst)
+        refill_per_second: Sustained rate
+        key_by: Any of "user", "ip", "route"; the policy is skipped when a
+            dimension is unknown (e.g. "user" for anonymous requests)
+        route_costs: Path prefix -> token cost; longest matching prefix wins
+        default_cost: Cost of requests no prefix matches (0 skips the policy)
+        lease: Extra tokens taken per Redis call and spent locally
+        anonymous_only: Apply only when the request has no user
+    """
+    name: str
+    capacity: float
+    refill_per_second: float
+    key_by: Tuple[str, ...] = ("ip",)
+    route_costs: Dict[str, float] = field(default_factory=dict)
+    default_cost: float = 1.0
+    lease: float = 0.0
+    anonymous_only: bool = False
+
+    def __post_init__(self):
+        unknown = set(self.key_by) - set(KEY_DIMENSIONS)
+        if unknown:
+            raise ValueError(f"Unknown rate limit dimensions: {sorted(unknown)}")
+        # Longest prefix first
+        self._prefixes = sorted(self.route_costs.items(), key=lambda item: len(item[0]), reverse=True)
+
+    def cost_for(self, path: str) -> float:
+        for prefix, cost in self._prefixes:
+            if path.startswith(prefix):
+                return cost
+        return self.default_cost
+
+    def bucket_id(self, identity: Dict[str, Optional[str]]) -> Optional[str]:
+        """Bucket identifier for this request, or None if the policy does not apply"""
+        if self.anonymous_only and identity.get("user"):
+            return None
+        parts = []
+        for dimension in self.key_by:
+            value = identity.get(dimension)
+            if not value:
+                return None
+            parts.append(f"{dimension}={value}")
+        return "|".join(parts)
+
+
+@dataclass
+class RateLimitDecision:
+    """Outcome of a rate limit check"""
+    allowed: bool
+    policy: Optional[str] = None
+    retry_after: float = 0.0
+    remaining: Optional[float] = None
+    fail_open: bool = False
+
+    @property
+    def retry_after_header(self) -> str:
+        return str(max(1, math.ceil(self.retry_after)))
+
+
+class DistributedRateLimiter:
+    """Evaluates rate limit policies against Redis token buckets with local leases"""
+
+    def __init__(self, policies: Sequence[RateLimitPolicy], redis_service=None,
+                 redis_timeout: float = 0.05, lease_ttl: float = 1.0, max_local_buckets: int = 50000):
+        self.policies: List[RateLimitPolicy] = list(policies)
+        self._redis_service = redis_service
+        self.redis_timeout = redis_timeout
+        self.lease_ttl = lease_ttl
+        self.max_local_buckets = max_local_buckets
+        # bucket key -> [leased tokens, lease expiry, blocked until, blocked cost]
+        self._local: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._script = None
+        self._script_client = None
+        self._last_fail_open_log = 0.0
+        self.stats = {
+            "checks": 0,
+            "local_grants": 0,
+            "local_denials": 0,
+            "redis_calls": 0,
+            "denied": 0,
+            "fail_open": 0
+        }
+
+    @property
+    def redis_service(self):
+        if self._redis_service is None:
+            # Lazy import: app.services pulls in the full service layer
+            from app.services.redis_service import redis_service
+            self._redis_service = redis_service
+        return self._redis_service
+
+    async def check(self, identity: Dict[str, Optional[str]], path: str) -> RateLimitDecision:
+        """
+        Check every applicable policy for one request
+
+        Args:
+            identity: {"user", "ip", "route"} values; missing ones disable policies keyed by them
+            path: Request path, used for route cost weights
+        """
+        self.stats["checks"] += 1
+        decision = RateLimitDecision(allowed=True)
+
+        for policy in self.policies:
+            bucket_id = policy.bucket_id(identity)
+            cost = policy.cost_for(path)
+            if bucket_id is None or cost <= 0:
+                continue
+
+            result = await self._consume(policy, CachePatterns.system_rate_limit_bucket(policy.name, bucket_id), cost)
+            if not result.allowed:
+                self.stats["denied"] += 1
+                return result
+            if result.fail_open:
+                decision.fail_open = True
+            if result.remaining is not None and (decision.remaining is None or result.remaining < decision.remaining):
+                decision.remaining = result.remaining
+                decision.policy = policy.name
+
+        return decision
+
+    async def _consume(self, policy: RateLimitPolicy, key: str, cost: float) -> RateLimitDecision:
+        now = time.monotonic()
+        local = self._local.get(key)
+
+        if local is not None:
+            leased, lease_expires, blocked_until, blocked_cost = local
+            if now < blocked_until and cost >= blocked_cost:
+                self.stats["local_denials"] += 1
+                return RateLimitDecision(allowed=False, policy=policy.name, retry_after=blocked_until - now)
+            if now < lease_expires and leased >= cost:
+                local[0] = leased - cost
+                self._local.move_to_end(key)
+                self.stats["local_grants"] += 1
+                return RateLimitDecision(allowed=True, policy=policy.name, remaining=local[0])
+
+        reply = await self._call_bucket(policy, key, cost, cost + policy.lease)
+        if reply is None:
+            return RateLimitDecision(allowed=True, policy=policy.name, fail_open=True)
+
+        granted, remaining, retry_after = reply
+        if granted < cost:
+            self._store_local(key, 0.0, now, now + retry_after, cost)
+            return RateLimitDecision(allowed=False, policy=policy.name, retry_after=retry_after, remaining=remaining)
+
+        self._store_local(key, granted - cost, now + self.lease_ttl, 0.0, 0.0)
+        return RateLimitDecision(allowed=True, policy=policy.name, remaining=remaining + granted - cost)
+
+    def _store_local(self, key: str, leased: float, lease_expires: float,
+                     blocked_until: float, blocked_cost: float) -> None:
+        self._local[key] = [leased, lease_expires, blocked_until, blocked_cost]
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_local_buckets:
+            self._local.popitem(last=False)
+
+    async def _call_bucket(self, policy: RateLimitPolicy, key: str, cost: float,
+                           want: float) -> Optional[Tuple[float, float, float]]:
+        """Run the Lua bucket; None means Redis is unavailable (fail open)"""
+        service = self.redis_service
+        if not service.is_available:
+            self._fail_open("Redis not initialized")
+            return None
+
+        try:
+            client = service.redis_client
+            if self._script is None or self._script_client is not client:
+                self._script = client.register_script(TOKEN_BUCKET_LUA)
+                self._script_client = client
+
+            self.stats["redis_calls"] += 1
+            reply = await asyncio.wait_for(
+                self._script(keys=[key], args=[policy.capacity, policy.refill_per_second, cost, want]),
+                timeout=self.redis_timeout
+            )
+            return tuple(float(value) for value in reply)
+        except Exception as e:
+            self._fail_open(f"{type(e).__name__}: {e}")
+            return None
+
+    def _fail_open(self, reason: str) -> None:
+        self.stats["fail_open"] += 1
+        now = time.monotonic()
+        if now - self._last_fail_open_log > 60:
+            self._last_fail_open_log = now
+            logger.warning(f"⚠️ Rate limiter failing open: {reason}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        checks = self.stats["checks"]
+        return {
+            **self.stats,
+            "local_buckets": len(self._local),
+            "local_grant_rate": self.stats["local_grants"] / checks if checks else 0.0,
+            "policies": [policy.name for policy in self.policies]
+        }
+
+
+# Default API policies: authenticated users get a per-user budget with AI routes
+# weighted by cost; anonymous clients fall back to a per-IP budget
+DEFAULT_RATE_LIMIT_POLICIES = [
+    RateLimitPolicy(
+        name="user",
+        capacity=120,
+        refill_per_second=2.0,
+        key_by=("user",),
+        route_costs={
+            "/api/v1/ai/": 10,
+            "/api/v1/chat/": 5,
+            "/api/v1/psychology/": 3,
+            "/api/v1/entries/search": 2,
+        },
+        lease=5
+    ),
+    RateLimitPolicy(
+        name="ip",
+        capacity=100,
+        refill_per_second=100 / 60,
+        key_by=("ip",),
+        anonymous_only=True,
+        lease=5
+    ),
+]
+
+# Global rate limiter instance
+rate_limiter = DistributedRateLimiter(DEFAULT_RATE_LIMIT_POLICIES)
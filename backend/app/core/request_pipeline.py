@@ -0,0 +1,144 @@
+# backend/app/core/request_pipeline.py
+"""
+Single-pass ASGI request pipeline
+Runs tracing, security headers, security logging and rate limiting as stages
+of one pure-ASGI middleware instead of stacked BaseHTTPMiddleware layers.
+
+- No per-layer task/stream wrapping: messages are forwarded as they arrive,
+  so streaming responses stay streaming
+- One request id per request, shared by every stage
+- Metric names use the matched route template, not the raw path
+"""
+
+import logging
+import re
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# Accept caller-supplied request ids only in a safe, bounded form
+_REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9._\-]{8,128}$")
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class RequestContext:
+    """Per-request state shared by all pipeline stages"""
+
+    __slots__ = (
+        "scope", "request_id", "method", "path", "headers", "client_host",
+        "started_at", "start_time", "response_started_at", "status_code",
+        "response_size", "error", "state"
+    )
+
+    def __init__(self, scope: Scope):
+        self.scope = scope
+        self.method: str = scope["method"]
+        self.path: str = scope["path"]
+        self.headers: Dict[str, str] = {
+            key.decode("latin-1"): value.decode("latin-1") for key, value in scope.get("headers", [])
+        }
+        client = scope.get("client")
+        self.client_host: str = client[0] if client else "unknown"
+
+        incoming_id = self.headers.get("x-request-id", "")
+        self.request_id: str = incoming_id if _REQUEST_ID_PATTERN.match(incoming_id) else str(uuid.uuid4())
+
+        self.started_at = datetime.utcnow()
+        self.start_time = time.perf_counter()
+        self.response_started_at: Optional[float] = None
+        self.status_code: Optional[int] = None
+        self.response_size = 0
+        self.error: Optional[str] = None
+        self.state: Dict[str, Any] = {}
+
+        # Expose the id to handlers as request.state.request_id
+        scope.setdefault("state", {})["request_id"] = self.request_id
+
+    @property
+    def route_template(self) -> str:
+        """Matched route path template (e.g. /api/v1/entries/{entry_id}), set by the router"""
+        route = self.scope.get("route")
+        if route is None:
+            return UNMATCHED_ROUTE
+        return getattr(route, "path_format", None) or getattr(route, "path", None) or UNMATCHED_ROUTE
+
+    @property
+    def duration_ms(self) -> float:
+        return (time.perf_counter() - self.start_time) * 1000
+
+
+class PipelineStage:
+    """
+    One concern of the request pipeline
+
+    on_request may return an ASGI response to short-circuit the request; later
+    stages and the application are then skipped. Stages that ran on_request
+    get on_response_start (mutable response headers) and on_complete.
+    """
+
+    async def on_request(self, ctx: RequestContext) -> Optional[ASGIApp]:
+        return None
+
+    def on_response_start(self, ctx: RequestContext, headers: MutableHeaders) -> None:
+        pass
+
+    async def on_complete(self, ctx: RequestContext) -> None:
+        pass
+
+
+class RequestPipelineMiddleware:
+    """Pure ASGI middleware running a sequence of PipelineStage objects in one pass"""
+
+    def __init__(self, app: ASGIApp, stages: Sequence[PipelineStage]):
+        self.app = app
+        self.stages: List[PipelineStage] = list(stages)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        ctx = RequestContext(scope)
+        entered: List[PipelineStage] = []
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                ctx.status_code = message["status"]
+                ctx.response_started_at = time.perf_counter()
+                headers = MutableHeaders(scope=message)
+                for stage in entered:
+                    stage.on_response_start(ctx, headers)
+            elif message["type"] == "http.response.body":
+                ctx.response_size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            response = None
+            for stage in self.stages:
+                entered.append(stage)
+                response = await stage.on_request(ctx)
+                if response is not None:
+                    break
+
+            if response is not None:
+                await response(scope, receive, send_wrapper)
+            else:
+                await self.app(scope, receive, send_wrapper)
+
+        except Exception as e:
+            ctx.error = str(e)
+            raise
+
+        finally:
+            for stage in reversed(entered):
+                try:
+                    await stage.on_complete(ctx)
+                except Exception as e:
+                    logger.error(f"❌ Request pipeline stage {type(stage).__name__} failed: {e}")
@@ -0,0 +1,121 @@
+# backend/app/core/request_timing.py
+"""
+Request-scoped latency breakdown
+Collects time spent in the database, Redis, model inference, LLM generation and
+the vector store for the current request, so a slow request shows where its
+time went (Server-Timing header and sampled slow-request log).
+
+- The tracing stage opens one RequestTimings per request in a contextvar
+- Instrumented code calls timing_span()/record_span(); outside a request both
+  are no-ops, so Celery tasks and startup code pay nothing
+- Child tasks inherit the contextvar and add to the same collector; spans of
+  concurrent tasks overlap, so categories can add up to more than wall time
+- Work sent to a thread pool is only attributed when the context is copied
+  (asyncio.to_thread); time the awaiting coroutine instead
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+# Span categories; model spans are suffixed with the model key (model.emotion_classifier)
+SPAN_DB = "db"
+SPAN_CACHE = "cache"
+SPAN_MODEL = "model"
+SPAN_LLM = "llm"
+SPAN_VECTOR = "vector"
+
+_timings_var: ContextVar[Optional["RequestTimings"]] = ContextVar("request_timings", default=None)
+
+
+class RequestTimings:
+    """Accumulated duration and call count per span name for one request"""
+
+    __slots__ = ("durations_ms", "counts")
+
+    def __init__(self):
+        self.durations_ms: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+
+    def record(self, name: str, duration_ms: float) -> None:
+        self.durations_ms[name] = self.durations_ms.get(name, 0.0) + duration_ms
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+    def breakdown(self) -> Dict[str, Dict[str, Any]]:
+        """Spans ordered by time spent, e.g. {"db": {"ms": 12.3, "count": 4}}"""
+        return {
+            name: {"ms": round(duration, 2), "count": self.counts[name]}
+            for name, duration in sorted(self.durations_ms.items(), key=lambda item: -item[1])
+        }
+
+    def server_timing(self, total_ms: Optional[float] = None) -> str:
+        """Server-Timing header value; desc carries the call count"""
+        metrics = [
+            f'{name};dur={duration:.1f};desc="{self.counts[name]}x"'
+            for name, duration in sorted(self.durations_ms.items(), key=lambda item: -item[1])
+        ]
+        if total_ms is not None:
+            metrics.append(f"total;dur={total_ms:.1f}")
+        return ", ".join(metrics)
+
+
+def start_request_timings() -> Tuple[RequestTimings, Token]:
+    """Open a collector for the current request; pass the token to end_request_timings"""
+    timings = RequestTimings()
+    return timings, _timings_var.set(timings)
+
+
+def end_request_timings(token: Token) -> None:
+    _timings_var.reset(token)
+
+
+def get_request_timings() -> Optional[RequestTimings]:
+    """Collector of the current request, or None outside a request"""
+    return _timings_var.get()
+
+
+def record_span(name: str, duration_ms: float) -> None:
+    """Add an externally measured duration to the current request"""
+    timings = _timings_var.get()
+    if timings is not None:
+        timings.record(name, duration_ms)
+
+
+@contextmanager
+def timing_span(name: str) -> Iterator[None]:
+    """Time a block (sync or inside a coroutine) into the current request's breakdown"""
+    timings = _timings_var.get()
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.record(name, (time.perf_counter() - start) * 1000)
+
+
+def instrument_engine(sync_engine) -> None:
+    """Attribute every statement executed on an engine to the request's db span"""
+    from sqlalchemy import event
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _start_statement_timer(conn, cursor, statement, parameters, context, executemany):
+        if _timings_var.get() is not None:
+            conn.info.setdefault("request_timing_starts", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _stop_statement_timer(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("request_timing_starts")
+        if starts:
+            record_span(SPAN_DB, (time.perf_counter() - starts.pop()) * 1000)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _stop_failed_statement_timer(exception_context):
+        # A failed statement never reaches after_cursor_execute
+        connection = exception_context.connection
+        if connection is not None:
+            starts = connection.info.get("request_timing_starts")
+            if starts:
+                record_span(SPAN_DB, (time.perf_counter() - starts.pop()) * 1000)
@@ -1,22 +1,22 @@
 # backend/app/core/request_tracing.py
 """
-Request Tracing and Observability Middleware
-Provides distributed tracing, request ID generation, and performance tracking
+Request Tracing and Observability
+Request pipeline stage providing tracing, request context and performance tracking
 """
 
-import time
-import uuid
 import logging
-from typing import Callable, Optional, Dict, Any
+import random
+from collections import OrderedDict
+from typing import Optional, Dict, Any
 from contextvars import ContextVar
 from dataclasses import dataclass
 from datetime import datetime
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.datastructures import MutableHeaders
 
 from app.core.performance_monitor import performance_monitor
+from app.core.request_pipeline import PipelineStage, RequestContext
+from app.core.request_timing import end_request_timings, start_request_timings
 
 # Context variables for request tracking
 request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
@@ -41,120 +41,113 @@ class RequestTrace:
     status_code: Optional[int] = None
     response_size: Optional[int] = None
     error: Optional[str] = None
+    route: Optional[str] = None
 
-class RequestTracingMiddleware(BaseHTTPMiddleware):
-    """Middleware for request tracing and performance monitoring"""
+class RequestTracingStage(PipelineStage):
+    """Request pipeline stage for request tracing and performance monitoring"""
     
-    def __init__(self, app: ASGIApp, enable_detailed_logging: bool = True):
-        super().__init__(app)
+    def __init__(self, enable_detailed_logging: bool = True, max_traces: int = 1000,
+                 enable_server_timing: bool = True, slow_request_threshold_ms: float = 1000.0,
+                 slow_request_sample_rate: float = 0.1):
         self.enable_detailed_logging = enable_detailed_logging
-        self.traces: Dict[str, RequestTrace] = {}
-        
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Process request with tracing and monitoring"""
-        # Generate unique request ID
-        request_id = str(uuid.uuid4())
-        request_id_var.set(request_id)
+        self.max_traces = max_traces
+        self.traces: "OrderedDict[str, RequestTrace]" = OrderedDict()
+        self.enable_server_timing = enable_server_timing
+        self.slow_request_threshold_ms = slow_request_threshold_ms
+        self.slow_request_sample_rate = slow_request_sample_rate
+    
+    async def on_request(self, ctx: RequestContext) -> None:
+        """Bind request context, open a trace record and the latency breakdown"""
+        request_id_var.set(ctx.request_id)
+        ctx.state["timings"], ctx.state["timings_token"] = start_request_timings()
         
-        # Extract user context from headers or auth
-        user_id = request.headers.get("X-User-ID")
-        session_id = request.headers.get("X-Session-ID")
+        # Extract user context from headers
+        user_id = ctx.headers.get("x-user-id")
+        session_id = ctx.headers.get("x-session-id")
         
-        if user_id:
-            user_id_var.set(user_id)
-        if session_id:
-            session_id_var.set(session_id)
+        user_id_var.set(user_id)
+        session_id_var.set(session_id)
         
-        # Create trace record
         trace = RequestTrace(
-            request_id=request_id,
-            method=request.method,
-            path=request.url.path,
-            user_agent=request.headers.get("User-Agent"),
-            ip_address=self._get_client_ip(request),
+            request_id=ctx.request_id,
+            method=ctx.method,
+            path=ctx.path,
+            user_agent=ctx.headers.get("user-agent"),
+            ip_address=self._get_client_ip(ctx),
             user_id=user_id,
             session_id=session_id,
-            start_time=datetime.utcnow()
+            start_time=ctx.started_at
         )
+        ctx.state["trace"] = trace
         
-        # Store trace
-        self.traces[request_id] = trace
+        self.traces[ctx.request_id] = trace
+        # Keep the most recent traces only
+        while len(self.traces) > self.max_traces:
+            self.traces.popitem(last=False)
+        return None
+    
+    def on_response_start(self, ctx: RequestContext, headers: MutableHeaders) -> None:
+        """Add tracing headers; the response time is time to first byte"""
+        duration_ms = ctx.duration_ms
+        headers["X-Request-ID"] = ctx.request_id
+        headers["X-Response-Time"] = f"{duration_ms:.2f}ms"
+        if self.enable_server_timing:
+            headers.append("Server-Timing", ctx.state["timings"].server_timing(duration_ms))
+    
+    async def on_complete(self, ctx: RequestContext) -> None:
+        """Close the trace and record metrics under the route template"""
+        trace: RequestTrace = ctx.state["trace"]
+        trace.end_time = datetime.utcnow()
+        trace.duration_ms = ctx.duration_ms
+        trace.status_code = ctx.status_code
+        trace.response_size = ctx.response_size
+        trace.route = ctx.route_template
+        trace.error = ctx.error
+        end_request_timings(ctx.state["timings_token"])
         
-        # Add request ID to response headers
-        start_time = time.time()
+        trace_metrics.record_request(trace)
+        await performance_monitor.record_timing(
+            f"request_{ctx.method}_{trace.route}",
+            trace.duration_ms,
+            tags={
+                "method": ctx.method,
+                "route": trace.route,
+                "status": str(ctx.status_code or 500)
+            },
+            error=ctx.error
+        )
         
-        try:
-            # Use performance monitor for timing
-            async with performance_monitor.timed_operation(
-                f"request_{request.method}_{request.url.path}",
-                tags={
-                    "method": request.method,
-                    "path": request.url.path,
-                    "user_id": user_id or "anonymous",
-                    "request_id": request_id
-                }
-            ):
-                response = await call_next(request)
-            
-            # Record successful completion
-            trace.end_time = datetime.utcnow()
-            trace.duration_ms = (time.time() - start_time) * 1000
-            trace.status_code = response.status_code
-            trace.response_size = int(response.headers.get("content-length", 0))
-            
-            # Add tracing headers to response
-            response.headers["X-Request-ID"] = request_id
-            response.headers["X-Response-Time"] = f"{trace.duration_ms:.2f}ms"
-            
-            # Log request completion
-            if self.enable_detailed_logging:
-                self._log_request_completion(trace)
-            
-            return response
-            
-        except Exception as e:
-            # Record error
-            trace.end_time = datetime.utcnow()
-            trace.duration_ms = (time.time() - start_time) * 1000
-            trace.error = str(e)
-            
-            # Log error
+        if ctx.error:
             logger.error(
-                f"Request failed: {request.method} {request.url.path}",
+                f"Request failed: {ctx.method} {ctx.path}",
                 extra={
-                    "request_id": request_id,
-                    "user_id": user_id,
-                    "session_id": session_id,
+                    "request_id": ctx.request_id,
+                    "user_id": trace.user_id,
+                    "session_id": trace.session_id,
                     "duration_ms": trace.duration_ms,
-                    "error": str(e)
+                    "error": ctx.error
                 }
             )
-            
-            raise
+        elif self.enable_detailed_logging:
+            self._log_request_completion(trace)
         
-        finally:
-            # Clean up old traces (keep last 1000)
-            if len(self.traces) > 1000:
-                oldest_keys = list(self.traces.keys())[:100]
-                for key in oldest_keys:
-                    del self.traces[key]
+        if (trace.duration_ms >= self.slow_request_threshold_ms
+                and random.random() < self.slow_request_sample_rate):
+            self._log_slow_request_breakdown(trace, ctx.state["timings"].breakdown())
     
-    def _get_client_ip(self, request: Request) -> str:
+    def _get_client_ip(self, ctx: RequestContext) -> str:
         """Extract client IP address from request"""
         # Check for forwarded headers first (load balancer/proxy)
-        forwarded_for = request.headers.get("X-Forwarded-For")
+        forwarded_for = ctx.headers.get("x-forwarded-for")
         if forwarded_for:
             return forwarded_for.split(",")[0].strip()
         
-        real_ip = request.headers.get("X-Real-IP")
+        real_ip = ctx.headers.get("x-real-ip")
         if real_ip:
             return real_ip
         
         # Fall back to direct client IP
-        if hasattr(request.client, "host"):
-            return request.client.host
-        
-        return "unknown"
+        return ctx.client_host
     
     def _log_request_completion(self, trace: RequestTrace) -> None:
         """Log request completion with structured data"""
@@ -185,6 +178,21 @@ class RequestTracingMiddleware(BaseHTTPMiddleware):
             }
         )
     
+    def _log_slow_request_breakdown(self, trace: RequestTrace, breakdown: Dict[str, Dict[str, Any]]) -> None:
+        """Log where a slow request spent its time (sampled)"""
+        summary = ", ".join(f"{name}={span['ms']:.0f}ms/{span['count']}" for name, span in breakdown.items())
+        logger.warning(
+            f"🐢 Slow request {trace.method} {trace.route} - {trace.duration_ms:.0f}ms "
+            f"[{summary or 'no instrumented spans'}]",
+            extra={
+                "request_id": trace.request_id,
+                "route": trace.route,
+                "status_code": trace.status_code,
+                "duration_ms": trace.duration_ms,
+                "timings": breakdown
+            }
+        )
+    
     def get_active_traces(self) -> Dict[str, RequestTrace]:
         """Get currently active traces"""
         return self.traces.copy()
@@ -231,8 +239,8 @@ class TraceMetrics:
     
     def record_request(self, trace: RequestTrace) -> None:
         """Record request metrics"""
-        # Count requests by path
-        path_key = f"{trace.method} {trace.path}"
+        # Count requests by route template (raw paths would create a key per id)
+        path_key = f"{trace.method} {trace.route or trace.path}"
         self.request_counts[path_key] = self.request_counts.get(path_key, 0) + 1
         
         # Record response time
@@ -272,14 +280,14 @@ class TraceMetrics:
 # Global tracing metrics instance
 trace_metrics = TraceMetrics()
 
-# Global middleware instance for access to traces
-request_tracer: Optional[RequestTracingMiddleware] = None
+# Global tracing stage instance for access to traces
+request_tracer: Optional[RequestTracingStage] = None
 
-def get_request_tracer() -> Optional[RequestTracingMiddleware]:
+def get_request_tracer() -> Optional[RequestTracingStage]:
     """Get the global request tracer instance"""
     return request_tracer
 
-def set_request_tracer(tracer: RequestTracingMiddleware) -> None:
+def set_request_tracer(tracer: RequestTracingStage) -> None:
     """Set the global request tracer instance"""
     global request_tracer
     request_tracer = tracer
\ No newline at end of file
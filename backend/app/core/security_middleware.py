@@ -1,36 +1,36 @@
 # backend/app/core/security_middleware.py
 """
-Security middleware for adding security headers and protection.
+Security stages for the request pipeline: security headers, security logging
+and distributed rate limiting.
 """
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response as StarletteResponse
-from typing import Callable
+from starlette.datastructures import MutableHeaders
+from starlette.routing import Match
+from fastapi.responses import JSONResponse
+from jose import JWTError, jwt
+from typing import Optional
+import logging
 import uuid
 
+from app.core.config import settings
+from app.core.rate_limiter import DistributedRateLimiter, rate_limiter
+from app.core.request_pipeline import PipelineStage, RequestContext
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+
+security_logger = logging.getLogger("security")
+
+
+class SecurityHeadersStage(PipelineStage):
     """
-    Middleware to add security headers to all responses.
+    Pipeline stage adding security headers to all responses.
     """
-    
-    def __init__(self, app, nonce_generator: bool = True):
-        super().__init__(app)
+
+    def __init__(self, nonce_generator: bool = True):
         self.nonce_generator = nonce_generator
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Add security headers to response."""
-        
-        response = await call_next(request)
-        
-        # Generate CSP nonce for dynamic content
-        nonce = str(uuid.uuid4()) if self.nonce_generator else None
-        
-        # Content Security Policy - strict but functional
-        csp_directives = [
-            "default-src 'self'",
-            "script-src 'self' 'unsafe-eval'" + (f" 'nonce-{nonce}'" if nonce else ""),
+
+        # Content Security Policy - strict but functional; only the nonce varies per request
+        self._csp_script_src = "script-src 'self' 'unsafe-eval'"
+        self._csp_rest = "; ".join([
             "style-src 'self' 'unsafe-inline' fonts.googleapis.com",
             "font-src 'self' fonts.gstatic.com",
             "img-src 'self' data: blob:",
@@ -40,149 +40,161 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
             "form-action 'self'",
             "frame-ancestors 'none'",
             "connect-src 'self' http://localhost:8000 ws://localhost:*"
-        ]
-        
-        security_headers = {
-            # Content Security Policy
-            "Content-Security-Policy": "; ".join(csp_directives),
-            
+        ])
+
+        self.static_headers = {
             # Clickjacking protection
             "X-Frame-Options": "DENY",
-            
+
             # XSS Protection
             "X-XSS-Protection": "1; mode=block",
-            
+
             # Content type sniffing protection
             "X-Content-Type-Options": "nosniff",
-            
+
             # Referrer policy
             "Referrer-Policy": "strict-origin-when-cross-origin",
-            
+
             # Permissions policy (formerly Feature-Policy)
             "Permissions-Policy": "camera=(), microphone=(), geolocation=(), payment=()",
-            
+
             # HSTS (HTTP Strict Transport Security) - only for HTTPS
             # Note: Only enable in production with HTTPS
             # "Strict-Transport-Security": "max-age=31536000; includeSubDomains; preload",
-            
+
             # Server information hiding
             "Server": "FastAPI",
-            
-            # Cache control for sensitive endpoints
-            "Cache-Control": "no-cache, no-store, must-revalidate" if request.url.path.startswith("/api/v1/auth") else "public, max-age=300"
         }
-        
-        # Add security headers
-        for header, value in security_headers.items():
-            response.headers[header] = value
-        
-        # Add nonce to request state if generated
-        if nonce:
-            request.state.csp_nonce = nonce
-        
-        return response
-
-
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+
+    async def on_request(self, ctx: RequestContext) -> None:
+        """Generate the CSP nonce before the handler runs so it can use request.state.csp_nonce."""
+        if self.nonce_generator:
+            nonce = str(uuid.uuid4())
+            ctx.state["csp_nonce"] = nonce
+            ctx.scope["state"]["csp_nonce"] = nonce
+        return None
+
+    def on_response_start(self, ctx: RequestContext, headers: MutableHeaders) -> None:
+        """Add security headers to response."""
+        nonce = ctx.state.get("csp_nonce")
+        script_src = self._csp_script_src + (f" 'nonce-{nonce}'" if nonce else "")
+        headers["Content-Security-Policy"] = f"default-src 'self'; {script_src}; {self._csp_rest}"
+
+        for header, value in self.static_headers.items():
+            headers[header] = value
+
+        # Cache control for sensitive endpoints
+        headers["Cache-Control"] = (
+            "no-cache, no-store, must-revalidate" if ctx.path.startswith("/api/v1/auth")
+            else "public, max-age=300"
+        )
+
+
+class SecurityLoggingStage(PipelineStage):
     """
-    Middleware for security-focused request logging.
+    Pipeline stage for security-focused request logging.
     """
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+
+    sensitive_paths = ("/auth/", "/admin/", "/api/v1/auth/")
+
+    async def on_request(self, ctx: RequestContext) -> None:
         """Log requests for security monitoring."""
-        
-        # Generate request ID for tracking
-        request_id = str(uuid.uuid4())
-        request.state.request_id = request_id
-        
-        # Get client info
-        client_ip = request.client.host if request.client else "unknown"
-        user_agent = request.headers.get("user-agent", "unknown")
-        
-        # Log security-relevant requests
-        sensitive_paths = ["/auth/", "/admin/", "/api/v1/auth/"]
-        is_sensitive = any(path in str(request.url) for path in sensitive_paths)
-        
+        is_sensitive = any(path in ctx.path for path in self.sensitive_paths)
+        ctx.state["security_sensitive"] = is_sensitive
+
         if is_sensitive:
-            # This would typically go to a security log
-            import logging
-            security_logger = logging.getLogger("security")
+            user_agent = ctx.headers.get("user-agent", "unknown")
             security_logger.info(
-                f"Request {request_id}: {request.method} {request.url} "
-                f"from {client_ip} ({user_agent[:100]})"
+                f"Request {ctx.request_id}: {ctx.method} {ctx.path} "
+                f"from {ctx.client_host} ({user_agent[:100]})"
             )
-        
-        try:
-            response = await call_next(request)
-            
-            # Log failed authentication attempts
-            if (is_sensitive and 
-                response.status_code in [401, 403, 429]):
-                security_logger.warning(
-                    f"Security event {request_id}: Status {response.status_code} "
-                    f"for {request.method} {request.url} from {client_ip}"
-                )
-            
-            return response
-            
-        except Exception as e:
-            # Log exceptions in sensitive endpoints
-            if is_sensitive:
-                security_logger.error(
-                    f"Exception in {request_id}: {str(e)} "
-                    f"for {request.method} {request.url} from {client_ip}"
-                )
-            raise
-
-
-class RateLimitingMiddleware(BaseHTTPMiddleware):
-    """
-    Simple rate limiting middleware for API protection.
+        return None
+
+    async def on_complete(self, ctx: RequestContext) -> None:
+        """Log failed authentication attempts and exceptions in sensitive endpoints."""
+        if not ctx.state.get("security_sensitive"):
+            return
+
+        if ctx.error:
+            security_logger.error(
+                f"Exception in {ctx.request_id}: {ctx.error} "
+                f"for {ctx.method} {ctx.path} from {ctx.client_host}"
+            )
+        elif ctx.status_code in (401, 403, 429):
+            security_logger.warning(
+                f"Security event {ctx.request_id}: Status {ctx.status_code} "
+                f"for {ctx.method} {ctx.path} from {ctx.client_host}"
+            )
+
+
+class RateLimitingStage(PipelineStage):
     """
+    Distributed rate limiting stage for API protection.
     
-    def __init__(self, app, requests_per_minute: int = 100):
-        super().__init__(app)
-        self.requests_per_minute = requests_per_minute
-        self.client_requests = {}  # In production, use Redis or similar
-        
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Apply rate limiting based on client IP."""
-        
-        client_ip = request.client.host if request.client else "unknown"
-        
+    Requests are identified by user (from a valid bearer token), client IP and,
+    for policies that need it, the matched route template.
+    """
+
+    exempt_paths = ("/health", "/api/v1/health")
+
+    def __init__(self, limiter: Optional[DistributedRateLimiter] = None):
+        self.limiter = limiter or rate_limiter
+        self.needs_route = any("route" in policy.key_by for policy in self.limiter.policies)
+
+    async def on_request(self, ctx: RequestContext) -> Optional[JSONResponse]:
+        """Apply rate limit policies; respond 429 with Retry-After when a bucket is empty."""
         # Skip rate limiting for health checks
-        if request.url.path in ["/health", "/api/v1/health"]:
-            return await call_next(request)
-        
-        # Simple sliding window rate limiting
-        import time
-        current_time = int(time.time() / 60)  # Current minute
-        
-        if client_ip not in self.client_requests:
-            self.client_requests[client_ip] = {}
-        
-        # Clean old entries (keep last 2 minutes)
-        old_minutes = [m for m in self.client_requests[client_ip] if m < current_time - 2]
-        for old_minute in old_minutes:
-            del self.client_requests[client_ip][old_minute]
-        
-        # Count requests in current minute
-        current_requests = self.client_requests[client_ip].get(current_time, 0)
-        
-        if current_requests >= self.requests_per_minute:
-            # Rate limit exceeded
-            from fastapi.responses import JSONResponse
+        if ctx.path in self.exempt_paths or ctx.method == "OPTIONS":
+            return None
+
+        identity = {
+            "user": self._get_user_id(ctx),
+            "ip": ctx.client_host,
+            "route": self._resolve_route(ctx) if self.needs_route else None
+        }
+        decision = await self.limiter.check(identity, ctx.path)
+        ctx.state["rate_limit"] = decision
+
+        if not decision.allowed:
             return JSONResponse(
                 status_code=429,
                 content={
                     "error_code": "RATE_LIMIT_EXCEEDED",
-                    "message": f"Rate limit exceeded. Maximum {self.requests_per_minute} requests per minute.",
-                    "retry_after": 60
+                    "message": f"Rate limit exceeded for policy '{decision.policy}'.",
+                    "retry_after": int(decision.retry_after_header)
                 },
-                headers={"Retry-After": "60"}
+                headers={"Retry-After": decision.retry_after_header, "X-RateLimit-Policy": decision.policy}
             )
-        
-        # Increment counter
-        self.client_requests[client_ip][current_time] = current_requests + 1
-        
-        return await call_next(request)
\ No newline at end of file
+        return None
+
+    def on_response_start(self, ctx: RequestContext, headers: MutableHeaders) -> None:
+        decision = ctx.state.get("rate_limit")
+        if decision is not None and decision.allowed and decision.remaining is not None:
+            headers["X-RateLimit-Remaining"] = str(int(decision.remaining))
+
+    @staticmethod
+    def _get_user_id(ctx: RequestContext) -> Optional[str]:
+        """User id from a valid access token; invalid or missing tokens count as anonymous"""
+        authorization = ctx.headers.get("authorization", "")
+        if not authorization.lower().startswith("bearer "):
+            return None
+        try:
+            payload = jwt.decode(
+                authorization[7:], settings.security.secret_key, algorithms=[settings.security.algorithm]
+            )
+        except JWTError:
+            return None
+        if payload.get("type") != "access":
+            return None
+        return payload.get("sub")
+
+    @staticmethod
+    def _resolve_route(ctx: RequestContext) -> Optional[str]:
+        """Route template of the request, matched ahead of the router"""
+        app = ctx.scope.get("app")
+        router = getattr(app, "router", None)
+        for route in getattr(router, "routes", []):
+            match, _ = route.matches(ctx.scope)
+            if match == Match.FULL:
+                return getattr(route, "path_format", None) or getattr(route, "path", None)
+        return None
@@ -68,6 +68,21 @@ class CacheStrategy(ABC):
         """Invalidate all keys matching pattern"""
         pass
 
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Get several cached values; missing keys are left out of the result"""
+        values = await asyncio.gather(*(self.get(key) for key in keys))
+        return {key: value for key, value in zip(keys, values) if value is not None}
+
+    async def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """Set several cached values with the same TTL"""
+        results = await asyncio.gather(*(self.set(key, value, ttl) for key, value in items.items()))
+        return all(results)
+
+    async def delete_many(self, keys: List[str]) -> int:
+        """Delete several cached values; returns the number deleted"""
+        results = await asyncio.gather(*(self.delete(key) for key in keys))
+        return sum(1 for deleted in results if deleted)
+
 class ServiceRegistry:
     """
     Service registry for dependency injection and Redis integration
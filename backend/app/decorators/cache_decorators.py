@@ -197,17 +197,18 @@ def cache_invalidate(
             # Invalidate cache patterns
             if cache_strategy and immediate:
                 try:
-                    for pattern in patterns:
-                        invalidated_count = await cache_strategy.invalidate_pattern(pattern)
+                    all_patterns = list(patterns)
+                    # Cascade invalidation if requested
+                    if cascade:
+                        for pattern in patterns:
+                            all_patterns.extend(_generate_cascade_patterns(pattern))
+                    
+                    # Patterns are independent; scan and delete them concurrently
+                    counts = await asyncio.gather(
+                        *(cache_strategy.invalidate_pattern(pattern) for pattern in all_patterns)
+                    )
+                    for pattern, invalidated_count in zip(all_patterns, counts):
                         logger.info(f"Invalidated {invalidated_count} cache keys for pattern: {pattern}")
-                        
-                        # Cascade invalidation if requested
-                        if cascade:
-                            cascade_patterns = _generate_cascade_patterns(pattern)
-                            for cascade_pattern in cascade_patterns:
-                                cascade_count = await cache_strategy.invalidate_pattern(cascade_pattern)
-                                logger.debug(f"Cascade invalidated {cascade_count} keys for: {cascade_pattern}")
-                                
                 except Exception as e:
                     logger.warning(f"Cache invalidation failed for {func.__name__}: {e}")
             
@@ -324,14 +325,16 @@ def redis_session_cache(
                     cached_result = await cache_strategy.get(session_key)
                     
                     if cached_result is not None:
-                        # Auto-refresh TTL on access
+                        # TTL refresh and activity tracking are independent writes; issued
+                        # together they share one pipelined round trip
+                        writes = []
                         if auto_refresh:
-                            await cache_strategy.expire(session_key, session_ttl)
-                        
-                        # Track activity
+                            writes.append(cache_strategy.expire(session_key, session_ttl))
                         if track_activity and session_id:
                             activity_key = f"session_activity:{session_id}"
-                            await cache_strategy.set(activity_key, time.time(), ttl=session_ttl)
+                            writes.append(cache_strategy.set(activity_key, time.time(), ttl=session_ttl))
+                        if writes:
+                            await asyncio.gather(*writes)
                         
                         return cached_result
                 
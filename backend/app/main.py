@@ -14,20 +14,23 @@ from app.core.config import settings
 from app.core.exceptions import JournalingAIException
 from app.core.database import database
 from app.core.performance_monitor import performance_monitor
+from app.core.password_hashing import password_hash_pool, PasswordHashingOverloadedError
 from app.services.unified_database_service import unified_db_service
-from app.services.redis_service_simple import simple_redis_service
+from app.services.redis_service import redis_service
 from app.core.service_interfaces import service_registry
 
 # Monitoring and observability imports
 from app.core.logging_config import setup_logging, get_logger
 from app.core.monitoring_config import monitoring_settings, create_monitoring_directories
-from app.core.request_tracing import RequestTracingMiddleware, set_request_tracer
+from app.core.request_tracing import RequestTracingStage, set_request_tracer
+from app.core.request_pipeline import RequestPipelineMiddleware
+from app.core.query_profiler import QueryProfilingStage
 
-# Security middleware imports
+# Security pipeline stage imports
 from app.core.security_middleware import (
-    SecurityHeadersMiddleware,
-    RequestLoggingMiddleware,
-    RateLimitingMiddleware
+    SecurityHeadersStage,
+    SecurityLoggingStage,
+    RateLimitingStage
 )
 
 # API routers
@@ -77,15 +80,15 @@ async def lifespan(app: FastAPI):
         await database.initialize()
         logger.info("✅ PostgreSQL database initialized")
         
-        # Initialize Simple Redis service to test recursion fix
+        # Initialize Redis; on failure it keeps reconnecting in the background and
+        # serves cache misses until then, so it is registered either way
         try:
-            await simple_redis_service.initialize()
-            logger.info("✅ Simple Redis service initialized")
-            service_registry.set_cache_strategy(simple_redis_service)
-            logger.info("✅ Simple Redis registered as caching strategy")
+            await redis_service.initialize()
+            logger.info("✅ Redis service initialized")
         except Exception as e:
-            logger.warning(f"⚠️  Simple Redis initialization failed, continuing without caching: {e}")
-            # Continue without Redis
+            logger.warning(f"⚠️  Redis unavailable, continuing without caching until it reconnects: {e}")
+        service_registry.set_cache_strategy(redis_service)
+        logger.info("✅ Redis registered as caching strategy")
         
         # Phase 2: Initialize unified database service
         logger.info("🔧 Initializing unified database service...")
@@ -97,6 +100,10 @@ async def lifespan(app: FastAPI):
         await performance_monitor.start_monitoring(interval=60)  # Monitor every minute
         logger.info("✅ Performance monitoring started")
         
+        # Start password hashing workers before the first login arrives
+        await password_hash_pool.start()
+        logger.info("✅ Password hashing pool started")
+        
         # Phase 4: Verify system health
         logger.info("🔍 Performing system health checks...")
         health_status = await unified_db_service.health_check()
@@ -142,13 +149,16 @@ async def lifespan(app: FastAPI):
             logger.info("✅ Performance monitoring stopped")
             
             # Close Redis connections
-            await simple_redis_service.close()
+            await redis_service.close()
             logger.info("✅ Redis connections closed")
             
             # Close database connections
             await database.close()
             logger.info("✅ Database connections closed")
             
+            # Stop password hashing workers
+            password_hash_pool.shutdown()
+            
             logger.info("👋 Journaling Assistant API shutdown complete")
             
         except Exception as e:
@@ -262,6 +272,18 @@ async def journaling_ai_exception_handler(request: Request, exc: JournalingAIExc
         content=exc.to_dict()
     )
 
+# Password hashing pool saturation: shed load with a retryable response
+@app.exception_handler(PasswordHashingOverloadedError)
+async def password_hashing_overloaded_handler(request: Request, exc: PasswordHashingOverloadedError):
+    """Return 503 with Retry-After while the bcrypt pool is saturated."""
+    logger.warning(f"🚦 Password hashing pool saturated, shedding {request.method} {request.url.path}")
+    
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Authentication service busy, please retry shortly"},
+        headers={"Retry-After": str(exc.retry_after)}
+    )
+
 # Pydantic validation error handler
 from fastapi.exceptions import RequestValidationError
 
@@ -309,19 +331,25 @@ async def global_exception_handler(request: Request, exc: Exception):
         }
     )
 
-# Add monitoring and security middleware (order matters - add from innermost to outermost)
-# Create and set request tracing middleware
-request_tracing_middleware = RequestTracingMiddleware(
-    app=app,
-    enable_detailed_logging=monitoring_settings.enable_detailed_request_logging
+# Monitoring and security run as stages of one pure-ASGI middleware (stage order matters)
+request_tracing_stage = RequestTracingStage(
+    enable_detailed_logging=monitoring_settings.enable_detailed_request_logging,
+    enable_server_timing=monitoring_settings.enable_server_timing,
+    slow_request_threshold_ms=monitoring_settings.response_time_warning_threshold_ms,
+    slow_request_sample_rate=monitoring_settings.slow_request_log_sample_rate
 )
-set_request_tracer(request_tracing_middleware)
+set_request_tracer(request_tracing_stage)
 
-# Add middleware in proper order
-app.add_middleware(SecurityHeadersMiddleware, nonce_generator=True)
-app.add_middleware(RequestLoggingMiddleware)
-app.add_middleware(RateLimitingMiddleware, requests_per_minute=100)
-app.add_middleware(RequestTracingMiddleware, enable_detailed_logging=monitoring_settings.enable_detailed_request_logging)
+app.add_middleware(
+    RequestPipelineMiddleware,
+    stages=[
+        request_tracing_stage,
+        QueryProfilingStage(),
+        SecurityHeadersStage(nonce_generator=True),
+        SecurityLoggingStage(),
+        RateLimitingStage()
+    ]
+)
 
 # Configure CORS for development and production with security restrictions
 app.add_middleware(
@@ -338,7 +366,7 @@ app.add_middleware(
         "X-Requested-With",
         "Cache-Control"
     ],  # Specific headers only
-    expose_headers=["X-Request-ID"],  # Only expose safe headers
+    expose_headers=["X-Request-ID", "Server-Timing"],  # Only expose safe headers
 )
 
 # Include API routers with proper ordering
@@ -428,8 +456,8 @@ async def cache_health_check():
         cache_stats = await get_cache_stats()
         
         # Get Redis info
-        redis_info = await simple_redis_service.get_info()
-        redis_metrics = await simple_redis_service.get_metrics()
+        redis_info = await redis_service.get_info()
+        redis_metrics = await redis_service.get_metrics()
         
         return {
             "status": "healthy",
@@ -11,8 +11,8 @@ Design Principles:
 """
 
 from sqlalchemy import (
-    String, Integer, DateTime, Boolean, Text, Numeric, Index,
-    ForeignKey, CheckConstraint, UniqueConstraint, func, text
+    String, Integer, DateTime, Boolean, Text, Numeric, Index, LargeBinary,
+    ForeignKey, CheckConstraint, UniqueConstraint, DDL, event, func, select, text
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID, TSVECTOR
 from sqlalchemy.ext.asyncio import AsyncAttrs
@@ -21,7 +21,7 @@ from sqlalchemy.orm import (
 )
 from sqlalchemy.sql import expression
 from sqlalchemy.ext.hybrid import hybrid_property
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
 from enum import Enum
 import uuid
@@ -274,6 +274,18 @@ class EntryTemplate(Base):
         Index('ix_templates_usage', 'usage_count', 'effectiveness_rating'),
     )
 
+# Weighted full-text document for Entry.search_vector (title > content).
+# The column is maintained by the trg_entries_search_vector trigger; keep in
+# sync with migration 8c41d2e7a9f3.
+ENTRY_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(content, '')), 'B')"
+)
+
+# GIN indexes with many keys per entry buffer inserts in a pending list;
+# keep in sync with migration c3f8a1d6e9b2
+ENTRY_DEFERRED_GIN_OPTIONS = {'fastupdate': 'on', 'gin_pending_list_limit': 16384}
+
 # Advanced Journal Entry Model
 class Entry(Base):
     """
@@ -350,7 +362,7 @@ class Entry(Base):
         nullable=True
     )
     
-    # Full-text search support
+    # Full-text search support (trigger-maintained, see ENTRY_SEARCH_VECTOR_SQL)
     search_vector: Mapped[Optional[str]] = mapped_column(TSVECTOR)
     
     # Rich metadata for psychology integration
@@ -372,7 +384,10 @@ class Entry(Base):
         cascade="all, delete-orphan"
     )
     
-    # Advanced indexing strategy
+    # Advanced indexing strategy. Every index is maintained on each insert and
+    # non-HOT update, so only indexes some query reads belong here
+    # (see index_review_service). The table's fillfactor is 85 to leave room
+    # for HOT updates of the unindexed analysis columns (migration c3f8a1d6e9b2).
     __table_args__ = (
         # Performance indexes
         Index('ix_entries_user_created', 'user_id', 'created_at'),
@@ -380,17 +395,19 @@ class Entry(Base):
         Index('ix_entries_mood_sentiment', 'mood', 'sentiment_score'),
         Index('ix_entries_favorites', 'user_id', 'is_favorite', 'created_at'),
         
-        # Full-text search indexes
-        Index('ix_entries_search_vector', 'search_vector', postgresql_using='gin'),
+        # Full-text search indexes (pending-list inserts, flushed by a beat task)
+        Index('ix_entries_search_vector', 'search_vector', postgresql_using='gin',
+              postgresql_with=ENTRY_DEFERRED_GIN_OPTIONS),
         
         # Trigram indexes for fuzzy search (requires pg_trgm extension)
         Index('ix_entries_title_trgm', 'title', postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'}),
-        Index('ix_entries_content_trgm', 'content', postgresql_using='gin', postgresql_ops={'content': 'gin_trgm_ops'}),
+        Index('ix_entries_content_trgm', 'content', postgresql_using='gin', postgresql_ops={'content': 'gin_trgm_ops'},
+              postgresql_with=ENTRY_DEFERRED_GIN_OPTIONS),
+        # GiST trigram index for KNN ordering (title <-> query)
+        Index('ix_entries_title_trgm_gist', 'title', postgresql_using='gist', postgresql_ops={'title': 'gist_trgm_ops'}),
         
         # JSONB indexes for metadata queries
         Index('ix_entries_tags_gin', 'tags', postgresql_using='gin'),
-        Index('ix_entries_psychology_gin', 'psychology_metadata', postgresql_using='gin'),
-        Index('ix_entries_analysis_gin', 'analysis_results', postgresql_using='gin'),
         
         # Constraints
         CheckConstraint('word_count >= 0', name='ck_entries_word_count_positive'),
@@ -406,6 +423,51 @@ class Entry(Base):
             self.reading_time_minutes = max(1, self.word_count // 200)  # ~200 WPM
         return content
 
+# Compact entry revision history
+class EntryRevision(Base):
+    """
+    One superseded version of an entry's content.
+    
+    The current text lives in entries.content only. Each row rebuilds its
+    version from the next newer one: 'delta' rows hold compressed edit ops
+    against that newer text, 'snapshot' rows (every Nth version) hold the
+    compressed full text and bound how many deltas a read replays. Rows
+    are written by entry_revision_service; created_at is when the version
+    was superseded, i.e. when the next version was opened.
+    """
+    __tablename__ = "entry_revisions"
+    
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), 
+        primary_key=True, 
+        default=uuid.uuid4
+    )
+    entry_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("entries.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    version: Mapped[int] = mapped_column(Integer, nullable=False)
+    kind: Mapped[str] = mapped_column(String(10), nullable=False)  # snapshot, delta
+    payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    # Length of the rebuilt text, checked on replay
+    content_length: Mapped[int] = mapped_column(Integer, nullable=False)
+    
+    # Rows are only read by entry; skip the base class's audit indexes
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    
+    __table_args__ = (
+        # Serves replay (version range of one entry) and guards concurrent saves
+        UniqueConstraint('entry_id', 'version', name='uq_entry_revisions_entry_version'),
+        CheckConstraint("kind IN ('snapshot', 'delta')", name='ck_entry_revisions_kind'),
+        CheckConstraint('version >= 1', name='ck_entry_revisions_version_positive'),
+    )
+
 # Chat Session Management
 class ChatSession(Base):
     """
@@ -477,6 +539,11 @@ class ChatSession(Base):
         Index('ix_sessions_psychology_gin', 'psychology_insights', postgresql_using='gin'),
     )
 
+# Message timestamps may come from the application clock while a session's
+# created_at comes from the database clock; bounds on the session start allow
+# this much skew between the two
+SESSION_START_SKEW = timedelta(days=1)
+
 # Chat Message Storage
 class ChatMessage(Base):
     """
@@ -507,9 +574,10 @@ class ChatMessage(Base):
     content: Mapped[str] = mapped_column(Text, nullable=False)
     role: Mapped[str] = mapped_column(String(20), nullable=False)  # user, assistant, system
     
-    # Message timing and performance
+    # Message timing and performance (partition key: part of the primary key)
     timestamp: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), 
+        primary_key=True,
         server_default=func.now(),
         nullable=False
     )
@@ -537,10 +605,14 @@ class ChatMessage(Base):
     session: Mapped["ChatSession"] = relationship("ChatSession", back_populates="messages")
     
     __table_args__ = (
-        Index('ix_messages_session_timestamp', 'session_id', 'timestamp'),
+        # Newest-first per session: serves "latest N messages" for the session list
+        Index('ix_messages_session_timestamp_desc', 'session_id', text('timestamp DESC')),
         Index('ix_messages_role_timestamp', 'role', 'timestamp'),
         Index('ix_messages_sentiment', 'sentiment_score'),
         Index('ix_messages_psychology_gin', 'psychology_context', postgresql_using='gin'),
+        # Monthly range partitions, see migration 9e4b2d7c1a60 and
+        # partition_maintenance_service
+        {'postgresql_partition_by': 'RANGE (timestamp)'},
     )
     
     @validates('content')
@@ -550,7 +622,43 @@ class ChatMessage(Base):
             self.word_count = len(content.split())
             self.character_count = len(content)
         return content
+    
+    @classmethod
+    def session_start_bound(cls, created_at):
+        """
+        Lower timestamp bound for messages of a session created at created_at.
+        
+        Messages are not older than their session beyond clock skew
+        (SESSION_START_SKEW); bounding on the session's creation lets
+        PostgreSQL skip the monthly partitions from before it at execution time.
+        """
+        return cls.timestamp >= created_at - SESSION_START_SKEW
+    
+    @classmethod
+    def since_session_start(cls, session_id):
+        """Lower timestamp bound for one session's messages"""
+        return cls.session_start_bound(
+            select(ChatSession.created_at).where(ChatSession.id == session_id).scalar_subquery()
+        )
+
 
+# Schemas built with create_all (tests, benchmarks) get no monthly partitions;
+# a default partition keeps chat_messages writable there
+event.listen(
+    ChatMessage.__table__,
+    "after_create",
+    DDL("CREATE TABLE IF NOT EXISTS chat_messages_default PARTITION OF chat_messages DEFAULT").execute_if(
+        dialect="postgresql"
+    )
+)
+
+# Revision payloads are zlib-compressed already; keep pglz off them (the
+# migration sets the same on migrated schemas)
+event.listen(
+    EntryRevision.__table__,
+    "after_create",
+    DDL("ALTER TABLE entry_revisions ALTER COLUMN payload SET STORAGE EXTERNAL").execute_if(dialect="postgresql")
+)
 
 # Compatibility aliases for existing code
 Session = ChatSession  # Backward compatibility alias
@@ -9,6 +9,7 @@ from typing import TypeVar, Generic, List, Optional, Dict, Any, Union
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, delete, func
 from contextlib import asynccontextmanager
+import asyncio
 import json
 import logging
 import hashlib
@@ -75,6 +76,37 @@ class CachedRepositoryMixin(Generic[T]):
             logger.warning(f"Cache get error for {key}: {e}")
             return None
     
+    async def _get_many_from_cache(self, keys: List[str]) -> Dict[str, T]:
+        """Get several entities from cache in one round trip, keyed by entity key"""
+        if not self._cache_strategy or not keys:
+            return {}
+        
+        try:
+            cache_keys = {self._get_cache_key(key): key for key in keys}
+            cached = await self._cache_strategy.get_many(list(cache_keys))
+            return {
+                cache_keys[cache_key]: self._deserialize_entity(data)
+                for cache_key, data in cached.items() if data
+            }
+            
+        except Exception as e:
+            logger.warning(f"Cache multi-get error for {len(keys)} keys: {e}")
+            return {}
+    
+    async def _set_many_cache(self, entities: Dict[str, T], ttl: Optional[int] = None) -> None:
+        """Set several entities in cache in one round trip"""
+        if not self._cache_strategy or not entities:
+            return
+        
+        try:
+            await self._cache_strategy.set_many(
+                {self._get_cache_key(key): self._serialize_entity(entity) for key, entity in entities.items()},
+                ttl
+            )
+            
+        except Exception as e:
+            logger.warning(f"Cache multi-set error for {len(entities)} keys: {e}")
+    
     async def _set_cache(self, key: str, entity: T, ttl: Optional[int] = None) -> None:
         """Set entity in cache"""
         if not self._cache_strategy:
@@ -205,6 +237,28 @@ class EnhancedBaseRepository(CachedRepositoryMixin[T], CacheableServiceInterface
             logger.error(f"Error getting {self.model_class.__name__} by ID {id}: {e}")
             raise RepositoryException(f"Failed to get entity by ID", context={"id": id, "error": str(e)})
     
+    async def get_by_ids(self, ids: List[str], use_cache: bool = True) -> Dict[str, T]:
+        """Get several entities: one cache round trip, one query for the misses"""
+        try:
+            ids = [str(id) for id in ids]
+            found = await self._get_many_from_cache(ids) if use_cache else {}
+            
+            missing = [id for id in ids if id not in found]
+            if missing:
+                stmt = select(self.model_class).where(getattr(self.model_class, 'id').in_(missing))
+                result = await self.session.execute(stmt)
+                loaded = {str(entity.id): entity for entity in result.scalars().all()}
+                found.update(loaded)
+                
+                if loaded and use_cache:
+                    await self._set_many_cache(loaded, self.default_ttl)
+            
+            return found
+            
+        except Exception as e:
+            logger.error(f"Error getting {self.model_class.__name__} by IDs: {e}")
+            raise RepositoryException(f"Failed to get entities by ID", context={"ids": ids, "error": str(e)})
+    
     async def create(self, data: Dict[str, Any], invalidate_cache: bool = True) -> T:
         """Create entity with cache invalidation"""
         try:
@@ -214,14 +268,14 @@ class EnhancedBaseRepository(CachedRepositoryMixin[T], CacheableServiceInterface
             await self.session.flush()
             await self.session.refresh(entity)
             
-            # Cache the new entity
+            # Cache the new entity and invalidate list caches concurrently
             entity_id = getattr(entity, 'id', None)
+            cache_updates = []
             if entity_id:
-                await self._set_cache(str(entity_id), entity, self.default_ttl)
-            
-            # Invalidate list caches
+                cache_updates.append(self._set_cache(str(entity_id), entity, self.default_ttl))
             if invalidate_cache:
-                await self._invalidate_cache_pattern("list:*")
+                cache_updates.append(self._invalidate_cache_pattern("list:*"))
+            await asyncio.gather(*cache_updates)
             
             logger.info(f"Created {self.model_class.__name__}:{entity_id}")
             return entity
@@ -246,12 +300,11 @@ class EnhancedBaseRepository(CachedRepositoryMixin[T], CacheableServiceInterface
             await self.session.flush()
             await self.session.refresh(entity)
             
-            # Update cache
-            await self._set_cache(str(id), entity, self.default_ttl)
-            
-            # Invalidate related caches
+            # Update cache and invalidate related caches concurrently
+            cache_updates = [self._set_cache(str(id), entity, self.default_ttl)]
             if invalidate_cache:
-                await self._invalidate_cache_pattern("list:*")
+                cache_updates.append(self._invalidate_cache_pattern("list:*"))
+            await asyncio.gather(*cache_updates)
             
             logger.info(f"Updated {self.model_class.__name__}:{id}")
             return entity
@@ -277,12 +330,11 @@ class EnhancedBaseRepository(CachedRepositoryMixin[T], CacheableServiceInterface
                 await self.session.delete(entity)
                 await self.session.flush()
             
-            # Remove from cache
-            await self._invalidate_cache(str(id))
-            
-            # Invalidate related caches
+            # Remove from cache and invalidate related caches concurrently
+            cache_updates = [self._invalidate_cache(str(id))]
             if invalidate_cache:
-                await self._invalidate_cache_pattern("list:*")
+                cache_updates.append(self._invalidate_cache_pattern("list:*"))
+            await asyncio.gather(*cache_updates)
             
             logger.info(f"Deleted {self.model_class.__name__}:{id}")
             return True
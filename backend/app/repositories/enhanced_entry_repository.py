@@ -5,14 +5,14 @@ Optimized for journaling operations with intelligent cache management
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from sqlalchemy import select, func, and_, or_, desc, text, asc
 from sqlalchemy.orm import selectinload
 from contextlib import asynccontextmanager
 
 from app.repositories.base_cached_repository import EnhancedBaseRepository
-from app.models.enhanced_models import Entry, Topic, User
+from app.models.enhanced_models import Entry, Topic, User, ENTRY_SEARCH_VECTOR_SQL
 from app.decorators.cache_decorators import cached, cache_invalidate, timed_operation, CachePatterns
 from app.core.exceptions import RepositoryException, NotFoundException
 from app.core.performance_monitor import performance_monitor
@@ -79,11 +79,10 @@ class EnhancedEntryRepository(EnhancedBaseRepository[Entry]):
                 Entry.deleted_at.is_(None)
             ]
             
-            # Full-text search condition
+            # Full-text search condition (search_vector is weighted title > content)
+            ts_query = func.plainto_tsquery('english', query)
             if query.strip():
-                search_conditions.append(
-                    Entry.search_vector.op('@@')(func.plainto_tsquery('english', query))
-                )
+                search_conditions.append(Entry.search_vector.op('@@')(ts_query))
             
             # Additional filters
             if mood_filter:
@@ -100,7 +99,7 @@ class EnhancedEntryRepository(EnhancedBaseRepository[Entry]):
                 ).where(
                     and_(*search_conditions)
                 ).order_by(
-                    func.ts_rank(Entry.search_vector, func.plainto_tsquery('english', query)).desc(),
+                    func.ts_rank(Entry.search_vector, ts_query).desc(),
                     Entry.created_at.desc()
                 ).offset(offset).limit(limit)
             else:
@@ -122,6 +121,40 @@ class EnhancedEntryRepository(EnhancedBaseRepository[Entry]):
             logger.error(f"Error in full-text search: {e}")
             raise RepositoryException(f"Full-text search failed", context={"query": query, "error": str(e)})
     
+    async def rank_full_text_ids(
+        self,
+        user_id: str,
+        query: str,
+        limit: int = 50
+    ) -> List[Tuple[str, float]]:
+        """
+        Ranked (entry_id, ts_rank) pairs for hybrid search fusion
+        
+        Selects ids only so the GIN index scan is not followed by wide row
+        fetches; callers hydrate the fused result set in one query.
+        """
+        if not query.strip():
+            return []
+        
+        try:
+            ts_query = func.plainto_tsquery('english', query)
+            rank = func.ts_rank(Entry.search_vector, ts_query)
+            
+            rank_query = select(Entry.id, rank.label('rank')).where(
+                and_(
+                    Entry.user_id == user_id,
+                    Entry.deleted_at.is_(None),
+                    Entry.search_vector.op('@@')(ts_query)
+                )
+            ).order_by(rank.desc(), Entry.created_at.desc()).limit(limit)
+            
+            result = await self.session.execute(rank_query)
+            return [(str(entry_id), float(score)) for entry_id, score in result.all()]
+            
+        except Exception as e:
+            logger.error(f"Error ranking full-text entry ids: {e}")
+            raise RepositoryException(f"Full-text ranking failed", context={"query": query, "error": str(e)})
+    
     @CachePatterns.ENTRY_ANALYTICS
     async def get_mood_analytics(
         self,
@@ -445,17 +478,9 @@ class EnhancedEntryRepository(EnhancedBaseRepository[Entry]):
             entry = Entry(**entry_data)
             self.session.add(entry)
             await self.session.flush()
+            # search_vector is filled by the trigger on insert
             await self.session.refresh(entry)
             
-            # Update search vector for full-text search
-            search_vector_query = text("""
-                UPDATE entries 
-                SET search_vector = to_tsvector('english', title || ' ' || content)
-                WHERE id = :entry_id
-            """)
-            
-            await self.session.execute(search_vector_query, {"entry_id": str(entry.id)})
-            
             logger.info(f"Created entry {entry.id} with {word_count} words")
             return entry
             
@@ -468,10 +493,9 @@ class EnhancedEntryRepository(EnhancedBaseRepository[Entry]):
     async def update_with_analysis(
         self,
         entry_id: str,
-        update_data: Dict[str, Any],
-        regenerate_search_vector: bool = True
+        update_data: Dict[str, Any]
     ) -> Optional[Entry]:
-        """Update entry with cache invalidation and search vector update"""
+        """Update entry with cache invalidation (search_vector follows via trigger)"""
         try:
             entry = await self.get_by_id(entry_id, use_cache=False)
             if not entry:
@@ -483,8 +507,6 @@ class EnhancedEntryRepository(EnhancedBaseRepository[Entry]):
                 update_data['word_count'] = len(content.split())
                 update_data['reading_time_minutes'] = max(1, update_data['word_count'] // 200)
                 update_data['character_count'] = len(content)
-                
-                regenerate_search_vector = True
             
             # Apply updates
             for key, value in update_data.items():
@@ -494,17 +516,6 @@ class EnhancedEntryRepository(EnhancedBaseRepository[Entry]):
             entry.updated_at = datetime.utcnow()
             
             await self.session.flush()
-            
-            # Regenerate search vector if needed
-            if regenerate_search_vector:
-                search_vector_query = text("""
-                    UPDATE entries 
-                    SET search_vector = to_tsvector('english', title || ' ' || content)
-                    WHERE id = :entry_id
-                """)
-                
-                await self.session.execute(search_vector_query, {"entry_id": entry_id})
-            
             await self.session.refresh(entry)
             
             logger.info(f"Updated entry {entry_id}")
@@ -591,34 +602,61 @@ class EnhancedEntryRepository(EnhancedBaseRepository[Entry]):
             logger.error(f"Error calculating writing streak: {e}")
             return {'current_streak': 0, 'longest_streak': 0, 'total_active_days': 0}
     
-    async def batch_update_search_vectors(self, batch_size: int = 1000) -> int:
+    async def backfill_search_vectors(
+        self,
+        after_id: Optional[str] = None,
+        batch_size: int = 1000,
+        only_missing: bool = False
+    ) -> Dict[str, Any]:
         """
-        Batch update search vectors for full-text search optimization
-        Used for maintenance and migration tasks
+        Recompute search vectors for one keyset page of entries
+        
+        Pages by primary key, so each call is an index range scan no matter how
+        far the backfill has progressed, and a run can resume from the last id.
+        Used for maintenance and for re-weighting rows written before the trigger.
+        
+        Returns:
+            {"updated": rows written, "scanned": rows in page, "last_id": cursor or None when done}
         """
         try:
-            update_query = text("""
+            missing_filter = "AND e.search_vector IS NULL" if only_missing else ""
+            backfill_query = text(f"""
                 WITH batch AS (
-                    SELECT id 
-                    FROM entries 
-                    WHERE search_vector IS NULL 
-                    AND deleted_at IS NULL
+                    SELECT id
+                    FROM entries
+                    WHERE id > CAST(:after_id AS uuid)
+                    ORDER BY id
                     LIMIT :batch_size
+                ),
+                updated AS (
+                    UPDATE entries e
+                    SET search_vector = {ENTRY_SEARCH_VECTOR_SQL}
+                    FROM batch
+                    WHERE e.id = batch.id {missing_filter}
+                    RETURNING e.id
                 )
-                UPDATE entries 
-                SET search_vector = to_tsvector('english', title || ' ' || content)
-                WHERE id IN (SELECT id FROM batch)
+                SELECT
+                    (SELECT count(*) FROM updated) AS updated,
+                    (SELECT count(*) FROM batch) AS scanned,
+                    (SELECT id FROM batch ORDER BY id DESC LIMIT 1) AS last_id
             """)
             
-            result = await self.session.execute(update_query, {"batch_size": batch_size})
-            updated_count = result.rowcount
+            result = await self.session.execute(backfill_query, {
+                "after_id": after_id or "00000000-0000-0000-0000-000000000000",
+                "batch_size": batch_size
+            })
+            row = result.one()
             
-            logger.info(f"Updated search vectors for {updated_count} entries")
-            return updated_count
+            logger.debug(f"Backfilled search vectors for {row.updated}/{row.scanned} entries after {after_id}")
+            return {
+                "updated": row.updated,
+                "scanned": row.scanned,
+                "last_id": str(row.last_id) if row.last_id else None
+            }
             
         except Exception as e:
-            logger.error(f"Error batch updating search vectors: {e}")
-            raise RepositoryException(f"Batch search vector update failed", context={"error": str(e)})
+            logger.error(f"Error backfilling search vectors: {e}")
+            raise RepositoryException(f"Search vector backfill failed", context={"after_id": after_id, "error": str(e)})
     
     @cached(ttl=180, key_prefix="bulk_entries", monitor_performance=True)
     async def get_entries_bulk_by_ids(
@@ -4,6 +4,7 @@ Enhanced Session Repository with Redis Integration
 Real-time session management with Redis-backed state caching
 """
 
+import asyncio
 import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
@@ -102,18 +103,17 @@ class EnhancedSessionRepository(EnhancedBaseRepository[ChatSession]):
                 content=initial_message,
                 role='assistant',
                 word_count=len(initial_message.split()),
-                character_count=len(initial_message),
-                timestamp=datetime.utcnow()
+                character_count=len(initial_message)
             )
             
             self.session.add(initial_msg)
             await self.session.flush()
             
-            # Cache session in Redis
-            await self._cache_session_state(chat_session)
-            
-            # Track user session
-            await redis_session_service.add_user_session(user_id, str(chat_session.id))
+            # Cache session state and track it for the user concurrently
+            await asyncio.gather(
+                self._cache_session_state(chat_session),
+                redis_session_service.add_user_session(user_id, str(chat_session.id))
+            )
             
             logger.info(f"Created session {chat_session.id} with initial message")
             return chat_session
@@ -122,7 +122,6 @@ class EnhancedSessionRepository(EnhancedBaseRepository[ChatSession]):
             logger.error(f"Error creating session with initial message: {e}")
             raise RepositoryException(f"Session creation failed", context={"title": title, "error": str(e)})
     
-    @redis_session_cache(session_ttl=7200, track_activity=True)
     @timed_operation("add_message", track_errors=True)
     async def add_message(
         self,
@@ -193,7 +192,8 @@ class EnhancedSessionRepository(EnhancedBaseRepository[ChatSession]):
                 query = query.options(*query_options)
             
             query = query.where(
-                ChatMessage.session_id == session_id
+                ChatMessage.session_id == session_id,
+                ChatMessage.since_session_start(session_id)
             ).order_by(ChatMessage.timestamp.asc()).offset(offset).limit(limit)
             
             result = await self.session.execute(query)
@@ -213,7 +213,8 @@ class EnhancedSessionRepository(EnhancedBaseRepository[ChatSession]):
         """Get recent messages for AI context generation"""
         try:
             query = select(ChatMessage).where(
-                ChatMessage.session_id == session_id
+                ChatMessage.session_id == session_id,
+                ChatMessage.since_session_start(session_id)
             ).order_by(ChatMessage.timestamp.desc()).limit(count)
             
             result = await self.session.execute(query)
@@ -590,17 +591,8 @@ class EnhancedSessionRepository(EnhancedBaseRepository[ChatSession]):
     async def _update_session_cache_after_message(self, session_id: str, message: ChatMessage) -> None:
         """Update session cache after new message"""
         try:
-            # Get current session data from Redis
-            session_data = await redis_session_service.get_session(session_id)
-            
-            if session_data:
-                # Update message count and activity
-                session_data['message_count'] = (session_data.get('message_count', 0) + 1)
-                session_data['last_activity'] = datetime.utcnow().isoformat()
-                session_data['last_message_role'] = message.role
-                session_data['last_message_timestamp'] = message.timestamp.isoformat()
-                
-                await redis_session_service.store_session(session_id, session_data)
+            # One atomic server-side update: concurrent senders cannot lose counts
+            await redis_session_service.record_message(session_id, message.role, message.timestamp)
             
         except Exception as e:
             logger.warning(f"Failed to update session cache after message: {e}")
@@ -611,15 +603,17 @@ class EnhancedSessionRepository(EnhancedBaseRepository[ChatSession]):
             # Move session data to archive key with longer TTL
             session_data = await redis_session_service.get_session(session_id)
             
+            writes = []
             if session_data:
                 session_data['archived_at'] = datetime.utcnow().isoformat()
                 archive_key = f"archived_session:{session_id}"
                 
                 # Store with 7-day TTL for potential recovery
-                await redis_session_service.redis.set(archive_key, session_data, ttl=604800)
+                writes.append(redis_session_service.redis.set(archive_key, session_data, ttl=604800))
             
             # Remove from active session cache
-            await redis_session_service.redis.delete(f"session:{session_id}")
+            writes.append(redis_session_service.delete_session(session_id))
+            await asyncio.gather(*writes)
             
         except Exception as e:
             logger.warning(f"Failed to archive session in Redis: {e}")
@@ -679,7 +673,9 @@ class EnhancedSessionRepository(EnhancedBaseRepository[ChatSession]):
                     order_by=ChatMessage.timestamp.desc()
                 ).label('rn')
             ).where(
-                ChatMessage.session_id.in_(session_ids)
+                ChatMessage.session_id.in_(session_ids),
+                # Constant bound: partitions before the oldest session are pruned at plan time
+                ChatMessage.timestamp >= min(session.created_at for session in sessions)
             )
             
             # Create subquery to get only the most recent messages
@@ -13,7 +13,7 @@ from typing import List, Optional, Dict, Any
 from sqlalchemy import select, func, and_, or_, text, desc
 from sqlalchemy.orm import selectinload
 from datetime import datetime, timedelta
-from ..models.enhanced_models import Entry, Topic, User
+from ..models.enhanced_models import Entry, Topic, User, ENTRY_SEARCH_VECTOR_SQL
 from .enhanced_base import EnhancedBaseRepository
 
 class EntryRepository(EnhancedBaseRepository[Entry]):
@@ -44,7 +44,6 @@ class EntryRepository(EnhancedBaseRepository[Entry]):
         Performs:
         - Word count calculation
         - Reading time estimation
-        - Full-text search vector generation
         - Basic content validation
         """
         # Calculate content metrics
@@ -62,17 +61,8 @@ class EntryRepository(EnhancedBaseRepository[Entry]):
             **kwargs
         )
         
-        # Generate search vector for full-text search
-        search_query = text("""
-            UPDATE entries 
-            SET search_vector = to_tsvector('english', title || ' ' || content)
-            WHERE id = :entry_id
-        """)
-        
+        # search_vector is generated by the entries trigger on insert
         created_entry = await self.create(entry)
-        
-        # Update search vector
-        await self.session.execute(search_query, {"entry_id": str(created_entry.id)})
         await self.session.commit()
         
         return created_entry
@@ -325,12 +315,17 @@ class EntryRepository(EnhancedBaseRepository[Entry]):
         - Periodic search index maintenance
         - Performance optimization
         """
-        update_query = text("""
-            UPDATE entries 
-            SET search_vector = to_tsvector('english', title || ' ' || content)
-            WHERE search_vector IS NULL
-            AND deleted_at IS NULL
-            LIMIT :batch_size
+        update_query = text(f"""
+            WITH batch AS (
+                SELECT id
+                FROM entries
+                WHERE search_vector IS NULL
+                AND deleted_at IS NULL
+                LIMIT :batch_size
+            )
+            UPDATE entries
+            SET search_vector = {ENTRY_SEARCH_VECTOR_SQL}
+            WHERE id IN (SELECT id FROM batch)
         """)
         
         result = await self.session.execute(update_query, {"batch_size": batch_size})
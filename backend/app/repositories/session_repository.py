@@ -9,8 +9,8 @@ Features:
 - Psychology integration tracking
 """
 
-from typing import List, Optional, Dict, Any
-from sqlalchemy import select, func, and_, desc, text, or_
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy import select, func, and_, desc, text, or_, true
 from sqlalchemy.orm import selectinload
 from datetime import datetime, timedelta
 import logging
@@ -94,6 +94,23 @@ class SessionRepository(EnhancedBaseRepository[ChatSession]):
         - Message count statistics
         - Content analysis metrics
         """
+        message, _ = await self.add_message_returning_count(session_id, content, role, **kwargs)
+        return message
+    
+    async def add_message_returning_count(
+        self,
+        session_id: str,
+        content: str,
+        role: str,
+        **kwargs
+    ) -> Tuple[ChatMessage, int]:
+        """
+        Add message to session and return the session's new message count.
+        
+        The count comes from the same atomic UPDATE that increments it, so
+        every message sees a distinct value and callers can trigger work on
+        count thresholds without reading the transcript.
+        """
         message = ChatMessage(
             session_id=session_id,
             content=content,
@@ -113,12 +130,14 @@ class SessionRepository(EnhancedBaseRepository[ChatSession]):
                 message_count = message_count + 1,
                 updated_at = CURRENT_TIMESTAMP
             WHERE id = :session_id
+            RETURNING message_count
         """)
         
-        await self.session.execute(session_update, {"session_id": session_id})
+        result = await self.session.execute(session_update, {"session_id": session_id})
+        message_count = result.scalar_one_or_none() or 0
         await self.session.flush()
         
-        return message
+        return message, message_count
     
     async def get_messages(
         self,
@@ -128,7 +147,8 @@ class SessionRepository(EnhancedBaseRepository[ChatSession]):
     ) -> List[ChatMessage]:
         """Get messages for a session with proper ordering."""
         query = select(ChatMessage).where(
-            ChatMessage.session_id == session_id
+            ChatMessage.session_id == session_id,
+            ChatMessage.since_session_start(session_id)
         ).order_by(ChatMessage.created_at.asc()).offset(offset).limit(limit)
         
         result = await self.session.execute(query)
@@ -141,7 +161,8 @@ class SessionRepository(EnhancedBaseRepository[ChatSession]):
     ) -> List[ChatMessage]:
         """Get recent messages for context in AI responses."""
         query = select(ChatMessage).where(
-            ChatMessage.session_id == session_id
+            ChatMessage.session_id == session_id,
+            ChatMessage.since_session_start(session_id)
         ).order_by(ChatMessage.created_at.desc()).limit(count)
         
         result = await self.session.execute(query)
@@ -293,6 +314,98 @@ class SessionRepository(EnhancedBaseRepository[ChatSession]):
         result = await self.session.execute(query)
         return list(result.scalars().all())
     
+    async def get_user_sessions_with_recent_messages(
+        self,
+        user_id: str,
+        limit: int = 20,
+        offset: int = 0,
+        message_count: int = 3,
+        status: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get a page of sessions with their latest messages in one query.
+        
+        The page of sessions is LEFT JOIN LATERAL'd to its newest
+        `message_count` messages, so each session costs one backward scan of
+        ix_messages_session_timestamp_desc instead of a query of its own.
+        The scan is bounded below by the session's creation so partitions
+        older than the session are pruned. Only the columns the session
+        list renders are selected.
+        
+        Returns plain dicts ordered by last activity, each with its
+        `recent_messages` in chronological order.
+        """
+        conditions = [
+            ChatSession.user_id == user_id,
+            ChatSession.deleted_at.is_(None)
+        ]
+        if status:
+            conditions.append(ChatSession.status == status)
+        
+        page = select(
+            ChatSession.id,
+            ChatSession.session_type,
+            ChatSession.title,
+            ChatSession.description,
+            ChatSession.status,
+            ChatSession.created_at,
+            ChatSession.updated_at,
+            ChatSession.last_activity,
+            ChatSession.message_count,
+            ChatSession.tags,
+            ChatSession.session_metadata
+        ).where(
+            and_(*conditions)
+        ).order_by(
+            ChatSession.last_activity.desc(), ChatSession.id
+        ).offset(offset).limit(limit).subquery("page")
+        
+        recent = select(
+            ChatMessage.id.label("message_id"),
+            ChatMessage.content,
+            ChatMessage.role,
+            ChatMessage.timestamp,
+            ChatMessage.message_metadata
+        ).where(
+            ChatMessage.session_id == page.c.id,
+            ChatMessage.session_start_bound(page.c.created_at)
+        ).order_by(ChatMessage.timestamp.desc()).limit(message_count).lateral("recent")
+        
+        query = select(page, recent).outerjoin(recent, true()).order_by(
+            page.c.last_activity.desc(), page.c.id, recent.c.timestamp.asc()
+        )
+        
+        result = await self.session.execute(query)
+        
+        sessions: Dict[Any, Dict[str, Any]] = {}
+        for row in result.mappings():
+            session = sessions.get(row["id"])
+            if session is None:
+                session = sessions[row["id"]] = {
+                    "id": row["id"],
+                    "session_type": row["session_type"],
+                    "title": row["title"],
+                    "description": row["description"],
+                    "status": row["status"],
+                    "created_at": row["created_at"],
+                    "updated_at": row["updated_at"],
+                    "last_activity": row["last_activity"],
+                    "message_count": row["message_count"],
+                    "tags": row["tags"],
+                    "session_metadata": row["session_metadata"],
+                    "recent_messages": []
+                }
+            if row["message_id"] is not None:
+                session["recent_messages"].append({
+                    "id": row["message_id"],
+                    "content": row["content"],
+                    "role": row["role"],
+                    "timestamp": row["timestamp"],
+                    "message_metadata": row["message_metadata"]
+                })
+        
+        return list(sessions.values())
+    
     async def update_session_duration(
         self,
         session_id: str,
@@ -1,11 +1,16 @@
 """
 Enhanced search repository with trigram (gin_trgm_ops) support
 Provides fuzzy search capabilities for better user experience
+
+Matching uses the indexable pg_trgm operators (%, <%, <<%) with thresholds
+scoped to the current transaction, so the GIN indexes narrow the candidate
+set and similarity scores are only computed for matching rows. Title-only
+lookups order by trigram distance (<->), which the GiST index serves as KNN.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, func, text
+from sqlalchemy import select, and_, or_, func, text, literal
 from sqlalchemy.orm import selectinload
 
 from app.models.enhanced_models import Entry, Topic
@@ -18,7 +23,79 @@ class TrigramSearchRepository(EnhancedBaseRepository):
     """Enhanced search capabilities using PostgreSQL trigram indexes"""
     
     def __init__(self, session: AsyncSession):
-        super().__init__(session)
+        super().__init__(session, Entry)
+    
+    async def _set_similarity_thresholds(self, min_similarity: float) -> None:
+        """Scope pg_trgm operator thresholds to the current transaction"""
+        await self.session.execute(text(
+            "SELECT set_config('pg_trgm.similarity_threshold', :threshold, true), "
+            "set_config('pg_trgm.word_similarity_threshold', :threshold, true), "
+            "set_config('pg_trgm.strict_word_similarity_threshold', :threshold, true)"
+        ), {"threshold": str(min_similarity)})
+    
+    @staticmethod
+    def _entry_match(query: str, search_fields: List[str], strict_words: bool = False):
+        """
+        Indexable match condition and score expression for entries
+        
+        Title uses whole-string similarity (title % q). Content is long, so it
+        is matched on word similarity (q <% content), or strict word similarity
+        (q <<% content) when strict_words is set.
+        """
+        conditions, scores = [], []
+        
+        if 'title' in search_fields:
+            conditions.append(Entry.title.op('%')(query))
+            scores.append(func.similarity(Entry.title, query))
+        
+        if 'content' in search_fields:
+            if strict_words:
+                conditions.append(literal(query).op('<<%')(Entry.content))
+                scores.append(func.strict_word_similarity(query, Entry.content))
+            else:
+                conditions.append(literal(query).op('<%')(Entry.content))
+                scores.append(func.word_similarity(query, Entry.content))
+        
+        condition = or_(*conditions) if len(conditions) > 1 else conditions[0]
+        score = func.greatest(*scores) if len(scores) > 1 else scores[0]
+        return condition, score
+    
+    def build_fuzzy_entry_query(
+        self,
+        user_id: str,
+        query: str,
+        limit: int = 20,
+        offset: int = 0,
+        search_fields: List[str] = None,
+        strict_words: bool = False,
+        ids_only: bool = False
+    ):
+        """
+        Fuzzy entry search statement (thresholds must be set on the session first)
+        
+        Exposed separately so the query plan can be checked with EXPLAIN.
+        """
+        search_fields = search_fields or ['title', 'content']
+        condition, score = self._entry_match(query, search_fields, strict_words)
+        
+        if ids_only:
+            statement = select(Entry.id, score.label('similarity_score'))
+        else:
+            statement = select(Entry, score.label('similarity_score')).options(selectinload(Entry.topic))
+        
+        # Title-only: KNN on the GiST index; otherwise rank the (few) matched rows
+        if search_fields == ['title']:
+            ordering = [Entry.title.op('<->')(query)]
+        else:
+            ordering = [score.desc(), Entry.created_at.desc()]
+        
+        return statement.where(
+            and_(
+                Entry.user_id == user_id,
+                Entry.deleted_at.is_(None),
+                condition
+            )
+        ).order_by(*ordering).offset(offset).limit(limit)
     
     async def fuzzy_search_entries(
         self,
@@ -27,10 +104,11 @@ class TrigramSearchRepository(EnhancedBaseRepository):
         min_similarity: float = 0.1,
         limit: int = 20,
         offset: int = 0,
-        search_fields: List[str] = None
+        search_fields: List[str] = None,
+        strict_words: bool = False
     ) -> List[Dict[str, Any]]:
         """
-        Fuzzy search entries using trigram similarity
+        Fuzzy search entries using indexable trigram operators
         
         Args:
             user_id: User identifier
@@ -39,47 +117,17 @@ class TrigramSearchRepository(EnhancedBaseRepository):
             limit: Maximum results to return
             offset: Results offset for pagination
             search_fields: Fields to search in ['title', 'content'] (default: both)
+            strict_words: Match content on strict word similarity (<<%)
         
         Returns:
             List of entries with similarity scores
         """
         try:
-            search_fields = search_fields or ['title', 'content']
-            similarity_conditions = []
-            
-            # Build similarity conditions for each field
-            for field in search_fields:
-                if field == 'title':
-                    similarity_conditions.append(
-                        func.similarity(Entry.title, query).label(f'{field}_similarity')
-                    )
-                elif field == 'content':
-                    similarity_conditions.append(
-                        func.similarity(Entry.content, query).label(f'{field}_similarity')
-                    )
-            
-            # Combine similarities (use maximum similarity across fields)
-            if len(similarity_conditions) > 1:
-                max_similarity = func.greatest(*[cond for cond in similarity_conditions])
-            else:
-                max_similarity = similarity_conditions[0]
-            
-            # Build the main query
-            search_query = select(
-                Entry,
-                max_similarity.label('similarity_score')
-            ).options(
-                selectinload(Entry.topic)
-            ).where(
-                and_(
-                    Entry.user_id == user_id,
-                    Entry.deleted_at.is_(None),
-                    max_similarity >= min_similarity
-                )
-            ).order_by(
-                max_similarity.desc(),
-                Entry.created_at.desc()
-            ).offset(offset).limit(limit)
+            await self._set_similarity_thresholds(min_similarity)
+            search_query = self.build_fuzzy_entry_query(
+                user_id, query, limit=limit, offset=offset,
+                search_fields=search_fields, strict_words=strict_words
+            )
             
             result = await self.session.execute(search_query)
             entries_with_scores = result.all()
@@ -100,6 +148,29 @@ class TrigramSearchRepository(EnhancedBaseRepository):
             logger.error(f"Error in trigram entry search: {e}")
             raise
     
+    async def rank_fuzzy_entry_ids(
+        self,
+        user_id: str,
+        query: str,
+        limit: int = 50,
+        min_similarity: float = 0.1
+    ) -> List[Tuple[str, float]]:
+        """
+        Ranked (entry_id, similarity) pairs for hybrid search fusion
+        
+        Selects ids only; callers hydrate the fused result set in one query.
+        """
+        try:
+            await self._set_similarity_thresholds(min_similarity)
+            rank_query = self.build_fuzzy_entry_query(user_id, query, limit=limit, ids_only=True)
+            
+            result = await self.session.execute(rank_query)
+            return [(str(entry_id), float(score)) for entry_id, score in result.all()]
+            
+        except Exception as e:
+            logger.error(f"Error ranking trigram entry ids: {e}")
+            raise
+    
     async def fuzzy_search_topics(
         self,
         user_id: str,
@@ -252,7 +323,8 @@ class TrigramSearchRepository(EnhancedBaseRepository):
             # Use title for similarity matching
             search_text = source_entry.title
             
-            # Find similar entries (excluding the source entry)
+            # Find similar entries (excluding the source entry), nearest titles first
+            await self._set_similarity_thresholds(0.1)
             similarity_score = func.similarity(Entry.title, search_text)
             
             similar_query = select(
@@ -265,10 +337,10 @@ class TrigramSearchRepository(EnhancedBaseRepository):
                     Entry.user_id == user_id,
                     Entry.id != entry_id,
                     Entry.deleted_at.is_(None),
-                    similarity_score > 0.1
+                    Entry.title.op('%')(search_text)
                 )
             ).order_by(
-                similarity_score.desc()
+                Entry.title.op('<->')(search_text)
             ).limit(limit)
             
             result = await self.session.execute(similar_query)
@@ -315,16 +387,17 @@ class TrigramSearchRepository(EnhancedBaseRepository):
         try:
             filters = filters or {}
             
-            # Base similarity conditions
+            # Indexable match; scores are only computed for matching rows
+            await self._set_similarity_thresholds(min_similarity)
+            match_condition, max_similarity = self._entry_match(query, ['title', 'content'])
             title_similarity = func.similarity(Entry.title, query)
-            content_similarity = func.similarity(Entry.content, query)
-            max_similarity = func.greatest(title_similarity, content_similarity)
+            content_similarity = func.word_similarity(query, Entry.content)
             
             # Build base conditions
             conditions = [
                 Entry.user_id == user_id,
                 Entry.deleted_at.is_(None),
-                max_similarity >= min_similarity
+                match_condition
             ]
             
             # Apply additional filters
@@ -15,16 +15,46 @@ from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+import numpy as np
+
 # Phase 2 integration imports
 from app.core.cache_patterns import CacheDomain, CachePatterns, CacheKeyBuilder
 from app.services.cache_service import unified_cache_service
 from app.services.ai_model_manager import ai_model_manager
 from app.services.ai_emotion_service import ai_emotion_service, EmotionAnalysis
 from app.services.ai_prompt_service import ai_prompt_service, PromptRequest, PromptType, PromptContext
+from app.services.crisis_batch_scorer import CrisisBatchScorer
 from app.core.service_interfaces import ServiceRegistry
 
 logger = logging.getLogger(__name__)
 
+# Zero-shot labels used for AI-enhanced crisis detection
+CRISIS_CATEGORIES = [
+    "suicidal thoughts",
+    "self-harm intentions", 
+    "substance abuse crisis",
+    "severe depression",
+    "panic and anxiety",
+    "emotional dysregulation",
+    "trauma response"
+]
+
+# Crisis keywords (high priority when trimming text, also a batch pre-filter)
+CRISIS_PRIORITY_KEYWORDS = [
+    'suicide', 'kill', 'die', 'death', 'hurt', 'pain', 'hopeless', 'worthless',
+    'end it', 'give up', "can't go on", 'no point', 'better off dead', 
+    'cut myself', 'self harm', 'overdose', 'jump', 'hanging', 'pills'
+]
+
+# Emotional escalation keywords (medium priority)
+ESCALATION_KEYWORDS = [
+    'rage', 'angry', 'furious', 'explosive', 'losing it', "can't control",
+    'panic', 'anxiety', 'terrified', 'overwhelmed', 'breakdown', 'crying'
+]
+
+# Scorer row that only feeds the batch pre-filter, never severity
+SCREENING_INDICATOR = "_screening"
+
 class CrisisLevel(Enum):
     """Crisis severity levels"""
     NONE = "none"
@@ -122,6 +152,10 @@ class AIInterventionService:
         self.intervention_templates = self._initialize_intervention_templates()
         self.therapeutic_techniques = self._initialize_therapeutic_techniques()
         self.safety_resources = self._initialize_safety_resources()
+        self._crisis_scorer = CrisisBatchScorer({
+            **{name: {"keywords": config["keywords"]} for name, config in self.crisis_indicators.items()},
+            SCREENING_INDICATOR: {"keywords": CRISIS_PRIORITY_KEYWORDS + ESCALATION_KEYWORDS}
+        })
         
         # Performance tracking
         self.intervention_stats = {
@@ -435,39 +469,8 @@ class AIInterventionService:
             # Detect crisis indicators
             risk_factors = await self._detect_crisis_indicators(text, emotion_analysis)
             
-            # Assess protective factors
-            protective_factors = self._assess_protective_factors(text, user_context)
-            
-            # Calculate overall crisis level
-            crisis_level = self._calculate_crisis_level(risk_factors, protective_factors)
-            
-            # Determine intervention needs
-            immediate_interventions = self._select_immediate_interventions(crisis_level, risk_factors)
-            followup_interventions = self._select_followup_interventions(crisis_level, risk_factors)
-            
-            # Safety planning and referral assessment
-            safety_plan_needed = crisis_level in [CrisisLevel.MODERATE, CrisisLevel.HIGH, CrisisLevel.CRITICAL]
-            professional_referral_urgent = crisis_level in [CrisisLevel.HIGH, CrisisLevel.CRITICAL]
-            
-            # Calculate confidence
-            assessment_confidence = self._calculate_assessment_confidence(risk_factors, emotion_analysis)
-            
-            assessment = CrisisAssessment(
-                crisis_level=crisis_level,
-                risk_factors=risk_factors,
-                protective_factors=protective_factors,
-                immediate_interventions=immediate_interventions,
-                followup_interventions=followup_interventions,
-                safety_plan_needed=safety_plan_needed,
-                professional_referral_urgent=professional_referral_urgent,
-                assessment_confidence=assessment_confidence,
-                assessment_metadata={
-                    "text_length": len(text),
-                    "emotion_primary": emotion_analysis.primary_emotion.emotion if emotion_analysis else "unknown",
-                    "user_context_available": user_context is not None,
-                    "assessment_method": "ai_powered"
-                },
-                created_at=datetime.utcnow()
+            assessment = self._build_crisis_assessment(
+                text, risk_factors, user_context, emotion_analysis, "ai_powered"
             )
             
             # Cache assessment
@@ -481,6 +484,84 @@ class AIInterventionService:
             logger.error(f"❌ Error in crisis assessment: {e}")
             return await self._fallback_crisis_assessment(text)
 
+    async def assess_crisis_levels_batch(self, texts: List[str],
+                                         user_contexts: Optional[List[Optional[Dict[str, Any]]]] = None,
+                                         emotion_analyses: Optional[List[Optional[EmotionAnalysis]]] = None,
+                                         model_batch_size: int = 16) -> List[CrisisAssessment]:
+        """
+        Assess crisis levels for many texts at once (backfills, re-screening)
+        
+        Lexical indicators are scored for the whole batch in one vectorized pass;
+        the zero-shot model only runs, batched, on texts that pass the lexical
+        pre-filter. Emotion analysis is not computed here - pass it in if available.
+        
+        Args:
+            texts: Texts to analyze
+            user_contexts: Optional per-text user context
+            emotion_analyses: Optional per-text pre-computed emotion analysis
+            model_batch_size: Batch size for the zero-shot pipeline
+            
+        Returns:
+            One CrisisAssessment per input text, in order
+        """
+        if not texts:
+            return []
+        
+        user_contexts = user_contexts or [None] * len(texts)
+        emotion_analyses = emotion_analyses or [None] * len(texts)
+        
+        try:
+            hits = self._crisis_scorer.score(texts)
+            
+            # severity = base * min(matches / keyword_count, 1) for every indicator x text
+            names = [name for name in hits.indicator_names if name != SCREENING_INDICATOR]
+            rows = [hits.indicator_names.index(name) for name in names]
+            keyword_totals = np.array([len(set(self.crisis_indicators[n]["keywords"])) for n in names], dtype=np.float64)
+            base_severity = np.array([self.crisis_indicators[n]["severity_base"] for n in names], dtype=np.float64)
+            match_factor = np.minimum(hits.keyword_counts[rows] / keyword_totals[:, None], 1.0)
+            severity = base_severity[:, None] * match_factor
+            
+            # Model pass only for lexical candidates
+            candidates = [i for i in np.flatnonzero(hits.candidate_mask) if texts[i] and texts[i].strip()]
+            ai_indicators = await self._ai_enhanced_crisis_detection_batch(
+                [texts[i] for i in candidates], model_batch_size
+            )
+            ai_by_text = dict(zip(candidates, ai_indicators))
+            
+            assessments = []
+            for col, text in enumerate(texts):
+                multiplier = self._emotion_severity_multiplier(emotion_analyses[col])
+                risk_factors = [
+                    CrisisIndicator(
+                        indicator=names[row],
+                        severity=float(min(severity[row, col] * multiplier, 1.0)),
+                        confidence=float(min(match_factor[row, col] + 0.3, 1.0)),
+                        description=self.crisis_indicators[names[row]]["description"],
+                        immediate_risk=self.crisis_indicators[names[row]]["immediate_risk"]
+                    )
+                    for row in np.flatnonzero(match_factor[:, col])
+                ]
+                risk_factors.extend(ai_by_text.get(col, []))
+                risk_factors.sort(key=lambda x: x.severity, reverse=True)
+                
+                assessments.append(self._build_crisis_assessment(
+                    text, risk_factors[:5], user_contexts[col], emotion_analyses[col], "ai_powered_batch"
+                ))
+            
+            self.intervention_stats["total_assessments"] += len(assessments)
+            self.intervention_stats["crisis_detections"] += sum(
+                1 for a in assessments if a.crisis_level != CrisisLevel.NONE
+            )
+            
+            logger.info(f"🆘 Batch crisis assessment completed: {len(texts)} texts, "
+                        f"{len(candidates)} model candidates")
+            
+            return assessments
+            
+        except Exception as e:
+            logger.error(f"❌ Error in batch crisis assessment: {e}")
+            return [await self._fallback_crisis_assessment(text or "") for text in texts]
+
     async def generate_intervention(self, assessment: CrisisAssessment, text: str,
                                   user_context: Optional[Dict[str, Any]] = None) -> PersonalizedIntervention:
         """
@@ -559,11 +640,7 @@ class AIInterventionService:
                 severity = base_severity * match_factor
                 
                 # Adjust based on emotion analysis
-                if emotion_analysis:
-                    if emotion_analysis.primary_emotion.emotion in ["sadness", "fear", "anger"]:
-                        severity *= 1.2
-                    if emotion_analysis.emotional_complexity > 0.7:
-                        severity *= 1.1
+                severity *= self._emotion_severity_multiplier(emotion_analysis)
                 
                 # Calculate confidence
                 confidence = min(match_factor + 0.3, 1.0)
@@ -604,16 +681,7 @@ class AIInterventionService:
             if not model:
                 return []
             
-            # Define crisis categories for classification
-            crisis_categories = [
-                "suicidal thoughts",
-                "self-harm intentions", 
-                "substance abuse crisis",
-                "severe depression",
-                "panic and anxiety",
-                "emotional dysregulation",
-                "trauma response"
-            ]
+            crisis_categories = CRISIS_CATEGORIES
             
             # Classify text with error handling
             try:
@@ -631,25 +699,106 @@ class AIInterventionService:
                 else:
                     raise
             
-            indicators = []
-            if results and "scores" in results:
-                for label, score in zip(results["labels"], results["scores"]):
-                    if score > 0.5:  # Threshold for crisis indication
-                        indicator = CrisisIndicator(
-                            indicator=f"ai_detected_{label.replace(' ', '_')}",
-                            severity=score,
-                            confidence=score,
-                            description=f"AI-detected: {label}",
-                            immediate_risk=score > 0.8
-                        )
-                        indicators.append(indicator)
-            
-            return indicators
+            return self._indicators_from_classification(results)
             
         except Exception as e:
             logger.error(f"❌ Error in AI crisis detection: {e}")
             return []
 
+    async def _ai_enhanced_crisis_detection_batch(self, texts: List[str], batch_size: int = 16) -> List[List[CrisisIndicator]]:
+        """Run zero-shot crisis classification over many texts in model batches"""
+        if not texts:
+            return []
+        
+        try:
+            model = await ai_model_manager.get_model("zero_shot_classifier")
+            if not model:
+                return [[] for _ in texts]
+            
+            processed = [self._intelligently_process_text_for_crisis(text, max_chars=1500) for text in texts]
+            
+            try:
+                results = model(processed, CRISIS_CATEGORIES, batch_size=batch_size)
+            except Exception as model_error:
+                # One bad input fails the whole batch; fall back to per-text detection
+                logger.warning(f"🤖 Batched crisis detection failed, retrying per text: {model_error}")
+                return [await self._ai_enhanced_crisis_detection(text) for text in texts]
+            
+            if isinstance(results, dict):
+                results = [results]
+            return [self._indicators_from_classification(result) for result in results]
+            
+        except Exception as e:
+            logger.error(f"❌ Error in batched AI crisis detection: {e}")
+            return [[] for _ in texts]
+
+    def _indicators_from_classification(self, results: Optional[Dict[str, Any]]) -> List[CrisisIndicator]:
+        """Convert zero-shot classification output into crisis indicators"""
+        indicators = []
+        if results and "scores" in results:
+            for label, score in zip(results["labels"], results["scores"]):
+                if score > 0.5:  # Threshold for crisis indication
+                    indicator = CrisisIndicator(
+                        indicator=f"ai_detected_{label.replace(' ', '_')}",
+                        severity=score,
+                        confidence=score,
+                        description=f"AI-detected: {label}",
+                        immediate_risk=score > 0.8
+                    )
+                    indicators.append(indicator)
+        
+        return indicators
+
+    def _emotion_severity_multiplier(self, emotion_analysis: Optional[EmotionAnalysis]) -> float:
+        """Severity multiplier from emotion analysis (1.0 when unavailable)"""
+        multiplier = 1.0
+        if emotion_analysis:
+            if emotion_analysis.primary_emotion.emotion in ["sadness", "fear", "anger"]:
+                multiplier *= 1.2
+            if emotion_analysis.emotional_complexity > 0.7:
+                multiplier *= 1.1
+        return multiplier
+
+    def _build_crisis_assessment(self, text: str, risk_factors: List[CrisisIndicator],
+                                 user_context: Optional[Dict[str, Any]],
+                                 emotion_analysis: Optional[EmotionAnalysis],
+                                 assessment_method: str) -> CrisisAssessment:
+        """Turn detected risk factors into a full crisis assessment"""
+        # Assess protective factors
+        protective_factors = self._assess_protective_factors(text, user_context)
+        
+        # Calculate overall crisis level
+        crisis_level = self._calculate_crisis_level(risk_factors, protective_factors)
+        
+        # Determine intervention needs
+        immediate_interventions = self._select_immediate_interventions(crisis_level, risk_factors)
+        followup_interventions = self._select_followup_interventions(crisis_level, risk_factors)
+        
+        # Safety planning and referral assessment
+        safety_plan_needed = crisis_level in [CrisisLevel.MODERATE, CrisisLevel.HIGH, CrisisLevel.CRITICAL]
+        professional_referral_urgent = crisis_level in [CrisisLevel.HIGH, CrisisLevel.CRITICAL]
+        
+        # Calculate confidence
+        assessment_confidence = self._calculate_assessment_confidence(risk_factors, emotion_analysis)
+        
+        return CrisisAssessment(
+            crisis_level=crisis_level,
+            risk_factors=risk_factors,
+            protective_factors=protective_factors,
+            immediate_interventions=immediate_interventions,
+            followup_interventions=followup_interventions,
+            safety_plan_needed=safety_plan_needed,
+            professional_referral_urgent=professional_referral_urgent,
+            assessment_confidence=assessment_confidence,
+            assessment_metadata={
+                "text_length": len(text),
+                "emotion_primary": emotion_analysis.primary_emotion.emotion if emotion_analysis else "unknown",
+                "user_context_available": user_context is not None,
+                "assessment_method": assessment_method
+            },
+            created_at=datetime.utcnow()
+        )
+
     def _assess_protective_factors(self, text: str, user_context: Optional[Dict[str, Any]]) -> List[str]:
         """Identify protective factors in text and context"""
         protective_factors = []
@@ -835,18 +984,8 @@ class AIInterventionService:
         if not sentences:
             return text[:max_chars]
         
-        # Crisis keywords (high priority)
-        crisis_keywords = [
-            'suicide', 'kill', 'die', 'death', 'hurt', 'pain', 'hopeless', 'worthless',
-            'end it', 'give up', "can't go on", 'no point', 'better off dead', 
-            'cut myself', 'self harm', 'overdose', 'jump', 'hanging', 'pills'
-        ]
-        
-        # Emotional escalation keywords (medium priority) 
-        escalation_keywords = [
-            'rage', 'angry', 'furious', 'explosive', 'losing it', "can't control",
-            'panic', 'anxiety', 'terrified', 'overwhelmed', 'breakdown', 'crying'
-        ]
+        crisis_keywords = CRISIS_PRIORITY_KEYWORDS
+        escalation_keywords = ESCALATION_KEYWORDS
         
         important_sentences = []
         current_length = 0
@@ -23,6 +23,7 @@ from app.core.cache_patterns import CacheDomain, CachePatterns, CacheKeyBuilder
 from app.services.cache_service import unified_cache_service
 from app.core.service_interfaces import ServiceRegistry
 from app.core.config import settings
+from app.core.request_timing import SPAN_MODEL, timing_span
 
 # Hardware-adaptive model selection
 from app.services.hardware_service import hardware_service
@@ -40,6 +41,29 @@ class ModelInfo:
         self.last_used = last_used or datetime.utcnow()
         self.usage_count = 0
 
+class TimedModel:
+    """
+    Proxy returned by get_model that attributes inference time to the current
+    request's latency breakdown (span model.<model_key>); everything else is
+    delegated to the wrapped pipeline
+    """
+    __slots__ = ("model", "span_name")
+
+    def __init__(self, model_key: str, model: Any):
+        self.model = model
+        self.span_name = f"{SPAN_MODEL}.{model_key}"
+
+    def __call__(self, *args, **kwargs):
+        with timing_span(self.span_name):
+            return self.model(*args, **kwargs)
+
+    def encode(self, *args, **kwargs):
+        with timing_span(self.span_name):
+            return self.model.encode(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.model, name)
+
 class AIModelManager:
     """
     Centralized AI Model Manager
@@ -250,7 +274,7 @@ class AIModelManager:
             **kwargs: Additional model loading parameters
             
         Returns:
-            Loaded model pipeline or None if unavailable
+            Loaded model pipeline (wrapped in TimedModel) or None if unavailable
         """
         try:
             # Ensure we're initialized
@@ -261,7 +285,7 @@ class AIModelManager:
             if model_key in self.loaded_models:
                 self._update_model_usage(model_key)
                 logger.debug(f"📖 Using cached model: {model_key}")
-                return self.loaded_models[model_key]
+                return TimedModel(model_key, self.loaded_models[model_key])
             
             # NOTE: AI model objects (transformers pipelines) cannot be properly serialized
             # for Redis cache due to their complexity. They should only be cached in memory.
@@ -274,8 +298,9 @@ class AIModelManager:
                 # Store in memory only (AI models can't be serialized for Redis)
                 self.loaded_models[model_key] = model
                 logger.info(f"✅ Model loaded and stored in memory: {model_key}")
+                return TimedModel(model_key, model)
             
-            return model
+            return None
             
         except Exception as e:
             logger.error(f"❌ Error loading model {model_key}: {e}")
@@ -13,7 +13,7 @@ from app.core.cache_patterns import (
     CachePatterns, CacheTTL, CacheKeyBuilder, CacheDomain, 
     CacheInvalidationPatterns, CacheMetrics
 )
-from app.services.redis_service_simple import simple_redis_service as redis_service
+from app.services.redis_service import redis_service
 
 logger = logging.getLogger(__name__)
 
@@ -269,7 +269,27 @@ class UnifiedCacheService:
         if ttl is None:
             ttl = CacheMetrics.get_recommended_ttl(domain, resource)
         return await self.redis.set(cache_key, data, ttl=ttl)
-    
+
+    async def delete(self, cache_key: str) -> bool:
+        """Delete a single cache key"""
+        return await self.redis.delete(cache_key)
+
+    # =============================================================================
+    # BATCH OPERATIONS (one round trip each)
+    # =============================================================================
+
+    async def get_many(self, cache_keys: List[str]) -> Dict[str, Any]:
+        """Get several cache keys with one MGET; missing keys are left out"""
+        return await self.redis.get_many(cache_keys)
+
+    async def set_many(self, items: Dict[str, Any], ttl: int = None) -> bool:
+        """Set several cache keys in one pipeline"""
+        return await self.redis.set_many(items, ttl=ttl or CacheTTL.HOURLY)
+
+    async def delete_many(self, cache_keys: List[str]) -> int:
+        """Delete several cache keys with one DEL"""
+        return await self.redis.delete_many(cache_keys)
+
     # =============================================================================
     # CACHE INVALIDATION METHODS
     # =============================================================================
@@ -280,11 +300,11 @@ class UnifiedCacheService:
         total_deleted = 0
         
         for pattern in patterns:
-            keys = await self.redis.scan_keys(pattern)
-            if keys:
-                await self.redis.delete(*keys)
-                total_deleted += len(keys)
-                logger.info(f"Invalidated {len(keys)} cache keys for pattern: {pattern}")
+            # Also drops near-cached copies in every worker
+            deleted = await self.redis.invalidate_pattern(pattern)
+            if deleted:
+                total_deleted += deleted
+                logger.info(f"Invalidated {deleted} cache keys for pattern: {pattern}")
         
         return total_deleted
     
@@ -294,11 +314,11 @@ class UnifiedCacheService:
         total_deleted = 0
         
         for pattern in patterns:
-            keys = await self.redis.scan_keys(pattern)
-            if keys:
-                await self.redis.delete(*keys)
-                total_deleted += len(keys)
-                logger.info(f"Invalidated {len(keys)} cache keys for pattern: {pattern}")
+            # Also drops near-cached copies in every worker
+            deleted = await self.redis.invalidate_pattern(pattern)
+            if deleted:
+                total_deleted += deleted
+                logger.info(f"Invalidated {deleted} cache keys for pattern: {pattern}")
         
         return total_deleted
     
@@ -308,11 +328,11 @@ class UnifiedCacheService:
         total_deleted = 0
         
         for pattern in patterns:
-            keys = await self.redis.scan_keys(pattern)
-            if keys:
-                await self.redis.delete(*keys)
-                total_deleted += len(keys)
-                logger.info(f"Invalidated {len(keys)} cache keys for pattern: {pattern}")
+            # Also drops near-cached copies in every worker
+            deleted = await self.redis.invalidate_pattern(pattern)
+            if deleted:
+                total_deleted += deleted
+                logger.info(f"Invalidated {deleted} cache keys for pattern: {pattern}")
         
         return total_deleted
     
@@ -336,6 +356,10 @@ class UnifiedCacheService:
         
         return metrics
     
+    def get_near_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Near-hit / far-hit rates of the in-process tier, or None when it is disabled"""
+        return self.redis.get_near_cache_stats()
+    
     async def cleanup_expired_cache(self) -> Dict[str, int]:
         """Clean up expired cache entries (placeholder for Redis automatic expiry)"""
         # Redis handles TTL automatically, but this can be extended for manual cleanup
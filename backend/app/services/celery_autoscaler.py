@@ -0,0 +1,385 @@
+# backend/app/services/celery_autoscaler.py
+"""
+Queue-Lag Celery Autoscaler
+Sizes each worker's pool from how far its queues are behind, measured on the
+Redis broker, instead of from the worker's own reserved-task count.
+
+- Depth is LLEN over a queue's priority sub-lists; backlog age comes from the
+  oldest message's publish timestamp header (stamped in before_task_publish)
+- Throughput is the rate of a shared per-queue completion counter, so every
+  worker on a queue sees the same drain rate
+- Each queue has a lag target; a worker scales up when any of its queues is
+  further behind than its target (backlog age or estimated drain time), and
+  scales down one step at a time only after several calm samples and a
+  cooldown, so a bursty queue does not flap the pool
+- Queue floors (crisis) keep a minimum concurrency however idle the queue is
+- Worker state and scaling decisions are written to the broker for the
+  monitoring API
+
+Enabled per worker with --autoscale=max,min (see celery_cpu_worker.worker_argv).
+"""
+
+import json
+import logging
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+from celery.concurrency.thread import TaskPool as ThreadTaskPool
+from celery.signals import before_task_publish, task_postrun
+from celery.worker.autoscale import Autoscaler
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Message header holding the publish time (epoch seconds)
+PUBLISHED_AT_HEADER = "published_at"
+
+# kombu's Redis transport stores priorities 0-9 in these sub-lists of a queue
+PRIORITY_STEPS = (0, 3, 6, 9)
+PRIORITY_SEPARATOR = "\x06\x16"
+
+# Broker keys
+COMPLETED_KEY = "celery:queue:{queue}:completed"
+AUTOSCALER_STATE_KEY = "celery:autoscaler:state:{hostname}"
+AUTOSCALER_DECISIONS_KEY = "celery:autoscaler:decisions"
+AUTOSCALER_STATE_TTL = 120
+AUTOSCALER_DECISIONS_KEPT = 200
+
+# Backlog lag (seconds) each queue may build up before its workers scale up
+QUEUE_LAG_TARGETS: Dict[str, float] = {
+    "crisis": 5.0,
+    "user_ops": 30.0,
+    "psychology": 60.0,
+    "default": 120.0,
+    "analytics": 600.0,
+    "maintenance": 900.0,
+}
+
+# Minimum concurrency of any worker consuming the queue
+QUEUE_CONCURRENCY_FLOORS: Dict[str, int] = {
+    "crisis": settings.CELERY_CRISIS_MIN_CONCURRENCY,
+}
+
+
+@dataclass
+class QueueSample:
+    """One broker measurement of a queue"""
+    queue: str
+    depth: int
+    oldest_age: Optional[float]     # Seconds; None when empty or unstamped
+    completed: int                  # Shared completion counter
+
+
+@dataclass(frozen=True)
+class ScalingPolicy:
+    """Thresholds and pacing for scaling decisions"""
+    scale_down_ratio: float = 0.25      # Calm when every queue is below this share of its target
+    calm_samples: int = 3               # Consecutive calm samples before shrinking
+    scale_up_cooldown: float = 15.0
+    scale_down_cooldown: float = 120.0
+    max_step: int = 4                   # Processes added per decision
+    throughput_smoothing: float = 0.3   # EWMA weight of the newest rate
+
+
+@dataclass
+class ScalingDecision:
+    current: int
+    target: int
+    reason: str
+    pressure: float                     # Worst queue lag / its target
+    queues: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    timestamp: float = field(default_factory=time.time)
+
+
+class BrokerQueueProbe:
+    """Reads queue depth, backlog age and completion counters from the Redis broker"""
+
+    def __init__(self, client=None, broker_url: Optional[str] = None, clock=time.time):
+        self._client = client
+        self.broker_url = broker_url or settings.CELERY_BROKER_URL
+        self._clock = clock
+
+    @property
+    def client(self):
+        if self._client is None:
+            # Sync client: the probe runs in worker threads and signal handlers
+            import redis
+            self._client = redis.Redis.from_url(self.broker_url, socket_timeout=2)
+        return self._client
+
+    @staticmethod
+    def queue_keys(queue: str) -> List[str]:
+        return [f"{queue}{PRIORITY_SEPARATOR}{step}" if step else queue for step in PRIORITY_STEPS]
+
+    def measure(self, queues: Iterable[str]) -> Dict[str, QueueSample]:
+        """Depth, oldest message age and completions for each queue in one round trip"""
+        queues = list(queues)
+        pipe = self.client.pipeline(transaction=False)
+        for queue in queues:
+            for key in self.queue_keys(queue):
+                pipe.llen(key)
+                pipe.lindex(key, -1)    # LPUSH'd, BRPOP'd: the tail is the oldest
+            pipe.get(COMPLETED_KEY.format(queue=queue))
+        replies = pipe.execute()
+
+        now = self._clock()
+        samples = {}
+        per_queue = 2 * len(PRIORITY_STEPS) + 1
+        for index, queue in enumerate(queues):
+            chunk = replies[index * per_queue:(index + 1) * per_queue]
+            depth = sum(int(length or 0) for length in chunk[0:-1:2])
+            published = [self._published_at(raw) for raw in chunk[1:-1:2]]
+            published = [value for value in published if value is not None]
+            samples[queue] = QueueSample(
+                queue=queue,
+                depth=depth,
+                oldest_age=max(0.0, now - min(published)) if published else None,
+                completed=int(chunk[-1] or 0),
+            )
+        return samples
+
+    @staticmethod
+    def _published_at(raw) -> Optional[float]:
+        if not raw:
+            return None
+        try:
+            headers = json.loads(raw).get("headers") or {}
+            return float(headers[PUBLISHED_AT_HEADER])
+        except (TypeError, ValueError, KeyError, AttributeError):
+            return None
+
+    def record_completion(self, queue: str) -> None:
+        self.client.incr(COMPLETED_KEY.format(queue=queue))
+
+    def publish_state(self, hostname: str, state: Dict[str, Any], decision: Optional[ScalingDecision] = None) -> None:
+        pipe = self.client.pipeline(transaction=False)
+        pipe.set(AUTOSCALER_STATE_KEY.format(hostname=hostname), json.dumps(state), ex=AUTOSCALER_STATE_TTL)
+        if decision is not None:
+            pipe.lpush(AUTOSCALER_DECISIONS_KEY, json.dumps({"hostname": hostname, **asdict(decision)}))
+            pipe.ltrim(AUTOSCALER_DECISIONS_KEY, 0, AUTOSCALER_DECISIONS_KEPT - 1)
+        pipe.execute()
+
+    def read_autoscalers(self, decision_limit: int = 50) -> Dict[str, Any]:
+        """Live worker autoscaler states and the most recent scaling decisions"""
+        keys = list(self.client.scan_iter(match=AUTOSCALER_STATE_KEY.format(hostname="*"), count=100))
+        states = self.client.mget(keys) if keys else []
+        decisions = self.client.lrange(AUTOSCALER_DECISIONS_KEY, 0, decision_limit - 1) if decision_limit > 0 else []
+        return {
+            "workers": [json.loads(state) for state in states if state],
+            "decisions": [json.loads(decision) for decision in decisions],
+        }
+
+
+class ThroughputTracker:
+    """Smoothed per-queue completion rate from successive counter samples"""
+
+    def __init__(self, smoothing: float = 0.3, clock=time.monotonic):
+        self.smoothing = smoothing
+        self._clock = clock
+        self._last: Dict[str, tuple] = {}
+        self.rates: Dict[str, float] = {}
+
+    def update(self, samples: Dict[str, QueueSample]) -> Dict[str, float]:
+        now = self._clock()
+        for queue, sample in samples.items():
+            previous = self._last.get(queue)
+            self._last[queue] = (now, sample.completed)
+            if previous is None or now <= previous[0]:
+                continue
+            delta = sample.completed - previous[1]
+            if delta < 0:
+                continue    # Counter was reset
+            rate = delta / (now - previous[0])
+            old = self.rates.get(queue)
+            self.rates[queue] = rate if old is None else old + self.smoothing * (rate - old)
+        return dict(self.rates)
+
+
+class QueueLagController:
+    """Turns queue samples into a target concurrency for one worker"""
+
+    def __init__(self, queues: Iterable[str], policy: Optional[ScalingPolicy] = None, clock=time.monotonic):
+        self.queues = tuple(queues)
+        self.policy = policy or ScalingPolicy()
+        self._clock = clock
+        self.throughput = ThroughputTracker(self.policy.throughput_smoothing, clock)
+        self.floor = max([QUEUE_CONCURRENCY_FLOORS.get(queue, 0) for queue in self.queues], default=0)
+        self._calm_samples = 0
+        self._last_scale_up: Optional[float] = None
+        self._last_change: Optional[float] = None
+
+    def queue_lag(self, sample: QueueSample, rate: Optional[float]) -> Dict[str, Any]:
+        """Backlog age and estimated drain time of one queue, relative to its target"""
+        drain = sample.depth / rate if sample.depth and rate else None
+        lag = max(sample.oldest_age or 0.0, drain or 0.0) if sample.depth else 0.0
+        target = QUEUE_LAG_TARGETS.get(sample.queue, QUEUE_LAG_TARGETS["default"])
+        return {
+            "depth": sample.depth,
+            "oldest_age": sample.oldest_age,
+            "throughput": rate,
+            "drain_seconds": drain,
+            "lag_seconds": lag,
+            "target_seconds": target,
+            "pressure": lag / target,
+        }
+
+    def decide(
+        self,
+        current: int,
+        min_concurrency: int,
+        max_concurrency: int,
+        samples: Dict[str, QueueSample],
+        reserved: int = 0,
+    ) -> ScalingDecision:
+        now = self._clock()
+        rates = self.throughput.update(samples)
+        lags = {queue: self.queue_lag(sample, rates.get(queue)) for queue, sample in samples.items()}
+        pressure = max([lag["pressure"] for lag in lags.values()], default=0.0)
+        floor = min(max(min_concurrency, self.floor), max_concurrency)
+
+        def decision(target: int, reason: str) -> ScalingDecision:
+            target = max(floor, min(max_concurrency, target))
+            if target > current:
+                self._last_scale_up = self._last_change = now
+            elif target < current:
+                self._last_change = now
+            return ScalingDecision(current=current, target=target, reason=reason, pressure=pressure, queues=lags)
+
+        if current < floor:
+            return decision(floor, "floor")
+        if current > max_concurrency:
+            return decision(max_concurrency, "max")
+
+        if pressure > 1.0:
+            self._calm_samples = 0
+            if self._last_scale_up is not None and now - self._last_scale_up < self.policy.scale_up_cooldown:
+                return decision(current, "scale_up_cooldown")
+            # Capacity proportional to how far behind target the worst queue is
+            wanted = math.ceil(max(current, 1) * pressure)
+            return decision(min(max(wanted, current + 1), current + self.policy.max_step), "queue_lag")
+
+        # Tasks waiting in this worker's own buffer also count as backlog
+        if pressure > self.policy.scale_down_ratio or reserved > current:
+            self._calm_samples = 0
+            return decision(current, "hold")
+
+        self._calm_samples += 1
+        if self._calm_samples < self.policy.calm_samples:
+            return decision(current, "hold")
+        if self._last_change is not None and now - self._last_change < self.policy.scale_down_cooldown:
+            return decision(current, "scale_down_cooldown")
+        self._calm_samples = 0
+        return decision(current - 1, "idle")
+
+
+class QueueLagAutoscaler(Autoscaler):
+    """Celery autoscaler driven by broker queue lag (set as worker_autoscaler)"""
+
+    def __init__(self, pool, max_concurrency, min_concurrency=0, worker=None, **kwargs):
+        super().__init__(pool, max_concurrency, min_concurrency, worker=worker, **kwargs)
+        self.queues = self._consumed_queues(worker)
+        self.controller = QueueLagController(self.queues)
+        self.probe = BrokerQueueProbe()
+        self.sample_interval = settings.CELERY_AUTOSCALE_INTERVAL
+        self.hostname = getattr(worker, "hostname", None) or "unknown"
+        self.last_decision: Optional[ScalingDecision] = None
+        self._last_sample = 0.0
+
+    @staticmethod
+    def _consumed_queues(worker) -> List[str]:
+        try:
+            queues = worker.app.amqp.queues
+            return sorted(queues.consume_from or queues)
+        except AttributeError:
+            return [settings.CELERY_WORKER_PROFILE or "default"]
+
+    def _maybe_scale(self, req=None):
+        now = time.monotonic()
+        if now - self._last_sample < self.sample_interval:
+            return False
+        self._last_sample = now
+
+        procs = self.processes
+        try:
+            samples = self.probe.measure(self.queues)
+        except Exception as e:
+            logger.warning(f"⚠️ Queue lag unavailable, using reserved-task autoscaling: {e}")
+            return super()._maybe_scale(req)
+
+        decision = self.controller.decide(procs, self.min_concurrency, self.max_concurrency, samples, self.qty)
+        self.last_decision = decision
+        changed = decision.target != procs
+        if changed:
+            logger.info(
+                f"📈 Autoscaler {self.hostname}: {procs} -> {decision.target} processes "
+                f"({decision.reason}, pressure {decision.pressure:.2f})"
+            )
+            if decision.target > procs:
+                self.scale_up(decision.target - procs)
+            else:
+                # The controller already applied hysteresis and cooldown
+                self._shrink(procs - decision.target)
+
+        try:
+            self.probe.publish_state(self.hostname, self.info(), decision if changed else None)
+        except Exception as e:
+            logger.debug(f"Could not publish autoscaler state: {e}")
+        return changed
+
+    def info(self):
+        info = super().info()
+        info.update({
+            "hostname": self.hostname,
+            "queues": self.queues,
+            "floor": self.controller.floor,
+            "last_decision": asdict(self.last_decision) if self.last_decision else None,
+            "updated_at": time.time(),
+        })
+        return info
+
+
+class ResizableThreadPool(ThreadTaskPool):
+    """Celery thread pool that supports grow/shrink, for the autoscaler"""
+
+    def grow(self, n=1):
+        self._resize(self.limit + n)
+
+    def shrink(self, n=1):
+        if self.limit - n < 1:
+            raise ValueError("cannot shrink the thread pool below one thread")
+        self._resize(self.limit - n)
+
+    def _resize(self, limit: int) -> None:
+        # Tasks already running finish on the old executor's threads; models are shared in-process
+        previous = self.executor
+        self.limit = limit
+        self.executor = ThreadPoolExecutor(max_workers=limit)
+        previous.shutdown(wait=False)
+
+
+# ==================== LAG SIGNALS ====================
+
+queue_probe = BrokerQueueProbe()
+
+
+@before_task_publish.connect
+def stamp_published_at(sender=None, headers=None, **kwargs):
+    """Record when a message entered the broker, for backlog age"""
+    if headers is not None:
+        headers[PUBLISHED_AT_HEADER] = time.time()
+
+
+@task_postrun.connect
+def count_queue_completion(sender=None, task=None, **kwargs):
+    """Advance the shared completion counter of the queue the task came from"""
+    try:
+        delivery_info = getattr(task.request, "delivery_info", None) or {}
+        queue = delivery_info.get("routing_key")
+        if queue:
+            queue_probe.record_completion(queue)
+    except Exception as e:
+        logger.debug(f"Could not count task completion: {e}")
@@ -0,0 +1,215 @@
+# backend/app/services/celery_bulk_dispatch.py
+"""
+Bulk Celery Task Fan-Out
+Dispatches thousands of small work items as a bounded stream of chunk tasks.
+
+- Items are packed into chunks; each chunk is one message to a "chunk task"
+  that takes a list of items and reports a result or an error per item
+- Chunks are published in batches over one pooled producer (one broker
+  connection per batch), in a dedicated executor so the event loop never waits
+  on the broker
+- At most max_in_flight chunks are outstanding; more are published as
+  earlier ones finish
+- Results are polled with one MGET per poll for all outstanding chunks and
+  yielded as each chunk completes
+- Items that failed are repacked and retried on their own, up to
+  max_attempts; items that succeeded are never re-run
+
+Chunk task contract (see run_chunk_items):
+    {"results": [result-or-None per item], "errors": {"<index>": "message"}}
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional, Sequence
+
+from app.services.celery_service import celery_app
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ChunkOutcome:
+    """One completed chunk, keyed by each item's index in the original input"""
+    task_id: str
+    attempt: int
+    results: Dict[int, Any] = field(default_factory=dict)
+    failed: Dict[int, str] = field(default_factory=dict)    # Out of attempts
+    retrying: List[int] = field(default_factory=list)       # Repacked for another attempt
+
+
+@dataclass
+class _Chunk:
+    indexes: List[int]
+    items: List[Any]
+    attempt: int = 1
+    task_id: Optional[str] = None
+    published_at: float = 0.0
+
+
+def chunk_result(results: Sequence[Any], errors: Optional[Dict[int, str]] = None) -> Dict[str, Any]:
+    """Result payload a chunk task returns"""
+    return {"results": list(results), "errors": {str(index): message for index, message in (errors or {}).items()}}
+
+
+def run_chunk_items(items: Sequence[Any], handler: Callable[[Any], Any]) -> Dict[str, Any]:
+    """Apply handler to each item of a chunk, recording failures per item"""
+    results: List[Any] = []
+    errors: Dict[int, str] = {}
+    for index, item in enumerate(items):
+        try:
+            results.append(handler(item))
+        except Exception as e:
+            results.append(None)
+            errors[index] = str(e) or type(e).__name__
+    return chunk_result(results, errors)
+
+
+class BulkDispatcher:
+    """Chunked, capped, streaming fan-out of items to a chunk task"""
+
+    def __init__(self, app=None, executor: Optional[ThreadPoolExecutor] = None, poll_interval: float = 0.5):
+        self.app = app or celery_app
+        # Publishing and result polling are blocking kombu/redis calls
+        self._executor = executor or ThreadPoolExecutor(max_workers=2, thread_name_prefix="celery-bulk")
+        self.poll_interval = poll_interval
+        self.stats = {
+            "dispatches": 0,
+            "chunks_published": 0,
+            "items_published": 0,
+            "items_retried": 0,
+            "items_failed": 0,
+            "chunks_timed_out": 0
+        }
+
+    async def dispatch(
+        self,
+        task_name: str,
+        items: Sequence[Any],
+        chunk_size: int = 100,
+        max_in_flight: int = 8,
+        max_attempts: int = 2,
+        kwargs: Optional[Dict[str, Any]] = None,
+        chunk_timeout: float = 600.0,
+    ) -> AsyncIterator[ChunkOutcome]:
+        """
+        Fan items out to a chunk task and yield outcomes as chunks complete
+
+        Args:
+            task_name: Chunk task taking the item list as its first argument
+            items: Work items (must be serializable)
+            chunk_size: Items per chunk task
+            max_in_flight: Chunks published but not yet finished
+            max_attempts: Attempts per item, counting the first
+            kwargs: Extra keyword arguments for every chunk task
+            chunk_timeout: Seconds before an unfinished chunk's items are reported failed
+                (not retried: the chunk may still be running)
+        """
+        chunk_size = max(1, chunk_size)
+        max_in_flight = max(1, max_in_flight)
+        loop = asyncio.get_running_loop()
+        self.stats["dispatches"] += 1
+
+        pending: Deque[_Chunk] = deque(
+            _Chunk(indexes=list(range(start, min(start + chunk_size, len(items)))),
+                   items=list(items[start:start + chunk_size]))
+            for start in range(0, len(items), chunk_size)
+        )
+        in_flight: Dict[str, _Chunk] = {}
+
+        while pending or in_flight:
+            if pending and len(in_flight) < max_in_flight:
+                batch = [pending.popleft() for _ in range(min(len(pending), max_in_flight - len(in_flight)))]
+                await loop.run_in_executor(self._executor, self._publish, task_name, batch, kwargs or {})
+                in_flight.update((chunk.task_id, chunk) for chunk in batch)
+
+            ready = await loop.run_in_executor(self._executor, self._collect, list(in_flight))
+            for task_id, meta in ready.items():
+                chunk = in_flight.pop(task_id, None)
+                if chunk is not None:
+                    yield self._settle(chunk, meta, pending, chunk_size, max_attempts)
+
+            now = time.monotonic()
+            for task_id, chunk in list(in_flight.items()):
+                if now - chunk.published_at > chunk_timeout:
+                    del in_flight[task_id]
+                    self.stats["chunks_timed_out"] += 1
+                    self.stats["items_failed"] += len(chunk.indexes)
+                    yield ChunkOutcome(task_id=task_id, attempt=chunk.attempt,
+                                       failed={index: "timed out" for index in chunk.indexes})
+
+            if in_flight and not ready:
+                await asyncio.sleep(self.poll_interval)
+
+    async def dispatch_all(self, task_name: str, items: Sequence[Any], **options) -> Dict[str, Any]:
+        """Run a bulk dispatch to completion and merge its outcomes"""
+        results: Dict[int, Any] = {}
+        failed: Dict[int, str] = {}
+        async for outcome in self.dispatch(task_name, items, **options):
+            results.update(outcome.results)
+            failed.update(outcome.failed)
+        return {"total": len(items), "succeeded": len(results), "failed": failed, "results": results}
+
+    def _publish(self, task_name: str, chunks: List[_Chunk], kwargs: Dict[str, Any]) -> None:
+        """Send a batch of chunk tasks through one pooled producer (blocking)"""
+        with self.app.producer_or_acquire() as producer:
+            for chunk in chunks:
+                result = self.app.send_task(task_name, args=(chunk.items,), kwargs=kwargs, producer=producer)
+                chunk.task_id = result.id
+                chunk.published_at = time.monotonic()
+        self.stats["chunks_published"] += len(chunks)
+        self.stats["items_published"] += sum(len(chunk.items) for chunk in chunks)
+        logger.info(f"📤 Bulk dispatch: published {len(chunks)} {task_name} chunks")
+
+    def _collect(self, task_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Finished chunk results, one backend round trip for all of them (blocking)"""
+        if not task_ids:
+            return {}
+        return dict(self.app.backend.get_many(set(task_ids), interval=0, max_iterations=1))
+
+    def _settle(self, chunk: _Chunk, meta: Dict[str, Any], pending: Deque[_Chunk],
+                chunk_size: int, max_attempts: int) -> ChunkOutcome:
+        outcome = ChunkOutcome(task_id=chunk.task_id, attempt=chunk.attempt)
+        payload = meta.get("result")
+
+        if meta.get("status") == "SUCCESS" and isinstance(payload, dict) and "results" in payload:
+            errors = {int(index): message for index, message in (payload.get("errors") or {}).items()}
+            results = payload.get("results") or []
+            for position, index in enumerate(chunk.indexes):
+                if position in errors or position >= len(results):
+                    errors.setdefault(position, "missing result")
+                else:
+                    outcome.results[index] = results[position]
+        else:
+            # The whole chunk failed (task error, revoked or unexpected payload)
+            message = str(payload) if payload is not None else meta.get("status", "unknown")
+            errors = {position: message for position in range(len(chunk.indexes))}
+
+        if not errors:
+            return outcome
+
+        positions = sorted(errors)
+        if chunk.attempt < max_attempts:
+            # Repack only the failed items
+            for start in range(0, len(positions), chunk_size):
+                retry = positions[start:start + chunk_size]
+                pending.append(_Chunk(indexes=[chunk.indexes[p] for p in retry],
+                                      items=[chunk.items[p] for p in retry],
+                                      attempt=chunk.attempt + 1))
+            outcome.retrying = [chunk.indexes[position] for position in positions]
+            self.stats["items_retried"] += len(positions)
+        else:
+            outcome.failed = {chunk.indexes[position]: errors[position] for position in positions}
+            self.stats["items_failed"] += len(positions)
+        return outcome
+
+    def get_stats(self) -> Dict[str, Any]:
+        return dict(self.stats)
+
+
+# Global bulk dispatcher instance
+bulk_dispatcher = BulkDispatcher()
@@ -0,0 +1,319 @@
+# backend/app/services/celery_cpu_worker.py
+"""
+Model-Warm Celery Worker Profiles
+Dedicated worker pools per queue group, each loading its queue's AI models
+before it takes tasks, so the first task after a restart or scale-up does not
+pay a cold model load.
+
+- the crisis pool uses the threads pool: one process holds one shared copy
+  of each model, and inference releases the GIL
+- queues whose tasks use the database or Redis (psychology, user_ops, ...)
+  run on prefork: each task's asyncio.run() opens and closes the process-wide
+  engine and Redis client (UnifiedDatabaseService.run_in_task), which
+  concurrent threads of one process would share across event loops
+- prefork pools on CPU load models in the parent before forking and freeze
+  them out of the GC, so children share the pages copy-on-write; prefork is
+  not supported for models on GPU (CUDA does not survive fork), such a worker
+  never reports ready
+- Readiness is a file written only once the profile's models are warm
+  (for container health checks); it is removed on shutdown
+
+Usage:
+    python -m app.services.celery_cpu_worker crisis
+    # or run worker_argv(profile) with worker_env(profile) set, e.g.
+    # CELERY_WORKER_PROFILE=crisis CELERY_CUSTOM_WORKER_POOL=app.services.celery_autoscaler:ResizableThreadPool \
+    #     celery -A app.services.celery_service:celery_app worker --include=app.services.celery_cpu_worker \
+    #         --pool=custom ...
+"""
+
+import asyncio
+import gc
+import logging
+import os
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from celery.signals import worker_init, worker_process_init, worker_ready, worker_shutdown
+
+from app.core.config import settings
+from app.services.celery_service import CeleryConfig
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class WorkerProfile:
+    """Queues, models and pool settings for one dedicated worker pool"""
+    name: str
+    queues: Tuple[str, ...]
+    models: Tuple[str, ...] = ()        # ai_model_manager model keys to preload
+    pool: str = "threads"               # "threads" or "prefork"
+    concurrency: int = 4
+    min_concurrency: Optional[int] = None   # With max_concurrency: autoscale on queue lag
+    max_concurrency: Optional[int] = None
+    prefetch_multiplier: int = 1        # Model tasks are long; don't hoard them
+    max_tasks_per_child: Optional[int] = None  # prefork only
+    time_limit: int = 600
+    soft_time_limit: int = 300
+
+
+# The stock thread pool cannot grow or shrink, so autoscaled thread workers use a resizable one.
+# --pool only takes Celery's pool names: an out-of-tree pool is selected with --pool=custom and
+# named in CUSTOM_POOL_ENV, which Celery reads when celery.concurrency is imported
+AUTOSCALED_POOLS = {"threads": "app.services.celery_autoscaler:ResizableThreadPool"}
+CUSTOM_POOL_ENV = "CELERY_CUSTOM_WORKER_POOL"
+
+
+# Queue ownership must match CeleryConfig.task_routes (see validate_profiles)
+WORKER_PROFILES: Dict[str, WorkerProfile] = {
+    "crisis": WorkerProfile(
+        name="crisis",
+        queues=("crisis",),
+        models=("zero_shot_classifier", "emotion_classifier", "sentiment_classifier"),
+        pool="threads",
+        concurrency=4,
+        min_concurrency=4,
+        max_concurrency=8,
+    ),
+    # Also serves bulk crisis re-screening (analytics), which needs the zero-shot model
+    # but must not compete with real-time crisis detection. Insight snapshot tasks
+    # use the database and Redis, so children are processes, not threads
+    "psychology": WorkerProfile(
+        name="psychology",
+        queues=("psychology", "analytics"),
+        models=("emotion_classifier", "sentiment_classifier", "zero_shot_classifier", "text_generator"),
+        pool="prefork",
+        concurrency=4,
+        min_concurrency=2,
+        max_concurrency=8,
+        max_tasks_per_child=500,
+        time_limit=1200,
+        soft_time_limit=600,
+    ),
+    "maintenance": WorkerProfile(
+        name="maintenance",
+        queues=("maintenance", "user_ops", "default"),
+        pool="prefork",
+        concurrency=2,
+        min_concurrency=1,
+        max_concurrency=4,
+        prefetch_multiplier=4,
+        max_tasks_per_child=1000,
+    ),
+}
+
+
+def get_profile(name: Optional[str]) -> Optional[WorkerProfile]:
+    if not name:
+        return None
+    profile = WORKER_PROFILES.get(name)
+    if profile is None:
+        raise ValueError(f"Unknown worker profile '{name}' (expected one of {', '.join(WORKER_PROFILES)})")
+    return profile
+
+
+def validate_profiles(profiles: Optional[Dict[str, WorkerProfile]] = None) -> List[str]:
+    """Problems with how the profiles cover the declared queues, routes and beat schedule"""
+    profiles = WORKER_PROFILES if profiles is None else profiles
+    problems = []
+
+    declared = {queue.name for queue in CeleryConfig.task_queues}
+    consumers: Dict[str, List[str]] = {}
+    for profile in profiles.values():
+        for queue in profile.queues:
+            consumers.setdefault(queue, []).append(profile.name)
+            if queue not in declared:
+                problems.append(f"profile '{profile.name}' consumes undeclared queue '{queue}'")
+
+    for queue in sorted(declared):
+        owners = consumers.get(queue, [])
+        if not owners:
+            problems.append(f"queue '{queue}' is not consumed by any worker profile")
+        elif len(owners) > 1:
+            problems.append(f"queue '{queue}' is consumed by several profiles: {', '.join(owners)}")
+
+    routed = [(pattern, route["queue"]) for pattern, route in CeleryConfig.task_routes.items()]
+    routed += [(name, entry["options"]["queue"]) for name, entry in CeleryConfig.beat_schedule.items()
+               if "queue" in entry.get("options", {})]
+    for source, queue in routed:
+        if queue not in consumers:
+            problems.append(f"'{source}' routes to queue '{queue}' which no worker profile consumes")
+
+    return problems
+
+
+class ModelWarmer:
+    """Preloads a profile's models and tracks whether this worker is warm"""
+
+    def __init__(self, profile: WorkerProfile):
+        self.profile = profile
+        self.warm_models: List[str] = []
+        self.failed_models: List[str] = []
+        self.load_seconds = 0.0
+
+    @property
+    def is_warm(self) -> bool:
+        return not self.failed_models and len(self.warm_models) == len(self.profile.models)
+
+    def preload(self) -> bool:
+        """Load every model of the profile in this process; True when all are warm"""
+        if not self.profile.models:
+            return True
+
+        start = time.perf_counter()
+        asyncio.run(self._load_models())
+        self.load_seconds = time.perf_counter() - start
+
+        if self.failed_models:
+            logger.error(f"❌ Worker profile '{self.profile.name}' could not warm models: {self.failed_models}")
+        else:
+            logger.info(
+                f"🔥 Worker profile '{self.profile.name}' warmed {len(self.warm_models)} models "
+                f"in {self.load_seconds:.1f}s (pid {os.getpid()})"
+            )
+        return self.is_warm
+
+    async def _load_models(self) -> None:
+        # Lazy import: the model manager pulls in torch/transformers
+        from app.services.ai_model_manager import ai_model_manager
+
+        self.warm_models, self.failed_models = [], []
+        for model_key in self.profile.models:
+            try:
+                model = await ai_model_manager.get_model(model_key)
+            except Exception as e:
+                logger.warning(f"⚠️ Preloading {model_key} failed: {e}")
+                model = None
+            (self.warm_models if model is not None else self.failed_models).append(model_key)
+
+    def limit_torch_threads(self) -> None:
+        """Split CPU cores between concurrent tasks instead of oversubscribing them"""
+        try:
+            import torch
+            torch.set_num_threads(max(1, (os.cpu_count() or 1) // self.profile.concurrency))
+        except ImportError:
+            pass
+
+
+def ready_file(profile: WorkerProfile) -> Path:
+    return Path(settings.CELERY_WORKER_READY_DIR) / f"celery-worker-{profile.name}.ready"
+
+
+def custom_pool(profile: WorkerProfile) -> Optional[str]:
+    """Out-of-tree pool class ("module:Class") the profile runs on, None for a stock pool"""
+    if profile.max_concurrency is None:
+        return None
+    return AUTOSCALED_POOLS.get(profile.pool)
+
+
+def worker_argv(profile: WorkerProfile, loglevel: str = "INFO") -> List[str]:
+    """Celery worker command line for a profile (see worker_env for its environment)"""
+    autoscaled = profile.max_concurrency is not None
+    pool = "custom" if custom_pool(profile) else profile.pool
+    argv = [
+        "celery", "-A", "app.services.celery_service:celery_app", "worker",
+        # Imports this module, connecting its signals, before worker_init fires
+        "--include=app.services.celery_cpu_worker",
+        f"--hostname={profile.name}@%h",
+        f"--loglevel={loglevel}",
+        f"--pool={pool}",
+        f"--concurrency={profile.concurrency}",
+        f"--queues={','.join(profile.queues)}",
+        f"--prefetch-multiplier={profile.prefetch_multiplier}",
+        f"--time-limit={profile.time_limit}",
+        f"--soft-time-limit={profile.soft_time_limit}",
+        "--events",
+    ]
+    if autoscaled:
+        # Starts at min; QueueLagAutoscaler (worker_autoscaler) grows it on backlog
+        argv.append(f"--autoscale={profile.max_concurrency},{profile.min_concurrency or profile.concurrency}")
+    if profile.pool == "prefork" and profile.max_tasks_per_child:
+        argv.append(f"--max-tasks-per-child={profile.max_tasks_per_child}")
+    return argv
+
+
+def worker_env(profile: WorkerProfile) -> Dict[str, str]:
+    """Environment variables the worker command line of a profile depends on"""
+    env = {"CELERY_WORKER_PROFILE": profile.name}
+    pool_class = custom_pool(profile)
+    if pool_class:
+        env[CUSTOM_POOL_ENV] = pool_class
+    return env
+
+
+# ==================== WORKER SIGNALS ====================
+
+active_profile = get_profile(settings.CELERY_WORKER_PROFILE)
+model_warmer = ModelWarmer(active_profile) if active_profile else None
+
+
+@worker_init.connect
+def preload_profile_models(sender=None, **kwargs):
+    """Runs in the main worker process before the consumer starts"""
+    if model_warmer is None:
+        return
+
+    ready_file(model_warmer.profile).unlink(missing_ok=True)
+    for problem in validate_profiles():
+        logger.warning(f"⚠️ Worker routing: {problem}")
+
+    if model_warmer.profile.pool == "prefork" and model_warmer.profile.models:
+        from app.services.ai_model_manager import ai_model_manager
+        if ai_model_manager.has_gpu:
+            # A CUDA context created here would be unusable in the forked children
+            logger.error(
+                f"❌ Worker profile '{model_warmer.profile.name}' preloads GPU models on a prefork pool; "
+                f"use the threads pool"
+            )
+            return
+
+    model_warmer.limit_torch_threads()
+    model_warmer.preload()
+    if model_warmer.profile.pool == "prefork":
+        # Keep the loaded objects out of GC passes so children don't dirty their pages
+        gc.freeze()
+
+
+@worker_process_init.connect
+def warm_pool_child(**kwargs):
+    """Runs in each prefork child before it is given tasks"""
+    if model_warmer is not None:
+        model_warmer.limit_torch_threads()
+
+
+@worker_ready.connect
+def signal_worker_ready(sender=None, **kwargs):
+    if model_warmer is None:
+        return
+
+    if model_warmer.is_warm:
+        ready_file(model_warmer.profile).touch()
+        logger.info(f"✅ Worker profile '{model_warmer.profile.name}' ready on queues {model_warmer.profile.queues}")
+    else:
+        logger.error(f"❌ Worker profile '{model_warmer.profile.name}' is consuming but not warm; readiness withheld")
+
+
+@worker_shutdown.connect
+def clear_worker_ready(sender=None, **kwargs):
+    if model_warmer is not None:
+        ready_file(model_warmer.profile).unlink(missing_ok=True)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Exec a Celery worker for the profile named on the command line"""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in WORKER_PROFILES:
+        print(f"usage: python -m app.services.celery_cpu_worker {{{','.join(WORKER_PROFILES)}}} [loglevel]")
+        sys.exit(2)
+
+    profile = WORKER_PROFILES[argv[0]]
+    os.environ.update(worker_env(profile))
+    command = worker_argv(profile, *argv[1:2])
+    os.execvp(command[0], command)
+
+
+if __name__ == "__main__":
+    main()
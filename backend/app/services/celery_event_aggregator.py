@@ -0,0 +1,322 @@
+# backend/app/services/celery_event_aggregator.py
+"""
+Celery Event Ingestion and Aggregation
+Keeps Celery event capture off the API event loop.
+
+- A daemon thread owns the broker connection and EventReceiver; it reduces each
+  event to a small tuple and appends it to a bounded ring buffer
+- The ring buffer is a deque with maxlen: append and popleft are atomic, so the
+  capture thread and the loop share it without locks; when the loop falls
+  behind the oldest events are dropped (and counted) instead of growing memory
+- The monitoring loop drains the buffer and folds events into per-task-name
+  counters, runtime histograms and failure rates, and per-worker heartbeat state
+- Changes since the last publish are kept as a delta, so publishing costs one
+  Redis call for the task names that actually changed
+"""
+
+import logging
+import socket
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from celery.events import EventReceiver
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the runtime histogram buckets; the last bucket is open-ended
+RUNTIME_BUCKETS = (0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0, 900.0)
+
+TASK_EVENT_TYPES = ("sent", "received", "started", "succeeded", "failed", "retried")
+
+# A worker is considered offline after missing this many heartbeats
+HEARTBEAT_MISSES_OFFLINE = 3
+
+
+class CapturedEvent(NamedTuple):
+    """The parts of a Celery event the aggregator uses"""
+    type: str
+    uuid: Optional[str]
+    name: Optional[str]
+    hostname: Optional[str]
+    timestamp: float
+    runtime: Optional[float] = None
+    queue: Optional[str] = None
+    exception: Optional[str] = None
+    active: Optional[int] = None
+    processed: Optional[int] = None
+    freq: Optional[float] = None
+    loadavg: Optional[tuple] = None
+    sw_ver: Optional[str] = None
+
+    @classmethod
+    def from_event(cls, event: Dict[str, Any]) -> "CapturedEvent":
+        loadavg = event.get("loadavg")
+        return cls(
+            type=event.get("type", ""),
+            uuid=event.get("uuid"),
+            name=event.get("name"),
+            hostname=event.get("hostname"),
+            timestamp=event.get("timestamp") or time.time(),
+            runtime=event.get("runtime"),
+            queue=event.get("queue") or event.get("routing_key"),
+            exception=event.get("exception"),
+            active=event.get("active"),
+            processed=event.get("processed"),
+            freq=event.get("freq"),
+            loadavg=tuple(loadavg) if loadavg else None,
+            sw_ver=event.get("sw_ver"),
+        )
+
+
+class EventRingBuffer:
+    """Bounded single-producer/single-consumer event buffer that drops the oldest when full"""
+
+    def __init__(self, capacity: int = 10000):
+        self.capacity = capacity
+        self._events = deque(maxlen=capacity)
+        self.pushed = 0     # Written only by the producer
+        self.popped = 0     # Written only by the consumer
+
+    def push(self, event: CapturedEvent) -> None:
+        self._events.append(event)
+        self.pushed += 1
+
+    def drain(self, limit: Optional[int] = None) -> List[CapturedEvent]:
+        events = []
+        while limit is None or len(events) < limit:
+            try:
+                events.append(self._events.popleft())
+            except IndexError:
+                break
+        self.popped += len(events)
+        return events
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    @property
+    def dropped(self) -> int:
+        return max(0, self.pushed - self.popped - len(self._events))
+
+
+@dataclass
+class TaskStats:
+    """Event counts and runtime histogram for one task name"""
+    counts: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(TASK_EVENT_TYPES, 0))
+    runtime_buckets: List[int] = field(default_factory=lambda: [0] * (len(RUNTIME_BUCKETS) + 1))
+    runtime_ms: int = 0
+
+    def record(self, event_type: str, runtime: Optional[float] = None) -> None:
+        self.counts[event_type] = self.counts.get(event_type, 0) + 1
+        if runtime is not None:
+            self.runtime_ms += int(runtime * 1000)
+            index = next((i for i, bound in enumerate(RUNTIME_BUCKETS) if runtime <= bound), len(RUNTIME_BUCKETS))
+            self.runtime_buckets[index] += 1
+
+    @property
+    def completed(self) -> int:
+        return self.counts["succeeded"] + self.counts["failed"]
+
+    @property
+    def failure_rate(self) -> float:
+        return self.counts["failed"] / self.completed if self.completed else 0.0
+
+    def runtime_percentile(self, fraction: float) -> Optional[float]:
+        """Upper bound of the bucket holding the given percentile (seconds)"""
+        total = sum(self.runtime_buckets)
+        if not total:
+            return None
+        rank = fraction * total
+        seen = 0
+        for index, count in enumerate(self.runtime_buckets):
+            seen += count
+            if seen >= rank:
+                return RUNTIME_BUCKETS[index] if index < len(RUNTIME_BUCKETS) else float("inf")
+        return float("inf")
+
+    def to_dict(self) -> Dict[str, Any]:
+        timed = sum(self.runtime_buckets)
+        return {
+            **self.counts,
+            "failure_rate": self.failure_rate,
+            "avg_runtime_seconds": self.runtime_ms / 1000 / timed if timed else None,
+            "p50_runtime_seconds": self.runtime_percentile(0.5),
+            "p95_runtime_seconds": self.runtime_percentile(0.95),
+            "runtime_histogram": dict(zip([f"le_{bound:g}" for bound in RUNTIME_BUCKETS] + ["le_inf"], self.runtime_buckets)),
+        }
+
+    def flat_counters(self, name: str) -> Dict[str, int]:
+        """Non-zero counters as "<task>|<counter>" fields for publishing"""
+        fields = {f"{name}|{event_type}": count for event_type, count in self.counts.items() if count}
+        if self.runtime_ms:
+            fields[f"{name}|runtime_ms"] = self.runtime_ms
+        for bound, count in zip([f"{bound:g}" for bound in RUNTIME_BUCKETS] + ["inf"], self.runtime_buckets):
+            if count:
+                fields[f"{name}|le_{bound}"] = count
+        return fields
+
+
+class EventAggregator:
+    """Incremental per-task and per-worker statistics from captured events"""
+
+    def __init__(self, name_cache_size: int = 20000, recent_failures: int = 50):
+        self.tasks: Dict[str, TaskStats] = {}
+        self.task_queues: Dict[str, str] = {}
+        self.workers: Dict[str, Dict[str, Any]] = {}
+        self.recent_failures = deque(maxlen=recent_failures)
+        self.events_applied = 0
+        self.failures_seen = 0
+        self.started_at = time.time()
+        self._delta: Dict[str, TaskStats] = {}
+        # Only task-sent/received carry the task name; later events are matched by uuid
+        self._names: "OrderedDict[str, str]" = OrderedDict()
+        self._name_cache_size = name_cache_size
+
+    def apply(self, events: List[CapturedEvent]) -> None:
+        for event in events:
+            if event.type.startswith("task-"):
+                self._apply_task_event(event)
+            elif event.type.startswith("worker-"):
+                self._apply_worker_event(event)
+            self.events_applied += 1
+
+    def _task_name(self, event: CapturedEvent) -> str:
+        if event.name:
+            if event.uuid:
+                self._names[event.uuid] = event.name
+                self._names.move_to_end(event.uuid)
+                while len(self._names) > self._name_cache_size:
+                    self._names.popitem(last=False)
+            return event.name
+        return self._names.get(event.uuid, "unknown")
+
+    def _apply_task_event(self, event: CapturedEvent) -> None:
+        event_type = event.type[len("task-"):]
+        if event_type not in TASK_EVENT_TYPES:
+            return
+        name = self._task_name(event)
+        if event_type == "sent" and event.queue:
+            self.task_queues[name] = event.queue
+
+        runtime = event.runtime if event_type == "succeeded" else None
+        self.tasks.setdefault(name, TaskStats()).record(event_type, runtime)
+        self._delta.setdefault(name, TaskStats()).record(event_type, runtime)
+
+        if event_type == "failed":
+            self.failures_seen += 1
+            self.recent_failures.append({
+                "task_id": event.uuid,
+                "task_name": name,
+                "worker": event.hostname,
+                "exception": event.exception,
+                "timestamp": event.timestamp,
+            })
+        if event_type in ("succeeded", "failed") and event.uuid:
+            self._names.pop(event.uuid, None)
+
+    def _apply_worker_event(self, event: CapturedEvent) -> None:
+        if not event.hostname:
+            return
+        worker = self.workers.setdefault(event.hostname, {"hostname": event.hostname})
+        worker["online"] = event.type != "worker-offline"
+        worker["last_heartbeat"] = event.timestamp
+        for key in ("active", "processed", "freq", "loadavg", "sw_ver"):
+            value = getattr(event, key)
+            if value is not None:
+                worker[key] = value
+
+    def worker_online(self, worker: Dict[str, Any], now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        freq = worker.get("freq") or 2.0
+        return worker.get("online", False) and now - worker.get("last_heartbeat", 0) <= freq * HEARTBEAT_MISSES_OFFLINE
+
+    def take_delta(self) -> Dict[str, int]:
+        """Counters accumulated since the previous call, flattened for publishing"""
+        delta, self._delta = self._delta, {}
+        fields: Dict[str, int] = {}
+        for name, stats in delta.items():
+            fields.update(stats.flat_counters(name))
+        return fields
+
+    def restore_delta(self, fields: Dict[str, int]) -> None:
+        """Put back a delta that could not be published"""
+        for key, amount in fields.items():
+            name, _, counter = key.rpartition("|")
+            stats = self._delta.setdefault(name, TaskStats())
+            if counter in stats.counts:
+                stats.counts[counter] += amount
+            elif counter == "runtime_ms":
+                stats.runtime_ms += amount
+            elif counter.startswith("le_"):
+                bounds = [f"{bound:g}" for bound in RUNTIME_BUCKETS] + ["inf"]
+                stats.runtime_buckets[bounds.index(counter[3:])] += amount
+
+    def totals(self) -> Dict[str, int]:
+        totals = dict.fromkeys(TASK_EVENT_TYPES, 0)
+        for stats in self.tasks.values():
+            for event_type, count in stats.counts.items():
+                totals[event_type] += count
+        return totals
+
+    def queue_stats(self, queue: str) -> Dict[str, Any]:
+        """Completed count, failure rate and mean runtime of the tasks routed to a queue"""
+        names = [name for name, routed in self.task_queues.items() if routed == queue]
+        succeeded = sum(self.tasks[name].counts["succeeded"] for name in names if name in self.tasks)
+        failed = sum(self.tasks[name].counts["failed"] for name in names if name in self.tasks)
+        timed = sum(sum(self.tasks[name].runtime_buckets) for name in names if name in self.tasks)
+        runtime_ms = sum(self.tasks[name].runtime_ms for name in names if name in self.tasks)
+        elapsed = max(time.time() - self.started_at, 1.0)
+        return {
+            "average_processing_time": runtime_ms / 1000 / timed if timed else 0.0,
+            "error_rate": failed / (succeeded + failed) if succeeded + failed else 0.0,
+            "throughput": (succeeded + failed) / elapsed,
+            "recent_task_count": succeeded + failed,
+        }
+
+
+class EventCaptureThread(threading.Thread):
+    """Consumes Celery events on its own connection and feeds a ring buffer"""
+
+    def __init__(self, app, buffer: EventRingBuffer, reconnect_delay: float = 5.0):
+        super().__init__(name="celery-event-capture", daemon=True)
+        self.app = app
+        self.buffer = buffer
+        self.reconnect_delay = reconnect_delay
+        self._stop_event = threading.Event()
+        self._receiver: Optional[EventReceiver] = None
+        self.errors = 0
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._receiver is not None:
+            self._receiver.should_stop = True
+
+    @property
+    def stopped(self) -> bool:
+        return self._stop_event.is_set()
+
+    def _on_event(self, event: Dict[str, Any]) -> None:
+        event_type = event.get("type", "")
+        if event_type.startswith(("task-", "worker-")):
+            self.buffer.push(CapturedEvent.from_event(event))
+
+    def run(self) -> None:
+        while not self.stopped:
+            try:
+                with self.app.connection() as connection:
+                    self._receiver = EventReceiver(connection, handlers={"*": self._on_event}, app=self.app)
+                    wakeup = True   # Ask workers for a heartbeat once per connection
+                    while not self.stopped:
+                        try:
+                            self._receiver.capture(limit=None, timeout=1.0, wakeup=wakeup)
+                        except socket.timeout:
+                            pass
+                        wakeup = False
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"❌ Celery event capture failed, reconnecting in {self.reconnect_delay:.0f}s: {e}")
+                self._stop_event.wait(self.reconnect_delay)
+        logger.info("🛑 Celery event capture stopped")
@@ -8,31 +8,50 @@ import logging
 import asyncio
 import time
 from typing import Dict, Any, List, Optional, Union
-from datetime import datetime, timedelta
+from datetime import datetime
 from dataclasses import dataclass, asdict
 from enum import Enum
 import json
+import uuid
 import psutil
-import socket
 import requests
 from contextlib import asynccontextmanager
 
-from app.core.cache_patterns import CachePatterns, CacheTTL, CacheKeyBuilder, CacheDomain
+from app.core.cache_patterns import CachePatterns, CacheTTL
 
 # Celery monitoring imports
 from celery import Celery
-from celery.events.state import State
-from celery.events import EventReceiver
-from kombu import Connection
 
 # App imports
-from app.services.celery_service import celery_app, celery_service
-from app.services.redis_service_simple import simple_redis_service as redis_service
+from app.services.celery_service import celery_app, celery_service, TaskPriority
+from app.services.celery_event_aggregator import EventAggregator, EventCaptureThread, EventRingBuffer
+from app.services.celery_autoscaler import QUEUE_LAG_TARGETS, queue_probe
+from app.services.redis_service import redis_service
 from app.core.config import settings
 from app.core.performance_monitor import performance_monitor
 
 logger = logging.getLogger(__name__)
 
+# Cumulative event counters stay for a week after the last publish
+TASK_STATS_TTL = 7 * 24 * 3600
+
+# Adds a flat {"<task>|<counter>": n} delta to the stats hash, but only from the
+# process holding the publisher lock: every process receives every event, so
+# deltas from the others would be double counts
+PUBLISH_TASK_DELTA_SCRIPT = """
+local owner = redis.call('GET', KEYS[2])
+if owner and owner ~= ARGV[1] then
+    return 0
+end
+redis.call('SET', KEYS[2], ARGV[1], 'EX', tonumber(ARGV[2]))
+local delta = cjson.decode(ARGV[4])
+for field, amount in pairs(delta) do
+    redis.call('HINCRBY', KEYS[1], field, amount)
+end
+redis.call('EXPIRE', KEYS[1], tonumber(ARGV[3]))
+return 1
+"""
+
 class WorkerStatus(Enum):
     """Worker status enumeration"""
     ONLINE = "online"
@@ -102,9 +121,12 @@ class CeleryMonitoringService:
     
     def __init__(self):
         self._monitoring_active = False
-        self._event_receiver = None
-        self._state = State()
-        self._monitoring_interval = 30  # seconds
+        self._monitoring_interval = 30  # seconds between snapshots
+        self._publish_interval = 5  # seconds between event delta publishes
+        self._events = EventRingBuffer(capacity=10000)
+        self._aggregator = EventAggregator()
+        self._capture_thread: Optional[EventCaptureThread] = None
+        self._instance_id = uuid.uuid4().hex
         self._performance_thresholds = {
             'max_queue_size': 1000,
             'max_processing_time': 300,  # 5 minutes
@@ -119,12 +141,8 @@ class CeleryMonitoringService:
         try:
             logger.info("🔍 Initializing Celery monitoring service...")
             
-            # Test Celery app connectivity
-            with celery_app.connection() as conn:
-                conn.ensure_connection(max_retries=3)
-            
-            # Initialize state tracking
-            self._state = State()
+            # Test Celery app connectivity (blocking kombu call, kept off the loop)
+            await asyncio.to_thread(self._check_broker_connection, 3)
             
             logger.info("✅ Celery monitoring service initialized")
             
@@ -132,6 +150,11 @@ class CeleryMonitoringService:
             logger.error(f"❌ Error initializing Celery monitoring: {e}")
             raise
     
+    @staticmethod
+    def _check_broker_connection(max_retries: int = 1) -> None:
+        with celery_app.connection() as conn:
+            conn.ensure_connection(max_retries=max_retries, timeout=5)
+    
     async def start_monitoring(self) -> None:
         """Start continuous monitoring of Celery workers and queues"""
         if self._monitoring_active:
@@ -142,14 +165,12 @@ class CeleryMonitoringService:
             self._monitoring_active = True
             logger.info("🚀 Starting Celery monitoring...")
             
-            # Start monitoring loop
-            monitoring_task = asyncio.create_task(self._monitoring_loop())
-            
-            # Start event processing
-            event_task = asyncio.create_task(self._process_events())
+            # Event capture blocks on the broker, so it gets its own thread
+            self._capture_thread = EventCaptureThread(celery_app, self._events)
+            self._capture_thread.start()
             
-            # Wait for tasks to complete (they run indefinitely)
-            await asyncio.gather(monitoring_task, event_task)
+            # Runs until stop_monitoring
+            await self._monitoring_loop()
             
         except Exception as e:
             logger.error(f"Error in Celery monitoring: {e}")
@@ -159,239 +180,133 @@ class CeleryMonitoringService:
     async def stop_monitoring(self) -> None:
         """Stop monitoring service"""
         self._monitoring_active = False
-        if self._event_receiver:
-            self._event_receiver.should_stop = True
+        if self._capture_thread:
+            self._capture_thread.stop()
+            self._capture_thread = None
         
         logger.info("🛑 Celery monitoring stopped")
     
     async def _monitoring_loop(self) -> None:
-        """Main monitoring loop"""
+        """Fold captured events in and publish deltas often; store a snapshot every interval"""
+        next_snapshot = 0.0
         while self._monitoring_active:
             try:
-                # Collect comprehensive metrics
-                worker_stats = await self.get_worker_statistics()
-                queue_stats = await self.get_queue_statistics()
-                task_stats = await self.get_task_statistics()
+                failures = self._ingest_events()
+                await self._publish_task_delta()
+                if failures:
+                    await self._alert_task_failures(failures)
                 
-                # Perform health checks
-                health_status = await self.perform_health_checks()
-                
-                # Store monitoring data
-                monitoring_data = {
-                    'timestamp': datetime.utcnow().isoformat(),
-                    'workers': worker_stats,
-                    'queues': queue_stats,
-                    'tasks': task_stats,
-                    'health_status': health_status,
-                    'system_metrics': await self._get_system_metrics()
-                }
-                
-                # Store in Redis for dashboard access using standardized pattern
-                cache_key = CacheKeyBuilder.build_key(CacheDomain.CELERY, "monitoring_snapshot")
-                await redis_service.set(
-                    cache_key,
-                    monitoring_data,
-                    ttl=self._monitoring_interval * 2
-                )
-                
-                # Check for alerts
-                await self._check_monitoring_alerts(monitoring_data)
-                
-                # Sleep until next monitoring cycle
-                await asyncio.sleep(self._monitoring_interval)
+                if time.monotonic() >= next_snapshot:
+                    next_snapshot = time.monotonic() + self._monitoring_interval
+                    await self._store_snapshot()
                 
             except Exception as e:
                 logger.error(f"Error in monitoring loop: {e}")
-                await asyncio.sleep(self._monitoring_interval)
+            
+            await asyncio.sleep(self._publish_interval)
     
-    async def _process_events(self) -> None:
-        """Process Celery events for real-time monitoring"""
-        try:
-            with celery_app.connection() as connection:
-                recv = EventReceiver(
-                    connection,
-                    handlers={
-                        'task-sent': self._on_task_sent,
-                        'task-received': self._on_task_received,
-                        'task-started': self._on_task_started,
-                        'task-succeeded': self._on_task_succeeded,
-                        'task-failed': self._on_task_failed,
-                        'task-retried': self._on_task_retried,
-                        'worker-online': self._on_worker_online,
-                        'worker-offline': self._on_worker_offline,
-                        'worker-heartbeat': self._on_worker_heartbeat,
-                    }
-                )
-                
-                self._event_receiver = recv
-                
-                # Process events
-                while self._monitoring_active:
-                    try:
-                        recv.capture(limit=None, timeout=1.0, wakeup=True)
-                    except socket.timeout:
-                        continue
-                    except Exception as e:
-                        logger.error(f"Error processing events: {e}")
-                        await asyncio.sleep(1)
+    def _ingest_events(self) -> List[Dict[str, Any]]:
+        """Apply buffered events to the aggregates; returns the new task failures"""
+        failures_before = self._aggregator.failures_seen
+        self._aggregator.apply(self._events.drain())
         
-        except Exception as e:
-            logger.error(f"Error setting up event processing: {e}")
+        new_failures = self._aggregator.failures_seen - failures_before
+        return list(self._aggregator.recent_failures)[-new_failures:] if new_failures else []
     
-    def _on_task_sent(self, event: Dict[str, Any]) -> None:
-        """Handle task-sent event"""
-        self._state.event(event)
+    async def _publish_task_delta(self) -> None:
+        """Add the counters changed since the last publish to the shared Redis hash"""
+        delta = self._aggregator.take_delta()
+        if not delta:
+            return
         
-        # Track task dispatch metrics
-        asyncio.create_task(self._track_task_event('sent', event))
-    
-    def _on_task_received(self, event: Dict[str, Any]) -> None:
-        """Handle task-received event"""
-        self._state.event(event)
-        asyncio.create_task(self._track_task_event('received', event))
+        applied = await redis_service.run_script(
+            PUBLISH_TASK_DELTA_SCRIPT,
+            keys=[CachePatterns.celery_task_stats(), CachePatterns.celery_stats_publisher()],
+            args=[self._instance_id, self._publish_interval * 3, TASK_STATS_TTL, json.dumps(delta)]
+        )
+        if applied is None:
+            # Redis unavailable: keep the counts for the next publish
+            self._aggregator.restore_delta(delta)
     
-    def _on_task_started(self, event: Dict[str, Any]) -> None:
-        """Handle task-started event"""
-        self._state.event(event)
-        asyncio.create_task(self._track_task_event('started', event))
-    
-    def _on_task_succeeded(self, event: Dict[str, Any]) -> None:
-        """Handle task-succeeded event"""
-        self._state.event(event)
-        asyncio.create_task(self._track_task_event('succeeded', event))
+    async def _alert_task_failures(self, failures: List[Dict[str, Any]]) -> None:
+        """Record alerts for failed critical and high-priority tasks"""
+        for failure in failures:
+            task_name = failure.get('task_name') or 'unknown'
+            logger.error(f"❌ Task failed: {task_name} [{failure.get('task_id', 'unknown')}]")
+            
+            priority = celery_service._get_task_priority(task_name)
+            if priority not in (TaskPriority.CRITICAL, TaskPriority.HIGH):
+                continue
+            
+            logger.critical(f"🚨 CRITICAL TASK FAILURE: {task_name} - {failure.get('exception')}")
+            await redis_service.set(
+                f"alert:task_failure:{failure.get('task_id')}",
+                {**failure, 'alert_type': 'task_failure', 'priority': priority.value},
+                ttl=86400  # 24 hours
+            )
     
-    def _on_task_failed(self, event: Dict[str, Any]) -> None:
-        """Handle task-failed event"""
-        self._state.event(event)
-        asyncio.create_task(self._track_task_event('failed', event))
+    async def _store_snapshot(self) -> None:
+        worker_stats = await self.get_worker_statistics()
+        queue_stats = await self.get_queue_statistics()
+        task_stats = await self.get_task_statistics()
         
-        # Log critical failures
-        task_name = event.get('name', 'unknown')
-        logger.error(f"❌ Task failed: {task_name} [{event.get('uuid', 'unknown')}]")
-    
-    def _on_task_retried(self, event: Dict[str, Any]) -> None:
-        """Handle task-retried event"""
-        self._state.event(event)
-        asyncio.create_task(self._track_task_event('retried', event))
-    
-    def _on_worker_online(self, event: Dict[str, Any]) -> None:
-        """Handle worker-online event"""
-        self._state.event(event)
-        worker_name = event.get('hostname', 'unknown')
-        logger.info(f"✅ Worker online: {worker_name}")
+        monitoring_data = {
+            'timestamp': datetime.utcnow().isoformat(),
+            'workers': worker_stats,
+            'queues': queue_stats,
+            'tasks': task_stats,
+            'health_status': await self.perform_health_checks(worker_stats, queue_stats, task_stats),
+            'system_metrics': await self._get_system_metrics()
+        }
         
-        asyncio.create_task(self._track_worker_event('online', event))
-    
-    def _on_worker_offline(self, event: Dict[str, Any]) -> None:
-        """Handle worker-offline event"""
-        self._state.event(event)
-        worker_name = event.get('hostname', 'unknown')
-        logger.warning(f"⚠️ Worker offline: {worker_name}")
+        await redis_service.set(
+            CachePatterns.celery_monitoring_snapshot(),
+            monitoring_data,
+            ttl=self._monitoring_interval * 2
+        )
         
-        asyncio.create_task(self._track_worker_event('offline', event))
+        await self._check_monitoring_alerts(monitoring_data)
     
-    def _on_worker_heartbeat(self, event: Dict[str, Any]) -> None:
-        """Handle worker-heartbeat event"""
-        self._state.event(event)
-        asyncio.create_task(self._track_worker_event('heartbeat', event))
+    def get_ingestion_stats(self) -> Dict[str, Any]:
+        """Event capture and ring buffer health"""
+        return {
+            'capture_running': bool(self._capture_thread and self._capture_thread.is_alive()),
+            'capture_errors': self._capture_thread.errors if self._capture_thread else 0,
+            'buffered': len(self._events),
+            'buffer_capacity': self._events.capacity,
+            'dropped': self._events.dropped,
+            'events_applied': self._aggregator.events_applied
+        }
     
-    async def _track_task_event(self, event_type: str, event: Dict[str, Any]) -> None:
-        """Track task events for analytics"""
-        try:
-            # Update counters
-            await redis_service.increment(f"celery_task_events:{event_type}")
-            await redis_service.increment("celery_total_task_events")
-            
-            # Store recent events for debugging
-            event_key = f"celery_recent_events:{event_type}"
-            recent_events = await redis_service.get(event_key) or []
-            
-            # Add new event
-            event_data = {
-                'timestamp': datetime.utcnow().isoformat(),
-                'task_id': event.get('uuid', 'unknown'),
-                'task_name': event.get('name', 'unknown'),
-                'worker': event.get('hostname', 'unknown'),
-                'event_data': event
-            }
-            
-            recent_events.append(event_data)
-            
-            # Keep only last 100 events per type
-            if len(recent_events) > 100:
-                recent_events.pop(0)
-            
-            await redis_service.set(event_key, recent_events, ttl=3600)
-            
-        except Exception as e:
-            logger.error(f"Error tracking task event: {e}")
-    
-    async def _track_worker_event(self, event_type: str, event: Dict[str, Any]) -> None:
-        """Track worker events for monitoring"""
-        try:
-            # Update worker status tracking
-            worker_name = event.get('hostname', 'unknown')
-            worker_status_key = f"celery_worker_status:{worker_name}"
-            
-            status_data = {
-                'status': event_type,
-                'timestamp': datetime.utcnow().isoformat(),
-                'event_data': event
-            }
-            
-            await redis_service.set(worker_status_key, status_data, ttl=300)  # 5 minutes
-            
-            # Update counters
-            await redis_service.increment(f"celery_worker_events:{event_type}")
-            
-        except Exception as e:
-            logger.error(f"Error tracking worker event: {e}")
+    def get_recent_failures(self) -> List[Dict[str, Any]]:
+        return list(self._aggregator.recent_failures)
     
     async def get_worker_statistics(self) -> List[Dict[str, Any]]:
-        """Get comprehensive worker statistics"""
+        """Worker state from heartbeat events (no broadcast round trip)"""
         try:
             worker_stats = []
+            now = time.time()
             
-            # Get active workers from Celery
-            inspect = celery_app.control.inspect()
-            
-            # Get worker status
-            stats = inspect.stats()
-            active_workers = inspect.active()
-            registered_tasks = inspect.registered()
-            
-            if stats:
-                for worker_name, worker_data in stats.items():
-                    try:
-                        # Get active tasks for this worker
-                        active_tasks = active_workers.get(worker_name, []) if active_workers else []
-                        
-                        # Get system metrics for worker
-                        worker_info = {
-                            'hostname': worker_name,
-                            'status': WorkerStatus.ONLINE.value,
-                            'active_tasks': len(active_tasks),
-                            'processed_tasks': worker_data.get('total', {}).get('count', 0),
-                            'failed_tasks': 0,  # Would need to track failures
-                            'cpu_usage': 0.0,  # Would get from worker if available
-                            'memory_usage': 0.0,  # Would get from worker if available
-                            'load_average': worker_data.get('rusage', {}).get('stime', 0),
-                            'last_heartbeat': datetime.utcnow().isoformat(),
-                            'queues': list(worker_data.get('pool', {}).get('processes', [])),
-                            'software_info': {
-                                'celery_version': worker_data.get('sw_ver', 'unknown'),
-                                'python_version': worker_data.get('sw_sys', 'unknown')
-                            },
-                            'registered_tasks': len(registered_tasks.get(worker_name, [])) if registered_tasks else 0,
-                            'pool_info': worker_data.get('pool', {}),
-                            'broker_info': worker_data.get('broker', {})
-                        }
-                        
-                        worker_stats.append(worker_info)
-                        
-                    except Exception as e:
-                        logger.error(f"Error getting stats for worker {worker_name}: {e}")
-                        continue
+            for hostname, worker in self._aggregator.workers.items():
+                online = self._aggregator.worker_online(worker, now)
+                active = worker.get('active', 0) or 0
+                
+                worker_stats.append({
+                    'hostname': hostname,
+                    'status': (WorkerStatus.ONLINE if online else WorkerStatus.OFFLINE).value,
+                    'activity': (WorkerStatus.BUSY if active else WorkerStatus.IDLE).value if online else None,
+                    'active_tasks': active,
+                    'processed_tasks': worker.get('processed', 0) or 0,
+                    'failed_tasks': sum(
+                        1 for failure in self._aggregator.recent_failures if failure.get('worker') == hostname
+                    ),
+                    'cpu_usage': 0.0,  # Not reported in heartbeats
+                    'memory_usage': 0.0,
+                    'load_average': list(worker.get('loadavg') or []),
+                    'last_heartbeat': datetime.utcfromtimestamp(worker['last_heartbeat']).isoformat(),
+                    'queues': [],
+                    'software_info': {'celery_version': worker.get('sw_ver', 'unknown')}
+                })
             
             # If no workers found, check if any should be running
             if not worker_stats:
@@ -409,10 +324,7 @@ class CeleryMonitoringService:
                     'load_average': 0.0,
                     'last_heartbeat': None,
                     'queues': [],
-                    'software_info': {},
-                    'registered_tasks': 0,
-                    'pool_info': {},
-                    'broker_info': {}
+                    'software_info': {}
                 })
             
             return worker_stats
@@ -429,43 +341,45 @@ class CeleryMonitoringService:
             # Define expected queues from configuration
             expected_queues = ['crisis', 'psychology', 'user_ops', 'analytics', 'maintenance', 'default']
             
-            # Get queue info from Redis broker
-            with celery_app.connection() as connection:
-                for queue_name in expected_queues:
-                    try:
-                        # Get basic queue info
-                        # Note: This is simplified - real implementation would query Redis directly
-                        queue_info = {
-                            'name': queue_name,
-                            'status': QueueStatus.HEALTHY.value,
-                            'message_count': 0,  # Would get from Redis
-                            'consumer_count': 1,  # Would get from broker
-                            'average_processing_time': 0.0,
-                            'error_rate': 0.0,
-                            'throughput': 0.0,
-                            'priority_distribution': {'high': 0, 'normal': 0, 'low': 0},
-                            'oldest_message_age': 0,
-                            'processing_rate': 0.0,
-                            'estimated_completion_time': None
-                        }
-                        
-                        # Get task statistics for this queue
-                        queue_task_stats = await self._get_queue_task_stats(queue_name)
-                        queue_info.update(queue_task_stats)
-                        
-                        # Determine queue status
-                        if queue_info['message_count'] > self._performance_thresholds['max_queue_size']:
-                            queue_info['status'] = QueueStatus.CONGESTED.value
-                        elif queue_info['average_processing_time'] > self._performance_thresholds['max_processing_time']:
-                            queue_info['status'] = QueueStatus.STALLED.value
-                        elif queue_info['message_count'] == 0:
-                            queue_info['status'] = QueueStatus.EMPTY.value
-                        
-                        queue_stats.append(queue_info)
-                        
-                    except Exception as e:
-                        logger.error(f"Error getting stats for queue {queue_name}: {e}")
-                        continue
+            # Depth and backlog age from the Redis broker (blocking client)
+            samples = await asyncio.to_thread(queue_probe.measure, expected_queues)
+            
+            for queue_name in expected_queues:
+                try:
+                    sample = samples[queue_name]
+                    queue_info = {
+                        'name': queue_name,
+                        'status': QueueStatus.HEALTHY.value,
+                        'message_count': sample.depth,
+                        'consumer_count': 1,  # Would get from broker
+                        'average_processing_time': 0.0,
+                        'error_rate': 0.0,
+                        'throughput': 0.0,
+                        'priority_distribution': {'high': 0, 'normal': 0, 'low': 0},
+                        'oldest_message_age': sample.oldest_age or 0,
+                        'lag_target_seconds': QUEUE_LAG_TARGETS.get(queue_name),
+                        'processed_total': sample.completed,
+                        'processing_rate': 0.0,
+                        'estimated_completion_time': None
+                    }
+                    
+                    # Get task statistics for this queue
+                    queue_task_stats = await self._get_queue_task_stats(queue_name)
+                    queue_info.update(queue_task_stats)
+                    
+                    # Determine queue status
+                    if queue_info['message_count'] > self._performance_thresholds['max_queue_size']:
+                        queue_info['status'] = QueueStatus.CONGESTED.value
+                    elif queue_info['average_processing_time'] > self._performance_thresholds['max_processing_time']:
+                        queue_info['status'] = QueueStatus.STALLED.value
+                    elif queue_info['message_count'] == 0:
+                        queue_info['status'] = QueueStatus.EMPTY.value
+                    
+                    queue_stats.append(queue_info)
+                    
+                except Exception as e:
+                    logger.error(f"Error getting stats for queue {queue_name}: {e}")
+                    continue
             
             return queue_stats
             
@@ -476,35 +390,7 @@ class CeleryMonitoringService:
     async def _get_queue_task_stats(self, queue_name: str) -> Dict[str, Any]:
         """Get task statistics for a specific queue"""
         try:
-            # Get recent task events for this queue
-            task_events = await redis_service.get(f"celery_recent_events:started") or []
-            
-            # Filter events for this queue and last hour
-            one_hour_ago = datetime.utcnow() - timedelta(hours=1)
-            recent_tasks = [
-                event for event in task_events
-                if event.get('queue') == queue_name and 
-                datetime.fromisoformat(event['timestamp']) > one_hour_ago
-            ]
-            
-            # Calculate statistics
-            if recent_tasks:
-                processing_times = [
-                    task.get('processing_time', 0) for task in recent_tasks
-                    if task.get('processing_time')
-                ]
-                
-                avg_processing_time = sum(processing_times) / len(processing_times) if processing_times else 0
-                throughput = len(recent_tasks) / 1.0  # tasks per hour
-            else:
-                avg_processing_time = 0
-                throughput = 0
-            
-            return {
-                'average_processing_time': avg_processing_time,
-                'throughput': throughput,
-                'recent_task_count': len(recent_tasks)
-            }
+            return self._aggregator.queue_stats(queue_name)
             
         except Exception as e:
             logger.error(f"Error getting queue task stats: {e}")
@@ -515,26 +401,26 @@ class CeleryMonitoringService:
             }
     
     async def get_task_statistics(self) -> Dict[str, Any]:
-        """Get comprehensive task execution statistics"""
+        """Task counts, runtimes and failure rates aggregated from events"""
         try:
-            # Get task event counters
+            events_by_type = self._aggregator.totals()
             task_stats = {
-                'total_events': await redis_service.get("celery_total_task_events") or 0,
-                'events_by_type': {},
-                'recent_tasks': [],
-                'task_performance': {},
-                'error_analysis': {}
+                'total_events': sum(events_by_type.values()),
+                'events_by_type': events_by_type,
+                'recent_tasks': list(reversed(self._aggregator.recent_failures))[:20],
+                'task_performance': {
+                    name: stats.to_dict() for name, stats in self._aggregator.tasks.items()
+                },
+                'error_analysis': {
+                    name: {'failed': stats.counts['failed'], 'failure_rate': stats.failure_rate}
+                    for name, stats in self._aggregator.tasks.items() if stats.counts['failed']
+                },
+                'ingestion': self.get_ingestion_stats()
             }
             
-            # Get event counts by type
-            event_types = ['sent', 'received', 'started', 'succeeded', 'failed', 'retried']
-            for event_type in event_types:
-                count = await redis_service.get(f"celery_task_events:{event_type}") or 0
-                task_stats['events_by_type'][event_type] = count
-            
             # Calculate success rate
-            succeeded = task_stats['events_by_type'].get('succeeded', 0)
-            failed = task_stats['events_by_type'].get('failed', 0)
+            succeeded = events_by_type.get('succeeded', 0)
+            failed = events_by_type.get('failed', 0)
             total_completed = succeeded + failed
             
             if total_completed > 0:
@@ -544,18 +430,6 @@ class CeleryMonitoringService:
                 task_stats['success_rate'] = 1.0
                 task_stats['error_rate'] = 0.0
             
-            # Get recent task details
-            for event_type in ['succeeded', 'failed']:
-                recent_events = await redis_service.get(f"celery_recent_events:{event_type}") or []
-                task_stats['recent_tasks'].extend(recent_events[-10:])  # Last 10 of each type
-            
-            # Sort by timestamp
-            task_stats['recent_tasks'].sort(
-                key=lambda x: x.get('timestamp', ''), 
-                reverse=True
-            )
-            task_stats['recent_tasks'] = task_stats['recent_tasks'][:20]  # Top 20 recent
-            
             return task_stats
             
         except Exception as e:
@@ -568,8 +442,13 @@ class CeleryMonitoringService:
                 'error_rate': 1.0
             }
     
-    async def perform_health_checks(self) -> Dict[str, Any]:
-        """Perform comprehensive health checks on Celery system"""
+    async def perform_health_checks(
+        self,
+        worker_stats: Optional[List[Dict[str, Any]]] = None,
+        queue_stats: Optional[List[Dict[str, Any]]] = None,
+        task_stats: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Perform comprehensive health checks on Celery system (reuses stats passed in)"""
         try:
             health_status = {
                 'overall_status': 'healthy',
@@ -580,8 +459,7 @@ class CeleryMonitoringService:
             
             # Check 1: Broker connectivity
             try:
-                with celery_app.connection() as conn:
-                    conn.ensure_connection(max_retries=1, timeout=5)
+                await asyncio.to_thread(self._check_broker_connection)
                 health_status['checks']['broker_connectivity'] = 'healthy'
             except Exception as e:
                 health_status['checks']['broker_connectivity'] = 'unhealthy'
@@ -589,7 +467,8 @@ class CeleryMonitoringService:
                 health_status['overall_status'] = 'unhealthy'
             
             # Check 2: Worker availability
-            worker_stats = await self.get_worker_statistics()
+            if worker_stats is None:
+                worker_stats = await self.get_worker_statistics()
             online_workers = [w for w in worker_stats if w['status'] == WorkerStatus.ONLINE.value]
             
             if len(online_workers) == 0:
@@ -605,7 +484,8 @@ class CeleryMonitoringService:
                 health_status['checks']['worker_availability'] = 'healthy'
             
             # Check 3: Queue congestion
-            queue_stats = await self.get_queue_statistics()
+            if queue_stats is None:
+                queue_stats = await self.get_queue_statistics()
             congested_queues = [q for q in queue_stats if q['status'] == QueueStatus.CONGESTED.value]
             
             if congested_queues:
@@ -617,7 +497,8 @@ class CeleryMonitoringService:
                 health_status['checks']['queue_congestion'] = 'healthy'
             
             # Check 4: Error rate
-            task_stats = await self.get_task_statistics()
+            if task_stats is None:
+                task_stats = await self.get_task_statistics()
             error_rate = task_stats.get('error_rate', 0)
             
             if error_rate > self._performance_thresholds['max_error_rate']:
@@ -667,7 +548,7 @@ class CeleryMonitoringService:
         """Get system-level metrics for monitoring"""
         try:
             return {
-                'cpu_usage': psutil.cpu_percent(interval=1),
+                'cpu_usage': psutil.cpu_percent(interval=None),  # Since the last call; never sleeps
                 'memory_usage': psutil.virtual_memory().percent,
                 'disk_usage': psutil.disk_usage('/').percent,
                 'load_average': list(psutil.getloadavg()) if hasattr(psutil, 'getloadavg') else [0, 0, 0],
@@ -729,7 +610,7 @@ class CeleryMonitoringService:
         """Get comprehensive data for monitoring dashboard"""
         try:
             # Get latest monitoring snapshot
-            monitoring_data = await redis_service.get("celery_monitoring_snapshot")
+            monitoring_data = await redis_service.get(CachePatterns.celery_monitoring_snapshot())
             
             if not monitoring_data:
                 # Generate fresh data if not available
@@ -929,7 +810,7 @@ async def restart_failed_tasks(max_retries: int = 3) -> Dict[str, Any]:
         logger.info("🔄 Restarting failed tasks...")
         
         # Get recent failed tasks
-        failed_events = await redis_service.get("celery_recent_events:failed") or []
+        failed_events = celery_monitoring_service.get_recent_failures()
         
         restart_results = {
             'tasks_found': len(failed_events),
@@ -974,27 +855,25 @@ async def restart_failed_tasks(max_retries: int = 3) -> Dict[str, Any]:
         }
 
 async def scale_workers(queue_name: str, target_workers: int) -> Dict[str, Any]:
-    """Scale workers for a specific queue (placeholder for production implementation)"""
+    """
+    Pin the concurrency of every worker consuming a queue to at least target_workers
+    
+    Autoscaled workers get target_workers as their new minimum (the queue lag
+    autoscaler may still grow them up to their maximum); fixed-size pools are
+    grown or shrunk to it.
+    """
     try:
         logger.info(f"📈 Scaling workers for queue {queue_name} to {target_workers}")
+        workers = await asyncio.to_thread(_set_queue_concurrency, queue_name, target_workers)
         
-        # In production, this would:
-        # 1. Use container orchestration (Docker Compose, Kubernetes)
-        # 2. Start/stop worker processes dynamically
-        # 3. Update worker configuration
-        # 4. Monitor scaling success
-        
-        scaling_result = {
+        return {
             'queue_name': queue_name,
             'target_workers': target_workers,
-            'scaling_status': 'simulated',  # Would be 'success' in production
-            'current_workers': 1,  # Would get actual count
-            'message': f"Worker scaling for {queue_name} would be implemented in production",
+            'scaling_status': 'success' if workers else 'no_workers',
+            'workers': workers,
             'timestamp': datetime.utcnow().isoformat()
         }
         
-        return scaling_result
-        
     except Exception as e:
         logger.error(f"Error scaling workers: {e}")
         return {
@@ -1004,6 +883,37 @@ async def scale_workers(queue_name: str, target_workers: int) -> Dict[str, Any]:
             'timestamp': datetime.utcnow().isoformat()
         }
 
+def _set_queue_concurrency(queue_name: str, target: int, timeout: float = 2.0) -> Dict[str, Any]:
+    """Broadcast concurrency changes to the workers consuming a queue (blocking)"""
+    inspect = celery_app.control.inspect(timeout=timeout)
+    consumers = [
+        hostname for hostname, queues in (inspect.active_queues() or {}).items()
+        if any(queue.get('name') == queue_name for queue in queues)
+    ]
+    if not consumers:
+        return {}
+    
+    stats = celery_app.control.inspect(destination=consumers, timeout=timeout).stats() or {}
+    results = {}
+    for hostname in consumers:
+        worker_stats = stats.get(hostname, {})
+        autoscaler = worker_stats.get('autoscaler')
+        if autoscaler:
+            new_max = max(target, autoscaler.get('max', target))
+            celery_app.control.autoscale(new_max, target, destination=[hostname])
+            results[hostname] = {'mode': 'autoscale', 'min': target, 'max': new_max,
+                                 'previous_min': autoscaler.get('min')}
+            continue
+        
+        current = worker_stats.get('pool', {}).get('max-concurrency', target)
+        if target > current:
+            celery_app.control.pool_grow(target - current, destination=[hostname])
+        elif target < current:
+            celery_app.control.pool_shrink(current - target, destination=[hostname])
+        results[hostname] = {'mode': 'pool', 'previous': current, 'current': target}
+    
+    return results
+
 # === CELERY WORKER STARTUP SCRIPT ===
 
 def create_worker_startup_script() -> str:
@@ -19,8 +19,7 @@ import asyncio
 import json
 
 from app.core.config import settings
-from app.services.redis_service_simple import simple_redis_service as redis_service
-from app.core.performance_monitor import performance_monitor
+from app.services.celery_autoscaler import ThroughputTracker, queue_probe
 
 logger = logging.getLogger(__name__)
 
@@ -97,11 +96,18 @@ class CeleryConfig:
     worker_max_tasks_per_child = 1000  # Prevent memory leaks
     worker_disable_rate_limits = True  # Better performance
     
+    # Scales on broker queue lag when a worker runs with --autoscale
+    worker_autoscaler = 'app.services.celery_autoscaler:QueueLagAutoscaler'
+    
     # === ROUTING & QUEUES ===
     task_routes = {
         # Crisis detection - highest priority
         'app.tasks.crisis.*': {'queue': 'crisis', 'priority': 9},
         
+        # Bulk crisis re-screening must not delay real-time detection
+        'app.tasks.crisis.batch_detect_crisis_patterns': {'queue': 'analytics', 'priority': 3},
+        'app.tasks.crisis.rescreen_crisis_chunk': {'queue': 'analytics', 'priority': 3},
+        
         # Psychology processing - high priority
         'app.tasks.psychology.*': {'queue': 'psychology', 'priority': 7},
         
@@ -177,6 +183,12 @@ class CeleryConfig:
             'options': {'queue': 'psychology', 'priority': 7}
         },
         
+        'schedule-insight-precompute': {
+            'task': 'app.tasks.psychology.schedule_insight_precompute',
+            'schedule': timedelta(minutes=10),  # Activity-weighted per user
+            'options': {'queue': 'psychology', 'priority': 5}
+        },
+        
         'monitor-crisis-patterns': {
             'task': 'app.tasks.crisis.monitor_user_patterns',
             'schedule': timedelta(minutes=5),   # Every 5 minutes
@@ -187,6 +199,18 @@ class CeleryConfig:
             'task': 'app.tasks.maintenance.system_health_check',
             'schedule': timedelta(minutes=10),  # Every 10 minutes
             'options': {'queue': 'maintenance', 'priority': 2}
+        },
+        
+        'flush-gin-pending-lists': {
+            'task': 'app.tasks.maintenance.flush_gin_pending_lists',
+            'schedule': timedelta(minutes=10),  # Keeps entry saves off the GIN merge path
+            'options': {'queue': 'maintenance', 'priority': 1}
+        },
+        
+        'maintain-table-partitions': {
+            'task': 'app.tasks.maintenance.maintain_table_partitions',
+            'schedule': timedelta(hours=24),  # Daily; partitions are premade months ahead
+            'options': {'queue': 'maintenance', 'priority': 1}
         }
     }
 
@@ -200,6 +224,7 @@ class CeleryService:
         self.app = None
         self._initialized = False
         self._task_metrics: Dict[str, TaskMetrics] = {}
+        self._queue_throughput = ThroughputTracker()
         self.performance_targets = {
             "task_dispatch_latency": 500,    # <500ms dispatch
             "crisis_processing_time": 60000,  # <60s crisis detection
@@ -264,14 +289,16 @@ class CeleryService:
         def task_postrun_handler(sender=None, task_id=None, task=None, args=None, kwargs=None, retval=None, state=None, **kwds):
             """Handle task completion for performance tracking"""
             try:
-                if task_id in self._task_metrics:
-                    metric = self._task_metrics[task_id]
+                # Signal handlers run in the worker without an event loop, so this stays
+                # synchronous; counts, runtimes and failures are aggregated from task events
+                metric = self._task_metrics.pop(task_id, None)
+                if metric is not None:
                     metric.end_time = time.time()
                     metric.duration_ms = (metric.end_time - metric.start_time) * 1000
                     metric.success = (state == 'SUCCESS')
                     
                     # Check performance targets
-                    asyncio.create_task(self._check_task_performance(metric))
+                    self._check_task_performance(metric)
                     
                     # Log completion
                     status = "✅" if metric.success else "❌"
@@ -279,19 +306,13 @@ class CeleryService:
                         f"{status} Task completed: {metric.task_name} [{task_id}] - "
                         f"Duration: {metric.duration_ms:.1f}ms, Status: {state}"
                     )
-                    
-                    # Store metrics in Redis for monitoring
-                    asyncio.create_task(self._store_task_metrics(metric))
-                    
-                    # Cleanup
-                    del self._task_metrics[task_id]
                 
             except Exception as e:
                 logger.error(f"Error in task postrun handler: {e}")
         
         @task_failure.connect
         def task_failure_handler(sender=None, task_id=None, exception=None, traceback=None, einfo=None, **kwds):
-            """Handle task failures for monitoring and alerting"""
+            """Handle task failures (alerts are raised by the monitoring service from task-failed events)"""
             try:
                 if task_id in self._task_metrics:
                     metric = self._task_metrics[task_id]
@@ -299,13 +320,6 @@ class CeleryService:
                     metric.success = False
                     
                     logger.error(f"❌ Task failed: {metric.task_name} [{task_id}] - Error: {exception}")
-                    
-                    # Store failure metrics
-                    asyncio.create_task(self._store_task_metrics(metric))
-                    
-                    # Alert on critical task failures
-                    if metric.priority in [TaskPriority.CRITICAL, TaskPriority.HIGH]:
-                        asyncio.create_task(self._send_failure_alert(metric, exception))
                 
             except Exception as e:
                 logger.error(f"Error in task failure handler: {e}")
@@ -338,7 +352,7 @@ class CeleryService:
         else:
             return TaskCategory.USER_OPERATIONS
     
-    async def _check_task_performance(self, metric: TaskMetrics):
+    def _check_task_performance(self, metric: TaskMetrics):
         """Check task performance against targets"""
         try:
             target_key = None
@@ -357,92 +371,16 @@ class CeleryService:
                         f"⚠️ Task performance target exceeded: {metric.task_name} "
                         f"took {metric.duration_ms:.1f}ms (target: {target_ms}ms)"
                     )
-                    
-                    # Record performance violation in monitoring system
-                    await performance_monitor._record_metric(
-                        name=f"task_performance_violation",
-                        value=metric.duration_ms - target_ms,
-                        metric_type=performance_monitor.MetricType.GAUGE,
-                        tags={
-                            "task_name": metric.task_name,
-                            "category": metric.category.value,
-                            "priority": metric.priority.value
-                        },
-                        description=f"Task performance target violation"
-                    )
         
         except Exception as e:
             logger.error(f"Error checking task performance: {e}")
     
-    async def _store_task_metrics(self, metric: TaskMetrics):
-        """Store task metrics in Redis for monitoring"""
-        try:
-            metrics_data = {
-                "task_id": metric.task_id,
-                "task_name": metric.task_name,
-                "priority": metric.priority.value,
-                "category": metric.category.value,
-                "duration_ms": metric.duration_ms,
-                "success": metric.success,
-                "error_message": metric.error_message,
-                "timestamp": metric.start_time
-            }
-            
-            # Store in Redis with TTL
-            await redis_service.set(
-                f"task_metrics:{metric.task_id}",
-                metrics_data,
-                ttl=86400  # 24 hours
-            )
-            
-            # Update counters for analytics
-            counter_key = f"task_counter:{metric.category.value}"
-            await redis_service.increment(counter_key)
-            
-            if metric.success:
-                success_key = f"task_success:{metric.category.value}"
-                await redis_service.increment(success_key)
-            else:
-                failure_key = f"task_failure:{metric.category.value}"
-                await redis_service.increment(failure_key)
-            
-        except Exception as e:
-            logger.error(f"Error storing task metrics: {e}")
-    
-    async def _send_failure_alert(self, metric: TaskMetrics, exception: Exception):
-        """Send alerts for critical task failures"""
-        try:
-            alert_data = {
-                "alert_type": "task_failure",
-                "task_name": metric.task_name,
-                "task_id": metric.task_id,
-                "priority": metric.priority.value,
-                "category": metric.category.value,
-                "error": str(exception),
-                "timestamp": time.time()
-            }
-            
-            # Store alert in Redis for monitoring dashboard
-            await redis_service.set(
-                f"alert:task_failure:{metric.task_id}",
-                alert_data,
-                ttl=86400  # 24 hours
-            )
-            
-            logger.critical(f"🚨 CRITICAL TASK FAILURE: {metric.task_name} - {exception}")
-            
-        except Exception as e:
-            logger.error(f"Error sending failure alert: {e}")
-    
     async def get_task_status(self, task_id: str) -> Dict[str, Any]:
         """Get comprehensive task status information"""
         try:
             # Get Celery task result
             result = AsyncResult(task_id, app=self.app)
             
-            # Get stored metrics
-            metrics_data = await redis_service.get(f"task_metrics:{task_id}")
-            
             status_info = {
                 "task_id": task_id,
                 "state": result.state,
@@ -454,9 +392,6 @@ class CeleryService:
                 "timestamp": time.time()
             }
             
-            if metrics_data:
-                status_info.update(metrics_data)
-            
             return status_info
             
         except Exception as e:
@@ -464,26 +399,31 @@ class CeleryService:
             return {"task_id": task_id, "error": str(e)}
     
     async def get_queue_statistics(self) -> Dict[str, Any]:
-        """Get comprehensive queue statistics"""
+        """Queue depth, backlog age and throughput measured on the broker"""
         try:
-            # This would require connecting to Redis and inspecting queues
-            # For now, return basic structure
+            queue_names = [queue.name for queue in CeleryConfig.task_queues]
+            # Blocking Redis client shared with the workers' autoscaler
+            samples = await asyncio.to_thread(queue_probe.measure, queue_names)
+            autoscalers = await asyncio.to_thread(queue_probe.read_autoscalers, 0)
+            rates = self._queue_throughput.update(samples)
+            
+            workers = autoscalers["workers"]
             stats = {
                 "queues": {
-                    "crisis": {"active": 0, "pending": 0, "processed": 0},
-                    "psychology": {"active": 0, "pending": 0, "processed": 0},
-                    "user_ops": {"active": 0, "pending": 0, "processed": 0},
-                    "analytics": {"active": 0, "pending": 0, "processed": 0},
-                    "maintenance": {"active": 0, "pending": 0, "processed": 0}
+                    name: {
+                        "pending": sample.depth,
+                        "oldest_age_seconds": sample.oldest_age,
+                        "processed": sample.completed,
+                        "throughput_per_second": rates.get(name)
+                    }
+                    for name, sample in samples.items()
                 },
                 "workers": {
-                    "active": 0,
-                    "total": 0
+                    "autoscaled": len(workers),
+                    "processes": sum(worker.get("current", 0) for worker in workers)
                 },
                 "performance": {
-                    "total_tasks_processed": 0,
-                    "success_rate": 0.0,
-                    "avg_processing_time": 0.0
+                    "total_tasks_processed": sum(sample.completed for sample in samples.values())
                 },
                 "timestamp": time.time()
             }
@@ -0,0 +1,219 @@
+# backend/app/services/conversation_tagging_service.py
+"""
+Conversation Auto-Tagging Service
+Tags chat sessions in the background, incrementally, from a stored cursor.
+
+- Triggered by ChatSession.message_count (returned by the UPDATE that
+  increments it), so sending a message never reads the transcript
+- One pending job per session: a Redis marker dedupes enqueues and is cleared
+  when the job finishes
+- Each job reads only the user messages after the session's tagging cursor,
+  up to a token budget, and advances the cursor past what it tagged
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set
+
+from sqlalchemy import and_, select
+
+from app.core.cache_patterns import CachePatterns
+from app.core.database import database
+from app.models.enhanced_models import ChatMessage, ChatSession
+from app.services.redis_service import redis_service
+
+logger = logging.getLogger(__name__)
+
+# Key in ChatSession.session_metadata holding the tagging cursor
+TAGGING_STATE_KEY = "auto_tagging"
+
+
+@dataclass
+class TaggingPolicy:
+    """When and how much to tag"""
+    every_n_messages: int = 6       # 3 user/assistant exchanges
+    min_user_messages: int = 2
+    min_content_chars: int = 20
+    token_budget: int = 1500        # Prompt text per job
+    chars_per_token: int = 4        # Rough estimate for English text
+    max_messages: int = 50          # New messages read per job
+    max_tags: int = 8
+    pending_ttl: int = 600          # Dedupe window for enqueued jobs
+
+
+class ConversationTaggingService:
+    """Counter-driven, deduplicated, incremental conversation tagging"""
+
+    def __init__(self, policy: Optional[TaggingPolicy] = None):
+        self.policy = policy or TaggingPolicy()
+        self._local_jobs: Set[asyncio.Task] = set()
+        self.stats = {
+            "jobs_enqueued": 0,
+            "jobs_deduplicated": 0,
+            "jobs_run": 0,
+            "sessions_tagged": 0,
+            "messages_tagged": 0,
+            "budget_truncations": 0
+        }
+
+    # ==================== TRIGGER ====================
+
+    def should_tag(self, message_count: int) -> bool:
+        every = self.policy.every_n_messages
+        return message_count >= every and message_count % every == 0
+
+    async def on_message_added(self, session_id: str, message_count: int) -> bool:
+        """Enqueue tagging when the session's message count crosses a threshold"""
+        if not self.should_tag(message_count):
+            return False
+        return await self.request_tagging(session_id)
+
+    async def request_tagging(self, session_id: str) -> bool:
+        """
+        Enqueue a deduplicated background tagging job
+
+        Returns True if a job was enqueued, False if one is already pending.
+        """
+        session_id = str(session_id)
+        pending_key = CachePatterns.session_tagging_pending(session_id)
+        if redis_service.is_available and not await redis_service.set_if_absent(
+            pending_key, "1", ttl=self.policy.pending_ttl
+        ):
+            self.stats["jobs_deduplicated"] += 1
+            return False
+
+        self.stats["jobs_enqueued"] += 1
+        try:
+            # Lazy import: celery_service imports the monitoring stack
+            from app.services.celery_service import dispatch_task, TaskPriority
+            await dispatch_task(
+                "app.tasks.user.tag_conversation",
+                args=(session_id,),
+                priority=TaskPriority.LOW
+            )
+        except Exception as e:
+            # No broker (e.g. local development): run in this process, still off the request path
+            logger.warning(f"⚠️ Could not enqueue auto-tagging for session {session_id}, running locally: {e}")
+            task = asyncio.get_running_loop().create_task(self.tag_new_messages(session_id))
+            self._local_jobs.add(task)
+            task.add_done_callback(self._local_jobs.discard)
+        return True
+
+    # ==================== TAGGING JOB ====================
+
+    async def tag_new_messages(self, session_id: str) -> Dict[str, Any]:
+        """Tag the user messages added since the session's cursor"""
+        session_id = str(session_id)
+        self.stats["jobs_run"] += 1
+        try:
+            async with database.get_session() as db:
+                session = await self._load_session(db, session_id)
+                if session is None:
+                    return {"session_id": session_id, "status": "not_found"}
+                state = (session.session_metadata or {}).get(TAGGING_STATE_KEY) or {}
+                rows = await self._load_new_user_messages(db, session_id, state.get("cursor"))
+
+            texts, cursor = self._select_within_budget(rows)
+            conversation_text = " ".join(texts)
+            if len(texts) < self.policy.min_user_messages or len(conversation_text.strip()) <= self.policy.min_content_chars:
+                # Leave the cursor so these messages are tagged together with the next ones
+                return {"session_id": session_id, "status": "insufficient_content", "new_messages": len(texts)}
+
+            # Lazy import: llm_service loads the AI model stack
+            from app.services.llm_service import llm_service
+            auto_tags = await llm_service.generate_automatic_tags(conversation_text, "conversation")
+
+            new_tags = await self._store_tags(session_id, auto_tags or [], cursor, len(texts))
+            self.stats["messages_tagged"] += len(texts)
+            if new_tags:
+                self.stats["sessions_tagged"] += 1
+                logger.info(f"🏷️ Auto-tagged session {session_id} with tags: {new_tags}")
+
+            return {
+                "session_id": session_id,
+                "status": "tagged",
+                "messages_tagged": len(texts),
+                "new_tags": new_tags,
+                "cursor": cursor.isoformat()
+            }
+        finally:
+            await redis_service.delete(CachePatterns.session_tagging_pending(session_id))
+
+    async def _load_session(self, db, session_id: str) -> Optional[ChatSession]:
+        result = await db.execute(
+            select(ChatSession).where(and_(ChatSession.id == session_id, ChatSession.deleted_at.is_(None)))
+        )
+        return result.scalar_one_or_none()
+
+    async def _load_new_user_messages(self, db, session_id: str, cursor: Optional[str]) -> List[Any]:
+        """User messages after the cursor, oldest first (served by the session/timestamp index)"""
+        conditions = [ChatMessage.session_id == session_id, ChatMessage.role == "user"]
+        if cursor:
+            conditions.append(ChatMessage.timestamp > datetime.fromisoformat(cursor))
+        else:
+            conditions.append(ChatMessage.since_session_start(session_id))
+
+        result = await db.execute(
+            select(ChatMessage.content, ChatMessage.timestamp)
+            .where(and_(*conditions))
+            .order_by(ChatMessage.timestamp.asc())
+            .limit(self.policy.max_messages)
+        )
+        return list(result.all())
+
+    def _select_within_budget(self, rows: List[Any]):
+        """Oldest-first message texts that fit the token budget, and the cursor after them"""
+        budget_chars = self.policy.token_budget * self.policy.chars_per_token
+        texts: List[str] = []
+        used = 0
+        cursor = None
+        for content, timestamp in rows:
+            text = (content or "").strip()
+            if texts and used + len(text) > budget_chars:
+                # The rest is picked up by the next job
+                self.stats["budget_truncations"] += 1
+                break
+            if text:
+                text = text[:budget_chars - used]
+                texts.append(text)
+                used += len(text)
+            cursor = timestamp
+        return texts, cursor
+
+    async def _store_tags(self, session_id: str, auto_tags: List[str], cursor: datetime, message_count: int) -> List[str]:
+        """Merge new tags and advance the cursor in one write"""
+        async with database.get_session() as db:
+            session = await self._load_session(db, session_id)
+            if session is None:
+                return []
+
+            existing_tags = session.tags or []
+            existing_lower = {tag.lower() for tag in existing_tags}
+            new_tags = []
+            for tag in auto_tags:
+                if tag.lower() not in existing_lower:
+                    existing_lower.add(tag.lower())
+                    new_tags.append(tag)
+            if new_tags:
+                session.tags = (existing_tags + new_tags)[:self.policy.max_tags]
+
+            metadata = dict(session.session_metadata or {})
+            state = metadata.get(TAGGING_STATE_KEY) or {}
+            metadata[TAGGING_STATE_KEY] = {
+                "cursor": cursor.isoformat(),
+                "messages_tagged": state.get("messages_tagged", 0) + message_count,
+                "tagged_at": datetime.utcnow().isoformat()
+            }
+            session.session_metadata = metadata
+
+            await db.commit()
+            return new_tags
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "local_jobs_running": len(self._local_jobs)}
+
+
+# Global conversation tagging service instance
+conversation_tagging_service = ConversationTaggingService()
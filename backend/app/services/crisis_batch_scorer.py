@@ -0,0 +1,168 @@
+# backend/app/services/crisis_batch_scorer.py
+"""
+Vectorized lexical crisis scoring for batches of texts
+Compiles every indicator keyword into a single matcher and produces
+indicator-by-text hit matrices so callers can apply their own weights
+with matrix operations instead of per-text Python loops
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+try:
+    from scipy import sparse
+except ImportError:  # scipy is optional - dense numpy matrices are used instead
+    sparse = None
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LexicalHits:
+    """Indicator-by-text hit counts for one batch"""
+    indicator_names: List[str]
+    keyword_counts: np.ndarray     # shape (indicators, texts)
+    pattern_counts: np.ndarray     # shape (indicators, texts)
+    keyword_hits: List[List[str]]  # matched keywords per text
+    pattern_hits: List[List[int]]  # matched pattern ids per text
+
+    @property
+    def candidate_mask(self) -> np.ndarray:
+        """Texts with at least one lexical hit in any indicator"""
+        return (self.keyword_counts.sum(axis=0) + self.pattern_counts.sum(axis=0)) > 0
+
+
+class CrisisBatchScorer:
+    """
+    Scores many texts against keyword/regex crisis indicators at once
+
+    Keywords are matched with one compiled alternation inside a lookahead so
+    overlapping keywords are all found in a single pass. Because the regex
+    engine reports the longest keyword at each position, shorter keywords that
+    are prefixes of it are credited too, which keeps the result identical to
+    independent substring checks. Regex patterns are compiled once and kept
+    separate: merging them into the alternation would drop overlapping matches.
+    """
+
+    def __init__(self, indicators: Dict[str, Dict[str, Sequence[str]]]):
+        self.indicator_names = list(indicators.keys())
+        self.keywords: List[str] = []
+        self.patterns: List[re.Pattern] = []
+
+        keyword_ids: Dict[str, int] = {}
+        keyword_rows, keyword_cols = [], []
+        pattern_rows, pattern_cols = [], []
+
+        for row, name in enumerate(self.indicator_names):
+            config = indicators[name]
+            for keyword in dict.fromkeys(k.lower() for k in config.get("keywords", [])):
+                if keyword not in keyword_ids:
+                    keyword_ids[keyword] = len(self.keywords)
+                    self.keywords.append(keyword)
+                keyword_rows.append(row)
+                keyword_cols.append(keyword_ids[keyword])
+            for pattern in config.get("patterns", []):
+                pattern_rows.append(row)
+                pattern_cols.append(len(self.patterns))
+                self.patterns.append(re.compile(pattern, re.IGNORECASE))
+
+        self._keyword_ids = keyword_ids
+        # Indicator x feature membership matrices
+        self._keyword_membership = self._matrix(
+            keyword_rows, keyword_cols, (len(self.indicator_names), len(self.keywords))
+        )
+        self._pattern_membership = self._matrix(
+            pattern_rows, pattern_cols, (len(self.indicator_names), len(self.patterns))
+        )
+
+        # Single matcher over all keywords, longest first so the lookahead
+        # reports the longest keyword starting at each position
+        self._matcher = None
+        self._prefix_closure: Dict[str, List[int]] = {}
+        if self.keywords:
+            ordered = sorted(self.keywords, key=len, reverse=True)
+            self._matcher = re.compile("(?=(" + "|".join(re.escape(k) for k in ordered) + "))")
+            for keyword in self.keywords:
+                self._prefix_closure[keyword] = [
+                    keyword_ids[other] for other in self.keywords if keyword.startswith(other)
+                ]
+
+        logger.debug(f"🔎 Crisis batch scorer compiled {len(self.keywords)} keywords, "
+                     f"{len(self.patterns)} patterns across {len(self.indicator_names)} indicators")
+
+    @staticmethod
+    def _matrix(rows: List[int], cols: List[int], shape):
+        """Build a binary matrix, sparse when scipy is available"""
+        data = np.ones(len(rows), dtype=np.float64)
+        if sparse is not None:
+            return sparse.csr_matrix((data, (rows, cols)), shape=shape)
+        dense = np.zeros(shape, dtype=np.float64)
+        dense[rows, cols] = 1.0
+        return dense
+
+    def score(self, texts: Sequence[str]) -> LexicalHits:
+        """Match every text once and return indicator-by-text hit counts"""
+        text_count = len(texts)
+        keyword_rows, keyword_cols = [], []
+        pattern_rows, pattern_cols = [], []
+        keyword_hits: List[List[str]] = []
+        pattern_hits: List[List[int]] = []
+
+        for col, text in enumerate(texts):
+            text_lower = (text or "").lower()
+
+            found = set()
+            if self._matcher is not None and text_lower:
+                for match in self._matcher.finditer(text_lower):
+                    found.update(self._prefix_closure[match.group(1)])
+            keyword_rows.extend(found)
+            keyword_cols.extend([col] * len(found))
+            keyword_hits.append([self.keywords[i] for i in sorted(found)])
+
+            matched_patterns = [i for i, pattern in enumerate(self.patterns)
+                                if text_lower and pattern.search(text_lower)]
+            pattern_rows.extend(matched_patterns)
+            pattern_cols.extend([col] * len(matched_patterns))
+            pattern_hits.append(matched_patterns)
+
+        # Feature x text incidence, projected onto indicators
+        keyword_incidence = self._matrix(keyword_rows, keyword_cols, (len(self.keywords), text_count))
+        pattern_incidence = self._matrix(pattern_rows, pattern_cols, (len(self.patterns), text_count))
+
+        return LexicalHits(
+            indicator_names=self.indicator_names,
+            keyword_counts=self._dense(self._keyword_membership @ keyword_incidence),
+            pattern_counts=self._dense(self._pattern_membership @ pattern_incidence),
+            keyword_hits=keyword_hits,
+            pattern_hits=pattern_hits
+        )
+
+    def indicator_keywords(self, indicator: str, keywords: Sequence[str]) -> List[str]:
+        """Filter a text's matched keywords down to those of one indicator"""
+        row = self.indicator_names.index(indicator)
+        membership = self._keyword_membership
+        if sparse is not None:
+            members = set(membership.getrow(row).indices)
+        else:
+            members = set(np.flatnonzero(membership[row]))
+        return [k for k in keywords if self._keyword_ids[k] in members]
+
+    def indicator_patterns(self, indicator: str, pattern_ids: Sequence[int]) -> List[int]:
+        """Filter a text's matched pattern ids down to those of one indicator"""
+        row = self.indicator_names.index(indicator)
+        membership = self._pattern_membership
+        if sparse is not None:
+            members = set(membership.getrow(row).indices)
+        else:
+            members = set(np.flatnonzero(membership[row]))
+        return [p for p in pattern_ids if p in members]
+
+    @staticmethod
+    def _dense(matrix) -> np.ndarray:
+        if sparse is not None and sparse.issparse(matrix):
+            return np.asarray(matrix.toarray())
+        return np.asarray(matrix)
@@ -26,7 +26,7 @@ from app.services.ai_model_manager import ai_model_manager
 from app.services.ai_emotion_service import ai_emotion_service
 from app.services.ai_prompt_service import ai_prompt_service
 from app.services.ai_intervention_service import ai_intervention_service
-from app.services.advanced_ai_service import advanced_ai_service
+from app.services.insight_precompute_service import insight_precompute_service, SnapshotType
 from app.services.llm_service import llm_service
 from app.core.service_interfaces import ServiceRegistry
 from app.repositories.session_repository import SessionRepository
@@ -387,17 +387,20 @@ class EnhancedChatService:
                     logger.warning(f"⚠️ Invalid cached context type: {type(cached_context)}, creating new context")
                     # Continue to create new context
             
-            # Get user personality profile for context adaptation
+            # Get user personality profile for context adaptation from the precomputed
+            # snapshot; never compute it on the chat path
             personality_profile = None
             try:
-                # Fetch recent user entries for personality analysis
-                entries = await self._fetch_recent_entries(user_id, 50)
-                if len(entries) >= 10:
-                    personality = await advanced_ai_service.generate_personality_profile(user_id, entries)
+                snapshot = await insight_precompute_service.get_snapshot(user_id, SnapshotType.PERSONALITY)
+                if snapshot is None or snapshot["stale"]:
+                    await insight_precompute_service.request_refresh(user_id)
+                if snapshot:
+                    personality = snapshot["data"]
                     personality_profile = {
-                        "dimensions": {dim.name: score for dim, score in personality.dimensions.items()},
-                        "traits": personality.traits,
-                        "communication_style": personality.communication_style
+                        "dimensions": {dim.upper(): score for dim, score in personality.get("dimensions", {}).items()},
+                        "traits": personality.get("traits", []),
+                        "communication_style": personality.get("communication_style", "unknown"),
+                        "computed_at": snapshot.get("computed_at")
                     }
             except Exception as e:
                 logger.warning(f"⚠️ Could not load personality profile: {e}")
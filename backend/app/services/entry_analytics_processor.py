@@ -5,7 +5,7 @@ from typing import Optional, Dict, Any
 from datetime import datetime
 
 from app.services.ai_emotion_service import ai_emotion_service, analyze_sentiment
-from app.services.redis_service_simple import simple_redis_service
+from app.services.redis_service import redis_service
 from app.core.cache_patterns import CachePatterns
 from app.core.exceptions import AnalyticsException
 
@@ -86,7 +86,7 @@ class EntryAnalyticsProcessor:
             # Invalidate caches
             invalidated_count = 0
             for cache_key in cache_keys_to_invalidate:
-                deleted = await simple_redis_service.delete(cache_key)
+                deleted = await redis_service.delete(cache_key)
                 if deleted:
                     invalidated_count += 1
             
@@ -0,0 +1,341 @@
+# backend/app/services/entry_revision_service.py
+"""
+Entry Revision Service
+Compact version history for entry content.
+
+- entries.content keeps the latest full text; history goes to entry_revisions
+- Reverse deltas: the row for version v holds the edit ops that rebuild v's
+  text from version v+1's text, zlib-compressed. Autosaves mostly touch the
+  end of a long entry, so a delta is a few hundred bytes where a full copy
+  is the whole entry
+- Every Nth version (and any version whose delta would not be smaller) is a
+  compressed full snapshot, so reading an old version replays at most
+  N - 1 deltas from the nearest snapshot or from the current text
+- Autosaves within the coalesce window of a version's first save stay in
+  that version: only the previous version's delta is re-based onto the new
+  text, no row is added and the version number does not move
+- Unchanged content is not rewritten at all
+"""
+
+import json
+import logging
+import re
+import zlib
+from datetime import datetime, timedelta, timezone
+from difflib import SequenceMatcher
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import database
+from app.core.exceptions import DatabaseException
+from app.models.enhanced_models import Entry, EntryRevision
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT = "snapshot"
+DELTA = "delta"
+
+# Diffs run in two passes: sentences (and line breaks) first, then the
+# words, whitespace and punctuation of each replaced stretch. Matching whole
+# sentences keeps the first pass short on long entries; the second keeps
+# ops aligned to what the user actually changed
+SENTENCE_PATTERN = re.compile(r"[^.!?\n]*(?:[.!?]+\s*|\n+)|[^.!?\n]+")
+WORD_PATTERN = re.compile(r"\w+|\s+|[^\w\s]+")
+
+# Above this many tokens a stretch is stored as one replacement instead of
+# being diffed (SequenceMatcher is quadratic at worst)
+MAX_DIFF_TOKENS = 4000
+
+# Lone surrogates can arrive through JSON; keep them round-trippable
+TEXT_ENCODING_ERRORS = "surrogatepass"
+
+DeltaOp = Union[int, str]
+
+
+def _common_prefix_length(a: str, b: str) -> int:
+    """Binary search on slice comparisons: C-speed even for long texts"""
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[:middle] == b[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _common_suffix_length(a: str, b: str, limit: int) -> int:
+    low, high = 0, limit
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[len(a) - middle:] == b[len(b) - middle:]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _append_op(ops: List[DeltaOp], op: DeltaOp) -> None:
+    """Append an op, merging it into the previous one of the same kind"""
+    if not op:
+        return
+    if ops:
+        last = ops[-1]
+        if isinstance(op, str) and isinstance(last, str):
+            ops[-1] = last + op
+            return
+        if isinstance(op, int) and isinstance(last, int) and (op > 0) == (last > 0):
+            ops[-1] = last + op
+            return
+    ops.append(op)
+
+
+def _diff_tokens(ops: List[DeltaOp], old: str, new: str, pattern: re.Pattern,
+                 refine: Optional[re.Pattern]) -> None:
+    """Append ops turning old into new, diffing on pattern's tokens and refining replaced stretches"""
+    old_tokens = pattern.findall(old)
+    new_tokens = pattern.findall(new)
+    if not old_tokens or not new_tokens or len(old_tokens) + len(new_tokens) > MAX_DIFF_TOKENS:
+        _append_op(ops, -len(old))
+        _append_op(ops, new)
+        return
+
+    matcher = SequenceMatcher(None, old_tokens, new_tokens, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        old_part = "".join(old_tokens[i1:i2])
+        new_part = "".join(new_tokens[j1:j2])
+        if tag == "equal":
+            _append_op(ops, len(old_part))
+        elif tag == "replace" and refine is not None:
+            _diff_tokens(ops, old_part, new_part, refine, None)
+        else:
+            _append_op(ops, -len(old_part))
+            _append_op(ops, new_part)
+
+
+def diff_ops(source: str, target: str) -> List[DeltaOp]:
+    """
+    Edit ops that rebuild target from source.
+
+    A positive int copies that many characters of source, a negative int
+    skips that many, a string is inserted.
+    """
+    prefix = _common_prefix_length(source, target)
+    suffix = _common_suffix_length(source, target, min(len(source), len(target)) - prefix)
+
+    ops: List[DeltaOp] = []
+    _append_op(ops, prefix)
+    _diff_tokens(ops, source[prefix:len(source) - suffix], target[prefix:len(target) - suffix],
+                 SENTENCE_PATTERN, WORD_PATTERN)
+    _append_op(ops, suffix)
+    return ops
+
+
+def apply_ops(source: str, ops: Sequence[DeltaOp]) -> str:
+    parts: List[str] = []
+    position = 0
+    for op in ops:
+        if isinstance(op, str):
+            parts.append(op)
+        elif op > 0:
+            parts.append(source[position:position + op])
+            position += op
+        else:
+            position -= op
+    return "".join(parts)
+
+
+def compress_text(content: str) -> bytes:
+    return zlib.compress(content.encode("utf-8", TEXT_ENCODING_ERRORS))
+
+
+def decompress_text(payload: bytes) -> str:
+    return zlib.decompress(payload).decode("utf-8", TEXT_ENCODING_ERRORS)
+
+
+def encode_delta(source: str, target: str) -> bytes:
+    """Compressed edit ops rebuilding target from source"""
+    ops = json.dumps(diff_ops(source, target), ensure_ascii=False, separators=(",", ":"))
+    return zlib.compress(ops.encode("utf-8", TEXT_ENCODING_ERRORS))
+
+
+def apply_delta(source: str, payload: bytes) -> str:
+    return apply_ops(source, json.loads(zlib.decompress(payload).decode("utf-8", TEXT_ENCODING_ERRORS)))
+
+
+def revision_payload(version: int, newer_content: str, content: str, snapshot_interval: int) -> Tuple[str, bytes]:
+    """Kind and payload storing a version's content relative to the next version's"""
+    snapshot = compress_text(content)
+    if version % snapshot_interval == 0:
+        return SNAPSHOT, snapshot
+    delta = encode_delta(newer_content, content)
+    # Rewrites of most of the text: the snapshot is smaller and ends the chain
+    if len(delta) >= len(snapshot):
+        return SNAPSHOT, snapshot
+    return DELTA, delta
+
+
+def materialize(kind: str, payload: bytes, newer_content: str) -> str:
+    """A version's content from its row and the next version's content"""
+    if kind == SNAPSHOT:
+        return decompress_text(payload)
+    return apply_delta(newer_content, payload)
+
+
+def replay(current_content: str, current_version: int, target_version: int, rows: Sequence[Any]) -> str:
+    """
+    Rebuild target_version from the current text and revision rows, newest first.
+
+    rows run from the nearest snapshot at or above target_version (or from
+    current_version - 1) down to target_version.
+    """
+    content = current_content
+    expected = current_version - 1
+    for index, row in enumerate(rows):
+        if row.kind == SNAPSHOT and index == 0:
+            expected = row.version
+        if row.version != expected:
+            raise DatabaseException(
+                "Entry revision history is incomplete",
+                context={"expected_version": expected, "found_version": row.version}
+            )
+        content = materialize(row.kind, row.payload, content)
+        if len(content) != row.content_length:
+            raise DatabaseException(
+                "Entry revision failed to rebuild",
+                context={"version": row.version, "expected_length": row.content_length, "length": len(content)}
+            )
+        expected -= 1
+
+    if expected != target_version - 1:
+        raise DatabaseException(
+            "Entry revision history is incomplete",
+            context={"expected_version": expected, "target_version": target_version}
+        )
+    return content
+
+
+def _as_utc(moment: datetime) -> datetime:
+    # SQLite hands back naive timestamps; they are stored in UTC
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+class EntryRevisionService:
+    """Delta-encoded, coalesced revision history of entry content"""
+
+    def __init__(self, coalesce_window: Optional[timedelta] = None, snapshot_interval: Optional[int] = None):
+        self.coalesce_window = (
+            coalesce_window if coalesce_window is not None
+            else timedelta(seconds=settings.ENTRY_REVISION_COALESCE_SECONDS)
+        )
+        self.snapshot_interval = max(1, snapshot_interval or settings.ENTRY_REVISION_SNAPSHOT_INTERVAL)
+
+    async def lock_entry(self, db: AsyncSession, entry_id: str) -> Optional[Entry]:
+        """Load an entry FOR UPDATE, so concurrent saves of it cannot both open a version"""
+        result = await db.execute(select(Entry).where(Entry.id == entry_id).with_for_update())
+        return result.scalar_one_or_none()
+
+    async def record_revision(self, db: AsyncSession, entry: Entry, content: str,
+                              now: Optional[datetime] = None) -> int:
+        """
+        Keep the entry's current text as history before content replaces it.
+
+        Runs in the caller's transaction on an entry from lock_entry(), and
+        returns the version content belongs to; the caller writes both to
+        the entry. Call only when content differs from entry.content.
+        """
+        now = _as_utc(now or datetime.now(timezone.utc))
+        version = entry.version or 1
+        latest = (await db.execute(
+            select(EntryRevision)
+            .where(EntryRevision.entry_id == entry.id)
+            .order_by(EntryRevision.version.desc())
+            .limit(1)
+        )).scalar_one_or_none()
+
+        # The current version opened when its predecessor was superseded
+        opened_at = latest.created_at if latest is not None else entry.created_at
+        if opened_at is not None and now - _as_utc(opened_at) < self.coalesce_window:
+            # The previous version's delta was taken against the text being
+            # replaced; re-base it onto the new text
+            if latest is not None and latest.version == version - 1 and latest.kind == DELTA:
+                older = apply_delta(entry.content, latest.payload)
+                latest.kind, latest.payload = revision_payload(
+                    latest.version, content, older, self.snapshot_interval
+                )
+            return version
+
+        kind, payload = revision_payload(version, content, entry.content, self.snapshot_interval)
+        db.add(EntryRevision(
+            entry_id=entry.id,
+            version=version,
+            kind=kind,
+            payload=payload,
+            content_length=len(entry.content),
+            created_at=now
+        ))
+        return version + 1
+
+    async def get_version(self, entry_id: str, version: int) -> Optional[str]:
+        """Content of one version of an entry, None if the entry or version does not exist"""
+        async with database.get_session() as db:
+            entry = (await db.execute(
+                select(Entry.content, Entry.version).where(Entry.id == entry_id)
+            )).one_or_none()
+            if entry is None:
+                return None
+            current_version = entry.version or 1
+            if not 1 <= version <= current_version:
+                return None
+            if version == current_version:
+                return entry.content
+
+            nearest_snapshot = select(func.min(EntryRevision.version)).where(
+                EntryRevision.entry_id == entry_id,
+                EntryRevision.version >= version,
+                EntryRevision.kind == SNAPSHOT
+            ).scalar_subquery()
+            rows = (await db.execute(
+                select(EntryRevision.version, EntryRevision.kind, EntryRevision.payload, EntryRevision.content_length)
+                .where(
+                    EntryRevision.entry_id == entry_id,
+                    EntryRevision.version >= version,
+                    EntryRevision.version <= func.coalesce(nearest_snapshot, current_version)
+                )
+                .order_by(EntryRevision.version.desc())
+            )).all()
+
+        return replay(entry.content, current_version, version, rows)
+
+    async def list_revisions(self, entry_id: str) -> List[Dict[str, Any]]:
+        """Stored versions of an entry, newest first, without their payloads"""
+        async with database.get_session() as db:
+            rows = (await db.execute(
+                select(
+                    EntryRevision.version,
+                    EntryRevision.kind,
+                    EntryRevision.content_length,
+                    func.length(EntryRevision.payload).label("stored_bytes"),
+                    EntryRevision.created_at
+                )
+                .where(EntryRevision.entry_id == entry_id)
+                .order_by(EntryRevision.version.desc())
+            )).all()
+
+        return [
+            {
+                "version": row.version,
+                "kind": row.kind,
+                "content_length": row.content_length,
+                "stored_bytes": row.stored_bytes,
+                "superseded_at": row.created_at.isoformat() if row.created_at else None
+            }
+            for row in rows
+        ]
+
+
+# Global entry revision service instance
+entry_revision_service = EntryRevisionService()
@@ -0,0 +1,273 @@
+# backend/app/services/hybrid_search_service.py
+"""
+Hybrid Search Service
+Single search entry point that fuses full-text, trigram and vector results
+with reciprocal rank fusion (RRF) instead of exposing each stack separately.
+
+- Legs run concurrently, each with its own timeout; a slow or failing leg
+  degrades the result instead of failing the request
+- Legs return ids only; the fused page is hydrated with one bulk query
+- Fused rankings are cached per (user, normalized query, content version),
+  so any entry write naturally invalidates them
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+import uuid
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, select
+from sqlalchemy.orm import selectinload
+
+from app.core.cache_patterns import CachePatterns, CacheTTL
+from app.core.database import database
+from app.core.performance_monitor import performance_monitor
+from app.models.enhanced_models import Entry
+from app.repositories.enhanced_entry_repository import EnhancedEntryRepository
+from app.repositories.trigram_search_repository import TrigramSearchRepository
+from app.services.insight_precompute_service import insight_precompute_service
+from app.services.redis_service import redis_service
+from app.services.vector_service import vector_service
+
+logger = logging.getLogger(__name__)
+
+
+class SearchLeg(Enum):
+    """Individual retrieval strategies fused by hybrid search"""
+    FULL_TEXT = "full_text"
+    TRIGRAM = "trigram"
+    VECTOR = "vector"
+
+
+@dataclass
+class HybridSearchConfig:
+    """Fusion and latency budget configuration"""
+    rrf_k: int = 60                   # Standard RRF damping constant
+    leg_limit: int = 50               # Candidates requested from each leg
+    leg_timeouts: Dict[SearchLeg, float] = field(default_factory=lambda: {
+        SearchLeg.FULL_TEXT: 0.5,
+        SearchLeg.TRIGRAM: 0.5,
+        SearchLeg.VECTOR: 1.5,
+    })
+    min_trigram_similarity: float = 0.1
+    cache_ttl: int = CacheTTL.MEDIUM_SHORT
+
+
+class HybridSearchService:
+    """Concurrent multi-leg entry search with reciprocal rank fusion"""
+
+    def __init__(self, config: Optional[HybridSearchConfig] = None):
+        self.config = config or HybridSearchConfig()
+        self.stats = {
+            "searches": 0,
+            "cache_hits": 0,
+            "leg_timeouts": 0,
+            "leg_errors": 0
+        }
+        logger.info("🔎 Hybrid Search Service initialized")
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """Case- and whitespace-insensitive form used for cache keys"""
+        return " ".join(query.lower().split())
+
+    @staticmethod
+    def reciprocal_rank_fusion(rankings: Dict[SearchLeg, List[str]], k: int = 60) -> List[Tuple[str, float, Dict[str, int]]]:
+        """
+        Fuse ranked id lists: score(d) = sum over legs of 1 / (k + rank)
+
+        Returns (id, score, {leg: rank}) sorted by score, ties broken by best rank.
+        """
+        scores: Dict[str, float] = {}
+        ranks: Dict[str, Dict[str, int]] = {}
+
+        for leg, ids in rankings.items():
+            for rank, entry_id in enumerate(ids, start=1):
+                if leg.value in ranks.setdefault(entry_id, {}):
+                    continue  # Duplicate within one leg keeps its best rank
+                ranks[entry_id][leg.value] = rank
+                scores[entry_id] = scores.get(entry_id, 0.0) + 1.0 / (k + rank)
+
+        fused = sorted(scores.items(), key=lambda item: (-item[1], min(ranks[item[0]].values())))
+        return [(entry_id, score, ranks[entry_id]) for entry_id, score in fused]
+
+    async def search(self, user_id: str, query: str, limit: int = 20, offset: int = 0,
+                     legs: Optional[List[SearchLeg]] = None) -> Dict[str, Any]:
+        """
+        Hybrid search over a user's entries
+
+        Returns:
+            {"results": [{"entry", "score", "ranks"}], "total_found", "legs", "cached", "content_version"}
+        """
+        self.stats["searches"] += 1
+        user_id = str(user_id)
+        legs = legs or list(SearchLeg)
+        normalized = self.normalize_query(query)
+
+        content_version = await insight_precompute_service.get_content_version(user_id)
+        cache_key = self._cache_key(user_id, normalized, legs, content_version)
+
+        cached = await redis_service.get(cache_key)
+        if cached:
+            self.stats["cache_hits"] += 1
+            fused = [(item["id"], item["score"], item["ranks"]) for item in cached["fused"]]
+            leg_status = cached["legs"]
+        else:
+            async with performance_monitor.timed_operation("hybrid_search_legs", {"legs": len(legs)}):
+                rankings, leg_status = await self._run_legs(user_id, normalized, legs)
+            fused = self.reciprocal_rank_fusion(rankings, self.config.rrf_k)
+
+            # Only complete rankings are cached; degraded ones are retried next time
+            if all(status["status"] == "ok" for status in leg_status.values()):
+                await redis_service.set(cache_key, {
+                    "fused": [{"id": i, "score": s, "ranks": r} for i, s, r in fused],
+                    "legs": leg_status
+                }, ttl=self.config.cache_ttl)
+
+        page = fused[offset:offset + limit]
+        entries = await self._hydrate(user_id, [entry_id for entry_id, _, _ in page])
+
+        results = [
+            {"entry": entries[entry_id], "score": round(score, 6), "ranks": ranks}
+            for entry_id, score, ranks in page
+            if entry_id in entries
+        ]
+
+        return {
+            "results": results,
+            "total_found": len(fused),
+            "legs": leg_status,
+            "cached": bool(cached),
+            "content_version": content_version
+        }
+
+    def _cache_key(self, user_id: str, normalized: str, legs: List[SearchLeg], content_version: int) -> str:
+        leg_names = ",".join(sorted(leg.value for leg in legs))
+        query_hash = hashlib.sha256(f"{leg_names}|{normalized}".encode()).hexdigest()[:16]
+        return CachePatterns.content_hybrid_search(user_id, query_hash, content_version)
+
+    # ==================== LEGS ====================
+
+    async def _run_legs(self, user_id: str, query: str,
+                        legs: List[SearchLeg]) -> Tuple[Dict[SearchLeg, List[str]], Dict[str, Dict[str, Any]]]:
+        """Run every leg concurrently under its own timeout"""
+        leg_functions = {
+            SearchLeg.FULL_TEXT: self._full_text_leg,
+            SearchLeg.TRIGRAM: self._trigram_leg,
+            SearchLeg.VECTOR: self._vector_leg,
+        }
+
+        async def run(leg: SearchLeg):
+            start_time = time.time()
+            try:
+                ids = await asyncio.wait_for(
+                    leg_functions[leg](user_id, query, self.config.leg_limit),
+                    timeout=self.config.leg_timeouts.get(leg, 1.0)
+                )
+                status = "ok"
+            except asyncio.TimeoutError:
+                self.stats["leg_timeouts"] += 1
+                logger.warning(f"⏱️ Hybrid search leg {leg.value} timed out")
+                ids, status = [], "timeout"
+            except Exception as e:
+                self.stats["leg_errors"] += 1
+                logger.warning(f"Hybrid search leg {leg.value} failed: {e}")
+                ids, status = [], "error"
+            return leg, ids, {
+                "status": status,
+                "count": len(ids),
+                "duration_ms": round((time.time() - start_time) * 1000, 2)
+            }
+
+        outcomes = await asyncio.gather(*(run(leg) for leg in legs))
+        rankings = {leg: ids for leg, ids, _ in outcomes}
+        leg_status = {leg.value: status for leg, _, status in outcomes}
+        return rankings, leg_status
+
+    async def _full_text_leg(self, user_id: str, query: str, limit: int) -> List[str]:
+        async with database.get_session() as session:
+            ranked = await EnhancedEntryRepository(session).rank_full_text_ids(user_id, query, limit)
+        return [entry_id for entry_id, _ in ranked]
+
+    async def _trigram_leg(self, user_id: str, query: str, limit: int) -> List[str]:
+        async with database.get_session() as session:
+            ranked = await TrigramSearchRepository(session).rank_fuzzy_entry_ids(
+                user_id, query, limit, self.config.min_trigram_similarity
+            )
+        return [entry_id for entry_id, _ in ranked]
+
+    async def _vector_leg(self, user_id: str, query: str, limit: int) -> List[str]:
+        # Embedding + Chroma query are synchronous; keep them off the event loop
+        # so the other legs (and the timeout) keep running. to_thread carries the
+        # request context along, so their time still shows in the request breakdown
+        results = await asyncio.to_thread(self._vector_search_blocking, user_id, query, limit)
+        candidate_ids = [result["id"] for result in results if self._is_uuid(result["id"])]
+        if not candidate_ids:
+            return []
+
+        # The query is filtered on the user_id metadata; the database still
+        # decides ownership and drops deleted entries before fusion
+        async with database.get_session() as session:
+            owned = await session.execute(
+                select(Entry.id).where(
+                    and_(
+                        Entry.id.in_(candidate_ids),
+                        Entry.user_id == user_id,
+                        Entry.deleted_at.is_(None)
+                    )
+                )
+            )
+            owned_ids = {str(entry_id) for entry_id in owned.scalars().all()}
+        return [entry_id for entry_id in candidate_ids if entry_id in owned_ids]
+
+    @staticmethod
+    def _vector_search_blocking(user_id: str, query: str, limit: int) -> List[Dict[str, Any]]:
+        # Errors propagate so the leg is reported failed and the ranking not cached
+        return asyncio.run(vector_service.search_entries(
+            query, limit, filters={"user_id": user_id}, raise_errors=True
+        ))
+
+    # ==================== HYDRATION ====================
+
+    async def _hydrate(self, user_id: str, entry_ids: List[str]) -> Dict[str, Entry]:
+        """Load the fused page in one query, dropping ids the user does not own"""
+        entry_ids = [entry_id for entry_id in entry_ids if self._is_uuid(entry_id)]
+        if not entry_ids:
+            return {}
+
+        async with database.get_session() as session:
+            result = await session.execute(
+                select(Entry).options(selectinload(Entry.topic)).where(
+                    and_(
+                        Entry.id.in_(entry_ids),
+                        Entry.user_id == user_id,
+                        Entry.deleted_at.is_(None)
+                    )
+                )
+            )
+            return {str(entry.id): entry for entry in result.scalars().all()}
+
+    @staticmethod
+    def _is_uuid(value: str) -> bool:
+        # Vector ids from older imports may not be database ids
+        try:
+            uuid.UUID(str(value))
+            return True
+        except ValueError:
+            return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Search and cache statistics"""
+        searches = self.stats["searches"]
+        return {
+            **self.stats,
+            "cache_hit_rate": self.stats["cache_hits"] / searches if searches else 0.0
+        }
+
+
+# Global hybrid search service instance
+hybrid_search_service = HybridSearchService()
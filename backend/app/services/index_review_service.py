@@ -0,0 +1,215 @@
+# backend/app/services/index_review_service.py
+"""
+Index Review Service
+Weighs what each index costs on the write path against what it serves on
+the read path, from PostgreSQL's cumulative statistics.
+
+- Reads: idx_scan / idx_tup_read from pg_stat_user_indexes
+- Writes: every insert and every non-HOT update adds an entry to every index
+  of the table, so index writes ~= n_tup_ins + (n_tup_upd - n_tup_hot_upd)
+- Size: pg_relation_size of the index
+- Flags: unused indexes (no scans since the statistics were reset), indexes
+  read rarely relative to how often they are written, GIN indexes without
+  fastupdate, and tables whose updates are rarely HOT
+- Also flushes GIN pending lists off the request path, so saves do not pay
+  for a full pending-list merge and searches do not scan a long pending list
+"""
+
+import logging
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+
+from app.core.database import database
+
+logger = logging.getLogger(__name__)
+
+INDEX_USAGE_SQL = text("""
+    SELECT s.relname AS table_name,
+           s.indexrelname AS index_name,
+           am.amname AS method,
+           s.idx_scan,
+           s.idx_tup_read,
+           pg_relation_size(s.indexrelid) AS size_bytes,
+           i.indisunique AS is_unique,
+           i.indisprimary AS is_primary,
+           COALESCE(array_to_string(c.reloptions, ','), '') AS options,
+           pg_get_indexdef(s.indexrelid) AS definition
+    FROM pg_stat_user_indexes s
+    JOIN pg_index i ON i.indexrelid = s.indexrelid
+    JOIN pg_class c ON c.oid = s.indexrelid
+    JOIN pg_am am ON am.oid = c.relam
+    WHERE CAST(:table AS text) IS NULL OR s.relname = :table
+    ORDER BY s.relname, s.indexrelname
+""")
+
+TABLE_WRITES_SQL = text("""
+    SELECT t.relname AS table_name,
+           t.n_tup_ins,
+           t.n_tup_upd,
+           t.n_tup_hot_upd,
+           t.n_tup_del,
+           t.n_live_tup,
+           pg_relation_size(t.relid) AS heap_bytes,
+           COALESCE(array_to_string(c.reloptions, ','), '') AS options
+    FROM pg_stat_user_tables t
+    JOIN pg_class c ON c.oid = t.relid
+    WHERE CAST(:table AS text) IS NULL OR t.relname = :table
+""")
+
+STATS_RESET_SQL = text("SELECT stats_reset FROM pg_stat_database WHERE datname = current_database()")
+
+GIN_INDEXES_SQL = text("""
+    SELECT c.relname AS index_name
+    FROM pg_index i
+    JOIN pg_class c ON c.oid = i.indexrelid
+    JOIN pg_class t ON t.oid = i.indrelid
+    JOIN pg_am am ON am.oid = c.relam
+    WHERE am.amname = 'gin' AND t.relname = :table
+    ORDER BY c.relname
+""")
+
+
+@dataclass
+class ReviewThresholds:
+    """When an index or table is worth a second look"""
+    min_scans_per_1k_writes: float = 1.0    # Below: written far more often than read
+    min_table_writes: int = 1000            # Ignore tables with too little traffic to judge
+    min_hot_ratio: float = 0.5              # Below: most updates rewrite every index
+
+
+@dataclass
+class IndexReview:
+    table: str
+    index: str
+    method: str
+    scans: int
+    size_bytes: int
+    index_writes: int
+    scans_per_1k_writes: Optional[float]
+    definition: str
+    findings: List[str] = field(default_factory=list)
+
+
+@dataclass
+class TableReview:
+    table: str
+    inserts: int
+    updates: int
+    hot_updates: int
+    hot_ratio: Optional[float]
+    index_count: int
+    index_bytes: int
+    heap_bytes: int
+    findings: List[str] = field(default_factory=list)
+
+
+def index_writes(table_row: Dict[str, Any]) -> int:
+    """Index entries one index receives: inserts plus updates that were not HOT"""
+    non_hot = max(0, int(table_row["n_tup_upd"] or 0) - int(table_row["n_tup_hot_upd"] or 0))
+    return int(table_row["n_tup_ins"] or 0) + non_hot
+
+
+def build_report(index_rows: List[Dict[str, Any]], table_rows: List[Dict[str, Any]],
+                 thresholds: Optional[ReviewThresholds] = None) -> Dict[str, Any]:
+    """Turn raw statistics rows into per-index and per-table findings"""
+    thresholds = thresholds or ReviewThresholds()
+    tables = {row["table_name"]: row for row in table_rows}
+
+    indexes: List[IndexReview] = []
+    for row in index_rows:
+        table_row = tables.get(row["table_name"])
+        writes = index_writes(table_row) if table_row else 0
+        scans = int(row["idx_scan"] or 0)
+        review = IndexReview(
+            table=row["table_name"],
+            index=row["index_name"],
+            method=row["method"],
+            scans=scans,
+            size_bytes=int(row["size_bytes"] or 0),
+            index_writes=writes,
+            scans_per_1k_writes=round(scans * 1000 / writes, 3) if writes else None,
+            definition=row["definition"]
+        )
+
+        enforces_constraint = row["is_unique"] or row["is_primary"]
+        if writes >= thresholds.min_table_writes and not enforces_constraint:
+            if scans == 0:
+                review.findings.append("unused: no scans since statistics reset, drop candidate")
+            elif review.scans_per_1k_writes < thresholds.min_scans_per_1k_writes:
+                review.findings.append("low_value: written far more often than read")
+        if row["method"] == "gin" and "fastupdate=off" in row["options"]:
+            review.findings.append("gin_fastupdate_off: every write merges into the index immediately")
+        indexes.append(review)
+
+    table_reviews: List[TableReview] = []
+    for name, row in tables.items():
+        own = [review for review in indexes if review.table == name]
+        updates = int(row["n_tup_upd"] or 0)
+        hot_ratio = round(int(row["n_tup_hot_upd"] or 0) / updates, 3) if updates else None
+        review = TableReview(
+            table=name,
+            inserts=int(row["n_tup_ins"] or 0),
+            updates=updates,
+            hot_updates=int(row["n_tup_hot_upd"] or 0),
+            hot_ratio=hot_ratio,
+            index_count=len(own),
+            index_bytes=sum(index.size_bytes for index in own),
+            heap_bytes=int(row["heap_bytes"] or 0)
+        )
+        if updates >= thresholds.min_table_writes and hot_ratio < thresholds.min_hot_ratio:
+            review.findings.append(
+                "low_hot_ratio: updates touch indexed columns or find no room on the page "
+                "(check which indexed columns are updated, consider a lower fillfactor)"
+            )
+        table_reviews.append(review)
+
+    # Most expensive first: written most, read least
+    indexes.sort(key=lambda review: (review.scans_per_1k_writes is None, review.scans_per_1k_writes or 0.0,
+                                     -review.size_bytes))
+    return {
+        "indexes": [asdict(review) for review in indexes],
+        "tables": [asdict(review) for review in sorted(table_reviews, key=lambda review: -review.index_bytes)],
+        "drop_candidates": [review.index for review in indexes if any(f.startswith("unused") for f in review.findings)]
+    }
+
+
+class IndexReviewService:
+    """Index usage review and deferred GIN maintenance"""
+
+    def __init__(self, thresholds: Optional[ReviewThresholds] = None):
+        self.thresholds = thresholds or ReviewThresholds()
+
+    async def review(self, table: Optional[str] = None) -> Dict[str, Any]:
+        """Usage, write cost and size of every index (or one table's indexes)"""
+        async with database.get_session() as session:
+            index_rows = [dict(row) for row in (await session.execute(INDEX_USAGE_SQL, {"table": table})).mappings()]
+            table_rows = [dict(row) for row in (await session.execute(TABLE_WRITES_SQL, {"table": table})).mappings()]
+            stats_reset = (await session.execute(STATS_RESET_SQL)).scalar()
+
+        report = build_report(index_rows, table_rows, self.thresholds)
+        # Counters are cumulative since this point: judge "unused" against its age
+        report["stats_reset"] = stats_reset.isoformat() if stats_reset else None
+        return report
+
+    async def flush_gin_pending_lists(self, table: str = "entries") -> Dict[str, int]:
+        """Merge every GIN pending list of a table into the main index"""
+        flushed: Dict[str, int] = {}
+        if database.engine is None:
+            await database.initialize()
+        async with database.get_session() as session:
+            names = (await session.execute(GIN_INDEXES_SQL, {"table": table})).scalars().all()
+            for name in names:
+                pages = await session.execute(
+                    text("SELECT gin_clean_pending_list(CAST(:index AS regclass))"), {"index": name}
+                )
+                flushed[name] = int(pages.scalar() or 0)
+
+        if any(flushed.values()):
+            logger.info(f"🧹 Flushed GIN pending lists on {table}: {flushed}")
+        return flushed
+
+
+# Global index review service instance
+index_review_service = IndexReviewService()
@@ -0,0 +1,344 @@
+# backend/app/services/insight_precompute_service.py
+"""
+Insight Precompute Service
+Materializes per-user personality profiles, temporal insights and predictions
+into durable Redis snapshots so request paths read a stamped snapshot instead
+of computing on demand.
+
+Refreshes are driven by:
+- Content version changes (bumped on every entry create/update/delete)
+- An activity-weighted cadence (active writers refresh more often)
+"""
+
+import logging
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func, select
+
+from app.core.cache_patterns import CachePatterns, CacheTTL
+from app.core.database import database
+from app.models.enhanced_models import Entry
+from app.services.cache_service import unified_cache_service
+from app.services.redis_service import redis_service
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotType(Enum):
+    """Kinds of precomputed per-user insights"""
+    PERSONALITY = "personality"
+    TEMPORAL = "temporal"
+    PREDICTIVE = "predictive"
+
+
+@dataclass
+class SnapshotSchedule:
+    """Refresh cadence configuration"""
+    min_interval_seconds: int = 1800            # Busiest writers: every 30 minutes
+    max_interval_seconds: int = CacheTTL.DAILY  # Idle users: once a day
+    activity_window_days: int = 7
+    max_users_per_run: int = 200
+    refresh_lock_ttl: int = 600                 # Dedupe window for enqueued refreshes
+    personality_entries: int = 200
+    temporal_entries: int = 100
+    predictive_entries: int = 150
+    prediction_horizon: int = 7
+
+
+class InsightPrecomputeService:
+    """
+    Background precomputation of expensive per-user AI insights
+
+    Snapshots are stored through the unified cache service with a freshness
+    stamp (computed_at, content_version). Readers compare the snapshot version
+    with the user's current content version to decide whether it is stale.
+    """
+
+    def __init__(self, schedule: Optional[SnapshotSchedule] = None):
+        self.schedule = schedule or SnapshotSchedule()
+        self.stats = {
+            "refreshes": 0,
+            "refresh_failures": 0,
+            "snapshot_hits": 0,
+            "snapshot_misses": 0,
+            "stale_reads": 0
+        }
+
+    # ==================== CONTENT VERSIONING ====================
+
+    async def bump_content_version(self, user_id: str) -> int:
+        """Mark a user's content as changed; called from entry write paths"""
+        return await redis_service.increment(CachePatterns.psychology_content_version(str(user_id)))
+
+    async def get_content_version(self, user_id: str) -> int:
+        """Current content version for a user (0 if never written)"""
+        version = await redis_service.get(CachePatterns.psychology_content_version(str(user_id)))
+        try:
+            return int(version or 0)
+        except (TypeError, ValueError):
+            return 0
+
+    # ==================== SNAPSHOT READS ====================
+
+    async def get_snapshot(self, user_id: str, snapshot_type: SnapshotType) -> Optional[Dict[str, Any]]:
+        """
+        Read the latest snapshot with its freshness stamp
+
+        Returns None if no snapshot has been materialized yet. Otherwise returns
+        {"data", "computed_at", "content_version", "current_version", "age_seconds", "stale"}.
+        """
+        user_id = str(user_id)
+        snapshot = await unified_cache_service.get_ai_analysis_result(
+            CachePatterns.psychology_snapshot(user_id, snapshot_type.value)
+        )
+        if not isinstance(snapshot, dict) or "data" not in snapshot:
+            self.stats["snapshot_misses"] += 1
+            return None
+
+        current_version = await self.get_content_version(user_id)
+        computed_at = snapshot.get("computed_at_epoch", 0)
+        snapshot["current_version"] = current_version
+        snapshot["age_seconds"] = round(max(0.0, time.time() - computed_at), 1)
+        snapshot["stale"] = snapshot.get("content_version", -1) != current_version
+
+        self.stats["snapshot_hits"] += 1
+        if snapshot["stale"]:
+            self.stats["stale_reads"] += 1
+        return snapshot
+
+    async def request_refresh(self, user_id: str) -> bool:
+        """
+        Enqueue a deduplicated background refresh for a user
+
+        Returns True if a refresh task was dispatched, False if one is already pending.
+        """
+        user_id = str(user_id)
+        lock_key = f"{CachePatterns.psychology_snapshot_meta(user_id)}:pending"
+        if not await redis_service.set_if_absent(lock_key, "1", ttl=self.schedule.refresh_lock_ttl):
+            return False
+
+        try:
+            # Lazy import: celery_service imports the monitoring stack
+            from app.services.celery_service import dispatch_task, TaskPriority
+            await dispatch_task(
+                "app.tasks.psychology.refresh_user_insight_snapshots",
+                args=(user_id,),
+                priority=TaskPriority.NORMAL
+            )
+            return True
+        except Exception as e:
+            await redis_service.delete(lock_key)
+            logger.warning(f"⚠️ Could not enqueue insight refresh for user {user_id}: {e}")
+            return False
+
+    # ==================== SNAPSHOT REFRESH ====================
+
+    async def refresh_user(self, user_id: str, force: bool = False) -> Dict[str, Any]:
+        """
+        Recompute and materialize all snapshots for a user
+
+        Args:
+            user_id: User identifier
+            force: Refresh even if the content version has not changed
+        """
+        # Lazy import keeps the AI stack out of modules that only read snapshots
+        from app.services.advanced_ai_service import advanced_ai_service, AnalysisTimeframe
+
+        user_id = str(user_id)
+        start_time = time.time()
+        version = await self.get_content_version(user_id)
+        meta = await redis_service.get(CachePatterns.psychology_snapshot_meta(user_id)) or {}
+
+        if not force and isinstance(meta, dict) and meta.get("content_version") == version \
+                and time.time() - meta.get("computed_at_epoch", 0) < self.schedule.min_interval_seconds:
+            return {"user_id": user_id, "status": "skipped", "reason": "up_to_date", "content_version": version}
+
+        refreshed: List[str] = []
+        try:
+            max_entries = max(self.schedule.personality_entries, self.schedule.temporal_entries,
+                              self.schedule.predictive_entries)
+            entries = await self._fetch_entries(user_id, max_entries)
+
+            if len(entries) >= 10:
+                profile = await advanced_ai_service.generate_personality_profile(
+                    user_id, entries[:self.schedule.personality_entries]
+                )
+                await self._store_snapshot(user_id, SnapshotType.PERSONALITY,
+                                           self._serialize_personality(profile), version)
+                refreshed.append(SnapshotType.PERSONALITY.value)
+
+                prediction = await advanced_ai_service.generate_predictive_analysis(
+                    user_id, entries[:self.schedule.predictive_entries], self.schedule.prediction_horizon
+                )
+                await self._store_snapshot(user_id, SnapshotType.PREDICTIVE,
+                                           self._serialize_prediction(prediction), version)
+                refreshed.append(SnapshotType.PREDICTIVE.value)
+
+            if len(entries) >= 5:
+                insights = await advanced_ai_service.analyze_temporal_patterns(
+                    user_id, entries[:self.schedule.temporal_entries], AnalysisTimeframe.MONTHLY
+                )
+                await self._store_snapshot(user_id, SnapshotType.TEMPORAL,
+                                           [self._serialize_insight(i) for i in insights], version)
+                refreshed.append(SnapshotType.TEMPORAL.value)
+
+            await redis_service.set(
+                CachePatterns.psychology_snapshot_meta(user_id),
+                {"content_version": version, "computed_at_epoch": time.time(),
+                 "entries_analyzed": len(entries)},
+                ttl=CacheTTL.DAILY
+            )
+            self.stats["refreshes"] += 1
+
+            return {
+                "user_id": user_id,
+                "status": "refreshed",
+                "snapshots": refreshed,
+                "content_version": version,
+                "entries_analyzed": len(entries),
+                "processing_time_ms": round((time.time() - start_time) * 1000, 2)
+            }
+
+        except Exception as e:
+            self.stats["refresh_failures"] += 1
+            logger.error(f"❌ Insight snapshot refresh failed for user {user_id}: {e}")
+            return {"user_id": user_id, "status": "failed", "error": str(e), "snapshots": refreshed}
+
+        finally:
+            await redis_service.delete(f"{CachePatterns.psychology_snapshot_meta(user_id)}:pending")
+
+    async def _fetch_entries(self, user_id: str, limit: int) -> List[Dict[str, Any]]:
+        """Fetch entries in the dict shape the advanced AI service expects (newest first)"""
+        from app.services.unified_database_service import unified_db_service
+
+        rows = await unified_db_service.get_entries(user_id=user_id, limit=limit)
+        entries = [
+            {
+                "id": str(entry.id),
+                "content": entry.content or "",
+                "created_at": entry.created_at,
+                "mood": entry.mood,
+                "tags": entry.tags or []
+            }
+            for entry in rows or []
+        ]
+        entries.sort(key=lambda x: x.get("created_at") or datetime.min, reverse=True)
+        return entries
+
+    async def store_personality_snapshot(self, user_id: str, profile, version: int) -> bool:
+        """Materialize a profile computed on a request path, stamped with the version read before computing"""
+        return await self._store_snapshot(str(user_id), SnapshotType.PERSONALITY,
+                                          self._serialize_personality(profile), version)
+
+    async def _store_snapshot(self, user_id: str, snapshot_type: SnapshotType, data: Any, version: int) -> bool:
+        now = datetime.utcnow()
+        snapshot = {
+            "type": snapshot_type.value,
+            "data": data,
+            "content_version": version,
+            "computed_at": now.isoformat(),
+            "computed_at_epoch": time.time()
+        }
+        return await unified_cache_service.set_ai_analysis_result(
+            snapshot, CachePatterns.psychology_snapshot(user_id, snapshot_type.value), ttl=CacheTTL.DAILY
+        )
+
+    # ==================== SCHEDULING ====================
+
+    def refresh_interval(self, recent_entries: int) -> int:
+        """Activity-weighted refresh interval: more recent writing means shorter intervals"""
+        interval = self.schedule.max_interval_seconds / (1 + max(0, recent_entries))
+        return int(min(self.schedule.max_interval_seconds,
+                       max(self.schedule.min_interval_seconds, interval)))
+
+    async def get_active_users(self) -> Dict[str, int]:
+        """Users with entry activity inside the activity window mapped to their recent entry count"""
+        since = datetime.utcnow() - timedelta(days=self.schedule.activity_window_days)
+        async with database.get_session() as session:
+            result = await session.execute(
+                select(Entry.user_id, func.count(Entry.id))
+                .where(Entry.updated_at >= since, Entry.deleted_at.is_(None))
+                .group_by(Entry.user_id)
+                .order_by(func.count(Entry.id).desc())
+                .limit(self.schedule.max_users_per_run)
+            )
+            return {str(user_id): count for user_id, count in result.all()}
+
+    async def select_due_users(self) -> List[str]:
+        """Users whose snapshots are stale by content version or by activity-weighted age"""
+        due = []
+        now = time.time()
+        for user_id, recent_entries in (await self.get_active_users()).items():
+            meta = await redis_service.get(CachePatterns.psychology_snapshot_meta(user_id))
+            if not isinstance(meta, dict):
+                due.append(user_id)
+                continue
+
+            if meta.get("content_version") != await self.get_content_version(user_id):
+                due.append(user_id)
+            elif now - meta.get("computed_at_epoch", 0) >= self.refresh_interval(recent_entries):
+                due.append(user_id)
+        return due
+
+    async def schedule_refreshes(self) -> Dict[str, Any]:
+        """Beat entrypoint: enqueue refreshes for every due user"""
+        due_users = await self.select_due_users()
+        dispatched = 0
+        for user_id in due_users:
+            if await self.request_refresh(user_id):
+                dispatched += 1
+        return {"due_users": len(due_users), "dispatched": dispatched, "timestamp": datetime.utcnow().isoformat()}
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "schedule": asdict(self.schedule)}
+
+    # ==================== SERIALIZATION ====================
+
+    @staticmethod
+    def _serialize_personality(profile) -> Dict[str, Any]:
+        return {
+            "dimensions": {dim.value: score for dim, score in profile.dimensions.items()},
+            "traits": profile.traits,
+            "behavioral_patterns": profile.behavioral_patterns,
+            "communication_style": profile.communication_style,
+            "emotional_profile": profile.emotional_profile,
+            "growth_areas": profile.growth_areas,
+            "strengths": profile.strengths,
+            "confidence_score": profile.confidence_score,
+            "last_updated": profile.last_updated.isoformat()
+        }
+
+    @staticmethod
+    def _serialize_prediction(analysis) -> Dict[str, Any]:
+        return {
+            "predicted_mood_trends": analysis.predicted_mood_trends,
+            "risk_factors": analysis.risk_factors,
+            "opportunity_windows": analysis.opportunity_windows,
+            "behavioral_predictions": analysis.behavioral_predictions,
+            "confidence_intervals": {k: list(v) for k, v in analysis.confidence_intervals.items()},
+            "recommendation_priority": analysis.recommendation_priority,
+            "created_at": analysis.created_at.isoformat()
+        }
+
+    @staticmethod
+    def _serialize_insight(insight) -> Dict[str, Any]:
+        return {
+            "insight_type": insight.insight_type.value,
+            "title": insight.title,
+            "description": insight.description,
+            "confidence": insight.confidence,
+            "significance": insight.significance,
+            "timeframe": insight.timeframe.value,
+            "supporting_data": insight.supporting_data,
+            "recommendations": insight.recommendations,
+            "metadata": insight.metadata,
+            "created_at": insight.created_at.isoformat()
+        }
+
+
+# Global instance
+insight_precompute_service = InsightPrecomputeService()
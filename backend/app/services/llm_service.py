@@ -6,6 +6,7 @@ from typing import List, Dict, Any, Optional, Tuple
 import logging
 from app.core.config import settings
 from app.core.circuit_breaker import CircuitBreakerConfig, get_service_circuit_breaker
+from app.core.request_timing import SPAN_LLM, timing_span
 from app.services.psychology_knowledge_service import (
     psychology_knowledge_service, 
     PsychologyDomain
@@ -55,7 +56,8 @@ class EnhancedLLMService:
                 
             return await loop.run_in_executor(None, _sync_generate)
         
-        return await self.circuit_breaker.call_async(_make_ollama_call)
+        with timing_span(SPAN_LLM):
+            return await self.circuit_breaker.call_async(_make_ollama_call)
         
     def __del__(self):
         """Destructor to ensure proper cleanup"""
@@ -0,0 +1,185 @@
+# backend/app/services/near_cache.py
+"""
+In-process near cache in front of Redis
+Hot, read-mostly keys are served from a per-worker LRU, so most reads of them
+do not reach Redis.
+
+- Only keys whose "domain:resource" prefix has a NearCachePolicy are held; each
+  domain has its own entry limit and TTL, and the TTL bounds staleness
+- Entries hold the raw Redis payload, and every hit deserializes a fresh copy,
+  so callers may mutate what they get back
+- Writers publish invalidations on a Redis pub/sub channel; every worker drops
+  matching entries. Messages from this worker are skipped because they were
+  applied locally first
+- If the subscription drops, invalidations may have been missed, so the owner
+  clears the cache and keeps it disabled until it has subscribed again
+- A generation counter stops a read that raced an invalidation from storing
+  the value it fetched before the invalidation
+"""
+
+import json
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.cache_patterns import CacheDomain, CacheTTL
+
+# Channel every worker subscribes to for near-cache invalidations
+NEAR_CACHE_CHANNEL = "cache:near:invalidate"
+
+MISSING = object()
+
+
+@dataclass(frozen=True)
+class NearCachePolicy:
+    """Entry limit and time-to-live for one near-cached domain"""
+    max_entries: int
+    ttl_seconds: float
+
+
+# Keyed by the first two key segments (CacheKeyBuilder's domain and resource)
+DEFAULT_NEAR_CACHE_POLICIES: Dict[str, NearCachePolicy] = {
+    f"{CacheDomain.SESSION.value}:data": NearCachePolicy(max_entries=2000, ttl_seconds=30),
+    f"{CacheDomain.PSYCHOLOGY.value}:profile": NearCachePolicy(max_entries=1000, ttl_seconds=CacheTTL.SHORT),
+    f"{CacheDomain.CONTENT.value}:topics": NearCachePolicy(max_entries=1000, ttl_seconds=CacheTTL.REALTIME),
+    f"{CacheDomain.AI_MODEL.value}:prompt": NearCachePolicy(max_entries=500, ttl_seconds=CacheTTL.MEDIUM_SHORT),
+}
+
+
+class NearCache:
+    """Per-domain LRU of raw Redis payloads with pub/sub invalidation"""
+
+    def __init__(self, policies: Optional[Dict[str, NearCachePolicy]] = None, clock=time.monotonic):
+        self.policies = dict(DEFAULT_NEAR_CACHE_POLICIES if policies is None else policies)
+        self.instance_id = uuid.uuid4().hex
+        self.active = False  # Set by the owner while its invalidation subscription is live
+        self._clock = clock
+        self._entries: Dict[str, "OrderedDict[str, Tuple[float, Any]]"] = {
+            domain: OrderedDict() for domain in self.policies
+        }
+        self._generation = 0
+        self.stats = {
+            "near_hits": 0,
+            "far_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "invalidations": 0,
+            "messages_received": 0,
+        }
+
+    def domain_of(self, key: str) -> Optional[str]:
+        """Near-cached domain of a key, or None when the key is not near-cached"""
+        parts = key.split(":", 2)
+        if len(parts) < 2:
+            return None
+        domain = f"{parts[0]}:{parts[1]}"
+        return domain if domain in self.policies else None
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, key: str) -> Any:
+        """Raw payload for a key, or MISSING"""
+        domain = self.domain_of(key)
+        if domain is None or not self.active:
+            return MISSING
+
+        entries = self._entries[domain]
+        entry = entries.get(key)
+        if entry is None:
+            return MISSING
+        expires_at, raw = entry
+        if expires_at <= self._clock():
+            del entries[key]
+            self.stats["expirations"] += 1
+            return MISSING
+
+        entries.move_to_end(key)
+        self.stats["near_hits"] += 1
+        return raw
+
+    def put(self, key: str, raw: Any, generation: Optional[int] = None) -> None:
+        """Store a payload read from Redis; skipped if an invalidation ran since `generation`"""
+        domain = self.domain_of(key)
+        if domain is None or not self.active:
+            return
+        if generation is not None and generation != self._generation:
+            return
+
+        policy = self.policies[domain]
+        entries = self._entries[domain]
+        entries[key] = (self._clock() + policy.ttl_seconds, raw)
+        entries.move_to_end(key)
+        while len(entries) > policy.max_entries:
+            entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def record_far_lookup(self, found: bool) -> None:
+        """Count a near-cacheable read that had to go to Redis"""
+        self.stats["far_hits" if found else "misses"] += 1
+
+    def invalidate(self, key: str) -> bool:
+        domain = self.domain_of(key)
+        if domain is None:
+            return False
+        self._generation += 1
+        removed = self._entries[domain].pop(key, None) is not None
+        if removed:
+            self.stats["invalidations"] += 1
+        return removed
+
+    def invalidate_pattern(self, pattern: str) -> int:
+        """Drop every entry matching a Redis glob pattern"""
+        self._generation += 1
+        removed = 0
+        for entries in self._entries.values():
+            for key in [key for key in entries if fnmatchcase(key, pattern)]:
+                del entries[key]
+                removed += 1
+        self.stats["invalidations"] += removed
+        return removed
+
+    def clear(self) -> None:
+        self._generation += 1
+        for entries in self._entries.values():
+            entries.clear()
+
+    def invalidation_message(self, key: Optional[str] = None, pattern: Optional[str] = None) -> str:
+        return json.dumps({"origin": self.instance_id, "key": key, "pattern": pattern})
+
+    def apply_message(self, data: Any) -> None:
+        """Apply an invalidation published by another worker"""
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError):
+            return
+        if message.get("origin") == self.instance_id:
+            return
+
+        self.stats["messages_received"] += 1
+        if message.get("pattern"):
+            self.invalidate_pattern(message["pattern"])
+        elif message.get("key"):
+            self.invalidate(message["key"])
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.stats["near_hits"] + self.stats["far_hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "active": self.active,
+            "near_hit_rate": self.stats["near_hits"] / lookups if lookups else 0.0,
+            "far_hit_rate": self.stats["far_hits"] / lookups if lookups else 0.0,
+            "domains": {
+                domain: {
+                    "entries": len(self._entries[domain]),
+                    "max_entries": policy.max_entries,
+                    "ttl_seconds": policy.ttl_seconds,
+                }
+                for domain, policy in self.policies.items()
+            },
+        }
@@ -0,0 +1,201 @@
+# backend/app/services/partition_maintenance_service.py
+"""
+Partition Maintenance Service
+Keeps monthly range-partitioned tables ready for writes and enforces retention.
+
+- Partitions are named <table>_pYYYY_MM and cover one UTC month
+- Partitions are created a few months ahead so writes never land in the
+  default partition (which would block creating the partition for that month)
+- Retention detaches whole expired partitions and drops them: no row-by-row
+  DELETE and no vacuum debt
+- Detaching is CONCURRENTLY (PostgreSQL 14+) when the table has no default
+  partition; PostgreSQL refuses that with one, so those tables take a plain
+  DETACH, which is brief and bounded by DDL_LOCK_TIMEOUT. A concurrent detach
+  interrupted half-way is finalized on the next run
+- Retention is opt-in (0 months keeps everything); counters derived from the
+  dropped rows (chat_sessions.message_count) are corrected in the DROP's
+  transaction
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.database import database
+
+logger = logging.getLogger(__name__)
+
+PARTITION_NAME_PATTERN = re.compile(r"^(?P<table>\w+)_p(?P<year>\d{4})_(?P<month>\d{2})$")
+
+# Partition DDL waits at most this long for the parent's lock, so a long
+# query on the table fails the DDL (retried next run) instead of queueing
+# every read and write behind it
+DDL_LOCK_TIMEOUT = "5s"
+
+LIST_PARTITIONS_SQL = text("""
+    SELECT child.relname AS name,
+           inh.inhdetachpending AS detach_pending,
+           pg_get_expr(child.relpartbound, child.oid) = 'DEFAULT' AS is_default
+    FROM pg_inherits inh
+    JOIN pg_class parent ON parent.oid = inh.inhparent
+    JOIN pg_class child ON child.oid = inh.inhrelid
+    WHERE parent.relname = :table
+    ORDER BY child.relname
+""")
+
+# Takes the dropped messages out of their sessions' message counts
+CHAT_SESSION_COUNTS_SQL = """
+    UPDATE chat_sessions
+    SET message_count = GREATEST(chat_sessions.message_count - dropped.messages, 0)
+    FROM (SELECT session_id, count(*) AS messages FROM {partition} GROUP BY session_id) AS dropped
+    WHERE chat_sessions.id = dropped.session_id
+"""
+
+
+@dataclass(frozen=True)
+class PartitionedTable:
+    """A table range-partitioned by month on a timestamptz column"""
+    name: str
+    retention_months: int = 0   # Whole months kept before the current one; 0 keeps everything
+    premake_months: int = 3
+    # Run on the detached partition ({partition}) in the same transaction as its DROP
+    before_drop_sql: Optional[str] = None
+
+
+def month_start(moment: datetime) -> datetime:
+    """First instant of moment's UTC month"""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    moment = moment.astimezone(timezone.utc)
+    return datetime(moment.year, moment.month, 1, tzinfo=timezone.utc)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    """Shift a month start by a number of months"""
+    index = month.year * 12 + (month.month - 1) + months
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+def partition_name(table: str, month: datetime) -> str:
+    return f"{table}_p{month:%Y_%m}"
+
+
+def partition_month(table: str, name: str) -> Optional[datetime]:
+    """Month a partition covers, or None for the default and foreign tables"""
+    match = PARTITION_NAME_PATTERN.match(name)
+    if not match or match.group("table") != table:
+        return None
+    return datetime(int(match.group("year")), int(match.group("month")), 1, tzinfo=timezone.utc)
+
+
+def create_partition_sql(table: str, month: datetime) -> str:
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(table, month)} PARTITION OF {table} "
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+    )
+
+
+def expired_partitions(table: PartitionedTable, names: Iterable[str], now: datetime) -> List[str]:
+    """Partitions whose whole month is older than the retention window"""
+    if table.retention_months <= 0:
+        return []
+    cutoff = add_months(month_start(now), -table.retention_months)
+    expired = []
+    for name in names:
+        month = partition_month(table.name, name)
+        if month is not None and add_months(month, 1) <= cutoff:
+            expired.append(name)
+    return sorted(expired)
+
+
+class PartitionMaintenanceService:
+    """Creates future partitions and drops expired ones"""
+
+    def __init__(self, tables: Optional[List[PartitionedTable]] = None):
+        self.tables = tables or [
+            PartitionedTable(
+                name="chat_messages",
+                retention_months=settings.CHAT_MESSAGE_RETENTION_MONTHS,
+                premake_months=settings.DB_PARTITION_PREMAKE_MONTHS,
+                before_drop_sql=CHAT_SESSION_COUNTS_SQL
+            )
+        ]
+
+    async def run_maintenance(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Create upcoming partitions, then apply retention, for every table"""
+        now = now or datetime.now(timezone.utc)
+        if database.engine is None:
+            await database.initialize()
+
+        results: Dict[str, Any] = {}
+        # DETACH ... CONCURRENTLY cannot run inside a transaction block
+        async with database.engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await conn.execute(text(f"SET lock_timeout = '{DDL_LOCK_TIMEOUT}'"))
+
+            for table in self.tables:
+                partitions = await self._list_partitions(conn, table.name)
+                created = await self._ensure_future_partitions(conn, table, set(partitions), now)
+                concurrently = not any(partition["is_default"] for partition in partitions.values())
+                dropped = await self._apply_retention(conn, table, partitions, now, concurrently)
+                results[table.name] = {"created": created, "dropped": dropped}
+
+        logger.info(f"🗂️ Partition maintenance completed: {results}")
+        return results
+
+    async def _list_partitions(self, conn, table: str) -> Dict[str, Dict[str, bool]]:
+        """Attached partitions of a table by name"""
+        result = await conn.execute(LIST_PARTITIONS_SQL, {"table": table})
+        return {
+            row.name: {"detach_pending": bool(row.detach_pending), "is_default": bool(row.is_default)}
+            for row in result
+        }
+
+    async def _ensure_future_partitions(self, conn, table: PartitionedTable, existing: set,
+                                        now: datetime) -> List[str]:
+        created = []
+        current = month_start(now)
+        for offset in range(table.premake_months + 1):
+            month = add_months(current, offset)
+            name = partition_name(table.name, month)
+            if name in existing:
+                continue
+            try:
+                await conn.execute(text(create_partition_sql(table.name, month)))
+                created.append(name)
+                logger.info(f"🗂️ Created partition {name}")
+            except Exception as e:
+                # Usually lock_timeout, or rows for that month already sitting
+                # in the default partition
+                logger.warning(f"⚠️ Could not create partition {name}: {e}")
+        return created
+
+    async def _apply_retention(self, conn, table: PartitionedTable, partitions: Dict[str, Dict[str, bool]],
+                               now: datetime, concurrently: bool) -> List[str]:
+        dropped = []
+        for name in expired_partitions(table, partitions, now):
+            if partitions[name]["detach_pending"]:
+                mode = " FINALIZE"
+            else:
+                mode = " CONCURRENTLY" if concurrently else ""
+            try:
+                await conn.execute(text(f"ALTER TABLE {table.name} DETACH PARTITION {name}{mode}"))
+                # Detached rows no longer change: correct what counted them and drop together
+                async with database.engine.begin() as transaction:
+                    if table.before_drop_sql:
+                        await transaction.execute(text(table.before_drop_sql.format(partition=name)))
+                    await transaction.execute(text(f"DROP TABLE {name}"))
+                dropped.append(name)
+                logger.info(f"🗑️ Dropped expired partition {name}")
+            except Exception as e:
+                logger.warning(f"⚠️ Could not drop partition {name}: {e}")
+        return dropped
+
+
+# Global partition maintenance service instance
+partition_maintenance_service = PartitionMaintenanceService()
@@ -4,7 +4,7 @@ import logging
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
-from app.services.redis_service_simple import simple_redis_service
+from app.services.redis_service import redis_service
 from app.core.cache_patterns import CachePatterns
 from app.core.exceptions import AnalyticsException
 
@@ -32,7 +32,7 @@ class PersonalityAnalyticsProcessor:
             # Invalidate caches using pattern matching
             invalidated_count = 0
             for pattern in cache_keys_to_invalidate:
-                deleted = await simple_redis_service.invalidate_pattern(pattern)
+                deleted = await redis_service.invalidate_pattern(pattern)
                 invalidated_count += deleted
             
             logger.debug(f"Invalidated {invalidated_count} personality cache entries for user {user_id}")
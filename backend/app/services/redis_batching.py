@@ -0,0 +1,103 @@
+# backend/app/services/redis_batching.py
+"""
+Redis command auto-batching
+Coalesces commands issued by concurrent coroutines in the same event-loop tick
+into one pipeline, so independent cache calls cost one round trip instead of one
+each.
+
+- Callers await execute("get", key) exactly like the client method
+- The first command of a tick schedules a flush with loop.call_soon; everything
+  enqueued before the loop gets back to that callback shares the pipeline
+- A lone command is sent directly; a pipeline is non-transactional (no MULTI)
+  and a failing command only fails its own caller
+- Connection errors fail every caller in the batch
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (command, args, kwargs, future)
+PendingCommand = Tuple[str, tuple, dict, asyncio.Future]
+
+
+class RedisCommandBatcher:
+    """Auto-batching wrapper around a redis.asyncio client"""
+
+    def __init__(self, client, max_batch_size: int = 128):
+        self.client = client
+        self.max_batch_size = max_batch_size
+        self._pending: List[PendingCommand] = []
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._flush_tasks: Set[asyncio.Task] = set()
+
+        self.commands_sent = 0
+        self.round_trips = 0
+        self.largest_batch = 0
+
+    async def execute(self, command: str, *args, **kwargs) -> Any:
+        """Queue a client command for the next flush and wait for its reply"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((command, args, kwargs, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._start_flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_soon(self._start_flush)
+
+        return await future
+
+    def _start_flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.ensure_future(self._flush(batch))
+        # Keep a reference until done so the flush is not garbage collected
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush(self, batch: List[PendingCommand]) -> None:
+        self.round_trips += 1
+        self.commands_sent += len(batch)
+        self.largest_batch = max(self.largest_batch, len(batch))
+
+        try:
+            if len(batch) == 1:
+                command, args, kwargs, future = batch[0]
+                try:
+                    results = [await getattr(self.client, command)(*args, **kwargs)]
+                except Exception as e:
+                    results = [e]
+            else:
+                async with self.client.pipeline(transaction=False) as pipe:
+                    for command, args, kwargs, _ in batch:
+                        getattr(pipe, command)(*args, **kwargs)
+                    results = await pipe.execute(raise_on_error=False)
+        except Exception as e:
+            logger.warning(f"Redis batch of {len(batch)} commands failed: {e}")
+            results = [e] * len(batch)
+
+        for (_, _, _, future), result in zip(batch, results):
+            # The caller may have been cancelled while the batch was in flight
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "commands_sent": self.commands_sent,
+            "round_trips": self.round_trips,
+            "largest_batch": self.largest_batch,
+            "commands_per_round_trip": round(self.commands_sent / self.round_trips, 2) if self.round_trips else 0.0,
+        }
@@ -1,30 +1,63 @@
 # backend/app/services/redis_service.py
 """
-Enterprise Redis Service for Phase 0B Integration
-Provides high-performance caching with connection pooling and monitoring
+Unified Redis Service
+One pooled client behind every cache, session, analytics and rate-limit
+consumer, so connection counts and tail latency are tuned in one place
+(settings.redis / REDIS_* environment variables).
+
+- Single ConnectionPool with socket timeouts and keepalive; hiredis reply
+  parsing when the package is installed and enabled
+- Concurrent get/set/delete calls are auto-batched into one pipeline
+- A failed connection marks the service unavailable: calls return cache
+  misses immediately while a background task reconnects with exponential
+  backoff
+- Per-command latency histograms for monitoring
+- Optional in-process near cache for hot read-mostly domains, kept coherent
+  across workers through pub/sub invalidation (see near_cache.py)
+- Hash records with per-field reads and Lua scripts for atomic
+  read-modify-write updates (used for session state)
 """
 
 import redis.asyncio as redis
+from redis._parsers import _AsyncHiredisParser, _AsyncRESP2Parser
+from redis.exceptions import ConnectionError as RedisConnectionError, NoScriptError, TimeoutError as RedisTimeoutError
+from redis.utils import HIREDIS_AVAILABLE
+import hashlib
 import json
 import logging
 import asyncio
-from typing import Any, Optional, Union, List, Dict, Pattern
-from datetime import timedelta
-from contextlib import asynccontextmanager
+from typing import Any, Optional, List, Dict, Sequence
+from contextlib import asynccontextmanager, contextmanager
 import time
 from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
 from enum import Enum
 
-from app.core.config import settings
+from app.core.config import RedisSettings, settings
 from app.core.exceptions import CacheException
+from app.core.request_timing import SPAN_CACHE, record_span
 from app.core.service_interfaces import CacheStrategy
+from app.services.near_cache import MISSING, NEAR_CACHE_CHANNEL, NearCache
+from app.services.redis_batching import RedisCommandBatcher
 
 logger = logging.getLogger(__name__)
 
-class SerializationStrategy(Enum):
-    """Serialization strategies for different data types"""
-    JSON = "json"
-    RAW = "raw"
+# Errors that mean the connection itself is unusable, not just one command
+CONNECTION_ERRORS = (RedisConnectionError, RedisTimeoutError, ConnectionError, OSError)
+
+class JSONEncoder(json.JSONEncoder):
+    """Custom JSON encoder to handle enums, Decimal, datetime, and other objects"""
+    def default(self, obj):
+        if isinstance(obj, Enum):
+            return obj.value
+        elif isinstance(obj, Decimal):
+            return float(obj)
+        elif isinstance(obj, datetime):
+            return obj.isoformat()
+        elif hasattr(obj, '__dict__'):
+            return obj.__dict__
+        return super().default(obj)
 
 @dataclass
 class CacheMetrics:
@@ -32,101 +65,293 @@ class CacheMetrics:
     hits: int = 0
     misses: int = 0
     errors: int = 0
-    avg_response_time: float = 0.0
-    
+    operations: int = 0
+    avg_response_time: float = 0.0  # Seconds, exponential moving average
+    memory_usage_mb: float = 0.0
+    timestamp: datetime = None
+
+    def __post_init__(self):
+        if self.timestamp is None:
+            self.timestamp = datetime.utcnow()
+
     @property
     def hit_rate(self) -> float:
         total = self.hits + self.misses
         return self.hits / total if total > 0 else 0.0
 
+class CommandLatencyHistogram:
+    """Fixed-bucket latency histogram for one Redis command"""
+
+    BUCKETS_MS = (0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0)
+
+    __slots__ = ("bucket_counts", "count", "errors", "total_ms", "max_ms")
+
+    def __init__(self):
+        # One extra bucket for everything above the last bound
+        self.bucket_counts = [0] * (len(self.BUCKETS_MS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, duration_ms: float, error: bool = False) -> None:
+        index = 0
+        while index < len(self.BUCKETS_MS) and duration_ms > self.BUCKETS_MS[index]:
+            index += 1
+        self.bucket_counts[index] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        if error:
+            self.errors += 1
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given fraction of observations"""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for bound, bucket_count in zip(self.BUCKETS_MS, self.bucket_counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": round(self.max_ms, 3),
+            "buckets": {
+                **{f"le_{bound:g}ms": bucket_count for bound, bucket_count in zip(self.BUCKETS_MS, self.bucket_counts)},
+                "overflow": self.bucket_counts[-1]
+            }
+        }
+
 class RedisService(CacheStrategy):
     """
-    Enterprise Redis service with connection pooling and monitoring
+    Pooled Redis client shared by every cache consumer
     Implements CacheStrategy interface for consistent caching operations
     """
-    
-    def __init__(self):
+
+    def __init__(self, redis_settings: Optional[RedisSettings] = None):
+        config = redis_settings or settings.redis
         self.redis_client: Optional[redis.Redis] = None
         self.connection_pool: Optional[redis.ConnectionPool] = None
         self._initialized = False
-        self._initializing = False  # Prevent recursive initialization
+        self._closed = False
         self._metrics = CacheMetrics()
-        
-        # Configuration from settings
-        self.redis_url = settings.redis.url
-        self.max_connections = settings.redis.max_connections
-        self.retry_on_timeout = settings.redis.retry_on_timeout
-        self.health_check_interval = settings.redis.health_check_interval
-        
-        # Performance settings
+        self._latency: Dict[str, CommandLatencyHistogram] = {}
+        self._batcher: Optional[RedisCommandBatcher] = None
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._near_cache_task: Optional[asyncio.Task] = None
+        self._script_shas: Dict[str, str] = {}
+        self._reconnects = 0
+        self._last_error: Optional[str] = None
+
+        # Connection pool configuration
+        self.redis_url = config.url
+        self.max_connections = config.max_connections
+        self.socket_timeout = config.socket_timeout
+        self.socket_connect_timeout = config.socket_connect_timeout
+        self.retry_on_timeout = config.retry_on_timeout
+        self.health_check_interval = config.health_check_interval
+        self.use_hiredis = config.use_hiredis and HIREDIS_AVAILABLE
+        self.reconnect_backoff_base = config.reconnect_backoff_base
+        self.reconnect_backoff_max = config.reconnect_backoff_max
+
+        # Concurrent get/set/delete calls share one pipeline per event-loop tick
+        self.auto_batching = config.auto_batching
+        self.max_batch_size = config.max_batch_size
+
+        # In-process tier in front of Redis for hot keys
+        self.near_cache: Optional[NearCache] = NearCache() if config.near_cache_enabled else None
+
+        # Cache settings
         self.default_ttl = 3600  # 1 hour
         self.max_ttl = 86400     # 24 hours
-        self.serialization_strategy = SerializationStrategy.JSON
-    
+
+    @property
+    def is_available(self) -> bool:
+        """True while the connection is up; calls short-circuit to cache misses otherwise"""
+        return self._initialized
+
+    @property
+    def client(self) -> Optional[redis.Redis]:
+        """Raw client for commands without a wrapper (sets, hashes, scripts)"""
+        return self.redis_client
+
+    async def is_connected(self) -> bool:
+        return self._initialized
+
     async def initialize(self) -> None:
-        """Initialize Redis connection with enterprise-grade configuration"""
-        if self._initialized or self._initializing:
+        """Connect the pool; on failure keep reconnecting in the background"""
+        if self._initialized:
             return
-            
-        self._initializing = True
+        self._closed = False
+
         try:
-            # Create connection pool with optimized settings
-            self.connection_pool = redis.ConnectionPool.from_url(
-                self.redis_url,
-                max_connections=self.max_connections,
-                retry_on_timeout=self.retry_on_timeout,
-                health_check_interval=self.health_check_interval,
-                decode_responses=False,  # Handle encoding manually for flexibility
-                socket_keepalive=True,
-                socket_keepalive_options={},
+            await self._connect()
+            logger.info(
+                f"✅ Redis service initialized (max_connections: {self.max_connections}, "
+                f"hiredis: {self.use_hiredis}, auto_batching: {self.auto_batching})"
             )
-            
-            # Create Redis client
-            self.redis_client = redis.Redis(
-                connection_pool=self.connection_pool,
-                decode_responses=False
-            )
-            
-            # Simple connection test without full health check
-            await self.redis_client.ping()
-            
-            self._initialized = True
-            logger.info("✅ Redis service initialized successfully")
-            
         except Exception as e:
             logger.error(f"❌ Redis initialization failed: {e}")
-            raise CacheException(
-                "Redis initialization failed",
-                context={"error": str(e), "redis_url": self.redis_url}
-            )
-        finally:
-            self._initializing = False
-    
+            self._last_error = str(e)
+            self._schedule_reconnect()
+            raise CacheException(f"Redis initialization failed: {e}")
+
+    async def _connect(self) -> None:
+        """Build a fresh pool and client, verify them, then start serving"""
+        await self._dispose_client()
+
+        self.connection_pool = redis.ConnectionPool.from_url(
+            self.redis_url,
+            max_connections=self.max_connections,
+            socket_timeout=self.socket_timeout,
+            socket_connect_timeout=self.socket_connect_timeout,
+            socket_keepalive=True,
+            retry_on_timeout=self.retry_on_timeout,
+            health_check_interval=self.health_check_interval,
+            decode_responses=False,  # Handle encoding manually for flexibility
+            parser_class=_AsyncHiredisParser if self.use_hiredis else _AsyncRESP2Parser,
+        )
+        self.redis_client = redis.Redis(connection_pool=self.connection_pool)
+
+        await self._perform_health_check()
+
+        self._batcher = RedisCommandBatcher(self.redis_client, self.max_batch_size) if self.auto_batching else None
+        self._initialized = True
+        self._last_error = None
+
+        if self.near_cache is not None:
+            self._near_cache_task = asyncio.get_running_loop().create_task(self._listen_for_invalidations())
+
+    async def _dispose_client(self) -> None:
+        self._batcher = None
+        self._stop_near_cache()
+        if self.redis_client is not None:
+            try:
+                await self.redis_client.close()
+                await self.connection_pool.disconnect()
+            except Exception as e:
+                logger.debug(f"Error disposing Redis connection pool: {e}")
+        self.redis_client = None
+        self.connection_pool = None
+
     async def close(self) -> None:
-        """Gracefully close Redis connections"""
-        if self.redis_client:
-            await self.redis_client.close()
-        if self.connection_pool:
-            await self.connection_pool.disconnect()
-        
+        """Close Redis connections and stop reconnecting"""
+        self._closed = True
+        if self._reconnect_task and not self._reconnect_task.done():
+            self._reconnect_task.cancel()
+        self._reconnect_task = None
         self._initialized = False
+        await self._dispose_client()
         logger.info("🔐 Redis connections closed")
-    
-    @asynccontextmanager
-    async def _timed_operation(self, operation_name: str):
-        """Context manager for timing and error tracking"""
-        start_time = time.time()
+
+    def _mark_unavailable(self, error: Exception) -> None:
+        """Stop sending commands over a broken connection and start reconnecting"""
+        self._last_error = str(error)
+        if self._initialized:
+            logger.warning(f"⚠️ Redis connection lost, serving cache misses until reconnected: {error}")
+            self._initialized = False
+        self._stop_near_cache()
+        self._schedule_reconnect()
+
+    def _stop_near_cache(self) -> None:
+        if self._near_cache_task and not self._near_cache_task.done() \
+                and self._near_cache_task is not asyncio.current_task():
+            self._near_cache_task.cancel()
+        self._near_cache_task = None
+        if self.near_cache is not None:
+            self.near_cache.active = False
+            self.near_cache.clear()
+
+    async def _listen_for_invalidations(self) -> None:
+        """Apply near-cache invalidations published by other workers"""
+        pubsub = self.redis_client.pubsub()
         try:
-            yield
-            self._metrics.hits += 1
+            await pubsub.subscribe(NEAR_CACHE_CHANNEL)
+            # Nothing is held locally until the subscription is live
+            self.near_cache.clear()
+            self.near_cache.active = True
+            while True:
+                # A bounded wait returns None when idle instead of tripping socket_timeout
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if message is not None:
+                    self.near_cache.apply_message(message["data"])
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
-            self._metrics.errors += 1
-            logger.error(f"Redis {operation_name} error: {e}")
+            # Invalidations may have been missed; stop serving near hits and reconnect
+            self._mark_unavailable(e)
+        finally:
+            self.near_cache.active = False
+            try:
+                await pubsub.reset()
+            except Exception:
+                pass
+
+    async def _publish_invalidation(self, key: Optional[str] = None, pattern: Optional[str] = None) -> None:
+        """Tell other workers to drop near-cached entries (local entries are dropped by the caller)"""
+        try:
+            await self._execute("publish", NEAR_CACHE_CHANNEL, self.near_cache.invalidation_message(key, pattern))
+        except Exception as e:
+            logger.warning(f"Near-cache invalidation publish failed for {key or pattern}: {e}")
+
+    def _schedule_reconnect(self) -> None:
+        if self._closed or (self._reconnect_task and not self._reconnect_task.done()):
+            return
+        try:
+            self._reconnect_task = asyncio.get_running_loop().create_task(self._reconnect_loop())
+        except RuntimeError:
+            # No running loop (sync caller); the next initialize() retries
+            self._reconnect_task = None
+
+    async def _reconnect_loop(self) -> None:
+        delay = self.reconnect_backoff_base
+        while not self._closed and not self._initialized:
+            await asyncio.sleep(delay)
+            try:
+                await self._connect()
+                self._reconnects += 1
+                logger.info(f"✅ Redis reconnected after {self._last_error or 'connection loss'}")
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._last_error = str(e)
+                delay = min(delay * 2, self.reconnect_backoff_max)
+                logger.warning(f"⚠️ Redis reconnect failed, retrying in {delay:.1f}s: {e}")
+
+    @contextmanager
+    def _timed(self, command: str):
+        """Record latency per command and detect broken connections"""
+        start = time.perf_counter()
+        failed = False
+        try:
+            yield
+        except CONNECTION_ERRORS as e:
+            failed = True
+            self._mark_unavailable(e)
+            raise
+        except Exception:
+            failed = True
             raise
         finally:
-            duration = time.time() - start_time
-            self._update_avg_response_time(duration)
-    
+            duration_ms = (time.perf_counter() - start) * 1000
+            histogram = self._latency.get(command)
+            if histogram is None:
+                histogram = self._latency[command] = CommandLatencyHistogram()
+            histogram.observe(duration_ms, failed)
+            self._update_avg_response_time(duration_ms / 1000)
+            record_span(SPAN_CACHE, duration_ms)
+
     def _update_avg_response_time(self, duration: float):
         """Update average response time with exponential moving average"""
         alpha = 0.1  # Smoothing factor
@@ -136,290 +361,459 @@ class RedisService(CacheStrategy):
             self._metrics.avg_response_time = (
                 alpha * duration + (1 - alpha) * self._metrics.avg_response_time
             )
-    
-    def _serialize_value(self, value: Any, strategy: SerializationStrategy = None) -> bytes:
-        """Serialize value based on strategy"""
-        if strategy is None:
-            strategy = self.serialization_strategy
-            
+
+    async def _execute(self, command: str, *args, **kwargs) -> Any:
+        """Run a client command, coalesced with concurrent callers when auto-batching"""
+        with self._timed(command):
+            if self._batcher is not None:
+                return await self._batcher.execute(command, *args, **kwargs)
+            return await getattr(self.redis_client, command)(*args, **kwargs)
+
+    @asynccontextmanager
+    async def pipeline(self, name: str = "pipeline"):
+        """Non-transactional pipeline timed as one command; call execute() inside the block"""
+        with self._timed(name):
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                yield pipe
+
+    def _serialize(self, value: Any) -> str:
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, cls=JSONEncoder)
+        return str(value)
+
+    def _deserialize(self, raw: Any) -> Any:
         try:
-            if strategy == SerializationStrategy.JSON:
-                return json.dumps(value, default=str).encode('utf-8')
-            elif strategy == SerializationStrategy.RAW:
-                if isinstance(value, str):
-                    return value.encode('utf-8')
-                elif isinstance(value, bytes):
-                    return value
-                else:
-                    return str(value).encode('utf-8')
-            else:
-                raise ValueError(f"Unknown serialization strategy: {strategy}")
-                
+            return json.loads(raw)
+        except json.JSONDecodeError:
+            return raw.decode('utf-8') if isinstance(raw, bytes) else raw
+
+    def _bounded_ttl(self, key: str, ttl: Optional[int]) -> int:
+        # Without a TTL use the default TTL for better cache management
+        if ttl and ttl > self.max_ttl:
+            logger.warning(f"TTL capped to max_ttl ({self.max_ttl}s) for key {key}")
+            return self.max_ttl
+        return ttl or self.default_ttl
+
+    async def _perform_health_check(self) -> None:
+        """Verify connectivity and a read/write round trip"""
+        await self.redis_client.ping()
+
+        test_key = f"health_check_{int(time.time())}"
+        test_value = "health_check_value"
+        await self.redis_client.set(test_key, test_value, ex=10)  # 10 second TTL
+        result = await self.redis_client.get(test_key)
+        if result is None or result.decode('utf-8') != test_value:
+            raise CacheException("Health check read/write test failed")
+        await self.redis_client.delete(test_key)
+
+        logger.debug("✅ Redis health check passed")
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get value from cache"""
+        if not self._initialized:
+            return None
+
+        near_cache = self.near_cache if self.near_cache is not None and self.near_cache.domain_of(key) else None
+        if near_cache is not None:
+            raw = near_cache.get(key)
+            if raw is not MISSING:
+                self._metrics.hits += 1
+                return self._deserialize(raw)
+            generation = near_cache.generation
+
+        try:
+            result = await self._execute("get", key)
+            if near_cache is not None:
+                near_cache.record_far_lookup(bool(result))
+                if result:
+                    near_cache.put(key, result, generation)
+            if result:
+                self._metrics.hits += 1
+                return self._deserialize(result)
+            self._metrics.misses += 1
+            return None
         except Exception as e:
-            logger.error(f"Serialization error: {e}")
-            raise CacheException(f"Failed to serialize value", context={"error": str(e)})
-    
-    def _deserialize_value(self, data: bytes, strategy: SerializationStrategy = None) -> Any:
-        """Deserialize value based on strategy"""
-        if strategy is None:
-            strategy = self.serialization_strategy
-            
+            self._metrics.errors += 1
+            logger.warning(f"Redis GET error for key {key}: {e}")
+            return None
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """Set value in cache (default TTL when none given)"""
+        if not self._initialized:
+            return False
+
         try:
-            if strategy == SerializationStrategy.JSON:
-                return json.loads(data.decode('utf-8'))
-            elif strategy == SerializationStrategy.RAW:
-                return data.decode('utf-8')
+            write = self._execute("setex", key, self._bounded_ttl(key, ttl), self._serialize(value))
+            if self.near_cache is not None and self.near_cache.domain_of(key):
+                # Queued behind the write, so with auto-batching both share one pipeline
+                self.near_cache.invalidate(key)
+                result, _ = await asyncio.gather(write, self._publish_invalidation(key=key))
             else:
-                raise ValueError(f"Unknown serialization strategy: {strategy}")
-                
+                result = await write
+            self._metrics.operations += 1
+            return bool(result)
         except Exception as e:
-            logger.error(f"Deserialization error: {e}")
-            raise CacheException(f"Failed to deserialize value", context={"error": str(e)})
-    
-    async def get(self, key: str) -> Optional[Any]:
-        """Get value from Redis cache"""
-        if not self._initialized and not self._initializing:
-            await self.initialize()
-            
-        async with self._timed_operation("get"):
-            try:
-                data = await self.redis_client.get(key)
-                if data is None:
-                    self._metrics.misses += 1
-                    return None
-                    
-                return self._deserialize_value(data)
-                
-            except Exception as e:
-                logger.error(f"Redis GET error for key {key}: {e}")
-                return None
-    
-    async def set(
-        self, 
-        key: str, 
-        value: Any, 
-        ttl: Optional[int] = None,
-        strategy: SerializationStrategy = None
-    ) -> bool:
-        """Set value in Redis cache with optional TTL"""
-        if not self._initialized and not self._initializing:
-            await self.initialize()
-            
-        async with self._timed_operation("set"):
-            try:
-                # Use default TTL if not specified
-                if ttl is None:
-                    ttl = self.default_ttl
-                elif ttl > self.max_ttl:
-                    ttl = self.max_ttl
-                
-                # Serialize value
-                serialized_data = self._serialize_value(value, strategy)
-                
-                # Set with expiration
-                success = await self.redis_client.setex(key, ttl, serialized_data)
-                return bool(success)
-                
-            except Exception as e:
-                logger.error(f"Redis SET error for key {key}: {e}")
-                return False
-    
+            self._metrics.errors += 1
+            logger.warning(f"Redis SET error for key {key}: {e}")
+            return False
+
     async def delete(self, key: str) -> bool:
-        """Delete key from Redis cache"""
-        if not self._initialized and not self._initializing:
-            await self.initialize()
-            
-        async with self._timed_operation("delete"):
-            try:
-                result = await self.redis_client.delete(key)
-                return result > 0
-                
-            except Exception as e:
-                logger.error(f"Redis DELETE error for key {key}: {e}")
-                return False
-    
-    async def exists(self, key: str) -> bool:
-        """Check if key exists in Redis"""
-        if not self._initialized and not self._initializing:
-            await self.initialize()
-            
+        """Delete key from cache"""
+        if not self._initialized:
+            return False
+
         try:
-            result = await self.redis_client.exists(key)
-            return result > 0
+            if self.near_cache is not None and self.near_cache.domain_of(key):
+                self.near_cache.invalidate(key)
+                result, _ = await asyncio.gather(self._execute("delete", key), self._publish_invalidation(key=key))
+            else:
+                result = await self._execute("delete", key)
+            self._metrics.operations += 1
+            return bool(result)
         except Exception as e:
-            logger.error(f"Redis EXISTS error for key {key}: {e}")
+            self._metrics.errors += 1
+            logger.warning(f"Redis DELETE error for key {key}: {e}")
             return False
-    
-    async def invalidate_pattern(self, pattern: str) -> int:
-        """Invalidate all keys matching pattern"""
-        if not self._initialized and not self._initializing:
-            await self.initialize()
-            
-        async with self._timed_operation("invalidate_pattern"):
-            try:
-                # Use SCAN to find matching keys (memory efficient)
-                keys_deleted = 0
-                async for key in self.redis_client.scan_iter(match=pattern, count=100):
-                    await self.redis_client.delete(key)
-                    keys_deleted += 1
-                
-                logger.info(f"Invalidated {keys_deleted} keys matching pattern: {pattern}")
-                return keys_deleted
-                
-            except Exception as e:
-                logger.error(f"Redis pattern invalidation error for {pattern}: {e}")
-                return 0
-    
-    async def get_multiple(self, keys: List[str]) -> Dict[str, Any]:
-        """Get multiple values in a single operation"""
-        if not self._initialized and not self._initializing:
-            await self.initialize()
-            
-        async with self._timed_operation("mget"):
-            try:
-                values = await self.redis_client.mget(keys)
-                results = {}
-                
-                for key, value in zip(keys, values):
-                    if value is not None:
-                        try:
-                            results[key] = self._deserialize_value(value)
-                        except:
-                            logger.warning(f"Failed to deserialize value for key: {key}")
-                            
-                return results
-                
-            except Exception as e:
-                logger.error(f"Redis MGET error: {e}")
-                return {}
-    
-    async def set_multiple(
-        self, 
-        key_value_pairs: Dict[str, Any], 
-        ttl: Optional[int] = None
-    ) -> bool:
-        """Set multiple key-value pairs efficiently"""
-        if not self._initialized and not self._initializing:
-            await self.initialize()
-            
-        async with self._timed_operation("mset"):
-            try:
-                # Serialize all values
-                serialized_pairs = {}
-                for key, value in key_value_pairs.items():
-                    serialized_pairs[key] = self._serialize_value(value)
-                
-                # Use pipeline for efficiency
-                async with self.redis_client.pipeline() as pipeline:
-                    await pipeline.mset(serialized_pairs)
-                    
-                    # Set expiration for all keys if TTL specified
-                    if ttl:
-                        for key in serialized_pairs.keys():
-                            await pipeline.expire(key, ttl)
-                    
-                    await pipeline.execute()
-                
-                return True
-                
-            except Exception as e:
-                logger.error(f"Redis MSET error: {e}")
-                return False
-    
-    async def increment(self, key: str, amount: int = 1) -> int:
-        """Increment numeric value atomically"""
-        if not self._initialized and not self._initializing:
-            await self.initialize()
-            
+
+    async def exists(self, key: str) -> bool:
+        """Check if key exists in Redis"""
+        if not self._initialized:
+            return False
+
         try:
-            result = await self.redis_client.incrby(key, amount)
-            return result
+            return await self._execute("exists", key) > 0
         except Exception as e:
-            logger.error(f"Redis INCREMENT error for key {key}: {e}")
-            return 0
-    
+            self._metrics.errors += 1
+            logger.warning(f"Redis EXISTS error for key {key}: {e}")
+            return False
+
     async def expire(self, key: str, ttl: int) -> bool:
-        """Set expiration time for existing key"""
-        if not self._initialized and not self._initializing:
-            await self.initialize()
-            
+        """Refresh the TTL of an existing key"""
+        if not self._initialized:
+            return False
+
         try:
-            result = await self.redis_client.expire(key, ttl)
+            result = await self._execute("expire", key, min(ttl, self.max_ttl))
+            self._metrics.operations += 1
             return bool(result)
         except Exception as e:
-            logger.error(f"Redis EXPIRE error for key {key}: {e}")
+            self._metrics.errors += 1
+            logger.warning(f"Redis EXPIRE error for key {key}: {e}")
             return False
-    
+
     async def get_ttl(self, key: str) -> int:
         """Get TTL for key (-1 if no expiration, -2 if key doesn't exist)"""
-        if not self._initialized and not self._initializing:
-            await self.initialize()
-            
+        if not self._initialized:
+            return -2
+
         try:
-            return await self.redis_client.ttl(key)
+            return await self._execute("ttl", key)
         except Exception as e:
-            logger.error(f"Redis TTL error for key {key}: {e}")
+            self._metrics.errors += 1
+            logger.warning(f"Redis TTL error for key {key}: {e}")
             return -2
-    
-    async def _health_check(self) -> bool:
-        """Perform Redis health check"""
+
+    async def increment(self, key: str, amount: int = 1) -> int:
+        """Increment numeric value atomically (key never expires)"""
+        if not self._initialized:
+            return 0
+
         try:
-            # Test basic connectivity
-            response = await self.redis_client.ping()
-            if not response:
-                raise CacheException("Redis PING failed")
-            
-            # Test read/write operations
-            test_key = "health_check"
-            test_value = {"timestamp": time.time(), "status": "healthy"}
-            
-            await self.redis_client.setex(test_key, 10, json.dumps(test_value))
-            retrieved = await self.redis_client.get(test_key)
-            
-            if not retrieved:
-                raise CacheException("Redis health check read/write test failed")
-            
-            await self.redis_client.delete(test_key)
-            
-            logger.info("✅ Redis health check passed")
+            result = await self._execute("incrby", key, amount)
+            self._metrics.operations += 1
+            return int(result)
+        except Exception as e:
+            self._metrics.errors += 1
+            logger.warning(f"Redis INCREMENT error for key {key}: {e}")
+            return 0
+
+    async def set_if_absent(self, key: str, value: Any, ttl: int) -> bool:
+        """Set value only if key does not exist (SET NX EX); returns True if set"""
+        if not self._initialized:
+            return False
+
+        try:
+            result = await self._execute("set", key, self._serialize(value), ex=min(ttl, self.max_ttl), nx=True)
+            self._metrics.operations += 1
+            return bool(result)
+        except Exception as e:
+            self._metrics.errors += 1
+            logger.warning(f"Redis SET NX error for key {key}: {e}")
+            return False
+
+    async def get_hash(self, key: str, fields: Optional[Sequence[str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Read a hash record written by set_hash (HGETALL, or HMGET for a projection)
+
+        Returns None if the record does not exist; with `fields`, only the
+        requested fields that are present are returned.
+        """
+        if not self._initialized:
+            return None
+
+        try:
+            if fields:
+                values = await self._execute("hmget", key, *fields)
+                raw = {field: value for field, value in zip(fields, values) if value is not None}
+            else:
+                raw = await self._execute("hgetall", key)
+            self._metrics.operations += 1
+            if not raw:
+                self._metrics.misses += 1
+                return None
+            self._metrics.hits += 1
+            return {
+                (field.decode('utf-8') if isinstance(field, bytes) else field): self._deserialize(value)
+                for field, value in raw.items()
+            }
+        except Exception as e:
+            self._metrics.errors += 1
+            logger.warning(f"Redis HGET error for key {key}: {e}")
+            return None
+
+    async def set_hash(self, key: str, mapping: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """Write fields of a hash record (HSET + EXPIRE in one round trip)"""
+        if not self._initialized or not mapping:
+            return False
+
+        try:
+            async with self.pipeline("hset") as pipe:
+                pipe.hset(key, mapping=self.encode_hash_fields(mapping))
+                pipe.expire(key, self._bounded_ttl(key, ttl))
+                await pipe.execute()
+            self._metrics.operations += 1
             return True
-            
         except Exception as e:
-            logger.error(f"❌ Redis health check failed: {e}")
-            raise CacheException(f"Redis health check failed: {e}")
-    
+            self._metrics.errors += 1
+            logger.warning(f"Redis HSET error for key {key}: {e}")
+            return False
+
+    def encode_hash_fields(self, mapping: Dict[str, Any]) -> Dict[str, str]:
+        """JSON-encode every field so reads restore types and integers stay HINCRBY-able"""
+        return {field: json.dumps(value, cls=JSONEncoder) for field, value in mapping.items()}
+
+    async def run_script(self, script: str, keys: Sequence[str] = (), args: Sequence[Any] = ()) -> Any:
+        """Run a Lua script atomically by SHA, sending the source only on NOSCRIPT"""
+        if not self._initialized:
+            return None
+
+        sha = self._script_shas.get(script)
+        if sha is None:
+            sha = self._script_shas[script] = hashlib.sha1(script.encode('utf-8')).hexdigest()
+
+        try:
+            try:
+                result = await self._execute("evalsha", sha, len(keys), *keys, *args)
+            except NoScriptError:
+                result = await self._execute("eval", script, len(keys), *keys, *args)
+            self._metrics.operations += 1
+            return result
+        except Exception as e:
+            self._metrics.errors += 1
+            logger.warning(f"Redis script error for keys {list(keys)}: {e}")
+            return None
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Get several values with one MGET; missing keys are left out of the result"""
+        if not self._initialized or not keys:
+            return {}
+
+        results = {}
+        near_cache = self.near_cache
+        if near_cache is not None:
+            remote_keys = []
+            for key in keys:
+                raw = near_cache.get(key)
+                if raw is MISSING:
+                    remote_keys.append(key)
+                else:
+                    results[key] = self._deserialize(raw)
+            generation = near_cache.generation
+        else:
+            remote_keys = keys
+
+        try:
+            if remote_keys:
+                with self._timed("mget"):
+                    raw_values = await self.redis_client.mget(remote_keys)
+                for key, raw in zip(remote_keys, raw_values):
+                    if near_cache is not None and near_cache.domain_of(key):
+                        near_cache.record_far_lookup(bool(raw))
+                        if raw:
+                            near_cache.put(key, raw, generation)
+                    if raw:
+                        results[key] = self._deserialize(raw)
+            self._metrics.hits += len(results)
+            self._metrics.misses += len(keys) - len(results)
+            return results
+        except Exception as e:
+            self._metrics.errors += 1
+            logger.warning(f"Redis MGET error for {len(keys)} keys: {e}")
+            return {}
+
+    async def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """Set several values in one pipelined round trip, each with its own TTL"""
+        if not self._initialized or not items:
+            return False
+
+        try:
+            async with self.pipeline("set_many") as pipe:
+                for key, value in items.items():
+                    pipe.setex(key, self._bounded_ttl(key, ttl), self._serialize(value))
+                # Invalidations ride in the same round trip, after the writes
+                for key in self._near_cached_keys(items):
+                    self.near_cache.invalidate(key)
+                    pipe.publish(NEAR_CACHE_CHANNEL, self.near_cache.invalidation_message(key=key))
+                results = await pipe.execute()
+            self._metrics.operations += len(items)
+            return all(results[:len(items)])
+        except Exception as e:
+            self._metrics.errors += 1
+            logger.warning(f"Redis pipelined SET error for {len(items)} keys: {e}")
+            return False
+
+    async def delete_many(self, keys: List[str]) -> int:
+        """Delete several keys with one DEL; returns the number deleted"""
+        if not self._initialized or not keys:
+            return 0
+
+        try:
+            near_keys = self._near_cached_keys(keys)
+            for key in near_keys:
+                self.near_cache.invalidate(key)
+            with self._timed("delete_many"):
+                deleted = await self.redis_client.delete(*keys)
+            if near_keys:
+                await asyncio.gather(*(self._publish_invalidation(key=key) for key in near_keys))
+            self._metrics.operations += len(keys)
+            return int(deleted)
+        except Exception as e:
+            self._metrics.errors += 1
+            logger.warning(f"Redis multi-key DELETE error for {len(keys)} keys: {e}")
+            return 0
+
+    def _near_cached_keys(self, keys) -> List[str]:
+        if self.near_cache is None:
+            return []
+        return [key for key in keys if self.near_cache.domain_of(key)]
+
+    # Aliases kept for callers written against the older service APIs
+    async def get_multiple(self, keys: List[str]) -> Dict[str, Any]:
+        return await self.get_many(keys)
+
+    async def set_multiple(self, key_value_pairs: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        return await self.set_many(key_value_pairs, ttl)
+
+    async def get_json(self, key: str) -> Optional[Any]:
+        return await self.get(key)
+
+    async def set_json(self, key: str, value: Any, expire: Optional[int] = None) -> bool:
+        return await self.set(key, value, ttl=expire)
+
+    async def invalidate_pattern(self, pattern: str, batch_size: int = 500) -> int:
+        """Invalidate keys matching pattern (SCAN, then DEL in batches)"""
+        if not self._initialized:
+            return 0
+
+        try:
+            if self.near_cache is not None:
+                self.near_cache.invalidate_pattern(pattern)
+                await self._publish_invalidation(pattern=pattern)
+
+            deleted = 0
+            with self._timed("invalidate_pattern"):
+                keys = []
+                async for key in self.redis_client.scan_iter(match=pattern, count=batch_size):
+                    keys.append(key)
+                    if len(keys) >= batch_size:
+                        deleted += await self.redis_client.delete(*keys)
+                        keys = []
+                if keys:
+                    deleted += await self.redis_client.delete(*keys)
+            self._metrics.operations += deleted
+            return deleted
+
+        except Exception as e:
+            self._metrics.errors += 1
+            logger.warning(f"Redis INVALIDATE_PATTERN error for pattern {pattern}: {e}")
+            return 0
+
     async def get_metrics(self) -> CacheMetrics:
         """Get current cache performance metrics"""
         return self._metrics
-    
+
+    def get_command_latency(self) -> Dict[str, Dict[str, Any]]:
+        """Latency histogram per command, busiest first"""
+        return {
+            command: histogram.to_dict()
+            for command, histogram in sorted(self._latency.items(), key=lambda item: -item[1].count)
+        }
+
+    def reset_command_latency(self) -> None:
+        self._latency.clear()
+
+    def get_near_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Near-hit / far-hit rates and per-domain sizes, or None when the near cache is off"""
+        return self.near_cache.get_stats() if self.near_cache is not None else None
+
     async def get_info(self) -> Dict[str, Any]:
-        """Get Redis server information"""
-        if not self._initialized and not self._initializing:
-            await self.initialize()
-            
+        """Get comprehensive Redis server information"""
+        if not self._initialized:
+            return {}
+
         try:
             info = await self.redis_client.info()
             return {
                 "redis_version": info.get("redis_version"),
                 "used_memory": info.get("used_memory_human"),
+                "used_memory_peak": info.get("used_memory_peak_human"),
                 "connected_clients": info.get("connected_clients"),
+                "blocked_clients": info.get("blocked_clients", 0),
                 "keyspace_hits": info.get("keyspace_hits", 0),
                 "keyspace_misses": info.get("keyspace_misses", 0),
-                "total_commands_processed": info.get("total_commands_processed", 0)
+                "total_commands_processed": info.get("total_commands_processed", 0),
+                "instantaneous_ops_per_sec": info.get("instantaneous_ops_per_sec", 0),
+                "uptime_in_seconds": info.get("uptime_in_seconds", 0),
+                "role": info.get("role", "unknown"),
+                # Connection pool metrics
+                "max_connections": self.max_connections,
+                "connection_pool_created": info.get("total_connections_received", 0),
+                # Cache configuration
+                "default_ttl": self.default_ttl,
+                "max_ttl": self.max_ttl,
+                "auto_batching": self._batcher.get_stats() if self._batcher else None
             }
         except Exception as e:
             logger.error(f"Error getting Redis info: {e}")
             return {}
-    
+
+    async def get_connection_stats(self) -> Dict[str, Any]:
+        """Get connection pool statistics"""
+        stats = {
+            "available": self._initialized,
+            "max_connections": self.max_connections,
+            "hiredis": self.use_hiredis,
+            "reconnects": self._reconnects,
+            "reconnecting": bool(self._reconnect_task and not self._reconnect_task.done()),
+            "last_error": self._last_error
+        }
+        pool = self.connection_pool
+        if pool is not None:
+            stats.update({
+                "created_connections": getattr(pool, '_created_connections', 0),
+                "available_connections": len(getattr(pool, '_available_connections', [])),
+                "in_use_connections": len(getattr(pool, '_in_use_connections', {}))
+            })
+        return stats
+
     async def flush_db(self, confirm: bool = False) -> bool:
         """Flush all keys from current database (use with caution)"""
         if not confirm:
             logger.warning("flush_db called without confirmation - ignoring")
             return False
-            
-        if not self._initialized and not self._initializing:
-            await self.initialize()
-            
+        if not self._initialized:
+            return False
+
         try:
             await self.redis_client.flushdb()
             logger.warning("🗑️ Redis database flushed")
@@ -432,45 +826,92 @@ class RedisService(CacheStrategy):
 class RedisSessionService:
     """Redis operations specifically for session management"""
     
+    # Session state lives in a hash so each message touches only the fields it
+    # changes. Updates run as one script: nothing is written unless the session
+    # is already cached (a partial record would report wrong counts), the
+    # counter is incremented server-side, and the TTL is refreshed.
+    # ARGV: ttl, counter field ('' for none), increment, then field/value pairs
+    UPDATE_SESSION_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return false
+end
+local count = 0
+if ARGV[2] ~= '' then
+    count = redis.call('HINCRBY', KEYS[1], ARGV[2], ARGV[3])
+end
+if #ARGV > 3 then
+    redis.call('HSET', KEYS[1], unpack(ARGV, 4))
+end
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+return count
+"""
+    
     def __init__(self, redis_service: RedisService):
         self.redis = redis_service
-        self.session_prefix = "session"
+        self.session_prefix = "session_state"
         self.user_sessions_prefix = "user_sessions"
         self.session_ttl = 7200  # 2 hours
     
+    def _session_key(self, session_id: str) -> str:
+        return f"{self.session_prefix}:{session_id}"
+    
     async def store_session(self, session_id: str, session_data: Dict[str, Any]) -> bool:
         """Store complete session data"""
-        key = f"{self.session_prefix}:{session_id}"
-        return await self.redis.set(key, session_data, ttl=self.session_ttl)
+        return await self.redis.set_hash(self._session_key(session_id), session_data, ttl=self.session_ttl)
     
-    async def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
-        """Retrieve complete session data"""
-        key = f"{self.session_prefix}:{session_id}"
-        return await self.redis.get(key)
+    async def get_session(self, session_id: str, fields: Optional[Sequence[str]] = None) -> Optional[Dict[str, Any]]:
+        """Retrieve session data, or only the given fields"""
+        return await self.redis.get_hash(self._session_key(session_id), fields)
     
     async def update_session(self, session_id: str, updates: Dict[str, Any]) -> bool:
-        """Update specific session fields"""
-        key = f"{self.session_prefix}:{session_id}"
-        
-        # Get current session data
-        current_data = await self.redis.get(key)
-        if current_data is None:
-            return False
-        
-        # Merge updates
-        current_data.update(updates)
+        """Update specific session fields; False if the session is not cached"""
+        result = await self._run_update(session_id, updates)
+        return result is not None
+    
+    async def record_message(self, session_id: str, role: str, timestamp: datetime) -> Optional[int]:
+        """
+        Count a new message and stamp the session's activity in one atomic call
         
-        # Store updated data
-        return await self.redis.set(key, current_data, ttl=self.session_ttl)
+        Returns the cached message count, or None if the session is not cached.
+        """
+        now = datetime.utcnow().isoformat()
+        return await self._run_update(
+            session_id,
+            {
+                'last_activity': now,
+                'last_message_role': role,
+                'last_message_timestamp': timestamp.isoformat() if timestamp else now
+            },
+            counter='message_count'
+        )
+    
+    async def delete_session(self, session_id: str) -> bool:
+        """Remove session state from the cache"""
+        return await self.redis.delete(self._session_key(session_id))
+    
+    async def _run_update(
+        self,
+        session_id: str,
+        updates: Dict[str, Any],
+        counter: Optional[str] = None,
+        increment: int = 1
+    ) -> Optional[int]:
+        args: List[Any] = [self.session_ttl, counter or '', increment]
+        for field, value in self.redis.encode_hash_fields(updates).items():
+            args.extend((field, value))
+        result = await self.redis.run_script(self.UPDATE_SESSION_SCRIPT, [self._session_key(session_id)], args)
+        return int(result) if result is not None else None
     
     async def add_user_session(self, user_id: str, session_id: str) -> bool:
         """Track session for a user"""
         key = f"{self.user_sessions_prefix}:{user_id}"
         
-        # Add session to user's session set
+        # Add session to user's session set and refresh its TTL in one round trip
         try:
-            await self.redis.redis_client.sadd(key, session_id)
-            await self.redis.expire(key, self.session_ttl)
+            async with self.redis.pipeline("add_user_session") as pipeline:
+                pipeline.sadd(key, session_id)
+                pipeline.expire(key, self.session_ttl)
+                await pipeline.execute()
             return True
         except Exception as e:
             logger.error(f"Error adding user session: {e}")
@@ -496,16 +937,21 @@ class RedisSessionService:
             
             async for key in self.redis.redis_client.scan_iter(match=pattern):
                 # Get all session IDs for this user
-                session_ids = await self.redis.redis_client.smembers(key)
+                session_ids = list(await self.redis.redis_client.smembers(key))
+                if not session_ids:
+                    continue
+                
+                # Check which sessions still exist with one pipelined EXISTS per user
+                async with self.redis.pipeline("cleanup_sessions") as pipeline:
+                    for session_id in session_ids:
+                        pipeline.exists(self._session_key(session_id.decode('utf-8')))
+                    exists_flags = await pipeline.execute()
                 
-                for session_id in session_ids:
-                    session_key = f"{self.session_prefix}:{session_id.decode('utf-8')}"
-                    
-                    # Check if session still exists
-                    if not await self.redis.exists(session_key):
-                        # Remove expired session from user's set
-                        await self.redis.redis_client.srem(key, session_id)
-                        cleaned += 1
+                expired = [sid for sid, exists in zip(session_ids, exists_flags) if not exists]
+                if expired:
+                    # Remove expired sessions from user's set
+                    await self.redis.redis_client.srem(key, *expired)
+                    cleaned += len(expired)
             
             logger.info(f"Cleaned up {cleaned} expired session references")
             return cleaned
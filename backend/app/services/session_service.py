@@ -9,6 +9,7 @@ from app.models.session import SessionCreate, SessionUpdate, Session, MessageCre
 from app.models.enhanced_models import ChatSession, ChatMessage
 from app.core.database import database
 from app.repositories.session_repository import SessionRepository
+from app.services.conversation_tagging_service import conversation_tagging_service
 from sqlalchemy import select
 import logging
 import uuid
@@ -159,7 +160,7 @@ class SessionService:
                 session_repo = SessionRepository(db)
                 
                 # Add message to database
-                db_message = await session_repo.add_message(
+                db_message, message_count = await session_repo.add_message_returning_count(
                     session_id=session_id,
                     content=message_data.content,
                     role=message_data.role.value,
@@ -169,6 +170,12 @@ class SessionService:
                 await db.commit()
                 await db.refresh(db_message)
                 
+                # Auto-tagging runs in the background, keyed off the new count
+                try:
+                    await conversation_tagging_service.on_message_added(session_id, message_count)
+                except Exception as e:
+                    logger.warning(f"Failed to schedule auto-tagging for session {session_id}: {e}")
+                
                 # Convert to Message model
                 return Message(
                     id=str(db_message.id),
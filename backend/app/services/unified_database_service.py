@@ -5,8 +5,9 @@ Replaces multiple database services with single, consistent interface
 """
 
 import logging
+import threading
 import uuid
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Coroutine, Optional, TypeVar, Union
 from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
 from contextlib import asynccontextmanager
@@ -15,12 +16,17 @@ from app.core.database import database
 from app.core.exceptions import DatabaseException, NotFoundException
 from app.core.service_interfaces import service_registry
 from app.core.cache_patterns import CacheKeyBuilder, CacheDomain, CacheTTL, CachePatterns
-from app.services.redis_service_simple import simple_redis_service
+from app.services.redis_service import redis_service, redis_session_service
+from app.services.insight_precompute_service import insight_precompute_service
+from app.services.partition_maintenance_service import partition_maintenance_service
+from app.services.entry_revision_service import entry_revision_service
 from app.repositories.base_cached_repository import RepositoryFactory
 from app.models.enhanced_models import Entry, ChatSession, ChatMessage, Topic, User
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 # Default user UUID for single-user mode
 DEFAULT_USER_UUID = uuid.UUID("00000000-0000-0000-0000-000000000001")
 
@@ -37,8 +43,8 @@ class UnifiedDatabaseService:
         """Increment a counter in Redis"""
         try:
             key = f"counter:{counter_name}"
-            current = await simple_redis_service.get(key) or "0"
-            await simple_redis_service.set(key, str(int(current) + 1))
+            current = await redis_service.get(key) or "0"
+            await redis_service.set(key, str(int(current) + 1))
         except Exception as e:
             logger.debug(f"Counter increment failed for {counter_name}: {e}")  # Non-critical, just debug
     
@@ -64,10 +70,13 @@ class UnifiedDatabaseService:
             # Initialize PostgreSQL database
             await database.initialize()
             
-            # Initialize enhanced Redis service (Phase 4: Direct integration)
-            await simple_redis_service.initialize()
-            service_registry.set_cache_strategy(simple_redis_service)
-            logger.info("✅ Unified Database Service initialized with Enhanced Redis caching")
+            # Initialize Redis; when unavailable it reconnects in the background
+            try:
+                await redis_service.initialize()
+            except Exception as e:
+                logger.warning(f"⚠️ Redis unavailable, caching disabled until it reconnects: {e}")
+            service_registry.set_cache_strategy(redis_service)
+            logger.info("✅ Unified Database Service initialized with Redis caching")
             
             self._initialized = True
             
@@ -78,6 +87,38 @@ class UnifiedDatabaseService:
                 context={"error": str(e)}
             )
     
+    async def close(self) -> None:
+        """Close database and Redis connections"""
+        await redis_service.close()
+        await database.close()
+        self._initialized = False
+    
+    async def run_in_task(self, work: Coroutine[Any, Any, T]) -> T:
+        """
+        Run a Celery task's work between initialize() and close()
+        
+        Each task call runs in its own asyncio.run() loop; pooled database and
+        Redis connections opened there must not outlive it, or the next call
+        picks up connections bound to a closed loop. The engine and Redis
+        client are process-wide, so tasks must not run concurrently in threads
+        of one process (use a prefork or solo pool).
+        """
+        if threading.current_thread() is not threading.main_thread():
+            work.close()
+            raise RuntimeError(
+                "Database tasks share the process-wide engine and Redis client; "
+                "run them on a prefork or solo worker pool, not in threads"
+            )
+        try:
+            await self.initialize()
+        except Exception:
+            work.close()
+            raise
+        try:
+            return await work
+        finally:
+            await self.close()
+    
     @asynccontextmanager
     async def get_session(self):
         """Get database session with automatic cleanup"""
@@ -97,9 +138,11 @@ class UnifiedDatabaseService:
         topic_id: Optional[str] = None,
         mood: Optional[str] = None,
         sentiment_score: Optional[float] = None,
-        tags: Optional[List[str]] = None
+        tags: Optional[List[str]] = None,
+        emotion_analysis: Optional[Dict[str, Any]] = None,
+        ai_analysis: Optional[Dict[str, Any]] = None
     ) -> Entry:
-        """Create entry with automatic caching and analytics"""
+        """Create entry with automatic caching and analytics (analysis is stored in the same INSERT)"""
         async with self.get_session() as session:
             try:
                 entry_repo = RepositoryFactory.create_entry_repository(session)
@@ -118,6 +161,10 @@ class UnifiedDatabaseService:
                     "word_count": len(content.split()),
                     "reading_time_minutes": max(1, len(content.split()) // 200)
                 }
+                if emotion_analysis is not None:
+                    entry_data["emotion_analysis"] = emotion_analysis
+                if ai_analysis is not None:
+                    entry_data["analysis_results"] = ai_analysis
                 
                 # Create entry with caching
                 entry = await entry_repo.create(entry_data, invalidate_cache=True)
@@ -129,7 +176,8 @@ class UnifiedDatabaseService:
                 
                 # Invalidate related analytics caches
                 try:
-                    await simple_redis_service.invalidate_pattern(f"analytics:*:{user_uuid}:*")
+                    await redis_service.invalidate_pattern(f"analytics:*:{user_uuid}:*")
+                    await insight_precompute_service.bump_content_version(str(user_uuid))
                 except Exception as e:
                     logger.debug(f"Cache invalidation failed: {e}")
                 
@@ -201,9 +249,16 @@ class UnifiedDatabaseService:
                 if title is not None:
                     update_data["title"] = title
                 if content is not None:
-                    update_data["content"] = content
-                    update_data["word_count"] = len(content.split())
-                    update_data["reading_time_minutes"] = max(1, len(content.split()) // 200)
+                    # Locked, so concurrent autosaves of the entry serialize;
+                    # the superseded text goes to the revision history
+                    current = await entry_revision_service.lock_entry(session, entry_id)
+                    if current is not None and current.content != content:
+                        update_data["version"] = await entry_revision_service.record_revision(
+                            session, current, content
+                        )
+                        update_data["content"] = content
+                        update_data["word_count"] = len(content.split())
+                        update_data["reading_time_minutes"] = max(1, len(content.split()) // 200)
                 if mood is not None:
                     update_data["mood"] = mood
                 if sentiment_score is not None:
@@ -221,7 +276,9 @@ class UnifiedDatabaseService:
                     
                     # Invalidate analytics caches
                     try:
-                        await simple_redis_service.invalidate_pattern(f"analytics:*:{entry.user_id}:*")
+                        await redis_service.invalidate_pattern(f"analytics:*:{entry.user_id}:*")
+                        if title is not None or "content" in update_data or mood is not None:
+                            await insight_precompute_service.bump_content_version(str(entry.user_id))
                     except Exception as e:
                         logger.debug(f"Cache invalidation failed: {e}")
                 
@@ -249,7 +306,8 @@ class UnifiedDatabaseService:
                     
                     # Invalidate analytics caches
                     try:
-                        await simple_redis_service.invalidate_pattern(f"analytics:*:{entry.user_id}:*")
+                        await redis_service.invalidate_pattern(f"analytics:*:{entry.user_id}:*")
+                        await insight_precompute_service.bump_content_version(str(entry.user_id))
                     except Exception as e:
                         logger.debug(f"Cache invalidation failed: {e}")
                 
@@ -285,22 +343,9 @@ class UnifiedDatabaseService:
                 )
                 await session.commit()
                 
-                # Cache session data in Redis
-                session_data = {
-                    "id": str(chat_session.id),
-                    "title": chat_session.title,
-                    "session_type": chat_session.session_type,
-                    "user_id": chat_session.user_id,
-                    "status": chat_session.status,
-                    "created_at": chat_session.created_at.isoformat(),
-                    "last_activity": chat_session.last_activity.isoformat() if chat_session.last_activity else None,
-                    "message_count": chat_session.message_count or 0
-                }
-                
-                # Store session data in Redis
+                # Session state was cached by the repository; track it for the user
                 try:
-                    await simple_redis_service.set(f"session:{chat_session.id}", session_data)
-                    await simple_redis_service.set(f"user_session:{user_id}:{chat_session.id}", str(chat_session.id))
+                    await redis_service.set(f"user_session:{user_id}:{chat_session.id}", str(chat_session.id))
                 except Exception as e:
                     logger.debug(f"Session caching failed: {e}")
                 
@@ -320,7 +365,7 @@ class UnifiedDatabaseService:
         """Get chat session with Redis caching"""
         # Try Redis cache first
         if use_cache:
-            cached_data = await simple_redis_service.get(f"session:{session_id}")
+            cached_data = await redis_session_service.get_session(session_id)
             if cached_data:
                 logger.debug(f"Session {session_id} retrieved from Redis cache")
                 # Convert cached data back to ChatSession object
@@ -338,13 +383,13 @@ class UnifiedDatabaseService:
                     "id": str(chat_session.id),
                     "title": chat_session.title,
                     "session_type": chat_session.session_type,
-                    "user_id": chat_session.user_id,
+                    "user_id": str(chat_session.user_id),
                     "status": chat_session.status,
                     "created_at": chat_session.created_at.isoformat(),
                     "last_activity": chat_session.last_activity.isoformat() if chat_session.last_activity else None,
                     "message_count": chat_session.message_count or 0
                 }
-                await simple_redis_service.set(f"session:{session_id}", session_data)
+                await redis_session_service.store_session(session_id, session_data)
             
             return chat_session
     
@@ -368,16 +413,7 @@ class UnifiedDatabaseService:
                 )
                 await session.commit()
                 
-                # Update session cache with new message count and activity
-                try:
-                    session_data = await simple_redis_service.get(f"session:{session_id}") or {}
-                    session_data.update({
-                        "last_activity": datetime.utcnow().isoformat(),
-                        "message_count": message.session.message_count
-                    })
-                    await simple_redis_service.set(f"session:{session_id}", session_data)
-                except Exception as e:
-                    logger.debug(f"Session cache update failed: {e}")
+                # The repository already counted the message in the cached session state
                 
                 # Update analytics counters
                 await self._increment_counter("daily_messages")
@@ -402,7 +438,7 @@ class UnifiedDatabaseService:
         # Check cache first using standardized pattern
         cache_key = CachePatterns.analytics_mood_trends(user_id, f"{days}d")
         if use_cache:
-            cached_stats = await simple_redis_service.get(cache_key)
+            cached_stats = await redis_service.get(cache_key)
             if cached_stats:
                 logger.debug(f"Mood statistics retrieved from cache for user {user_id}")
                 return cached_stats
@@ -415,7 +451,7 @@ class UnifiedDatabaseService:
                 
                 # Cache results using standardized TTL
                 if use_cache:
-                    await simple_redis_service.set(cache_key, stats, ttl=CacheTTL.SHORT)  # 5 minutes for fresher analytics
+                    await redis_service.set(cache_key, stats, ttl=CacheTTL.SHORT)  # 5 minutes for fresher analytics
                 
                 return stats
                 
@@ -434,7 +470,7 @@ class UnifiedDatabaseService:
         # Check cache first using standardized pattern
         cache_key = CachePatterns.analytics_writing_stats(user_id, days)
         if use_cache:
-            cached_stats = await simple_redis_service.get(cache_key)
+            cached_stats = await redis_service.get(cache_key)
             if cached_stats:
                 return cached_stats
         
@@ -448,7 +484,7 @@ class UnifiedDatabaseService:
                 
                 # Cache results using standardized TTL
                 if use_cache:
-                    await simple_redis_service.set(cache_key, stats, ttl=CacheTTL.SHORT)  # 5 minutes for fresher analytics
+                    await redis_service.set(cache_key, stats, ttl=CacheTTL.SHORT)  # 5 minutes for fresher analytics
                 
                 return stats
                 
@@ -488,7 +524,7 @@ class UnifiedDatabaseService:
                 
                 # Invalidate topics cache
                 try:
-                    await simple_redis_service.invalidate_pattern(f"topics:*:{user_id}:*")
+                    await redis_service.invalidate_pattern(f"topics:*:{user_id}:*")
                 except Exception as e:
                     logger.debug(f"Topic cache invalidation failed: {e}")
                 
@@ -513,7 +549,7 @@ class UnifiedDatabaseService:
         
         if use_cache:
             cache_key = CacheKeyBuilder.build_key(CacheDomain.CONTENT, "topics", {"user": str(user_uuid)})
-            cached_topics = await simple_redis_service.get(cache_key)
+            cached_topics = await redis_service.get(cache_key)
             if cached_topics:
                 return cached_topics
         
@@ -538,7 +574,7 @@ class UnifiedDatabaseService:
                 
                 # Cache the results using standardized TTL
                 if use_cache:
-                    await simple_redis_service.set(cache_key, topics, ttl=CacheTTL.HOURLY)
+                    await redis_service.set(cache_key, topics, ttl=CacheTTL.HOURLY)
                 
                 return topics
                 
@@ -550,7 +586,7 @@ class UnifiedDatabaseService:
         """Get topic by ID with caching"""
         if use_cache:
             cache_key = CacheKeyBuilder.build_key(CacheDomain.CONTENT, "topic", {"id": topic_id})
-            cached_topic = await simple_redis_service.get(cache_key)
+            cached_topic = await redis_service.get(cache_key)
             if cached_topic:
                 return cached_topic
         
@@ -565,7 +601,7 @@ class UnifiedDatabaseService:
                 
                 # Cache the result using standardized TTL
                 if topic and use_cache:
-                    await simple_redis_service.set(cache_key, topic, ttl=CacheTTL.HOURLY)
+                    await redis_service.set(cache_key, topic, ttl=CacheTTL.HOURLY)
                 
                 return topic
                 
@@ -600,8 +636,8 @@ class UnifiedDatabaseService:
                 await session.refresh(topic)
                 
                 # Invalidate caches
-                await simple_redis_service.invalidate_pattern(f"topic:{topic_id}")
-                await simple_redis_service.invalidate_pattern(f"topics:*:{topic.user_id}:*")
+                await redis_service.invalidate_pattern(f"topic:{topic_id}")
+                await redis_service.invalidate_pattern(f"topics:*:{topic.user_id}:*")
                 
                 return topic
                 
@@ -629,8 +665,8 @@ class UnifiedDatabaseService:
                 await session.commit()
                 
                 # Invalidate caches
-                await simple_redis_service.invalidate_pattern(f"topic:{topic_id}")
-                await simple_redis_service.invalidate_pattern(f"topics:*:{topic.user_id}:*")
+                await redis_service.invalidate_pattern(f"topic:{topic_id}")
+                await redis_service.invalidate_pattern(f"topics:*:{topic.user_id}:*")
                 
                 return True
                 
@@ -665,9 +701,9 @@ class UnifiedDatabaseService:
         
         # Redis health check with enhanced service
         try:
-            if hasattr(simple_redis_service, 'redis_client') and simple_redis_service.redis_client:
-                await simple_redis_service.redis_client.ping()
-                redis_info = await simple_redis_service.get_info()
+            if hasattr(redis_service, 'redis_client') and redis_service.redis_client:
+                await redis_service.redis_client.ping()
+                redis_info = await redis_service.get_info()
                 health_status["components"]["redis"] = {
                     "status": "healthy",
                     "details": {
@@ -692,7 +728,7 @@ class UnifiedDatabaseService:
         
         # Cache performance metrics - get Redis metrics
         try:
-            redis_metrics = await simple_redis_service.get_metrics()
+            redis_metrics = await redis_service.get_metrics()
             health_status["components"]["cache_performance"] = {
                 "hit_rate": redis_metrics.hit_rate,
                 "avg_response_time": redis_metrics.avg_response_time,
@@ -708,7 +744,9 @@ class UnifiedDatabaseService:
         """Clean up expired data and optimize performance"""
         cleanup_results = {
             "expired_sessions": 0,
-            "cache_keys_cleaned": 0
+            "cache_keys_cleaned": 0,
+            "partitions_created": 0,
+            "partitions_dropped": 0
         }
         
         try:
@@ -720,7 +758,13 @@ class UnifiedDatabaseService:
             except Exception as e:
                 logger.warning(f"Session cleanup failed: {e}")
             
-            # Additional cleanup operations can be added here
+            # Expired messages go a whole monthly partition at a time
+            try:
+                partitions = await partition_maintenance_service.run_maintenance()
+                cleanup_results["partitions_created"] = sum(len(table["created"]) for table in partitions.values())
+                cleanup_results["partitions_dropped"] = sum(len(table["dropped"]) for table in partitions.values())
+            except Exception as e:
+                logger.warning(f"Partition maintenance failed: {e}")
             
             logger.info(f"Cleanup completed: {cleanup_results}")
             return cleanup_results
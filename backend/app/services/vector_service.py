@@ -8,9 +8,12 @@ import torch
 from typing import List, Dict, Any, Optional
 import logging
 from app.core.config import settings
+from app.core.request_timing import SPAN_MODEL, SPAN_VECTOR, timing_span
 
 logger = logging.getLogger(__name__)
 
+EMBEDDING_SPAN = f"{SPAN_MODEL}.embeddings"
+
 class VectorService:
     def __init__(self):
         # Initialize ChromaDB but delay model loading
@@ -170,7 +173,8 @@ class VectorService:
             
             # Generate embedding with CUDA error handling
             try:
-                embedding = self.embedding_model.encode(processed_content).tolist()
+                with timing_span(EMBEDDING_SPAN):
+                    embedding = self.embedding_model.encode(processed_content).tolist()
             except RuntimeError as cuda_error:
                 if "CUDA" in str(cuda_error) or "device-side assert" in str(cuda_error):
                     logger.warning(f"CUDA error in embedding generation, falling back to CPU: {cuda_error}")
@@ -185,12 +189,13 @@ class VectorService:
             
             # Add to collection
             try:
-                self.collection.add(
-                    ids=[entry_id],
-                    embeddings=[embedding],
-                    documents=[content],
-                    metadatas=[clean_metadata]
-                )
+                with timing_span(SPAN_VECTOR):
+                    self.collection.add(
+                        ids=[entry_id],
+                        embeddings=[embedding],
+                        documents=[content],
+                        metadatas=[clean_metadata]
+                    )
                 logger.info(f"Added entry {entry_id} to vector database")
             except Exception as dimension_error:
                 if "dimension" in str(dimension_error):
@@ -226,17 +231,19 @@ class VectorService:
             # Ensure embedding model is loaded
             await self._ensure_model_loaded()
             
-            embedding = self.embedding_model.encode(content).tolist()
+            with timing_span(EMBEDDING_SPAN):
+                embedding = self.embedding_model.encode(content).tolist()
             
             # Prepare metadata for ChromaDB
             clean_metadata = self._prepare_metadata(metadata)
             
-            self.collection.update(
-                ids=[entry_id],
-                embeddings=[embedding],
-                documents=[content],
-                metadatas=[clean_metadata]
-            )
+            with timing_span(SPAN_VECTOR):
+                self.collection.update(
+                    ids=[entry_id],
+                    embeddings=[embedding],
+                    documents=[content],
+                    metadatas=[clean_metadata]
+                )
             logger.info(f"Updated entry {entry_id} in vector database")
         except Exception as e:
             logger.error(f"Error updating entry in vector database: {e}")
@@ -245,31 +252,35 @@ class VectorService:
     async def delete_entry(self, entry_id: str):
         """Delete an entry from the vector database"""
         try:
-            self.collection.delete(ids=[entry_id])
+            with timing_span(SPAN_VECTOR):
+                self.collection.delete(ids=[entry_id])
             logger.info(f"Deleted entry {entry_id} from vector database")
         except Exception as e:
             logger.error(f"Error deleting entry from vector database: {e}")
             raise
     
     async def search_entries(self, query: str, limit: int = 10, 
-                           filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-        """Search for similar entries"""
+                           filters: Optional[Dict[str, Any]] = None,
+                           raise_errors: bool = False) -> List[Dict[str, Any]]:
+        """Search for similar entries (errors return [] unless raise_errors)"""
         try:
             # Ensure embedding model is loaded
             await self._ensure_model_loaded()
             
-            query_embedding = self.embedding_model.encode(query).tolist()
+            with timing_span(EMBEDDING_SPAN):
+                query_embedding = self.embedding_model.encode(query).tolist()
             
             # Prepare filters for ChromaDB
             where_clause = None
             if filters:
                 where_clause = self._prepare_metadata(filters)
             
-            results = self.collection.query(
-                query_embeddings=[query_embedding],
-                n_results=limit,
-                where=where_clause
-            )
+            with timing_span(SPAN_VECTOR):
+                results = self.collection.query(
+                    query_embeddings=[query_embedding],
+                    n_results=limit,
+                    where=where_clause
+                )
             
             search_results = []
             for i in range(len(results['ids'][0])):
@@ -289,8 +300,29 @@ class VectorService:
             return search_results
         except Exception as e:
             logger.error(f"Error searching entries: {e}")
+            if raise_errors:
+                raise
             return []
     
+    def ids_missing_metadata(self, key: str) -> List[str]:
+        """Ids of stored entries whose metadata has no value for key"""
+        results = self.collection.get(include=["metadatas"])
+        return [
+            entry_id for entry_id, metadata in zip(results['ids'], results['metadatas'])
+            if not (metadata or {}).get(key)
+        ]
+    
+    def merge_metadata(self, metadata_by_id: Dict[str, Dict[str, Any]]) -> None:
+        """Add metadata keys to stored entries, keeping their embeddings and other keys"""
+        if not metadata_by_id:
+            return
+        entry_ids = list(metadata_by_id)
+        with timing_span(SPAN_VECTOR):
+            self.collection.update(
+                ids=entry_ids,
+                metadatas=[self._prepare_metadata(metadata_by_id[entry_id]) for entry_id in entry_ids]
+            )
+    
     async def get_all_entries(self) -> List[Dict[str, Any]]:
         """Get all entries from the vector database"""
         try:
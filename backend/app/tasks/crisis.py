@@ -11,16 +11,18 @@ import time
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 import json
-import re
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+
 # Celery and app imports
 from app.services.celery_service import celery_app, monitored_task, TaskPriority, TaskCategory
 from app.services.unified_database_service import unified_db_service
-from app.services.redis_service_simple import simple_redis_service as redis_service
 from app.core.config import settings
 from app.core.performance_monitor import performance_monitor
+from app.services.crisis_batch_scorer import CrisisBatchScorer
+from app.services.celery_bulk_dispatch import chunk_result
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +63,20 @@ CRISIS_PATTERNS = {
     ),
 }
 
+# Per-match contributions used by the lexical score
+KEYWORD_MATCH_SCORE = 0.2
+PATTERN_MATCH_SCORE = 0.4
+
+# Compiled once per worker process
+_crisis_scorer = CrisisBatchScorer({
+    name: {"keywords": indicators.keywords, "patterns": indicators.patterns}
+    for name, indicators in CRISIS_PATTERNS.items()
+})
+_severity_weights = np.array(
+    [CRISIS_PATTERNS[name].severity_weight for name in _crisis_scorer.indicator_names],
+    dtype=np.float64
+)
+
 # === CRISIS DETECTION TASKS ===
 
 @monitored_task(priority=TaskPriority.CRITICAL, category=TaskCategory.CRISIS_DETECTION)
@@ -94,56 +110,9 @@ def detect_crisis_patterns(self, user_id: str, content: str, entry_id: str = Non
             "analysis_time_ms": 0
         }
         
-        # Normalize content for analysis
-        content_lower = content.lower()
-        
-        # Analyze for each crisis pattern
-        total_score = 0.0
-        detected_patterns = []
-        
-        for pattern_name, indicators in CRISIS_PATTERNS.items():
-            pattern_score = 0.0
-            matches = []
-            
-            # Check keywords
-            for keyword in indicators.keywords:
-                if keyword in content_lower:
-                    matches.append(f"keyword: {keyword}")
-                    pattern_score += 0.2
-            
-            # Check regex patterns
-            for pattern in indicators.patterns:
-                regex_matches = re.findall(pattern, content_lower, re.IGNORECASE)
-                if regex_matches:
-                    matches.extend([f"pattern: {match}" for match in regex_matches])
-                    pattern_score += 0.4
-            
-            # Apply severity weight
-            if pattern_score > 0:
-                weighted_score = pattern_score * indicators.severity_weight
-                total_score += weighted_score
-                
-                detected_patterns.append({
-                    "category": pattern_name,
-                    "severity": indicators.category,
-                    "score": weighted_score,
-                    "matches": matches,
-                    "weight": indicators.severity_weight
-                })
-        
-        # Determine risk level based on total score
-        if total_score >= 1.0:
-            risk_level = CrisisLevel.CRITICAL
-            intervention_required = True
-        elif total_score >= 0.7:
-            risk_level = CrisisLevel.HIGH
-            intervention_required = True
-        elif total_score >= 0.4:
-            risk_level = CrisisLevel.MODERATE
-            intervention_required = False
-        else:
-            risk_level = CrisisLevel.LOW
-            intervention_required = False
+        # Score through the shared batch scorer so single and bulk runs agree
+        risk_level, total_score, detected_patterns = _score_crisis_batch([content])[0]
+        intervention_required = risk_level in (CrisisLevel.HIGH, CrisisLevel.CRITICAL)
         
         # Update assessment
         crisis_assessment.update({
@@ -292,8 +261,178 @@ def evaluate_intervention_triggers(self, user_id: str, risk_score: float, user_c
             "evaluation_time_ms": 0
         }
 
+@monitored_task(priority=TaskPriority.NORMAL, category=TaskCategory.CRISIS_DETECTION)
+def batch_detect_crisis_patterns(self, items: List[Dict[str, Any]], chunk_size: int = 500,
+                                 use_model: bool = False) -> Dict[str, Any]:
+    """
+    Re-screen many texts for crisis indicators in chunks
+    
+    Args:
+        items: Dicts with "content" and optional "user_id" / "entry_id"
+        chunk_size: Texts scored per vectorized pass
+        use_model: Also run the zero-shot model on lexical candidates
+    
+    Returns:
+        Summary with counts per risk level and assessments at MODERATE or above
+    """
+    start_time = time.time()
+    total = len(items)
+    chunk_size = max(1, chunk_size)
+    
+    summary = {
+        "total": total,
+        "processed": 0,
+        "risk_levels": {level.value: 0 for level in CrisisLevel},
+        "flagged": [],
+        "use_model": use_model,
+        "errors": 0
+    }
+    
+    logger.info(f"🚨 Batch crisis screening started - {total} texts, chunk size {chunk_size}")
+    
+    for offset in range(0, total, chunk_size):
+        chunk = items[offset:offset + chunk_size]
+        texts = [item.get("content") or "" for item in chunk]
+        
+        try:
+            if use_model:
+                chunk_results = asyncio.run(_model_assess_chunk(texts))
+            else:
+                chunk_results = [
+                    {"risk_level": level.value, "risk_score": round(score, 3), "detected_indicators": patterns}
+                    for level, score, patterns in _score_crisis_batch(texts)
+                ]
+        except Exception as e:
+            logger.error(f"❌ Batch crisis chunk at offset {offset} failed: {e}")
+            summary["errors"] += len(chunk)
+            chunk_results = []
+        
+        for item, result in zip(chunk, chunk_results):
+            summary["risk_levels"][result["risk_level"]] += 1
+            if result["risk_level"] != CrisisLevel.LOW.value:
+                summary["flagged"].append({
+                    "user_id": item.get("user_id"),
+                    "entry_id": item.get("entry_id"),
+                    **result
+                })
+        
+        summary["processed"] = min(offset + len(chunk), total)
+        if self.request.id:  # No task id when called directly
+            self.update_state(state="PROGRESS", meta={
+                "processed": summary["processed"],
+                "total": total,
+                "flagged": len(summary["flagged"])
+            })
+    
+    elapsed = time.time() - start_time
+    summary["duration_seconds"] = round(elapsed, 2)
+    summary["texts_per_second"] = round(total / elapsed, 1) if elapsed > 0 else None
+    
+    logger.info(f"✅ Batch crisis screening complete - {total} texts, "
+                f"{len(summary['flagged'])} flagged in {elapsed:.1f}s")
+    
+    return summary
+
+@monitored_task(priority=TaskPriority.NORMAL, category=TaskCategory.CRISIS_DETECTION)
+def rescreen_crisis_chunk(self, items: List[Dict[str, Any]], use_model: bool = False) -> Dict[str, Any]:
+    """
+    Chunk task for bulk crisis re-screening (see celery_bulk_dispatch)
+    
+    Args:
+        items: Dicts with "content" and optional "user_id" / "entry_id"
+        use_model: Assess with the zero-shot model instead of lexical scoring
+    
+    Returns:
+        One assessment per item, or a per-item error for the dispatcher to retry
+    """
+    texts = [(item or {}).get("content") or "" for item in items]
+    
+    try:
+        if use_model:
+            assessments = asyncio.run(_model_assess_chunk(texts))
+        else:
+            assessments = [
+                {"risk_level": level.value, "risk_score": round(score, 3), "detected_indicators": patterns}
+                for level, score, patterns in _score_crisis_batch(texts)
+            ]
+    except Exception as e:
+        logger.error(f"❌ Crisis re-screening chunk of {len(items)} failed: {e}")
+        return chunk_result([None] * len(items), {index: str(e) for index in range(len(items))})
+    
+    return chunk_result([
+        {"user_id": (item or {}).get("user_id"), "entry_id": (item or {}).get("entry_id"), **assessment}
+        for item, assessment in zip(items, assessments)
+    ])
+
 # === HELPER FUNCTIONS ===
 
+def _score_crisis_batch(texts: List[str]) -> List[Tuple[CrisisLevel, float, List[Dict]]]:
+    """Lexical crisis scoring for many texts with one matcher pass per text"""
+    hits = _crisis_scorer.score(texts)
+    
+    # Indicator x text scores, then severity weights as a matrix-vector product
+    indicator_scores = KEYWORD_MATCH_SCORE * hits.keyword_counts + PATTERN_MATCH_SCORE * hits.pattern_counts
+    totals = indicator_scores.T @ _severity_weights
+    
+    results = []
+    for col, text in enumerate(texts):
+        detected_patterns = []
+        for row in np.flatnonzero(indicator_scores[:, col]):
+            pattern_name = hits.indicator_names[row]
+            indicators = CRISIS_PATTERNS[pattern_name]
+            text_lower = (text or "").lower()
+            
+            matches = [f"keyword: {keyword}" for keyword in
+                       _crisis_scorer.indicator_keywords(pattern_name, hits.keyword_hits[col])]
+            for pattern_id in _crisis_scorer.indicator_patterns(pattern_name, hits.pattern_hits[col]):
+                matches.extend(f"pattern: {match}" for match in
+                               _crisis_scorer.patterns[pattern_id].findall(text_lower))
+            
+            detected_patterns.append({
+                "category": pattern_name,
+                "severity": indicators.category,
+                "score": float(indicator_scores[row, col] * indicators.severity_weight),
+                "matches": matches,
+                "weight": indicators.severity_weight
+            })
+        
+        results.append((_risk_level_for_score(float(totals[col])), float(totals[col]), detected_patterns))
+    
+    return results
+
+def _risk_level_for_score(total_score: float) -> CrisisLevel:
+    """Map a lexical crisis score onto a risk level"""
+    if total_score >= 1.0:
+        return CrisisLevel.CRITICAL
+    elif total_score >= 0.7:
+        return CrisisLevel.HIGH
+    elif total_score >= 0.4:
+        return CrisisLevel.MODERATE
+    return CrisisLevel.LOW
+
+async def _model_assess_chunk(texts: List[str]) -> List[Dict[str, Any]]:
+    """Model-backed assessment for a chunk via the intervention service batch API"""
+    # Imported lazily so lexical-only crisis workers never load model code
+    from app.services.ai_intervention_service import ai_intervention_service, CrisisLevel as AICrisisLevel
+    
+    assessments = await ai_intervention_service.assess_crisis_levels_batch(texts)
+    
+    # The intervention service has an extra NONE level; fold it into LOW
+    return [
+        {
+            "risk_level": (CrisisLevel.LOW if assessment.crisis_level == AICrisisLevel.NONE
+                           else CrisisLevel(assessment.crisis_level.value)).value,
+            "risk_score": round(max((f.severity for f in assessment.risk_factors), default=0.0), 3),
+            "detected_indicators": [
+                {"category": f.indicator, "score": f.severity, "confidence": f.confidence,
+                 "immediate_risk": f.immediate_risk}
+                for f in assessment.risk_factors
+            ]
+        }
+        for assessment in assessments
+    ]
+
+
 def _generate_crisis_recommendations(risk_level: CrisisLevel, detected_patterns: List[Dict]) -> List[str]:
     """Generate contextual recommendations based on crisis assessment"""
     
@@ -337,5 +476,7 @@ def _generate_crisis_recommendations(risk_level: CrisisLevel, detected_patterns:
 # Export tasks for Celery discovery
 __all__ = [
     'detect_crisis_patterns',
-    'evaluate_intervention_triggers'
+    'evaluate_intervention_triggers',
+    'batch_detect_crisis_patterns',
+    'rescreen_crisis_chunk'
 ]
\ No newline at end of file
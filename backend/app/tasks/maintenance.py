@@ -4,6 +4,7 @@ Enterprise Maintenance and System Health Tasks for Phase 0C
 Consolidated task coordinators that delegate to maintenance services
 """
 
+import asyncio
 import logging
 from typing import Dict, Any
 from datetime import datetime
@@ -13,6 +14,9 @@ from dataclasses import dataclass
 from celery import current_app as celery_app
 from app.core.service_interfaces import ServiceRegistry
 from app.services.celery_service import monitored_task, TaskPriority, TaskCategory
+from app.services.index_review_service import index_review_service
+from app.services.partition_maintenance_service import partition_maintenance_service
+from app.services.unified_database_service import unified_db_service
 
 logger = logging.getLogger(__name__)
 
@@ -275,6 +279,62 @@ def analytics_data_cleanup(self) -> Dict[str, Any]:
             "timestamp": datetime.utcnow().isoformat()
         }
 
+@monitored_task(priority=TaskPriority.LOW, category=TaskCategory.MAINTENANCE)
+def maintain_table_partitions(self) -> Dict[str, Any]:
+    """
+    Create upcoming monthly partitions and drop the ones past retention
+    
+    Retention works on whole partitions (detach + drop) instead of bulk
+    DELETEs; see partition_maintenance_service
+    """
+    try:
+        results = asyncio.run(unified_db_service.run_in_task(partition_maintenance_service.run_maintenance()))
+        
+        return {
+            "success": True,
+            "operation": "partition_maintenance",
+            "tables": results,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+        
+    except Exception as e:
+        logger.error(f"Partition maintenance failed: {str(e)}")
+        return {
+            "success": False,
+            "error": str(e),
+            "operation": "partition_maintenance",
+            "timestamp": datetime.utcnow().isoformat()
+        }
+
+@monitored_task(priority=TaskPriority.LOW, category=TaskCategory.MAINTENANCE)
+def flush_gin_pending_lists(self, table: str = "entries") -> Dict[str, Any]:
+    """
+    Merge GIN pending lists into their indexes between requests
+    
+    With fastupdate, entry saves only append to the pending list; flushing it
+    here keeps searches from scanning a long list and saves from paying for
+    the merge when the list fills up
+    """
+    try:
+        flushed = asyncio.run(unified_db_service.run_in_task(index_review_service.flush_gin_pending_lists(table)))
+        
+        return {
+            "success": True,
+            "operation": "gin_pending_list_flush",
+            "table": table,
+            "pages_flushed": flushed,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+        
+    except Exception as e:
+        logger.error(f"GIN pending list flush failed: {str(e)}")
+        return {
+            "success": False,
+            "error": str(e),
+            "operation": "gin_pending_list_flush",
+            "timestamp": datetime.utcnow().isoformat()
+        }
+
 # =============================================================================
 # TASK COORDINATION UTILITIES
 # =============================================================================
@@ -17,6 +17,8 @@ from app.services.psychology_knowledge_service import psychology_knowledge_servi
 from app.services.ai_emotion_service import ai_emotion_service
 from app.services.ai_intervention_service import ai_intervention_service
 from app.services.ai_prompt_service import ai_prompt_service
+from app.services.insight_precompute_service import insight_precompute_service
+from app.services.unified_database_service import unified_db_service
 from app.core.performance_monitor import performance_monitor
 
 logger = logging.getLogger(__name__)
@@ -249,6 +251,68 @@ def process_crisis_intervention_psychology(self, user_id: str, content: str, ris
             "timestamp": datetime.utcnow().isoformat()
         }
 
+@monitored_task(priority=TaskPriority.NORMAL, category=TaskCategory.PSYCHOLOGY_PROCESSING)
+def refresh_user_insight_snapshots(self, user_id: str, force: bool = False) -> Dict[str, Any]:
+    """
+    Task coordinator for refreshing a user's precomputed insight snapshots
+    Delegates to insight precompute service
+    
+    Args:
+        user_id: User identifier
+        force: Refresh even if the user's content version is unchanged
+    
+    Returns:
+        Refresh results with the snapshots that were materialized
+    """
+    try:
+        logger.info(f"🧠 Coordinating insight snapshot refresh for user {user_id}")
+        
+        refresh_result = asyncio.run(unified_db_service.run_in_task(
+            insight_precompute_service.refresh_user(user_id, force=force)
+        ))
+        refresh_result["task_id"] = self.request.id
+        
+        return refresh_result
+        
+    except Exception as e:
+        logger.error(f"❌ Insight snapshot refresh coordination failed: {e}")
+        return {
+            "error": str(e),
+            "user_id": user_id,
+            "task_id": self.request.id,
+            "status": "failed",
+            "timestamp": datetime.utcnow().isoformat()
+        }
+
+@monitored_task(priority=TaskPriority.NORMAL, category=TaskCategory.PSYCHOLOGY_PROCESSING)
+def schedule_insight_precompute(self) -> Dict[str, Any]:
+    """
+    Beat task: enqueue snapshot refreshes for users whose content changed
+    or whose activity-weighted refresh interval has elapsed
+    
+    Returns:
+        Scheduling summary
+    """
+    try:
+        schedule_result = asyncio.run(
+            unified_db_service.run_in_task(insight_precompute_service.schedule_refreshes())
+        )
+        
+        logger.info(
+            f"📅 Insight precompute scheduled: {schedule_result['dispatched']}/"
+            f"{schedule_result['due_users']} due users dispatched"
+        )
+        return schedule_result
+        
+    except Exception as e:
+        logger.error(f"❌ Insight precompute scheduling failed: {e}")
+        return {
+            "error": str(e),
+            "task_id": self.request.id,
+            "status": "failed",
+            "timestamp": datetime.utcnow().isoformat()
+        }
+
 # Export tasks for Celery discovery
 __all__ = [
     'process_psychology_content',
@@ -256,5 +320,7 @@ __all__ = [
     'analyze_user_psychology_profile',
     'generate_psychology_insights',
     'update_psychology_knowledge_base',
-    'process_crisis_intervention_psychology'
+    'process_crisis_intervention_psychology',
+    'refresh_user_insight_snapshots',
+    'schedule_insight_precompute'
 ]
@@ -0,0 +1,57 @@
+# backend/app/tasks/user.py
+"""
+User-Facing Background Task Coordinators
+Work triggered by user actions that should not hold up the response
+Follows enterprise architecture: Tasks coordinate, Services contain business logic
+"""
+
+import logging
+import asyncio
+from typing import Dict, Any
+from datetime import datetime
+
+# Celery and app imports
+from app.services.celery_service import monitored_task, TaskPriority, TaskCategory
+from app.services.conversation_tagging_service import conversation_tagging_service
+from app.services.unified_database_service import unified_db_service
+
+logger = logging.getLogger(__name__)
+
+# === CONVERSATION TASK COORDINATORS ===
+
+@monitored_task(priority=TaskPriority.LOW, category=TaskCategory.USER_OPERATIONS)
+def tag_conversation(self, session_id: str) -> Dict[str, Any]:
+    """
+    Task coordinator for incremental conversation auto-tagging
+    Delegates to conversation tagging service
+    
+    Args:
+        session_id: Chat session to tag
+    
+    Returns:
+        Tagging results with the tags that were added
+    """
+    try:
+        logger.info(f"🏷️ Coordinating auto-tagging for session {session_id}")
+        
+        tagging_result = asyncio.run(unified_db_service.run_in_task(
+            conversation_tagging_service.tag_new_messages(session_id)
+        ))
+        tagging_result["task_id"] = self.request.id
+        
+        return tagging_result
+        
+    except Exception as e:
+        logger.error(f"❌ Conversation auto-tagging coordination failed: {e}")
+        return {
+            "error": str(e),
+            "session_id": session_id,
+            "task_id": self.request.id,
+            "status": "failed",
+            "timestamp": datetime.utcnow().isoformat()
+        }
+
+# Export tasks for Celery discovery
+__all__ = [
+    'tag_conversation'
+]
@@ -0,0 +1,34 @@
+# backend/benchmarks/__init__.py
+"""
+Benchmark suite for the Journaling AI backend
+
+Runs the FastAPI application in-process against a deterministic synthetic
+corpus with fake AI backends. See scripts/benchmark_suite.py for the CLI;
+scripts/revision_benchmark.py replays an autosave workload against the
+entry revision store.
+"""
+
+from .corpus import CorpusConfig, CorpusManifest, SyntheticCorpus, seed_corpus
+from .fakes import FakeAIBackends, FakeLatency
+from .harness import BenchmarkHarness, HarnessConfig, compare_reports, summarize_latencies
+from .revisions import EditWorkload, EditWorkloadConfig, RevisionBenchmark, RevisionBenchmarkConfig
+from .scenarios import DEFAULT_SCENARIOS, EndpointScenario
+
+__all__ = [
+    'CorpusConfig',
+    'CorpusManifest',
+    'SyntheticCorpus',
+    'seed_corpus',
+    'FakeAIBackends',
+    'FakeLatency',
+    'BenchmarkHarness',
+    'HarnessConfig',
+    'compare_reports',
+    'summarize_latencies',
+    'EditWorkload',
+    'EditWorkloadConfig',
+    'RevisionBenchmark',
+    'RevisionBenchmarkConfig',
+    'DEFAULT_SCENARIOS',
+    'EndpointScenario'
+]
@@ -0,0 +1,316 @@
+# backend/benchmarks/corpus.py
+"""
+Deterministic synthetic corpora for the benchmark harness
+
+Generates users, journal entries, chat sessions and messages from a seed, so
+two runs at the same scale and seed produce identical rows (ids included) and
+benchmark numbers stay comparable across commits. Rows are generated lazily
+and inserted in batches with Core inserts, which keeps 1M-entry corpora within
+memory.
+"""
+
+import logging
+import random
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List
+
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.models.enhanced_models import ChatMessage, ChatSession, Entry, ENTRY_SEARCH_VECTOR_SQL, User
+
+logger = logging.getLogger(__name__)
+
+# The sessions API still reads the single default user; make it the first corpus user
+DEFAULT_USER_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+
+MOODS = ["very_positive", "positive", "neutral", "negative", "very_negative"]
+SESSION_TYPES = ["reflection_buddy", "inner_voice", "growth_challenge", "pattern_detective", "free_chat"]
+
+_SUBJECTS = ["work", "my sister", "the project", "sleep", "running", "my manager", "the move",
+             "therapy", "money", "my friends", "the deadline", "cooking", "the weekend", "my health"]
+_FEELINGS = ["anxious", "grateful", "tired", "hopeful", "frustrated", "calm", "overwhelmed",
+             "proud", "lonely", "excited", "restless", "content"]
+_SENTENCES = [
+    "Today I kept thinking about {subject} and felt {feeling}.",
+    "I noticed I get {feeling} whenever {subject} comes up.",
+    "Talking about {subject} left me {feeling} but clearer.",
+    "I want to handle {subject} differently next time.",
+    "Writing this down about {subject} helps me feel less {feeling}.",
+    "Small win: I made progress on {subject}.",
+    "I am {feeling} about {subject}, and that is okay.",
+]
+_TAGS = ["work", "family", "health", "sleep", "gratitude", "stress", "goals", "relationships", "habits"]
+
+
+@dataclass
+class CorpusConfig:
+    """
+    Size and shape of a synthetic corpus
+
+    Entries and sessions are spread round-robin-with-noise across users, so the
+    first user (the API's default user) always has data.
+    """
+    users: int = 10
+    entries: int = 1000
+    sessions: int = 50
+    messages_per_session: int = 20
+    seed: int = 1234
+    batch_size: int = 5000
+    # Anchor for timestamps; entries spread over the preceding ``days`` days
+    anchor: datetime = field(default_factory=lambda: datetime.now(timezone.utc).replace(
+        hour=0, minute=0, second=0, microsecond=0))
+    days: int = 365
+
+    def __post_init__(self):
+        if self.users < 1:
+            raise ValueError("A corpus needs at least one user")
+
+
+@dataclass
+class CorpusManifest:
+    """Ids and sample values the endpoint scenarios draw from"""
+    config: CorpusConfig
+    user_ids: List[uuid.UUID]
+    sample_entry_ids: List[uuid.UUID]
+    session_ids: List[uuid.UUID]
+    queries: List[str]
+    seed_seconds: float = 0.0
+
+    @property
+    def primary_user_id(self) -> uuid.UUID:
+        return self.user_ids[0]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "users": self.config.users,
+            "entries": self.config.entries,
+            "sessions": self.config.sessions,
+            "messages_per_session": self.config.messages_per_session,
+            "seed": self.config.seed,
+            "seed_seconds": round(self.seed_seconds, 2)
+        }
+
+
+class SyntheticCorpus:
+    """Row generators for one CorpusConfig; every generator re-seeds, so order of use does not matter"""
+
+    def __init__(self, config: CorpusConfig):
+        self.config = config
+
+    def _rng(self, stream: str) -> random.Random:
+        return random.Random(f"{self.config.seed}:{stream}")
+
+    @staticmethod
+    def _uuid(rng: random.Random) -> uuid.UUID:
+        return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+    def user_ids(self) -> List[uuid.UUID]:
+        rng = self._rng("users")
+        return [DEFAULT_USER_ID] + [self._uuid(rng) for _ in range(self.config.users - 1)]
+
+    def _user_for(self, rng: random.Random, index: int, user_ids: List[uuid.UUID]) -> uuid.UUID:
+        # Mostly round-robin, with a skew towards the first users like real usage
+        if rng.random() < 0.2:
+            return user_ids[min(int(rng.expovariate(1.0)), len(user_ids) - 1)]
+        return user_ids[index % len(user_ids)]
+
+    def _timestamp(self, rng: random.Random) -> datetime:
+        return self.config.anchor - timedelta(seconds=rng.randrange(self.config.days * 86400))
+
+    @staticmethod
+    def paragraph(rng: random.Random, sentences: int) -> str:
+        return " ".join(
+            rng.choice(_SENTENCES).format(subject=rng.choice(_SUBJECTS), feeling=rng.choice(_FEELINGS))
+            for _ in range(sentences)
+        )
+
+    def users(self) -> Iterator[Dict[str, Any]]:
+        for index, user_id in enumerate(self.user_ids()):
+            yield {
+                "id": user_id,
+                "username": f"bench_user_{index:07d}",
+                "email": f"bench_user_{index:07d}@example.com",
+                "display_name": f"Bench User {index}",
+                "preferences": {},
+                "psychology_profile": {},
+                "created_at": self.config.anchor - timedelta(days=self.config.days),
+                "updated_at": self.config.anchor
+            }
+
+    def auth_users(self, password_hash: str) -> Iterator[Dict[str, Any]]:
+        """Login records sharing ids with users(); one precomputed hash keeps seeding fast"""
+        for user in self.users():
+            yield {
+                "id": user["id"],
+                "username": user["username"],
+                "email": user["email"],
+                "password_hash": password_hash,
+                "is_active": True,
+                "is_verified": True,
+                "is_superuser": False,
+                "failed_login_attempts": 0,
+                "display_name": user["display_name"],
+                "created_at": user["created_at"],
+                "updated_at": user["updated_at"]
+            }
+
+    def entries(self) -> Iterator[Dict[str, Any]]:
+        rng = self._rng("entries")
+        user_ids = self.user_ids()
+        for index in range(self.config.entries):
+            content = self.paragraph(rng, rng.randint(3, 12))
+            created_at = self._timestamp(rng)
+            word_count = len(content.split())
+            yield {
+                "id": self._uuid(rng),
+                "title": f"{rng.choice(_FEELINGS).capitalize()} about {rng.choice(_SUBJECTS)}",
+                "content": content,
+                "entry_type": "journal",
+                "user_id": self._user_for(rng, index, user_ids),
+                "word_count": word_count,
+                "reading_time_minutes": max(1, word_count // 200),
+                "mood": rng.choice(MOODS),
+                "sentiment_score": round(rng.uniform(-1, 1), 2),
+                "emotion_analysis": {},
+                "tags": rng.sample(_TAGS, rng.randint(0, 3)),
+                "auto_tags": [],
+                "psychology_tags": [],
+                "is_favorite": rng.random() < 0.05,
+                "is_private": True,
+                "version": 1,
+                "psychology_metadata": {},
+                "analysis_results": {},
+                "created_at": created_at,
+                "updated_at": created_at
+            }
+
+    def sessions(self) -> Iterator[Dict[str, Any]]:
+        rng = self._rng("sessions")
+        user_ids = self.user_ids()
+        for index in range(self.config.sessions):
+            created_at = self._timestamp(rng)
+            session_type = rng.choice(SESSION_TYPES)
+            yield {
+                "id": self._uuid(rng),
+                "title": f"{session_type.replace('_', ' ').title()} #{index}",
+                "session_type": session_type,
+                "personality_config": {},
+                "user_id": self._user_for(rng, index, user_ids),
+                "status": "active",
+                "last_activity": created_at + timedelta(minutes=self.config.messages_per_session),
+                "message_count": self.config.messages_per_session,
+                "psychology_insights": {},
+                "coaching_notes": {},
+                "progress_tracking": {},
+                "tags": [],
+                "auto_tags": [],
+                "session_metadata": {},
+                "created_at": created_at,
+                "updated_at": created_at
+            }
+
+    def messages(self, sessions: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        rng = self._rng("messages")
+        for session in sessions:
+            for position in range(self.config.messages_per_session):
+                content = self.paragraph(rng, rng.randint(1, 4))
+                timestamp = session["created_at"] + timedelta(minutes=position)
+                yield {
+                    "id": self._uuid(rng),
+                    "session_id": session["id"],
+                    "content": content,
+                    "role": "user" if position % 2 == 0 else "assistant",
+                    "timestamp": timestamp,
+                    "word_count": len(content.split()),
+                    "character_count": len(content),
+                    "emotion_analysis": {},
+                    "psychology_context": {},
+                    "coaching_insights": {},
+                    "message_metadata": {},
+                    "model_parameters": {},
+                    "created_at": timestamp,
+                    "updated_at": timestamp
+                }
+
+    def queries(self, count: int = 20) -> List[str]:
+        rng = self._rng("queries")
+        return [f"{rng.choice(_FEELINGS)} {rng.choice(_SUBJECTS)}" for _ in range(count)]
+
+
+async def _insert_batches(engine: AsyncEngine, table, rows: Iterator[Dict[str, Any]], batch_size: int) -> int:
+    total = 0
+    batch: List[Dict[str, Any]] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            async with engine.begin() as conn:
+                await conn.execute(insert(table), batch)
+            total += len(batch)
+            batch = []
+    if batch:
+        async with engine.begin() as conn:
+            await conn.execute(insert(table), batch)
+        total += len(batch)
+    return total
+
+
+async def seed_corpus(engine: AsyncEngine, config: CorpusConfig, password_hash: str,
+                      sample_size: int = 200) -> CorpusManifest:
+    """
+    Insert a synthetic corpus into an empty schema
+
+    Args:
+        engine: Target database (schema already created)
+        config: Corpus size and seed
+        password_hash: Hash stored for every auth user
+        sample_size: How many entry ids to keep for per-entry scenarios
+    """
+    from app.auth.models import AuthUser
+
+    corpus = SyntheticCorpus(config)
+    started = time.perf_counter()
+
+    await _insert_batches(engine, User.__table__, corpus.users(), config.batch_size)
+    await _insert_batches(engine, AuthUser.__table__, corpus.auth_users(password_hash), config.batch_size)
+
+    sample_entry_ids: List[uuid.UUID] = []
+
+    def tracked_entries() -> Iterator[Dict[str, Any]]:
+        for row in corpus.entries():
+            if row["user_id"] == DEFAULT_USER_ID and len(sample_entry_ids) < sample_size:
+                sample_entry_ids.append(row["id"])
+            yield row
+
+    entry_count = await _insert_batches(engine, Entry.__table__, tracked_entries(), config.batch_size)
+
+    sessions = list(corpus.sessions())
+    await _insert_batches(engine, ChatSession.__table__, iter(sessions), config.batch_size)
+    message_count = await _insert_batches(
+        engine, ChatMessage.__table__, corpus.messages(sessions), config.batch_size
+    )
+
+    if engine.dialect.name == "postgresql":
+        # Trigger-maintained in migrated schemas; fill it for create_all schemas too
+        async with engine.begin() as conn:
+            await conn.execute(text(
+                f"UPDATE entries SET search_vector = {ENTRY_SEARCH_VECTOR_SQL} WHERE search_vector IS NULL"
+            ))
+            await conn.execute(text("ANALYZE"))
+
+    manifest = CorpusManifest(
+        config=config,
+        user_ids=corpus.user_ids(),
+        sample_entry_ids=sample_entry_ids,
+        session_ids=[session["id"] for session in sessions if session["user_id"] == DEFAULT_USER_ID],
+        queries=corpus.queries(),
+        seed_seconds=time.perf_counter() - started
+    )
+    logger.info(
+        f"🌱 Seeded corpus: {config.users} users, {entry_count} entries, "
+        f"{len(sessions)} sessions, {message_count} messages in {manifest.seed_seconds:.1f}s"
+    )
+    return manifest
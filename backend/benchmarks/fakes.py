@@ -0,0 +1,262 @@
+# backend/benchmarks/fakes.py
+"""
+Fake AI backends for the benchmark harness
+
+Drop-in stand-ins for the models behind AIModelManager, the embedding models
+and the Ollama client used by EnhancedLLMService. Outputs are deterministic
+(derived from a hash of the input) and every call costs a configurable amount
+of wall time, so endpoint latency can be measured without GPUs, model
+downloads or a running Ollama.
+
+The fakes block the calling thread like the real models do: a slow fake model
+stalls the event loop exactly where a slow real one would.
+"""
+
+import hashlib
+import logging
+import math
+import random
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+EMOTION_LABELS = ["joy", "sadness", "anger", "fear", "surprise", "disgust", "neutral"]
+SENTIMENT_LABELS = ["negative", "neutral", "positive"]
+
+
+@dataclass
+class FakeLatency:
+    """
+    Wall time per fake model call, in milliseconds
+
+    ``jitter`` is a fraction of the base latency added from a seeded RNG, so
+    runs with the same seed see the same latency sequence.
+    """
+    embedding_ms: float = 5.0
+    classifier_ms: float = 15.0
+    zero_shot_ms: float = 40.0
+    generation_ms: float = 80.0
+    llm_ms: float = 250.0
+    jitter: float = 0.1
+    seed: int = 42
+
+    @classmethod
+    def zero(cls) -> "FakeLatency":
+        """No model latency: isolates framework, database and cache cost"""
+        return cls(embedding_ms=0, classifier_ms=0, zero_shot_ms=0, generation_ms=0, llm_ms=0, jitter=0)
+
+
+class _LatencySource:
+    """Seeded latency generator shared by the fakes of one backend set"""
+
+    def __init__(self, latency: FakeLatency):
+        self.latency = latency
+        self._rng = random.Random(latency.seed)
+        self.calls: Dict[str, int] = {}
+
+    def wait(self, kind: str) -> None:
+        self.calls[kind] = self.calls.get(kind, 0) + 1
+        base = getattr(self.latency, f"{kind}_ms")
+        if base <= 0:
+            return
+        time.sleep(base * (1 + self.latency.jitter * self._rng.random()) / 1000)
+
+
+def _digest(text: str) -> bytes:
+    return hashlib.sha256(text.encode("utf-8", "ignore")).digest()
+
+
+def _scores(text: str, labels: Sequence[str]) -> List[float]:
+    """Deterministic softmax-like distribution over labels"""
+    digest = _digest(text)
+    raw = [math.exp((digest[i % len(digest)] / 255.0) * 3) for i in range(len(labels))]
+    total = sum(raw)
+    return [value / total for value in raw]
+
+
+class FakeSentenceTransformer:
+    """
+    Stand-in for sentence_transformers.SentenceTransformer
+
+    Embeddings are feature-hashed token counts, L2-normalized, so texts sharing
+    words land near each other and vector search returns sensible neighbours.
+    """
+
+    def __init__(self, model_name_or_path: str = "fake-embeddings", *args,
+                 dimension: int = 384, latency: Optional[_LatencySource] = None, **kwargs):
+        self.model_name = str(model_name_or_path)
+        self.dimension = dimension
+        self._latency = latency
+
+    def encode(self, sentences: Union[str, Sequence[str]], *args, **kwargs) -> np.ndarray:
+        single = isinstance(sentences, str)
+        batch = [sentences] if single else list(sentences)
+        if self._latency:
+            self._latency.wait("embedding")
+        vectors = np.zeros((len(batch), self.dimension), dtype=np.float32)
+        for row, text in enumerate(batch):
+            for token in text.lower().split():
+                bucket = int.from_bytes(_digest(token)[:4], "little")
+                vectors[row, bucket % self.dimension] += 1.0 if bucket & 1 << 31 else -1.0
+            norm = np.linalg.norm(vectors[row])
+            if norm:
+                vectors[row] /= norm
+        return vectors[0] if single else vectors
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return self.dimension
+
+    def to(self, device: str) -> "FakeSentenceTransformer":
+        return self
+
+
+class FakeTextClassifier:
+    """Stand-in for a transformers text-classification pipeline with top_k=None"""
+
+    def __init__(self, labels: Sequence[str], latency: _LatencySource):
+        self.labels = list(labels)
+        self._latency = latency
+
+    def __call__(self, inputs: Union[str, Sequence[str]], **kwargs) -> List[List[Dict[str, Any]]]:
+        batch = [inputs] if isinstance(inputs, str) else list(inputs)
+        self._latency.wait("classifier")
+        return [
+            [{"label": label, "score": score} for label, score in zip(self.labels, _scores(text, self.labels))]
+            for text in batch
+        ]
+
+
+class FakeZeroShotClassifier:
+    """Stand-in for a transformers zero-shot-classification pipeline"""
+
+    def __init__(self, latency: _LatencySource):
+        self._latency = latency
+
+    def __call__(self, sequences: Union[str, Sequence[str]], candidate_labels: Sequence[str],
+                 **kwargs) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        batch = [sequences] if isinstance(sequences, str) else list(sequences)
+        self._latency.wait("zero_shot")
+        results = []
+        for text in batch:
+            # Benchmark text is never a crisis: keep every label well below detection thresholds
+            ranked = sorted(zip(candidate_labels, _scores(text, candidate_labels)), key=lambda item: -item[1])
+            results.append({
+                "sequence": text,
+                "labels": [label for label, _ in ranked],
+                "scores": [score * 0.3 for _, score in ranked]
+            })
+        return results[0] if isinstance(sequences, str) else results
+
+
+class FakeText2TextGenerator:
+    """Stand-in for a transformers text2text-generation pipeline"""
+
+    def __init__(self, latency: _LatencySource):
+        self._latency = latency
+
+    def __call__(self, prompt: str, **kwargs) -> List[Dict[str, str]]:
+        self._latency.wait("generation")
+        return [{"generated_text": _fake_reply(prompt, "What would help you take the next small step today?")}]
+
+
+class FakeOllamaClient:
+    """Stand-in for ollama.Client; only generate() is used by EnhancedLLMService"""
+
+    def __init__(self, latency: _LatencySource, model: str = "fake-llm"):
+        self._latency = latency
+        self.model = model
+
+    def generate(self, model: Optional[str] = None, prompt: str = "", stream: bool = False,
+                 **kwargs) -> Dict[str, Any]:
+        self._latency.wait("llm")
+        return {
+            "model": model or self.model,
+            "response": _fake_reply(prompt, "It sounds like this has been on your mind. "
+                                            "What feels most important about it right now?"),
+            "done": True
+        }
+
+
+def _fake_reply(prompt: str, closing: str) -> str:
+    digest = _digest(prompt).hex()[:8]
+    return f"Thank you for sharing that ({digest}). {closing}"
+
+
+class FakeModelLoader:
+    """Replaces AIModelManager._load_single_model, returning fakes by model type"""
+
+    def __init__(self, latency: _LatencySource):
+        self._latency = latency
+
+    async def __call__(self, model_key: str, config: Dict[str, Any], **kwargs) -> Any:
+        model_type = config.get("model_type")
+        if model_type == "text-classification":
+            labels = EMOTION_LABELS if config.get("task") == "emotion-analysis" else SENTIMENT_LABELS
+            return FakeTextClassifier(labels, self._latency)
+        if model_type == "zero-shot-classification":
+            return FakeZeroShotClassifier(self._latency)
+        if model_type == "text2text-generation":
+            return FakeText2TextGenerator(self._latency)
+        if model_type == "sentence-transformers":
+            return FakeSentenceTransformer(config.get("model_name", model_key), latency=self._latency)
+        return None
+
+
+class FakeAIBackends:
+    """
+    Installs fake models into the application's AI singletons
+
+    Usage:
+        backends = FakeAIBackends(FakeLatency(llm_ms=300))
+        backends.install_import_hooks()   # before importing app.main
+        from app.main import app
+        backends.attach()                 # after the services exist
+    """
+
+    def __init__(self, latency: Optional[FakeLatency] = None):
+        self.latency = latency or FakeLatency()
+        self._source = _LatencySource(self.latency)
+
+    @property
+    def calls(self) -> Dict[str, int]:
+        """Fake model calls by kind, for checking which endpoints touched which models"""
+        return dict(self._source.calls)
+
+    def embedding_model(self, *args, **kwargs) -> FakeSentenceTransformer:
+        return FakeSentenceTransformer(*args, latency=self._source, **kwargs)
+
+    def install_import_hooks(self) -> None:
+        """
+        Make module-level model construction cheap
+
+        Some services build a SentenceTransformer when their module is
+        imported; replacing the class first keeps imports free of downloads.
+        """
+        import sentence_transformers
+
+        if "app.main" in sys.modules:
+            logger.warning("⚠️ Fake AI import hooks installed after app.main was imported")
+        sentence_transformers.SentenceTransformer = self.embedding_model
+
+    def attach(self) -> None:
+        """Swap the model-backed parts of the live service singletons for fakes"""
+        from app.services.ai_model_manager import ai_model_manager
+        from app.services.llm_service import llm_service
+        from app.services.psychology_knowledge_service import psychology_knowledge_service
+        from app.services.vector_service import vector_service
+
+        ai_model_manager._load_single_model = FakeModelLoader(self._source)
+        ai_model_manager.loaded_models.clear()
+
+        llm_service.client = FakeOllamaClient(self._source, model=llm_service.model)
+
+        vector_service.embedding_model = self.embedding_model("fake-embeddings")
+        vector_service.model_loaded = True
+        psychology_knowledge_service.embedding_model = self.embedding_model("fake-embeddings")
+
+        logger.info(f"🧪 Fake AI backends attached: {self.latency}")
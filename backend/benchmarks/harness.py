@@ -0,0 +1,475 @@
+# backend/benchmarks/harness.py
+"""
+In-process ASGI benchmark harness
+
+Drives the real FastAPI application through httpx.ASGITransport: no server,
+no network, no model downloads. The database is a local PostgreSQL or a
+temporary SQLite stand-in seeded with a deterministic synthetic corpus, and
+the AI backends are fakes with configurable latency (see benchmarks.fakes).
+
+Per endpoint the report has latency percentiles, throughput at a fixed
+concurrency, status codes and tracemalloc allocations per request. Reports
+are plain JSON so runs on two commits can be diffed with compare_reports().
+"""
+
+import asyncio
+import importlib
+import logging
+import math
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+import tracemalloc
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from benchmarks.corpus import CorpusConfig, CorpusManifest, seed_corpus
+from benchmarks.fakes import FakeAIBackends, FakeLatency
+from benchmarks.scenarios import EndpointScenario, select_scenarios
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_PASSWORD = "benchmark-password"
+# Percentiles reported for every scenario
+PERCENTILES = (50, 95, 99)
+
+
+@dataclass
+class HarnessConfig:
+    """
+    Args:
+        database_url: Async SQLAlchemy URL; None uses a temporary SQLite file.
+            PostgreSQL runs every scenario, SQLite skips postgres_only ones
+        reset_database: Drop and recreate the schema of a non-empty database
+        redis_url: Redis for caches and the rate limiter; None runs without Redis
+        requests: Measured requests per scenario
+        concurrency: In-flight requests during the measured pass (write
+            scenarios run one at a time on SQLite)
+        warmup: Unmeasured requests per scenario before measuring
+        allocation_samples: Sequential requests traced with tracemalloc (0 disables)
+        keep_rate_limits: Leave API rate limiting on (off by default: the
+            benchmark user would be throttled)
+        log_level: Applied after the app configures logging; request logging
+            at DEBUG/INFO is part of what gets measured
+    """
+    corpus: CorpusConfig = field(default_factory=CorpusConfig)
+    latency: FakeLatency = field(default_factory=FakeLatency)
+    database_url: Optional[str] = None
+    reset_database: bool = False
+    redis_url: Optional[str] = None
+    requests: int = 200
+    concurrency: int = 10
+    warmup: int = 10
+    allocation_samples: int = 50
+    scenarios: Optional[List[str]] = None
+    keep_rate_limits: bool = False
+    log_level: str = "WARNING"
+
+
+def percentile(ordered: List[float], p: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not ordered:
+        return 0.0
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+def summarize_latencies(samples_ms: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples_ms)
+    summary = {f"p{p}": round(percentile(ordered, p), 3) for p in PERCENTILES}
+    summary["mean"] = round(statistics.mean(ordered), 3) if ordered else 0.0
+    summary["max"] = round(ordered[-1], 3) if ordered else 0.0
+    return summary
+
+
+def _register_sqlite_types() -> None:
+    """
+    Make the PostgreSQL schema usable on the SQLite stand-in
+
+    JSONB/TSVECTOR columns and now() get SQLite spellings. UUID columns are
+    declared CHAR(32) (a bare UUID type has numeric affinity in SQLite, which
+    turns all-digit hex ids into integers) and accept string ids the way
+    asyncpg does, since the repositories pass both.
+    """
+    from sqlalchemy import types as sqltypes
+    from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+    from sqlalchemy.dialects.sqlite.aiosqlite import SQLiteDialect_aiosqlite
+    from sqlalchemy.ext.compiler import compiles
+    from sqlalchemy.sql import functions
+
+    class LenientUuid(sqltypes.Uuid):
+        def bind_processor(self, dialect):
+            process = super().bind_processor(dialect)
+
+            def coerce(value):
+                if isinstance(value, str):
+                    value = uuid.UUID(value)
+                return process(value) if process else value
+            return coerce
+
+    SQLiteDialect_aiosqlite.colspecs = {**SQLiteDialect_aiosqlite.colspecs, sqltypes.Uuid: LenientUuid}
+
+    @compiles(JSONB, "sqlite")
+    def _jsonb(type_, compiler, **kw):
+        return "JSON"
+
+    @compiles(TSVECTOR, "sqlite")
+    def _tsvector(type_, compiler, **kw):
+        return "TEXT"
+
+    @compiles(sqltypes.UUID, "sqlite")
+    @compiles(sqltypes.Uuid, "sqlite")
+    def _uuid(type_, compiler, **kw):
+        return "CHAR(32)"
+
+    @compiles(functions.now, "sqlite")
+    def _now(element, compiler, **kw):
+        return "CURRENT_TIMESTAMP"
+
+
+def _git_revision() -> Dict[str, Any]:
+    repo = os.path.dirname(os.path.abspath(__file__))
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                                cwd=repo, timeout=5).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                                    capture_output=True, text=True, cwd=repo, timeout=30).stdout.strip())
+        return {"commit": commit or None, "dirty": dirty}
+    except Exception:
+        return {"commit": None, "dirty": None}
+
+
+class BenchmarkHarness:
+    """
+    Sets up the application against a seeded database and fake AI backends,
+    then runs endpoint scenarios
+
+    Usage:
+        async with BenchmarkHarness(HarnessConfig(...)) as harness:
+            report = await harness.run()
+    """
+
+    def __init__(self, config: HarnessConfig):
+        self.config = config
+        self.backends = FakeAIBackends(config.latency)
+        self.app = None
+        self.engine = None
+        self.manifest: Optional[CorpusManifest] = None
+        self._access_token: Optional[str] = None
+        self._workdir: Optional[str] = None
+        self._previous_cwd: Optional[str] = None
+
+    @property
+    def dialect(self) -> str:
+        return self.engine.dialect.name if self.engine is not None else "unknown"
+
+    async def __aenter__(self) -> "BenchmarkHarness":
+        await self.setup()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def setup(self) -> None:
+        # Services persist vector stores relative to the working directory; keep them out of the tree
+        self._workdir = tempfile.mkdtemp(prefix="journaling-bench-")
+        self._previous_cwd = os.getcwd()
+        os.chdir(self._workdir)
+        os.environ.setdefault("CHROMA_PERSIST_DIRECTORY", os.path.join(self._workdir, "chroma_db"))
+
+        logging.disable(logging.getLevelName(self.config.log_level.upper()) - 1)
+        self.backends.install_import_hooks()
+        from app.main import app
+        self.app = app
+        self.backends.attach()
+
+        await self._setup_database()
+        await self._setup_redis()
+
+        if not self.config.keep_rate_limits:
+            from app.core.rate_limiter import rate_limiter
+            rate_limiter.policies.clear()
+
+        from app.auth.security import jwt_manager
+        self._access_token = jwt_manager.create_access_token({"sub": str(self.manifest.primary_user_id)})
+
+    async def _setup_database(self) -> None:
+        from sqlalchemy import event, func, select
+        from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+        from app.core.database import database
+        from app.core.password_hashing import pwd_context
+        from app.core.query_profiler import query_profiler
+        from app.core.request_timing import instrument_engine
+        from app.models.enhanced_models import Base, Entry
+        from app.services.unified_database_service import unified_db_service
+
+        # Importing the auth models registers their tables on Base.metadata for create_all.
+        importlib.import_module("app.auth.models")
+
+        url = self.config.database_url or f"sqlite+aiosqlite:///{os.path.join(self._workdir, 'bench.db')}"
+        if url.startswith("sqlite"):
+            _register_sqlite_types()
+            self.engine = create_async_engine(url, connect_args={"timeout": 60})
+
+            @event.listens_for(self.engine.sync_engine, "connect")
+            def _sqlite_pragmas(dbapi_connection, connection_record):
+                cursor = dbapi_connection.cursor()
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+                cursor.close()
+        else:
+            self.engine = create_async_engine(url, pool_size=20, max_overflow=10)
+
+        async with self.engine.begin() as conn:
+            if self.dialect == "postgresql":
+                from sqlalchemy import text
+                await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            if self.config.reset_database:
+                await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+            existing = (await conn.execute(select(func.count()).select_from(Entry))).scalar()
+        if existing:
+            raise RuntimeError(
+                f"Benchmark database already has {existing} entries; "
+                "pass reset_database (--reset-database) to recreate it"
+            )
+
+        # Point the application's database singleton at the benchmark engine
+        database.engine = self.engine
+        instrument_engine(self.engine.sync_engine)
+        query_profiler.instrument(self.engine.sync_engine)
+        database.session_factory = async_sessionmaker(
+            bind=self.engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
+        )
+        unified_db_service._initialized = True
+
+        self.manifest = await seed_corpus(
+            self.engine, self.config.corpus, password_hash=pwd_context.hash(BENCHMARK_PASSWORD)
+        )
+        query_profiler.reset()
+
+    async def _setup_redis(self) -> None:
+        if not self.config.redis_url:
+            return
+        from app.services.redis_service import redis_service
+        redis_service.redis_url = self.config.redis_url
+        await redis_service.initialize()
+        await redis_service.redis_client.flushdb()
+
+    async def close(self) -> None:
+        if self.config.redis_url:
+            from app.services.redis_service import redis_service
+            await redis_service.close()
+        if self.engine is not None:
+            await self.engine.dispose()
+        if self._previous_cwd:
+            os.chdir(self._previous_cwd)
+        if self._workdir:
+            shutil.rmtree(self._workdir, ignore_errors=True)
+
+    def _client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=self.app, client=("127.0.0.1", 50000)),
+            base_url="http://benchmark",
+            timeout=120.0
+        )
+
+    async def _request(self, client: httpx.AsyncClient, scenario: EndpointScenario,
+                       rng: random.Random) -> httpx.Response:
+        path, body = scenario.build(rng, self.manifest)
+        headers = {"Authorization": f"Bearer {self._access_token}"} if scenario.authenticated else {}
+        return await client.request(scenario.method, path, json=body, headers=headers)
+
+    async def run_scenario(self, scenario: EndpointScenario) -> Dict[str, Any]:
+        from app.core.query_profiler import query_profiler
+
+        seed = self.config.corpus.seed
+        calls_before = self.backends.calls
+        status_codes: Dict[str, int] = {}
+        latencies: List[float] = []
+        span_totals: Dict[str, float] = {}
+        # SQLite has a single writer: concurrent writes would measure lock waits, not the endpoint
+        concurrency = 1 if scenario.writes and self.dialect == "sqlite" else max(1, self.config.concurrency)
+
+        async with self._client() as client:
+            for i in range(self.config.warmup):
+                await self._request(client, scenario, random.Random(f"{seed}:{scenario.name}:warmup:{i}"))
+
+            next_index = 0
+
+            async def worker():
+                nonlocal next_index
+                while next_index < self.config.requests:
+                    index = next_index
+                    next_index += 1
+                    started = time.perf_counter()
+                    response = await self._request(client, scenario, random.Random(f"{seed}:{scenario.name}:{index}"))
+                    latencies.append((time.perf_counter() - started) * 1000)
+                    status_codes[str(response.status_code)] = status_codes.get(str(response.status_code), 0) + 1
+                    for span, duration in parse_server_timing(response.headers.get("server-timing", "")).items():
+                        span_totals[span] = span_totals.get(span, 0.0) + duration
+
+            started = time.perf_counter()
+            with query_profiler.query_budget() as queries:
+                await asyncio.gather(*(worker() for _ in range(concurrency)))
+            elapsed = time.perf_counter() - started
+
+            allocations = await self._measure_allocations(client, scenario)
+
+        calls_after = self.backends.calls
+        result = {
+            "method": scenario.method,
+            "requests": len(latencies),
+            "concurrency": concurrency,
+            "status_codes": status_codes,
+            "error_rate": round(
+                sum(n for code, n in status_codes.items() if int(code) >= 400) / max(1, len(latencies)), 4
+            ),
+            "latency_ms": summarize_latencies(latencies),
+            "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+            "queries_per_request": {
+                "mean": round(statistics.mean(q.total for q in queries.requests), 2) if queries.requests else 0.0,
+                "max": max((q.total for q in queries.requests), default=0)
+            },
+            # Mean server-side time per request by span (db, cache, model.<key>, llm, vector)
+            "server_timing_ms": {
+                span: round(total / max(1, len(latencies)), 3)
+                for span, total in sorted(span_totals.items(), key=lambda item: -item[1])
+            },
+            "fake_model_calls": {
+                kind: count - calls_before.get(kind, 0) for kind, count in calls_after.items()
+                if count - calls_before.get(kind, 0)
+            }
+        }
+        if allocations:
+            result["allocations"] = allocations
+        return result
+
+    async def _measure_allocations(self, client: httpx.AsyncClient,
+                                   scenario: EndpointScenario) -> Optional[Dict[str, float]]:
+        """
+        Python heap allocated per request, traced in a separate sequential pass
+        (tracemalloc slows everything down, so it never overlaps the timed pass)
+        """
+        samples = self.config.allocation_samples
+        if samples <= 0:
+            return None
+
+        peaks: List[float] = []
+        retained: List[float] = []
+        tracemalloc.start()
+        try:
+            for i in range(samples):
+                rng = random.Random(f"{self.config.corpus.seed}:{scenario.name}:alloc:{i}")
+                tracemalloc.reset_peak()
+                before, _ = tracemalloc.get_traced_memory()
+                await self._request(client, scenario, rng)
+                after, peak = tracemalloc.get_traced_memory()
+                peaks.append((peak - before) / 1024)
+                retained.append((after - before) / 1024)
+        finally:
+            tracemalloc.stop()
+
+        ordered = sorted(peaks)
+        return {
+            "samples": samples,
+            "peak_kib_mean": round(statistics.mean(peaks), 1),
+            "peak_kib_p95": round(percentile(ordered, 95), 1),
+            "retained_kib_mean": round(statistics.mean(retained), 1)
+        }
+
+    async def run(self) -> Dict[str, Any]:
+        """Run every selected scenario and return the JSON-serializable report"""
+        results: Dict[str, Any] = {}
+        skipped: Dict[str, str] = {}
+
+        for scenario in select_scenarios(self.config.scenarios):
+            if scenario.postgres_only and self.dialect != "postgresql":
+                skipped[scenario.name] = f"requires postgresql (running on {self.dialect})"
+                continue
+            logger.info(f"⏱️ Benchmarking {scenario.name}")
+            results[scenario.name] = await self.run_scenario(scenario)
+
+        return {
+            "meta": {
+                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "git": _git_revision(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "database": self.dialect,
+                "redis": bool(self.config.redis_url),
+                "rate_limits": self.config.keep_rate_limits
+            },
+            "corpus": self.manifest.to_dict(),
+            "fake_latency_ms": asdict(self.config.latency),
+            "scenarios": results,
+            "skipped": skipped
+        }
+
+
+def parse_server_timing(header: str) -> Dict[str, float]:
+    """Span durations from a Server-Timing header ("db;dur=1.2;desc=\"3x\", total;dur=9.8")"""
+    spans: Dict[str, float] = {}
+    for metric in filter(None, (part.strip() for part in header.split(","))):
+        name, *params = metric.split(";")
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip() == "dur":
+                try:
+                    spans[name.strip()] = float(value)
+                except ValueError:
+                    pass
+    return spans
+
+
+def compare_reports(baseline: Dict[str, Any], current: Dict[str, Any],
+                    threshold: float = 0.10) -> Dict[str, Any]:
+    """
+    Relative change per scenario between two reports
+
+    A scenario regresses when any latency percentile grows, or throughput
+    drops, by more than ``threshold`` (0.10 = 10%).
+    """
+    comparison: Dict[str, Any] = {}
+    regressions: List[str] = []
+
+    for name, now in current.get("scenarios", {}).items():
+        before = baseline.get("scenarios", {}).get(name)
+        if not before:
+            continue
+
+        changes = {}
+        for key in (f"p{p}" for p in PERCENTILES):
+            old, new = before["latency_ms"][key], now["latency_ms"][key]
+            changes[f"{key}_ms"] = {"baseline": old, "current": new, "change": round((new - old) / old, 4) if old else None}
+        old_rps, new_rps = before["throughput_rps"], now["throughput_rps"]
+        changes["throughput_rps"] = {
+            "baseline": old_rps, "current": new_rps,
+            "change": round((new_rps - old_rps) / old_rps, 4) if old_rps else None
+        }
+
+        regressed = any(
+            change["change"] is not None and change["change"] > threshold
+            for key, change in changes.items() if key.endswith("_ms")
+        ) or (changes["throughput_rps"]["change"] is not None and changes["throughput_rps"]["change"] < -threshold)
+        changes["regressed"] = regressed
+        if regressed:
+            regressions.append(name)
+        comparison[name] = changes
+
+    return {
+        "baseline": baseline.get("meta", {}).get("git", {}).get("commit"),
+        "current": current.get("meta", {}).get("git", {}).get("commit"),
+        "threshold": threshold,
+        "scenarios": comparison,
+        "regressions": regressions
+    }
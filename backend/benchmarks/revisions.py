@@ -0,0 +1,394 @@
+# backend/benchmarks/revisions.py
+"""
+Entry revision history benchmark
+
+Replays a deterministic synthetic editing workload (long entries written
+over several sessions, autosaved every few seconds, mostly typed at the end
+with occasional edits earlier in the text) under three save strategies:
+
+- overwrite: rewrite entries.content only, no history (the floor)
+- full_copy: overwrite plus a full copy of the text per save, the versioning
+  the entries.version / parent_entry_id columns were laid out for
+- delta: the save path of update_entry, with entry_revision_service keeping
+  coalesced, delta-encoded history
+
+Per strategy the report has history rows and bytes, save latency and, on
+PostgreSQL, the WAL generated (pg_current_wal_insert_lsn before and after)
+and the history table's on-disk size. For delta, every stored version is
+read back through get_version() and checked against the text it replaced.
+"""
+
+import logging
+import os
+import platform
+import random
+import shutil
+import tempfile
+import time
+import uuid
+import zlib
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, Text, func, insert, select, text, update
+
+from app.models.enhanced_models import Base, Entry, EntryRevision, User
+from benchmarks.corpus import DEFAULT_USER_ID, CorpusConfig, SyntheticCorpus
+from benchmarks.fakes import FakeAIBackends, FakeLatency
+from benchmarks.harness import _git_revision, _register_sqlite_types, summarize_latencies
+
+logger = logging.getLogger(__name__)
+
+STRATEGIES = ("overwrite", "full_copy", "delta")
+
+# Baseline history table: one full copy of the content per save
+FULL_COPY_TABLE = Table(
+    "bench_entry_full_copies",
+    MetaData(),
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("entry_id", String(36), nullable=False, index=True),
+    Column("content", Text, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False)
+)
+
+
+@dataclass
+class EditWorkloadConfig:
+    """
+    Shape of the synthetic editing workload
+
+    Each entry is written in sessions_per_entry sittings session_gap_hours
+    apart; a sitting autosaves saves_per_session times, autosave_seconds
+    apart. A save types words_per_save more words at the end, or with
+    probability mid_edit_ratio inserts, deletes or rewords a sentence
+    earlier in the text.
+    """
+    entries: int = 10
+    sessions_per_entry: int = 5
+    saves_per_session: int = 40
+    autosave_seconds: int = 10
+    session_gap_hours: float = 20.0
+    initial_sentences: int = 30
+    words_per_save: int = 6
+    mid_edit_ratio: float = 0.15
+    seed: int = 1234
+    anchor: datetime = field(default_factory=lambda: datetime(2025, 1, 6, 9, 0, tzinfo=timezone.utc))
+
+    @property
+    def saves_per_entry(self) -> int:
+        return self.sessions_per_entry * self.saves_per_session
+
+
+class EditWorkload:
+    """Save sequences for one EditWorkloadConfig; every entry re-seeds, so replays are identical"""
+
+    def __init__(self, config: EditWorkloadConfig):
+        self.config = config
+
+    def _rng(self, index: int) -> random.Random:
+        return random.Random(f"{self.config.seed}:revisions:{index}")
+
+    def initial_content(self, index: int) -> str:
+        return SyntheticCorpus.paragraph(self._rng(index), self.config.initial_sentences)
+
+    def created_at(self, index: int) -> datetime:
+        return self.config.anchor + timedelta(minutes=index)
+
+    def saves(self, index: int) -> Iterator[Tuple[datetime, str]]:
+        """(saved_at, content) for every autosave of one entry, oldest first"""
+        config = self.config
+        rng = self._rng(index)
+        content = SyntheticCorpus.paragraph(rng, config.initial_sentences)
+        typing: List[str] = []
+
+        for session in range(config.sessions_per_entry):
+            started = self.created_at(index) + timedelta(hours=config.session_gap_hours * session)
+            for save in range(config.saves_per_session):
+                if rng.random() < config.mid_edit_ratio:
+                    content = self._edit_earlier_text(rng, content)
+                else:
+                    if len(typing) < config.words_per_save:
+                        typing.extend(SyntheticCorpus.paragraph(rng, 1).split())
+                    words, typing = typing[:config.words_per_save], typing[config.words_per_save:]
+                    content = f"{content} {' '.join(words)}"
+                yield started + timedelta(seconds=config.autosave_seconds * (save + 1)), content
+
+    @staticmethod
+    def _edit_earlier_text(rng: random.Random, content: str) -> str:
+        sentences = content.split(". ")
+        position = rng.randrange(len(sentences))
+        action = rng.random()
+        if action < 0.4:
+            sentences.insert(position, SyntheticCorpus.paragraph(rng, 1).rstrip("."))
+        elif action < 0.6 and len(sentences) > 1:
+            del sentences[position]
+        else:
+            words = sentences[position].split(" ")
+            words[rng.randrange(len(words))] = rng.choice(["really", "honestly", "quietly", "again", "finally"])
+            sentences[position] = " ".join(words)
+        return ". ".join(sentences)
+
+
+@dataclass
+class RevisionBenchmarkConfig:
+    """
+    Args:
+        database_url: Async SQLAlchemy URL; None uses a temporary SQLite file
+            (no WAL or relation size figures there)
+        reset_database: Drop and recreate the schema of a non-empty database.
+            WAL is cluster-wide, so run on an otherwise idle server
+        coalesce_seconds / snapshot_interval: entry_revision_service settings
+        strategies: Subset of STRATEGIES to run
+    """
+    workload: EditWorkloadConfig = field(default_factory=EditWorkloadConfig)
+    database_url: Optional[str] = None
+    reset_database: bool = False
+    coalesce_seconds: int = 600
+    snapshot_interval: int = 20
+    strategies: Tuple[str, ...] = STRATEGIES
+
+
+class RevisionBenchmark:
+    """
+    Usage:
+        async with RevisionBenchmark(RevisionBenchmarkConfig(...)) as benchmark:
+            report = await benchmark.run()
+    """
+
+    def __init__(self, config: RevisionBenchmarkConfig):
+        self.config = config
+        self.workload = EditWorkload(config.workload)
+        self.engine = None
+        self.service = None
+        self._session_factory = None
+        self._workdir: Optional[str] = None
+
+    @property
+    def dialect(self) -> str:
+        return self.engine.dialect.name if self.engine is not None else "unknown"
+
+    async def __aenter__(self) -> "RevisionBenchmark":
+        await self.setup()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def setup(self) -> None:
+        from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+        # The services package builds embedding models on import
+        FakeAIBackends(FakeLatency.zero()).install_import_hooks()
+        from app.core.database import database
+        from app.services.entry_revision_service import EntryRevisionService
+
+        self._workdir = tempfile.mkdtemp(prefix="journaling-revisions-")
+        url = self.config.database_url or f"sqlite+aiosqlite:///{os.path.join(self._workdir, 'revisions.db')}"
+        if url.startswith("sqlite"):
+            _register_sqlite_types()
+            self.engine = create_async_engine(url, connect_args={"timeout": 60})
+        else:
+            self.engine = create_async_engine(url, pool_size=5, max_overflow=0)
+
+        async with self.engine.begin() as conn:
+            if self.dialect == "postgresql":
+                await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            if self.config.reset_database:
+                await conn.run_sync(FULL_COPY_TABLE.metadata.drop_all)
+                await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(FULL_COPY_TABLE.metadata.create_all)
+            existing = (await conn.execute(select(func.count()).select_from(Entry))).scalar()
+            if existing:
+                raise RuntimeError(
+                    f"Benchmark database already has {existing} entries; "
+                    "pass reset_database (--reset-database) to recreate it"
+                )
+            users = SyntheticCorpus(CorpusConfig(users=1, anchor=self.config.workload.anchor)).users()
+            await conn.execute(insert(User.__table__), list(users))
+
+        # get_version() reads through the application's database singleton
+        database.engine = self.engine
+        self._session_factory = async_sessionmaker(
+            bind=self.engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
+        )
+        database.session_factory = self._session_factory
+        self.service = EntryRevisionService(
+            coalesce_window=timedelta(seconds=self.config.coalesce_seconds),
+            snapshot_interval=self.config.snapshot_interval
+        )
+
+    async def close(self) -> None:
+        if self.engine is not None:
+            await self.engine.dispose()
+        if self._workdir:
+            shutil.rmtree(self._workdir, ignore_errors=True)
+
+    def _entry_id(self, strategy: str, index: int) -> uuid.UUID:
+        return uuid.uuid5(uuid.NAMESPACE_URL, f"revision-benchmark/{self.config.workload.seed}/{strategy}/{index}")
+
+    async def _insert_entries(self, strategy: str) -> None:
+        rows = []
+        for index in range(self.config.workload.entries):
+            content = self.workload.initial_content(index)
+            rows.append({
+                "id": self._entry_id(strategy, index),
+                "title": f"Revision benchmark {index}",
+                "content": content,
+                "user_id": DEFAULT_USER_ID,
+                "word_count": len(content.split()),
+                "version": 1,
+                "created_at": self.workload.created_at(index),
+                "updated_at": self.workload.created_at(index)
+            })
+        async with self.engine.begin() as conn:
+            await conn.execute(insert(Entry.__table__), rows)
+
+    async def _wal_position(self) -> Optional[str]:
+        if self.dialect != "postgresql":
+            return None
+        async with self.engine.connect() as conn:
+            return (await conn.execute(text("SELECT CAST(pg_current_wal_insert_lsn() AS text)"))).scalar()
+
+    async def _wal_bytes_since(self, start: Optional[str]) -> Optional[int]:
+        if start is None:
+            return None
+        async with self.engine.connect() as conn:
+            return int((await conn.execute(
+                text("SELECT pg_wal_lsn_diff(pg_current_wal_insert_lsn(), CAST(:start AS pg_lsn))"), {"start": start}
+            )).scalar())
+
+    async def _relation_bytes(self, table: str) -> Optional[int]:
+        if self.dialect != "postgresql":
+            return None
+        async with self.engine.connect() as conn:
+            return int((await conn.execute(text("SELECT pg_total_relation_size(CAST(:table AS regclass))"),
+                                           {"table": table})).scalar())
+
+    async def _save(self, strategy: str, entry_id: uuid.UUID, saved_at: datetime, content: str,
+                    superseded: Dict[Tuple[uuid.UUID, int], int]) -> int:
+        """One autosave; returns the history bytes it added"""
+        if strategy == "delta":
+            async with self._session_factory() as db:
+                entry = await self.service.lock_entry(db, entry_id)
+                if entry.content != content:
+                    version = await self.service.record_revision(db, entry, content, now=saved_at)
+                    if version != entry.version:
+                        superseded[(entry_id, entry.version)] = zlib.crc32(entry.content.encode("utf-8"))
+                    entry.version = version
+                    entry.content = content
+                await db.commit()
+            return 0
+
+        values = {"content": content, "word_count": len(content.split())}
+        async with self.engine.begin() as conn:
+            await conn.execute(update(Entry.__table__).where(Entry.__table__.c.id == entry_id).values(**values))
+            if strategy == "full_copy":
+                await conn.execute(insert(FULL_COPY_TABLE).values(
+                    entry_id=str(entry_id), content=content, created_at=saved_at
+                ))
+                return len(content.encode("utf-8"))
+        return 0
+
+    async def run_strategy(self, strategy: str) -> Dict[str, Any]:
+        await self._insert_entries(strategy)
+        superseded: Dict[Tuple[uuid.UUID, int], int] = {}
+        latencies: List[float] = []
+        history_bytes = 0
+
+        wal_start = await self._wal_position()
+        for index in range(self.config.workload.entries):
+            entry_id = self._entry_id(strategy, index)
+            for saved_at, content in self.workload.saves(index):
+                started = time.perf_counter()
+                history_bytes += await self._save(strategy, entry_id, saved_at, content, superseded)
+                latencies.append((time.perf_counter() - started) * 1000)
+        wal_bytes = await self._wal_bytes_since(wal_start)
+
+        result: Dict[str, Any] = {
+            "saves": len(latencies),
+            "save_latency_ms": summarize_latencies(latencies),
+            "wal_bytes": wal_bytes
+        }
+        if strategy == "overwrite":
+            result.update(history_rows=0, history_bytes=0, history_relation_bytes=None)
+        elif strategy == "full_copy":
+            result.update(
+                history_rows=len(latencies),
+                history_bytes=history_bytes,
+                history_relation_bytes=await self._relation_bytes(FULL_COPY_TABLE.name)
+            )
+        else:
+            async with self.engine.connect() as conn:
+                rows = (await conn.execute(
+                    select(EntryRevision.kind, func.count(), func.sum(func.length(EntryRevision.payload)))
+                    .group_by(EntryRevision.kind)
+                )).all()
+            by_kind = {kind: (count, int(size or 0)) for kind, count, size in rows}
+            result.update(
+                history_rows=sum(count for count, _ in by_kind.values()),
+                history_bytes=sum(size for _, size in by_kind.values()),
+                history_relation_bytes=await self._relation_bytes(EntryRevision.__tablename__),
+                snapshots=by_kind.get("snapshot", (0, 0))[0],
+                replay=await self._verify_replay(superseded)
+            )
+        return result
+
+    async def _verify_replay(self, superseded: Dict[Tuple[uuid.UUID, int], int]) -> Dict[str, Any]:
+        """Read back every stored version and compare it with the text it replaced"""
+        latencies: List[float] = []
+        mismatches = 0
+        for (entry_id, version), checksum in superseded.items():
+            started = time.perf_counter()
+            content = await self.service.get_version(str(entry_id), version)
+            latencies.append((time.perf_counter() - started) * 1000)
+            if content is None or zlib.crc32(content.encode("utf-8")) != checksum:
+                mismatches += 1
+        return {"versions": len(latencies), "mismatches": mismatches,
+                "latency_ms": summarize_latencies(latencies)}
+
+    async def run(self) -> Dict[str, Any]:
+        """Run every selected strategy and return the JSON-serializable report"""
+        results: Dict[str, Any] = {}
+        for strategy in self.config.strategies:
+            logger.info(f"⏱️ Replaying edit workload with {strategy} saves")
+            results[strategy] = await self.run_strategy(strategy)
+
+        workload = asdict(self.config.workload)
+        workload["anchor"] = self.config.workload.anchor.isoformat()
+        return {
+            "meta": {
+                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "git": _git_revision(),
+                "python": platform.python_version(),
+                "database": self.dialect
+            },
+            "workload": workload,
+            "revision_settings": {
+                "coalesce_seconds": self.config.coalesce_seconds,
+                "snapshot_interval": self.config.snapshot_interval
+            },
+            "strategies": results,
+            "savings": compare_strategies(results)
+        }
+
+
+def _ratio(part: Optional[int], whole: Optional[int]) -> Optional[float]:
+    return round(part / whole, 4) if part is not None and whole else None
+
+
+def compare_strategies(results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Delta history as a fraction of full-copy history, and WAL over the no-history floor"""
+    delta, full_copy, overwrite = results.get("delta"), results.get("full_copy"), results.get("overwrite")
+    if not delta or not full_copy:
+        return {}
+    savings = {
+        "history_bytes_ratio": _ratio(delta["history_bytes"], full_copy["history_bytes"]),
+        "history_relation_bytes_ratio": _ratio(delta["history_relation_bytes"], full_copy["history_relation_bytes"]),
+        "wal_bytes_ratio": _ratio(delta["wal_bytes"], full_copy["wal_bytes"])
+    }
+    if overwrite and overwrite["wal_bytes"] is not None:
+        floor = overwrite["wal_bytes"]
+        savings["history_wal_overhead_ratio"] = _ratio(delta["wal_bytes"] - floor, full_copy["wal_bytes"] - floor)
+    return savings
@@ -0,0 +1,130 @@
+# backend/benchmarks/scenarios.py
+"""
+Endpoint scenarios for the benchmark harness
+
+Each scenario is one endpoint with request parameters drawn from the corpus
+manifest by a per-request seeded RNG, so the same request sequence is replayed
+on every run. Read scenarios come first; scenarios that write run last so they
+do not change the data earlier scenarios read.
+"""
+
+import random
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from benchmarks.corpus import CorpusManifest
+
+RequestParts = Tuple[str, Optional[Dict[str, Any]]]
+
+
+@dataclass
+class EndpointScenario:
+    """
+    One benchmarked endpoint
+
+    Args:
+        name: Report key
+        method: HTTP method
+        build: (rng, manifest) -> (path with query string, JSON body or None)
+        authenticated: Send the primary user's bearer token
+        postgres_only: Needs PostgreSQL features (full-text search, pg_trgm,
+            array_agg);
+            skipped on the SQLite stand-in
+        writes: Mutates the corpus
+    """
+    name: str
+    method: str
+    build: Callable[[random.Random, CorpusManifest], RequestParts]
+    authenticated: bool = True
+    postgres_only: bool = False
+    writes: bool = False
+
+
+def _entry_id(rng: random.Random, manifest: CorpusManifest) -> str:
+    return str(rng.choice(manifest.sample_entry_ids))
+
+
+def _session_id(rng: random.Random, manifest: CorpusManifest) -> str:
+    return str(rng.choice(manifest.session_ids))
+
+
+def _query(rng: random.Random, manifest: CorpusManifest) -> str:
+    return rng.choice(manifest.queries)
+
+
+DEFAULT_SCENARIOS: List[EndpointScenario] = [
+    EndpointScenario(
+        "health", "GET",
+        lambda rng, m: ("/health", None),
+        authenticated=False
+    ),
+    EndpointScenario(
+        "entries_list", "GET",
+        lambda rng, m: (f"/api/v1/entries/?limit=20&skip={rng.randrange(0, 100)}", None)
+    ),
+    EndpointScenario(
+        "entry_detail", "GET",
+        lambda rng, m: (f"/api/v1/entries/{_entry_id(rng, m)}", None)
+    ),
+    EndpointScenario(
+        "entries_mood_analytics", "GET",
+        lambda rng, m: (f"/api/v1/entries/analytics/mood?days={rng.choice([7, 30, 90])}", None),
+        postgres_only=True
+    ),
+    EndpointScenario(
+        "entries_semantic_search", "GET",
+        lambda rng, m: (f"/api/v1/entries/search/semantic?query={_query(rng, m)}&limit=10", None)
+    ),
+    EndpointScenario(
+        "entries_hybrid_search", "GET",
+        lambda rng, m: (f"/api/v1/entries/search/hybrid?query={_query(rng, m)}&limit=20", None),
+        postgres_only=True
+    ),
+    EndpointScenario(
+        "sessions_list", "GET",
+        lambda rng, m: ("/api/v1/sessions/?limit=20", None)
+    ),
+    EndpointScenario(
+        "session_messages", "GET",
+        lambda rng, m: (f"/api/v1/sessions/{_session_id(rng, m)}/messages?limit=50", None)
+    ),
+    EndpointScenario(
+        "entry_create", "POST",
+        lambda rng, m: ("/api/v1/entries/", {
+            "title": f"Benchmark entry {rng.randrange(10**6)}",
+            "content": _query(rng, m) + ". " + " ".join(_query(rng, m) for _ in range(rng.randint(5, 30))),
+            "entry_type": "journal",
+            "tags": []
+        }),
+        writes=True
+    ),
+    EndpointScenario(
+        "session_send_message", "POST",
+        lambda rng, m: (f"/api/v1/sessions/{_session_id(rng, m)}/messages", {
+            "content": f"I have been feeling {_query(rng, m)} lately.",
+            "role": "user"
+        }),
+        writes=True
+    ),
+    EndpointScenario(
+        "chat_message", "POST",
+        lambda rng, m: ("/api/v1/chat/message", {
+            "user_id": str(m.primary_user_id),
+            "message": f"Can we talk about {_query(rng, m)}?"
+        }),
+        writes=True
+    ),
+]
+
+
+def select_scenarios(names: Optional[List[str]] = None,
+                     scenarios: Optional[List[EndpointScenario]] = None) -> List[EndpointScenario]:
+    """Scenarios in default order, optionally restricted to ``names``"""
+    scenarios = scenarios if scenarios is not None else DEFAULT_SCENARIOS
+    if not names:
+        return list(scenarios)
+    known = {scenario.name for scenario in scenarios}
+    unknown = set(names) - known
+    if unknown:
+        raise ValueError(f"Unknown scenarios: {sorted(unknown)} (available: {sorted(known)})")
+    return [scenario for scenario in scenarios if scenario.name in names]
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Resumable, throttled backfill of entries.search_vector
+
+Walks the entries table in primary-key order (keyset pagination), recomputing
+the weighted title > content vector one batch per transaction. The last id of
+every committed batch is written to a checkpoint file so an interrupted run
+picks up where it stopped. Run from the backend directory:
+
+    python scripts/backfill_search_vectors.py --batch-size 2000 --max-rows-per-second 5000
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+from typing import Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.core.database import database
+from app.repositories.enhanced_entry_repository import EnhancedEntryRepository
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT = os.path.join(os.path.dirname(__file__), '..', 'data', 'search_vector_backfill.json')
+
+
+def load_checkpoint(path: str) -> Optional[str]:
+    """Return the last committed entry id, if a previous run left one"""
+    try:
+        with open(path) as f:
+            return json.load(f).get("last_id")
+    except FileNotFoundError:
+        return None
+
+
+def save_checkpoint(path: str, last_id: Optional[str], total_updated: int) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"last_id": last_id, "total_updated": total_updated, "saved_at": time.time()}, f)
+
+
+async def backfill(batch_size: int, max_rows_per_second: float, checkpoint: str,
+                   restart: bool, only_missing: bool) -> int:
+    """Run the backfill until the table is exhausted; returns rows updated"""
+    await database.initialize()
+
+    after_id = None if restart else load_checkpoint(checkpoint)
+    if after_id:
+        logger.info(f"🔄 Resuming search vector backfill after {after_id}")
+
+    total_updated = 0
+    total_scanned = 0
+    started = time.time()
+
+    try:
+        while True:
+            batch_started = time.time()
+
+            # One transaction per batch keeps row locks short
+            async with database.get_session() as session:
+                page = await EnhancedEntryRepository(session).backfill_search_vectors(
+                    after_id=after_id, batch_size=batch_size, only_missing=only_missing
+                )
+
+            if not page["last_id"]:
+                break
+
+            after_id = page["last_id"]
+            total_updated += page["updated"]
+            total_scanned += page["scanned"]
+            save_checkpoint(checkpoint, after_id, total_updated)
+
+            batch_elapsed = time.time() - batch_started
+            overall_rate = total_scanned / max(time.time() - started, 1e-6)
+            logger.info(f"📈 {page['updated']}/{page['scanned']} rows in {batch_elapsed:.2f}s "
+                        f"({page['scanned'] / max(batch_elapsed, 1e-6):.0f} rows/s, "
+                        f"overall {overall_rate:.0f} rows/s, {total_scanned} scanned) - cursor {after_id}")
+
+            # Throttle: never exceed the requested scan rate
+            if max_rows_per_second > 0:
+                min_duration = page["scanned"] / max_rows_per_second
+                if batch_elapsed < min_duration:
+                    await asyncio.sleep(min_duration - batch_elapsed)
+
+            if page["scanned"] < batch_size:
+                break
+    finally:
+        await database.close()
+
+    elapsed = time.time() - started
+    logger.info(f"✅ Search vector backfill complete - {total_updated} updated, {total_scanned} scanned "
+                f"in {elapsed:.1f}s ({total_scanned / max(elapsed, 1e-6):.0f} rows/s)")
+    return total_updated
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Backfill weighted entries.search_vector in keyset batches")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows per transaction")
+    parser.add_argument("--max-rows-per-second", type=float, default=2000,
+                        help="Throttle on scanned rows per second (0 disables)")
+    parser.add_argument("--checkpoint", default=DEFAULT_CHECKPOINT, help="Checkpoint file used to resume")
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint and start from the first entry")
+    parser.add_argument("--only-missing", action="store_true", help="Only fill rows whose search_vector is NULL")
+    args = parser.parse_args()
+
+    asyncio.run(backfill(args.batch_size, args.max_rows_per_second, args.checkpoint,
+                         args.restart, args.only_missing))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Backfill user_id into entry vector metadata
+
+Hybrid search filters the vector query on user_id; vectors written before
+entries carried it in their metadata are invisible to that filter. This looks
+up each such vector's owner in the entries table and merges user_id into its
+metadata (embeddings are untouched). Vectors whose entry no longer exists are
+reported and left alone. Safe to re-run. From the backend directory:
+
+    python scripts/backfill_vector_user_ids.py --batch-size 500
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import uuid
+from typing import Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy import select
+
+from app.core.database import database
+from app.models.enhanced_models import Entry
+from app.services.vector_service import vector_service
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _entry_ids(vector_ids: List[str]) -> List[uuid.UUID]:
+    ids = []
+    for vector_id in vector_ids:
+        try:
+            ids.append(uuid.UUID(vector_id))
+        except ValueError:
+            pass  # Older imports used non-database ids
+    return ids
+
+
+async def owners(vector_ids: List[str]) -> Dict[str, str]:
+    """Owner of every vector id that is an existing entry"""
+    async with database.get_session() as session:
+        result = await session.execute(
+            select(Entry.id, Entry.user_id).where(Entry.id.in_(_entry_ids(vector_ids)))
+        )
+        return {str(entry_id): str(user_id) for entry_id, user_id in result.all()}
+
+
+async def backfill(batch_size: int) -> int:
+    """Merge user_id into every vector missing it; returns vectors updated"""
+    await database.initialize()
+    updated = 0
+    try:
+        missing = vector_service.ids_missing_metadata("user_id")
+        logger.info(f"🔎 {len(missing)} vectors without user_id")
+
+        for start in range(0, len(missing), batch_size):
+            batch = missing[start:start + batch_size]
+            owned = await owners(batch)
+            vector_service.merge_metadata({entry_id: {"user_id": user_id} for entry_id, user_id in owned.items()})
+            updated += len(owned)
+            if len(owned) < len(batch):
+                logger.warning(f"⚠️ {len(batch) - len(owned)} vectors in this batch have no entry; left unchanged")
+            logger.info(f"📈 {updated}/{len(missing)} vectors updated")
+    finally:
+        await database.close()
+
+    logger.info(f"✅ Vector user_id backfill complete - {updated} updated")
+    return updated
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Backfill user_id into entry vector metadata")
+    parser.add_argument("--batch-size", type=int, default=500, help="Vectors looked up and updated per batch")
+    args = parser.parse_args()
+
+    asyncio.run(backfill(max(1, args.batch_size)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Index strategy review
+
+Prints every index's scans, index writes and size from PostgreSQL's
+cumulative statistics, most expensive first, with drop and tuning
+candidates. Counters accumulate since the statistics were last reset, so
+review after representative traffic. Run from the backend directory:
+
+    python scripts/index_review.py --table entries
+    python scripts/index_review.py --json > index_review.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+from typing import Any, Dict, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.core.database import database
+from app.services.index_review_service import IndexReviewService, ReviewThresholds
+
+logging.basicConfig(level=logging.WARNING)
+
+
+def format_bytes(size: int) -> str:
+    for unit in ("B", "kB", "MB", "GB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(f"Statistics since: {report['stats_reset'] or 'cluster start'}\n")
+
+    print(f"{'table':<24} {'inserts':>10} {'updates':>10} {'hot %':>7} {'indexes':>8} {'index size':>11} {'heap size':>10}")
+    for table in report["tables"]:
+        hot = f"{table['hot_ratio'] * 100:.0f}" if table["hot_ratio"] is not None else "-"
+        print(f"{table['table']:<24} {table['inserts']:>10} {table['updates']:>10} {hot:>7} "
+              f"{table['index_count']:>8} {format_bytes(table['index_bytes']):>11} {format_bytes(table['heap_bytes']):>10}")
+        for finding in table["findings"]:
+            print(f"    ! {finding}")
+
+    print(f"\n{'index':<40} {'method':<6} {'scans':>10} {'writes':>10} {'scans/1k w':>11} {'size':>10}")
+    for index in report["indexes"]:
+        ratio = f"{index['scans_per_1k_writes']:.1f}" if index["scans_per_1k_writes"] is not None else "-"
+        print(f"{index['index']:<40} {index['method']:<6} {index['scans']:>10} {index['index_writes']:>10} "
+              f"{ratio:>11} {format_bytes(index['size_bytes']):>10}")
+        for finding in index["findings"]:
+            print(f"    ! {finding}")
+
+    if report["drop_candidates"]:
+        print(f"\nDrop candidates: {', '.join(report['drop_candidates'])}")
+
+
+async def review(table: Optional[str], thresholds: ReviewThresholds, as_json: bool) -> None:
+    await database.initialize()
+    try:
+        report = await IndexReviewService(thresholds).review(table)
+    finally:
+        await database.close()
+
+    if as_json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Review index usage against write cost")
+    parser.add_argument("--table", help="Only review this table's indexes")
+    parser.add_argument("--min-scans-per-1k-writes", type=float, default=1.0,
+                        help="Flag indexes read less often than this per 1000 index writes")
+    parser.add_argument("--min-table-writes", type=int, default=1000,
+                        help="Only judge tables with at least this many writes")
+    parser.add_argument("--json", action="store_true", help="Print the raw report as JSON")
+    args = parser.parse_args()
+
+    thresholds = ReviewThresholds(
+        min_scans_per_1k_writes=args.min_scans_per_1k_writes,
+        min_table_writes=args.min_table_writes
+    )
+    asyncio.run(review(args.table, thresholds, args.json))
+
+
+if __name__ == "__main__":
+    main()
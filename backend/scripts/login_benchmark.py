@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Login burst benchmark
+
+Fires concurrent logins at a running API while a probe hits a cheap endpoint
+on a fixed interval. Probe latency is the number to watch: if bcrypt runs on
+the event loop it climbs with the login concurrency; with hashing offloaded it
+should stay flat. Shed logins (503 + Retry-After) are reported separately.
+
+    python scripts/login_benchmark.py --concurrency 50 --logins 500
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import uuid
+from collections import Counter
+from typing import Any, Dict, List
+
+import httpx
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    """p50/p95/p99/max in milliseconds"""
+    if not latencies:
+        return {}
+    ordered = sorted(latencies)
+
+    def percentile(p: float) -> float:
+        return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))] * 1000
+
+    return {
+        "count": len(ordered),
+        "mean_ms": round(statistics.mean(ordered) * 1000, 1),
+        "p50_ms": round(percentile(50), 1),
+        "p95_ms": round(percentile(95), 1),
+        "p99_ms": round(percentile(99), 1),
+        "max_ms": round(ordered[-1] * 1000, 1)
+    }
+
+
+class LoginBenchmark:
+    """Concurrent login load with a latency probe"""
+
+    def __init__(self, base_url: str, api_prefix: str = "/api/v1"):
+        self.base_url = base_url.rstrip("/")
+        self.api_prefix = api_prefix
+
+    async def ensure_user(self, client: httpx.AsyncClient, username: str, password: str) -> None:
+        response = await client.post(f"{self.api_prefix}/auth/register", json={
+            "username": username,
+            "email": f"{username}@example.com",
+            "password": password,
+            "password_confirm": password
+        })
+        if response.status_code not in (200, 201, 409):
+            raise RuntimeError(f"Could not create benchmark user: {response.status_code} {response.text}")
+
+    async def run(self, username: str, password: str, logins: int, concurrency: int,
+                  probe_path: str, probe_interval: float) -> Dict[str, Any]:
+        login_latencies: List[float] = []
+        probe_latencies: List[float] = []
+        statuses: Counter = Counter()
+        retry_after: Counter = Counter()
+        semaphore = asyncio.Semaphore(concurrency)
+        done = asyncio.Event()
+
+        limits = httpx.Limits(max_connections=concurrency + 5, max_keepalive_connections=concurrency + 5)
+        async with httpx.AsyncClient(base_url=self.base_url, timeout=60.0, limits=limits) as client:
+            await self.ensure_user(client, username, password)
+
+            # Baseline probe latency before the burst
+            baseline = []
+            for _ in range(20):
+                start = time.perf_counter()
+                await client.get(probe_path)
+                baseline.append(time.perf_counter() - start)
+                await asyncio.sleep(probe_interval)
+
+            async def login() -> None:
+                async with semaphore:
+                    start = time.perf_counter()
+                    try:
+                        response = await client.post(f"{self.api_prefix}/auth/login", json={
+                            "username_or_email": username,
+                            "password": password
+                        })
+                        statuses[response.status_code] += 1
+                        if response.status_code == 503:
+                            retry_after[response.headers.get("retry-after", "-")] += 1
+                        else:
+                            login_latencies.append(time.perf_counter() - start)
+                    except httpx.HTTPError as e:
+                        statuses[type(e).__name__] += 1
+
+            async def probe() -> None:
+                while not done.is_set():
+                    start = time.perf_counter()
+                    try:
+                        await client.get(probe_path)
+                        probe_latencies.append(time.perf_counter() - start)
+                    except httpx.HTTPError:
+                        pass
+                    await asyncio.sleep(probe_interval)
+
+            logger.info(f"🚀 {logins} logins at concurrency {concurrency}, probing {probe_path}")
+            probe_task = asyncio.create_task(probe())
+            started = time.perf_counter()
+            await asyncio.gather(*(login() for _ in range(logins)))
+            elapsed = time.perf_counter() - started
+            done.set()
+            await probe_task
+
+        return {
+            "logins": logins,
+            "concurrency": concurrency,
+            "elapsed_s": round(elapsed, 2),
+            "logins_per_second": round(statuses[200] / elapsed, 1),
+            "status_counts": {str(k): v for k, v in statuses.items()},
+            "retry_after": dict(retry_after),
+            "login_latency": summarize(login_latencies),
+            "probe_latency_baseline": summarize(baseline),
+            "probe_latency_under_load": summarize(probe_latencies)
+        }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure API latency under concurrent logins")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--logins", type=int, default=200, help="Total login requests")
+    parser.add_argument("--concurrency", type=int, default=50, help="Logins in flight at once")
+    parser.add_argument("--username", default=f"bench_{uuid.uuid4().hex[:8]}")
+    parser.add_argument("--password", default="BenchPassw0rd!")
+    parser.add_argument("--probe-path", default="/health", help="Cheap endpoint used as the latency probe")
+    parser.add_argument("--probe-interval", type=float, default=0.05)
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    report = await LoginBenchmark(args.base_url).run(
+        args.username, args.password, args.logins, args.concurrency,
+        args.probe_path, args.probe_interval
+    )
+
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Middleware overhead benchmark
+
+Compares the per-request cost of the request pipeline against the previous
+layout, where each concern was its own BaseHTTPMiddleware layer. Both variants
+run the same stages (tracing, security headers, security logging, rate
+limiting) so the difference is the middleware mechanics alone. Requests are
+driven straight through ASGI, with no network or server in the way.
+
+    python scripts/middleware_benchmark.py --requests 5000 --output middleware.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.rate_limiter import DEFAULT_RATE_LIMIT_POLICIES, DistributedRateLimiter
+from app.core.request_pipeline import PipelineStage, RequestContext, RequestPipelineMiddleware
+from app.core.request_tracing import RequestTracingStage
+from app.core.security_middleware import SecurityHeadersStage, SecurityLoggingStage, RateLimitingStage
+
+logging.basicConfig(level=logging.WARNING)
+logger = logging.getLogger(__name__)
+
+
+class LegacyStageMiddleware(BaseHTTPMiddleware):
+    """One stage per BaseHTTPMiddleware layer, as the stack was before the pipeline"""
+
+    def __init__(self, app, stage: PipelineStage):
+        super().__init__(app)
+        self.stage = stage
+
+    async def dispatch(self, request: Request, call_next: Callable):
+        ctx = RequestContext(request.scope)  # Every layer made its own request id
+        response = await self.stage.on_request(ctx) or await call_next(request)
+        ctx.status_code = response.status_code
+        self.stage.on_response_start(ctx, response.headers)
+        await self.stage.on_complete(ctx)
+        return response
+
+
+class OfflineRedis:
+    """No Redis in the benchmark: the limiter takes its fail-open path on every request"""
+    is_available = False
+
+
+def build_stages() -> List[PipelineStage]:
+    return [
+        RequestTracingStage(enable_detailed_logging=False),
+        SecurityHeadersStage(nonce_generator=True),
+        SecurityLoggingStage(),
+        RateLimitingStage(DistributedRateLimiter(DEFAULT_RATE_LIMIT_POLICIES, redis_service=OfflineRedis()))
+    ]
+
+
+def build_app(variant: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/v1/entries/{entry_id}")
+    async def read_entry(entry_id: str):
+        return {"id": entry_id, "title": "benchmark", "content": "x" * 512}
+
+    @app.get("/api/v1/stream")
+    async def stream():
+        async def chunks():
+            yield b"first\n"
+            await asyncio.sleep(0.05)
+            yield b"second\n"
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    if variant == "pipeline":
+        app.add_middleware(RequestPipelineMiddleware, stages=build_stages())
+    elif variant == "legacy":
+        # add_middleware wraps outward: add innermost first to keep the stage order
+        for stage in reversed(build_stages()):
+            app.add_middleware(LegacyStageMiddleware, stage=stage)
+    return app
+
+
+async def call(app: FastAPI, path: str) -> Dict[str, float]:
+    """Drive one request through ASGI; returns total and time-to-first-body-chunk"""
+    scope = {"type": "http", "method": "GET", "path": path, "raw_path": path.encode(),
+             "query_string": b"", "headers": [(b"user-agent", b"bench")],
+             "client": ("127.0.0.1", 5000), "server": ("bench", 80), "scheme": "http",
+             "http_version": "1.1", "root_path": ""}
+    request_sent = False
+    disconnected = asyncio.Event()
+    first_chunk = None
+    start = time.perf_counter()
+
+    async def receive():
+        nonlocal request_sent
+        if request_sent:
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+        request_sent = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal first_chunk
+        if message["type"] == "http.response.body" and message.get("body") and first_chunk is None:
+            first_chunk = time.perf_counter()
+
+    await app(scope, receive, send)
+    end = time.perf_counter()
+    disconnected.set()
+    return {"total": end - start, "first_chunk": (first_chunk or end) - start}
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+
+    def percentile(p: float) -> float:
+        return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))] * 1e6
+
+    return {
+        "mean_us": round(statistics.mean(ordered) * 1e6, 1),
+        "p50_us": round(percentile(50), 1),
+        "p95_us": round(percentile(95), 1),
+        "p99_us": round(percentile(99), 1)
+    }
+
+
+async def bench_variant(variant: str, requests: int, concurrency: int) -> Dict[str, Any]:
+    app = build_app(variant)
+    path = "/api/v1/entries/5f1c2a9e-0000-4000-8000-000000000000"
+
+    for _ in range(200):  # Warm-up
+        await call(app, path)
+
+    sequential = [(await call(app, path))["total"] for _ in range(requests)]
+
+    started = time.perf_counter()
+    for batch_start in range(0, requests, concurrency):
+        batch = min(concurrency, requests - batch_start)
+        await asyncio.gather(*(call(app, path) for _ in range(batch)))
+    concurrent_elapsed = time.perf_counter() - started
+
+    streaming = [await call(app, "/api/v1/stream") for _ in range(20)]
+
+    return {
+        "latency": summarize(sequential),
+        "throughput_rps": round(requests / concurrent_elapsed, 1),
+        "stream_first_chunk": summarize([s["first_chunk"] for s in streaming]),
+        "stream_total": summarize([s["total"] for s in streaming])
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare request pipeline overhead with stacked BaseHTTPMiddleware")
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    report = {"requests": args.requests, "concurrency": args.concurrency}
+    for variant in ("none", "legacy", "pipeline"):
+        report[variant] = await bench_variant(variant, args.requests, args.concurrency)
+
+    base = report["none"]["latency"]["p50_us"]
+    report["overhead_p50_us"] = {
+        variant: round(report[variant]["latency"]["p50_us"] - base, 1) for variant in ("legacy", "pipeline")
+    }
+
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,178 @@
+import pytest
+import sys
+import os
+import json
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from app.services.celery_autoscaler import (
+    COMPLETED_KEY, PUBLISHED_AT_HEADER, BrokerQueueProbe, QueueLagController, QueueSample,
+    ResizableThreadPool, ScalingPolicy, stamp_published_at
+)
+
+
+class FakeBrokerClient:
+    """Sync Redis stand-in holding kombu-style queue lists"""
+
+    def __init__(self):
+        self.lists = {}
+        self.values = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def llen(self, key):
+        return len(self.lists.get(key, []))
+
+    def lindex(self, key, index):
+        items = self.lists.get(key, [])
+        return items[index] if -len(items) <= index < len(items) else None
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def incr(self, key):
+        self.values[key] = int(self.values.get(key, 0)) + 1
+        return self.values[key]
+
+    def lpush(self, key, value):
+        self.lists.setdefault(key, []).insert(0, value)
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        def queue_call(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+        return queue_call
+
+    def execute(self):
+        return [getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+
+def publish(client, key, published_at):
+    client.lpush(key, json.dumps({"body": "", "headers": {PUBLISHED_AT_HEADER: published_at}}))
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def sample(queue, depth=0, oldest_age=None, completed=0):
+    return {queue: QueueSample(queue=queue, depth=depth, oldest_age=oldest_age, completed=completed)}
+
+
+class TestBrokerQueueProbe:
+    """Test queue depth and backlog age measurement"""
+
+    def test_depth_and_age_span_priority_sublists(self):
+        client = FakeBrokerClient()
+        publish(client, "psychology", 990.0)
+        publish(client, "psychology", 995.0)
+        publish(client, "psychology\x06\x166", 970.0)
+        client.values[COMPLETED_KEY.format(queue="psychology")] = b"12"
+        probe = BrokerQueueProbe(client=client, clock=FakeClock(1000.0))
+
+        samples = probe.measure(["psychology", "crisis"])
+
+        assert samples["psychology"].depth == 3
+        assert samples["psychology"].oldest_age == pytest.approx(30.0)
+        assert samples["psychology"].completed == 12
+        assert samples["crisis"].depth == 0
+        assert samples["crisis"].oldest_age is None
+
+    def test_unstamped_messages_count_toward_depth_only(self):
+        client = FakeBrokerClient()
+        client.lpush("analytics", json.dumps({"body": "", "headers": {}}))
+        probe = BrokerQueueProbe(client=client, clock=FakeClock())
+
+        samples = probe.measure(["analytics"])
+
+        assert samples["analytics"].depth == 1
+        assert samples["analytics"].oldest_age is None
+
+    def test_publish_hook_stamps_header(self):
+        headers = {}
+
+        stamp_published_at(headers=headers)
+
+        assert isinstance(headers[PUBLISHED_AT_HEADER], float)
+
+
+class TestQueueLagController:
+    """Test scaling decisions, hysteresis and floors"""
+
+    def test_backlog_age_over_target_scales_up_with_step_cap(self):
+        controller = QueueLagController(["psychology"], ScalingPolicy(max_step=2), clock=FakeClock())
+
+        decision = controller.decide(2, 1, 8, sample("psychology", depth=40, oldest_age=300.0))
+
+        assert decision.reason == "queue_lag"
+        assert decision.target == 4
+        assert decision.pressure == pytest.approx(5.0)
+
+    def test_slow_drain_scales_up_before_messages_age(self):
+        clock = FakeClock()
+        controller = QueueLagController(["crisis"], clock=clock)
+        controller.decide(4, 1, 8, sample("crisis", depth=0, completed=0))
+        clock.now += 10
+
+        # 1 task/s drained, 20 waiting: 20s to drain against a 5s target
+        decision = controller.decide(4, 1, 8, sample("crisis", depth=20, oldest_age=1.0, completed=10))
+
+        assert decision.queues["crisis"]["drain_seconds"] == pytest.approx(20.0)
+        assert decision.target == 8
+
+    def test_scale_down_waits_for_calm_samples_and_cooldown(self):
+        clock = FakeClock()
+        policy = ScalingPolicy(calm_samples=2, scale_up_cooldown=0, scale_down_cooldown=60)
+        controller = QueueLagController(["psychology"], policy, clock=clock)
+        assert controller.decide(2, 1, 8, sample("psychology", depth=10, oldest_age=120.0)).target == 4
+
+        clock.now += 10
+        assert controller.decide(4, 1, 8, sample("psychology")).reason == "hold"
+        clock.now += 10
+        assert controller.decide(4, 1, 8, sample("psychology")).reason == "scale_down_cooldown"
+        # Inside the hysteresis band: neither grow nor count as calm
+        clock.now += 60
+        assert controller.decide(4, 1, 8, sample("psychology", depth=3, oldest_age=30.0)).reason == "hold"
+        clock.now += 10
+        assert controller.decide(4, 1, 8, sample("psychology")).reason == "hold"
+        clock.now += 10
+        decision = controller.decide(4, 1, 8, sample("psychology"))
+
+        assert decision.reason == "idle"
+        assert decision.target == 3
+
+    def test_crisis_floor_holds_when_idle(self):
+        controller = QueueLagController(["crisis"], ScalingPolicy(calm_samples=1, scale_down_cooldown=0), clock=FakeClock())
+
+        assert controller.floor == 4
+        assert controller.decide(2, 1, 8, sample("crisis")).target == 4
+        assert controller.decide(4, 1, 8, sample("crisis")).target == 4
+
+
+class TestResizableThreadPool:
+    """Test thread pool resizing used by the autoscaler"""
+
+    def test_grow_and_shrink_change_limit(self):
+        pool = ResizableThreadPool(limit=2)
+        try:
+            pool.grow(2)
+            assert pool.num_processes == 4
+            assert pool.executor._max_workers == 4
+
+            pool.shrink(3)
+            assert pool.num_processes == 1
+            with pytest.raises(ValueError):
+                pool.shrink(1)
+        finally:
+            pool.executor.shutdown()
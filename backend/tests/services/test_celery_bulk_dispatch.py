@@ -0,0 +1,112 @@
+import pytest
+import sys
+import os
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from app.services.celery_bulk_dispatch import BulkDispatcher, run_chunk_items
+
+
+class FakeCeleryApp:
+    """Runs each published chunk through a handler and serves results like the Redis backend"""
+
+    def __init__(self, handler, fail_chunks=()):
+        self.handler = handler
+        self.fail_chunks = set(fail_chunks)
+        self.sent = []
+        self.producers_acquired = 0
+        self.ready = {}
+        self.backend = SimpleNamespace(get_many=self._get_many)
+
+    @contextmanager
+    def producer_or_acquire(self, producer=None):
+        self.producers_acquired += 1
+        yield object()
+
+    def send_task(self, name, args=(), kwargs=None, producer=None):
+        assert producer is not None
+        task_id = f"chunk-{len(self.sent)}"
+        self.sent.append((name, list(args[0]), kwargs))
+        if len(self.sent) in self.fail_chunks:
+            self.ready[task_id] = {"status": "FAILURE", "result": RuntimeError("worker lost")}
+        else:
+            self.ready[task_id] = {"status": "SUCCESS", "result": run_chunk_items(args[0], self.handler)}
+        return SimpleNamespace(id=task_id)
+
+    def _get_many(self, task_ids, interval=0.5, max_iterations=None):
+        for task_id in task_ids:
+            if task_id in self.ready:
+                yield task_id, self.ready.pop(task_id)
+
+
+def flaky_square(failures):
+    """Squares items; raises the first time it sees each item in `failures`"""
+    seen = set()
+
+    def handler(item):
+        if item in failures and item not in seen:
+            seen.add(item)
+            raise ValueError(f"bad {item}")
+        return item * item
+    return handler
+
+
+class TestBulkDispatcher:
+    """Test chunked fan-out, concurrency caps and partial retries"""
+
+    @pytest.mark.asyncio
+    async def test_items_are_chunked_and_results_keyed_by_input_index(self):
+        app = FakeCeleryApp(flaky_square(set()))
+        dispatcher = BulkDispatcher(app=app, poll_interval=0)
+
+        summary = await dispatcher.dispatch_all("app.tasks.test.square_chunk", list(range(10)), chunk_size=4)
+
+        assert [len(items) for _, items, _ in app.sent] == [4, 4, 2]
+        assert summary["results"] == {index: index * index for index in range(10)}
+        assert summary["failed"] == {}
+
+    @pytest.mark.asyncio
+    async def test_in_flight_cap_limits_each_publish_batch(self):
+        app = FakeCeleryApp(flaky_square(set()))
+        dispatcher = BulkDispatcher(app=app, poll_interval=0)
+
+        outcomes = [outcome async for outcome in dispatcher.dispatch(
+            "app.tasks.test.square_chunk", list(range(10)), chunk_size=2, max_in_flight=2
+        )]
+
+        assert len(outcomes) == 5
+        # One producer per batch of at most two chunks
+        assert app.producers_acquired == 3
+
+    @pytest.mark.asyncio
+    async def test_only_failed_items_are_retried(self):
+        app = FakeCeleryApp(flaky_square({3, 7}))
+        dispatcher = BulkDispatcher(app=app, poll_interval=0)
+
+        outcomes = [outcome async for outcome in dispatcher.dispatch(
+            "app.tasks.test.square_chunk", list(range(8)), chunk_size=4
+        )]
+
+        # Each chunk's failed items are repacked on their own
+        assert sorted(items for _, items, _ in app.sent[2:]) == [[3], [7]]
+        assert sorted(index for outcome in outcomes for index in outcome.retrying) == [3, 7]
+        results = {index: value for outcome in outcomes for index, value in outcome.results.items()}
+        assert results == {index: index * index for index in range(8)}
+
+    @pytest.mark.asyncio
+    async def test_items_fail_after_max_attempts(self):
+        app = FakeCeleryApp(flaky_square(set()), fail_chunks={2, 3})
+        dispatcher = BulkDispatcher(app=app, poll_interval=0)
+
+        summary = await dispatcher.dispatch_all(
+            "app.tasks.test.square_chunk", list(range(4)), chunk_size=2, max_attempts=2
+        )
+
+        # Chunk 2 fails whole, its retry (chunk 3) fails too
+        assert set(summary["failed"]) == {2, 3}
+        assert "worker lost" in summary["failed"][2]
+        assert summary["results"] == {0: 0, 1: 1}
+        assert dispatcher.get_stats()["items_failed"] == 2
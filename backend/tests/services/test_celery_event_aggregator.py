@@ -0,0 +1,122 @@
+import pytest
+import sys
+import os
+import json
+from unittest.mock import AsyncMock, patch
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from app.services.celery_event_aggregator import CapturedEvent, EventAggregator, EventRingBuffer
+
+
+def task_event(event_type, uuid, name=None, **fields):
+    return CapturedEvent.from_event({"type": f"task-{event_type}", "uuid": uuid, "name": name, "hostname": "w1", **fields})
+
+
+class TestEventRingBuffer:
+    """Test the bounded capture buffer"""
+
+    def test_full_buffer_drops_oldest(self):
+        buffer = EventRingBuffer(capacity=3)
+        for index in range(5):
+            buffer.push(task_event("sent", f"id-{index}", "app.tasks.user.x"))
+
+        drained = buffer.drain()
+
+        assert [event.uuid for event in drained] == ["id-2", "id-3", "id-4"]
+        assert buffer.dropped == 2
+        assert len(buffer) == 0
+
+    def test_drain_limit(self):
+        buffer = EventRingBuffer()
+        for index in range(4):
+            buffer.push(task_event("sent", f"id-{index}"))
+
+        assert len(buffer.drain(limit=3)) == 3
+        assert len(buffer) == 1
+
+
+class TestEventAggregator:
+    """Test incremental task and worker aggregation"""
+
+    def test_lifecycle_is_attributed_by_uuid(self):
+        aggregator = EventAggregator()
+
+        aggregator.apply([
+            task_event("sent", "a", "app.tasks.crisis.detect", queue="crisis"),
+            task_event("received", "a", "app.tasks.crisis.detect"),
+            task_event("started", "a"),
+            task_event("succeeded", "a", runtime=0.3),
+            task_event("sent", "b", "app.tasks.crisis.detect", queue="crisis"),
+            task_event("failed", "b", exception="ValueError()"),
+        ])
+
+        stats = aggregator.tasks["app.tasks.crisis.detect"].to_dict()
+        assert stats["succeeded"] == 1
+        assert stats["failed"] == 1
+        assert stats["failure_rate"] == pytest.approx(0.5)
+        assert stats["runtime_histogram"]["le_0.5"] == 1
+        assert aggregator.failures_seen == 1
+        assert aggregator.recent_failures[-1]["exception"] == "ValueError()"
+        assert aggregator.queue_stats("crisis")["error_rate"] == pytest.approx(0.5)
+
+    def test_delta_holds_only_changes_since_last_take(self):
+        aggregator = EventAggregator()
+        aggregator.apply([task_event("sent", "a", "app.tasks.user.tag")])
+        assert aggregator.take_delta() == {"app.tasks.user.tag|sent": 1}
+
+        aggregator.apply([task_event("succeeded", "a", runtime=2.0)])
+        delta = aggregator.take_delta()
+
+        assert delta == {
+            "app.tasks.user.tag|succeeded": 1,
+            "app.tasks.user.tag|runtime_ms": 2000,
+            "app.tasks.user.tag|le_5": 1,
+        }
+        assert aggregator.take_delta() == {}
+        aggregator.restore_delta(delta)
+        assert aggregator.take_delta() == delta
+
+    def test_worker_goes_offline_after_missed_heartbeats(self):
+        aggregator = EventAggregator()
+        aggregator.apply([CapturedEvent.from_event({
+            "type": "worker-heartbeat", "hostname": "crisis@h", "timestamp": 100.0, "freq": 2.0, "active": 1
+        })])
+        worker = aggregator.workers["crisis@h"]
+
+        assert aggregator.worker_online(worker, now=104.0)
+        assert not aggregator.worker_online(worker, now=107.0)
+
+
+class TestMonitoringPublish:
+    """Test delta publishing from the monitoring loop"""
+
+    @pytest.mark.asyncio
+    async def test_publish_sends_flat_delta_once(self):
+        from app.services.celery_monitoring import CeleryMonitoringService
+
+        service = CeleryMonitoringService()
+        service._events.push(task_event("sent", "a", "app.tasks.user.tag"))
+        assert service._ingest_events() == []
+
+        with patch("app.services.celery_monitoring.redis_service.run_script", new=AsyncMock(return_value=1)) as run_script:
+            await service._publish_task_delta()
+            await service._publish_task_delta()
+
+        run_script.assert_awaited_once()
+        assert json.loads(run_script.await_args.kwargs["args"][3]) == {"app.tasks.user.tag|sent": 1}
+
+    @pytest.mark.asyncio
+    async def test_unpublished_delta_is_kept_when_redis_is_down(self):
+        from app.services.celery_monitoring import CeleryMonitoringService
+
+        service = CeleryMonitoringService()
+        service._events.push(task_event("failed", "a", "app.tasks.crisis.detect"))
+        failures = service._ingest_events()
+        assert [failure["task_id"] for failure in failures] == ["a"]
+
+        with patch("app.services.celery_monitoring.redis_service.run_script", new=AsyncMock(return_value=None)):
+            await service._publish_task_delta()
+
+        assert service._aggregator.take_delta() == {"app.tasks.crisis.detect|failed": 1}
@@ -0,0 +1,127 @@
+import pytest
+import sys
+import os
+from unittest.mock import patch
+
+from celery import concurrency
+from celery.bin.base import CLIContext
+from celery.bin.worker import worker as worker_command
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from app.services import celery_cpu_worker
+from app.services.celery_cpu_worker import (
+    CUSTOM_POOL_ENV, WORKER_PROFILES, ModelWarmer, WorkerProfile, validate_profiles, worker_argv, worker_env
+)
+from app.services.celery_service import celery_app
+from app.services.celery_autoscaler import ResizableThreadPool
+
+
+def parse_worker_argv(profile):
+    """Run a profile's command line through Celery's own worker option parsing"""
+    argv = worker_argv(profile)
+    # Celery reads CELERY_CUSTOM_WORKER_POOL into its pool aliases when it is imported
+    custom = worker_env(profile).get(CUSTOM_POOL_ENV)
+    with patch.dict(concurrency.ALIASES, {"custom": custom}):
+        context = worker_command.make_context(
+            "worker", argv[argv.index("worker") + 1:],
+            obj=CLIContext(app=celery_app, no_color=True, workdir=None, quiet=True)
+        )
+    return context.params
+
+
+class TestWorkerProfiles:
+    """Test that profiles line up with Celery routing"""
+
+    def test_every_routed_queue_has_exactly_one_profile(self):
+        assert validate_profiles() == []
+
+    def test_uncovered_queue_is_reported(self):
+        profiles = {name: profile for name, profile in WORKER_PROFILES.items() if name != "maintenance"}
+
+        problems = validate_profiles(profiles)
+
+        assert "queue 'maintenance' is not consumed by any worker profile" in problems
+        assert any("app.tasks.maintenance.*" in problem for problem in problems)
+
+    def test_worker_command_matches_profile(self):
+        argv = worker_argv(WORKER_PROFILES["crisis"])
+
+        assert "--pool=custom" in argv
+        assert worker_env(WORKER_PROFILES["crisis"])[CUSTOM_POOL_ENV] == \
+            "app.services.celery_autoscaler:ResizableThreadPool"
+        assert "--autoscale=8,4" in argv
+        assert "--queues=crisis" in argv
+        assert "--prefetch-multiplier=1" in argv
+        assert not any(arg.startswith("--max-tasks-per-child") for arg in argv)
+        assert "--max-tasks-per-child=1000" in worker_argv(WORKER_PROFILES["maintenance"])
+
+    def test_fixed_size_profile_keeps_stock_pool(self):
+        argv = worker_argv(WorkerProfile(name="test", queues=("crisis",), concurrency=3))
+
+        assert "--pool=threads" in argv
+        assert "--concurrency=3" in argv
+        assert not any(arg.startswith("--autoscale") for arg in argv)
+        assert CUSTOM_POOL_ENV not in worker_env(WorkerProfile(name="test", queues=("crisis",)))
+
+    @pytest.mark.parametrize("name", sorted(WORKER_PROFILES))
+    def test_celery_accepts_every_profile_command(self, name):
+        profile = WORKER_PROFILES[name]
+
+        params = parse_worker_argv(profile)
+
+        assert params["queues"] == list(profile.queues)
+        # Profile signals are connected by importing this module in the worker
+        assert params["include"] == ["app.services.celery_cpu_worker"]
+        assert params["autoscale"] == (profile.max_concurrency, profile.min_concurrency)
+        if profile.pool == "threads":
+            assert params["pool"] is ResizableThreadPool
+
+    def test_database_and_redis_queues_run_on_prefork(self):
+        # Their tasks open and close the process-wide engine and Redis client per asyncio.run()
+        for queue in ("psychology", "user_ops", "maintenance"):
+            owner = next(profile for profile in WORKER_PROFILES.values() if queue in profile.queues)
+            assert owner.pool == "prefork", queue
+
+
+class TestModelWarmer:
+    """Test model preloading and warm state"""
+
+    def test_all_models_loaded_means_warm(self):
+        warmer = ModelWarmer(WorkerProfile(name="test", queues=("crisis",), models=("a", "b")))
+
+        async def fake_load():
+            warmer.warm_models, warmer.failed_models = ["a", "b"], []
+
+        with patch.object(warmer, "_load_models", fake_load):
+            assert warmer.preload() is True
+        assert warmer.is_warm
+
+    def test_failed_model_withholds_warm_state(self):
+        warmer = ModelWarmer(WorkerProfile(name="test", queues=("crisis",), models=("a", "b")))
+
+        async def fake_load():
+            warmer.warm_models, warmer.failed_models = ["a"], ["b"]
+
+        with patch.object(warmer, "_load_models", fake_load):
+            assert warmer.preload() is False
+        assert not warmer.is_warm
+
+    def test_profile_without_models_is_warm(self):
+        assert ModelWarmer(WORKER_PROFILES["maintenance"]).preload() is True
+
+    def test_prefork_gpu_profile_never_reports_ready(self, tmp_path):
+        warmer = ModelWarmer(WorkerProfile(name="test", queues=("crisis",), pool="prefork", models=("a",)))
+
+        with patch.object(celery_cpu_worker, "model_warmer", warmer), \
+                patch.object(celery_cpu_worker.settings, "CELERY_WORKER_READY_DIR", str(tmp_path)), \
+                patch("app.services.ai_model_manager.ai_model_manager") as model_manager, \
+                patch.object(warmer, "preload") as preload:
+            model_manager.has_gpu = True
+            celery_cpu_worker.preload_profile_models()
+            celery_cpu_worker.warm_pool_child()
+            celery_cpu_worker.signal_worker_ready()
+
+        preload.assert_not_called()
+        assert not celery_cpu_worker.ready_file(warmer.profile).exists()
@@ -0,0 +1,105 @@
+import pytest
+import asyncio
+import sys
+import os
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from app.services.conversation_tagging_service import ConversationTaggingService, TaggingPolicy
+
+
+def make_rows(*contents):
+    start = datetime(2025, 8, 1, tzinfo=timezone.utc)
+    return [(content, start + timedelta(minutes=i)) for i, content in enumerate(contents)]
+
+
+class TestTaggingTrigger:
+    """Test counter-driven, deduplicated enqueueing"""
+
+    def test_every_sixth_message_triggers(self):
+        service = ConversationTaggingService()
+
+        assert [count for count in range(1, 19) if service.should_tag(count)] == [6, 12, 18]
+
+    @pytest.mark.asyncio
+    async def test_pending_job_is_not_enqueued_twice(self):
+        service = ConversationTaggingService()
+
+        with patch("app.services.conversation_tagging_service.redis_service") as redis, \
+                patch("app.services.celery_service.dispatch_task", AsyncMock()) as dispatch:
+            redis.is_available = True
+            redis.set_if_absent = AsyncMock(side_effect=[True, False])
+
+            assert await service.on_message_added("s1", 6) is True
+            assert await service.on_message_added("s1", 12) is False
+            assert await service.on_message_added("s1", 7) is False
+
+        assert dispatch.await_count == 1
+        assert dispatch.await_args.kwargs["args"] == ("s1",)
+        assert service.stats["jobs_deduplicated"] == 1
+
+    @pytest.mark.asyncio
+    async def test_runs_in_process_when_broker_is_unavailable(self):
+        service = ConversationTaggingService()
+
+        with patch("app.services.conversation_tagging_service.redis_service") as redis, \
+                patch("app.services.celery_service.dispatch_task", AsyncMock(side_effect=ConnectionError("no broker"))), \
+                patch.object(service, "tag_new_messages", AsyncMock()) as tag:
+            redis.is_available = True
+            redis.set_if_absent = AsyncMock(return_value=True)
+
+            assert await service.request_tagging("s1") is True
+            await asyncio.gather(*service._local_jobs)
+
+        tag.assert_awaited_once_with("s1")
+
+    @pytest.mark.asyncio
+    async def test_worker_job_clears_pending_marker_before_closing_redis(self):
+        from app.services.unified_database_service import UnifiedDatabaseService
+
+        service = ConversationTaggingService()
+        calls = []
+
+        with patch("app.services.unified_database_service.database") as database, \
+                patch("app.services.unified_database_service.redis_service") as redis, \
+                patch("app.services.unified_database_service.service_registry"), \
+                patch.object(service, "_load_session", AsyncMock(return_value=None)), \
+                patch("app.services.conversation_tagging_service.database", database):
+            database.initialize = AsyncMock(side_effect=lambda: calls.append("db_initialize"))
+            database.close = AsyncMock()
+            database.get_session.return_value.__aenter__ = AsyncMock()
+            database.get_session.return_value.__aexit__ = AsyncMock(return_value=False)
+            redis.initialize = AsyncMock()
+            redis.delete = AsyncMock(side_effect=lambda key: calls.append("delete"))
+            redis.close = AsyncMock(side_effect=lambda: calls.append("redis_close"))
+            with patch("app.services.conversation_tagging_service.redis_service", redis):
+                result = await UnifiedDatabaseService().run_in_task(service.tag_new_messages("s1"))
+
+        assert result["status"] == "not_found"
+        assert calls == ["db_initialize", "delete", "redis_close"]
+
+
+class TestTaggingBudget:
+    """Test incremental selection of new messages"""
+
+    def test_messages_beyond_budget_wait_for_next_job(self):
+        service = ConversationTaggingService(TaggingPolicy(token_budget=5, chars_per_token=4))
+        rows = make_rows("a" * 8, "", "b" * 8, "c" * 8)
+
+        texts, cursor = service._select_within_budget(rows)
+
+        assert texts == ["a" * 8, "b" * 8]
+        assert cursor == rows[2][1]
+        assert service.stats["budget_truncations"] == 1
+
+    def test_single_long_message_is_truncated_to_budget(self):
+        service = ConversationTaggingService(TaggingPolicy(token_budget=2, chars_per_token=4))
+        rows = make_rows("x" * 100)
+
+        texts, cursor = service._select_within_budget(rows)
+
+        assert texts == ["x" * 8]
+        assert cursor == rows[0][1]
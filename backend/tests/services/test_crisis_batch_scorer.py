@@ -0,0 +1,109 @@
+import pytest
+import sys
+import os
+import re
+from unittest.mock import patch, AsyncMock, MagicMock
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from app.services.crisis_batch_scorer import CrisisBatchScorer
+
+INDICATORS = {
+    "self_harm": {
+        "keywords": ["hurt myself", "kill myself", "suicide"],
+        "patterns": [r"(?:want to|plan to).{0,20}(?:hurt|kill|end).{0,10}myself"]
+    },
+    "isolation": {
+        "keywords": ["alone", "all alone", "cutting", "cutting people off"],
+        "patterns": []
+    },
+    "overlap": {
+        "keywords": ["hurt myself", "myself"],
+        "patterns": []
+    }
+}
+
+TEXTS = [
+    "I want to hurt myself tonight",
+    "Cutting people off again, all alone",
+    "A calm day at the beach",
+    "",
+    "SUICIDE hotline saved me, I was alone",
+]
+
+
+def naive_counts(texts):
+    """Reference implementation: independent substring and regex checks"""
+    keyword_counts, pattern_counts = [], []
+    for config in INDICATORS.values():
+        keyword_counts.append([sum(1 for k in config["keywords"] if k in t.lower()) for t in texts])
+        pattern_counts.append([sum(1 for p in config["patterns"] if re.search(p, t.lower(), re.IGNORECASE))
+                               for t in texts])
+    return keyword_counts, pattern_counts
+
+
+class TestCrisisBatchScorer:
+    """Test vectorized lexical crisis scoring"""
+
+    def test_matches_naive_substring_semantics(self):
+        """Single-pass matching gives the same counts as per-keyword checks"""
+        hits = CrisisBatchScorer(INDICATORS).score(TEXTS)
+        keyword_counts, pattern_counts = naive_counts(TEXTS)
+
+        assert hits.keyword_counts.shape == (3, len(TEXTS))
+        assert hits.keyword_counts.tolist() == keyword_counts
+        assert hits.pattern_counts.tolist() == pattern_counts
+
+    def test_overlapping_and_prefix_keywords_are_all_credited(self):
+        """Keywords sharing a prefix or overlapping each other are all found"""
+        scorer = CrisisBatchScorer(INDICATORS)
+        hits = scorer.score(["cutting people off, all alone"])
+
+        assert sorted(hits.keyword_hits[0]) == ["all alone", "alone", "cutting", "cutting people off"]
+        assert scorer.indicator_keywords("isolation", hits.keyword_hits[0]) == hits.keyword_hits[0]
+        assert scorer.indicator_keywords("self_harm", hits.keyword_hits[0]) == []
+
+    def test_shared_keyword_counts_for_every_indicator(self):
+        hits = CrisisBatchScorer(INDICATORS).score(["I hurt myself"])
+        counts = dict(zip(hits.indicator_names, hits.keyword_counts[:, 0]))
+
+        assert counts["self_harm"] == 1
+        assert counts["overlap"] == 2
+
+    def test_candidate_mask(self):
+        hits = CrisisBatchScorer(INDICATORS).score(TEXTS)
+
+        assert hits.candidate_mask.tolist() == [True, True, False, False, True]
+
+    def test_dense_fallback_without_scipy(self):
+        """Results are identical when scipy is unavailable"""
+        with patch('app.services.crisis_batch_scorer.sparse', None):
+            hits = CrisisBatchScorer(INDICATORS).score(TEXTS)
+
+        keyword_counts, _ = naive_counts(TEXTS)
+        assert hits.keyword_counts.tolist() == keyword_counts
+
+
+class TestInterventionBatchAssessment:
+    """Test the intervention service batch API"""
+
+    @pytest.mark.asyncio
+    async def test_model_only_runs_on_prefiltered_candidates(self):
+        from app.services.ai_intervention_service import AIInterventionService, CrisisLevel
+
+        service = AIInterventionService()
+        texts = ["I feel hopeless and worthless, nothing matters", "Lovely walk in the park today"]
+        model = MagicMock(return_value=[{"labels": ["severe depression"], "scores": [0.9]}])
+
+        with patch('app.services.ai_intervention_service.ai_model_manager') as manager:
+            manager.get_model = AsyncMock(return_value=model)
+            assessments = await service.assess_crisis_levels_batch(texts)
+
+        assert len(assessments) == 2
+        model.assert_called_once()
+        assert model.call_args.args[0] == [texts[0]]
+        assert assessments[0].crisis_level != CrisisLevel.NONE
+        assert "ai_detected_severe_depression" in [f.indicator for f in assessments[0].risk_factors]
+        assert assessments[1].crisis_level == CrisisLevel.NONE
+        assert assessments[0].assessment_metadata["assessment_method"] == "ai_powered_batch"
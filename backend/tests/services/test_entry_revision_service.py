@@ -0,0 +1,140 @@
+import pytest
+import sys
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from app.core.exceptions import DatabaseException
+from app.services.entry_revision_service import (
+    DELTA, SNAPSHOT, EntryRevisionService, apply_delta, decompress_text, diff_ops, encode_delta,
+    replay, revision_payload
+)
+
+NOW = datetime(2026, 10, 18, 12, 30, tzinfo=timezone.utc)
+LONG_TEXT = " ".join(f"Sentence {i} about the day and how it went." for i in range(200))
+
+
+def session_with_latest(latest):
+    """Session whose latest-revision query returns latest"""
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = latest
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+def revision_rows(texts, snapshot_interval):
+    """Stored rows for versions 1..len(texts)-1, the last text being current"""
+    rows = {}
+    for version in range(1, len(texts)):
+        kind, payload = revision_payload(version, texts[version], texts[version - 1], snapshot_interval)
+        rows[version] = SimpleNamespace(version=version, kind=kind, payload=payload,
+                                        content_length=len(texts[version - 1]))
+    return rows
+
+
+class TestDeltaCodec:
+    """Test edit ops and their compressed encoding"""
+
+    def test_appended_text_is_a_copy_and_an_insert(self):
+        assert diff_ops(LONG_TEXT, LONG_TEXT + " More words.") == [len(LONG_TEXT), " More words."]
+
+    def test_edits_round_trip(self):
+        edited = LONG_TEXT.replace("Sentence 57 about", "Sentence 57, honestly, about").replace(
+            "Sentence 120 about the day and how it went. ", "") + " Ünïcode ✓"
+
+        assert apply_delta(LONG_TEXT, encode_delta(LONG_TEXT, edited)) == edited
+        assert apply_delta(edited, encode_delta(edited, LONG_TEXT)) == LONG_TEXT
+        assert apply_delta("", encode_delta("", edited)) == edited
+
+    def test_delta_is_much_smaller_than_the_text(self):
+        kind, payload = revision_payload(1, LONG_TEXT + " One more sentence.", LONG_TEXT, snapshot_interval=20)
+
+        assert kind == DELTA
+        assert len(payload) < 50
+
+    def test_snapshot_every_interval_and_for_rewrites(self):
+        kind, payload = revision_payload(20, LONG_TEXT + " More.", LONG_TEXT, snapshot_interval=20)
+        assert kind == SNAPSHOT
+        assert decompress_text(payload) == LONG_TEXT
+
+        # Nothing in common: a delta cannot beat the compressed text
+        assert revision_payload(3, "x" * 40, LONG_TEXT, snapshot_interval=20)[0] == SNAPSHOT
+
+
+class TestReplay:
+    """Test rebuilding old versions from the current text"""
+
+    def test_every_version_is_rebuilt_from_nearest_snapshot_or_current(self):
+        texts = [LONG_TEXT + f" Edit {i}." * i for i in range(1, 8)]
+        rows = revision_rows(texts, snapshot_interval=3)
+        current = len(texts)
+
+        assert rows[3].kind == SNAPSHOT and rows[6].kind == SNAPSHOT
+        assert replay(texts[-1], current, 5, [rows[6], rows[5]]) == texts[4]
+        assert replay(texts[-1], current, 1, [rows[3], rows[2], rows[1]]) == texts[0]
+        assert replay(texts[-1], current, 6, [rows[6]]) == texts[5]
+
+    def test_gap_in_the_chain_is_an_error(self):
+        texts = [LONG_TEXT + f" Edit {i}." for i in range(1, 6)]
+        rows = revision_rows(texts, snapshot_interval=20)
+
+        with pytest.raises(DatabaseException):
+            replay(texts[-1], 5, 2, [rows[4], rows[2]])
+        with pytest.raises(DatabaseException):
+            replay(texts[-1], 5, 2, [rows[4], rows[3]])
+
+
+class TestRecordRevision:
+    """Test opening versions and coalescing autosaves"""
+
+    @pytest.mark.asyncio
+    async def test_save_after_the_window_opens_a_version(self):
+        service = EntryRevisionService(coalesce_window=timedelta(minutes=10), snapshot_interval=20)
+        entry = SimpleNamespace(id=uuid.uuid4(), version=3, content=LONG_TEXT, created_at=NOW - timedelta(days=1))
+        latest = SimpleNamespace(version=2, kind=DELTA, payload=b"", created_at=NOW - timedelta(hours=1))
+        db = session_with_latest(latest)
+        new_content = LONG_TEXT + " Later that evening."
+
+        version = await service.record_revision(db, entry, new_content, now=NOW)
+
+        row = db.add.call_args.args[0]
+        assert version == 4
+        assert (row.version, row.kind, row.content_length, row.created_at) == (3, DELTA, len(LONG_TEXT), NOW)
+        assert apply_delta(new_content, row.payload) == LONG_TEXT
+
+    @pytest.mark.asyncio
+    async def test_autosave_inside_the_window_rebases_the_previous_delta(self):
+        service = EntryRevisionService(coalesce_window=timedelta(minutes=10), snapshot_interval=20)
+        older = LONG_TEXT
+        current = LONG_TEXT + " First autosave."
+        latest = SimpleNamespace(version=2, kind=DELTA, payload=encode_delta(current, older),
+                                 created_at=NOW - timedelta(minutes=3))
+        entry = SimpleNamespace(id=uuid.uuid4(), version=3, content=current, created_at=NOW - timedelta(days=1))
+        db = session_with_latest(latest)
+        new_content = current + " Second autosave."
+
+        version = await service.record_revision(db, entry, new_content, now=NOW)
+
+        assert version == 3
+        db.add.assert_not_called()
+        assert apply_delta(new_content, latest.payload) == older
+
+    @pytest.mark.asyncio
+    async def test_first_version_coalesces_against_entry_creation(self):
+        service = EntryRevisionService(coalesce_window=timedelta(minutes=10), snapshot_interval=20)
+        # SQLite returns naive timestamps
+        entry = SimpleNamespace(id=uuid.uuid4(), version=1, content=LONG_TEXT,
+                                created_at=(NOW - timedelta(minutes=2)).replace(tzinfo=None))
+        db = session_with_latest(None)
+
+        assert await service.record_revision(db, entry, LONG_TEXT + " More.", now=NOW) == 1
+        db.add.assert_not_called()
+
+        assert await service.record_revision(db, entry, LONG_TEXT + " More.", now=NOW + timedelta(hours=1)) == 2
+        assert db.add.call_args.args[0].version == 1
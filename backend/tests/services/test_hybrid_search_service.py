@@ -0,0 +1,108 @@
+import pytest
+import sys
+import os
+import asyncio
+from unittest.mock import patch, AsyncMock
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from app.services.hybrid_search_service import HybridSearchService, HybridSearchConfig, SearchLeg
+
+MODULE = 'app.services.hybrid_search_service'
+
+
+class TestHybridSearchService:
+    """Test rank fusion, leg timeouts and ranking cache"""
+
+    def test_reciprocal_rank_fusion(self):
+        """Documents found by several legs outrank single-leg hits"""
+        fused = HybridSearchService.reciprocal_rank_fusion({
+            SearchLeg.FULL_TEXT: ["a", "b", "c"],
+            SearchLeg.TRIGRAM: ["b", "d"],
+            SearchLeg.VECTOR: ["c", "b"],
+        }, k=60)
+
+        ids = [entry_id for entry_id, _, _ in fused]
+        assert ids[0] == "b"
+        assert set(ids) == {"a", "b", "c", "d"}
+        assert fused[0][2] == {"full_text": 2, "trigram": 1, "vector": 2}
+        assert fused[0][1] == pytest.approx(1 / 62 + 1 / 61 + 1 / 62)
+
+    def test_normalize_query(self):
+        assert HybridSearchService.normalize_query("  Rainy   DAY\tthoughts ") == "rainy day thoughts"
+
+    @pytest.mark.asyncio
+    async def test_slow_leg_times_out_and_result_is_not_cached(self):
+        """A leg over budget is dropped; the degraded ranking is not cached"""
+        service = HybridSearchService(HybridSearchConfig(leg_timeouts={
+            SearchLeg.FULL_TEXT: 1.0, SearchLeg.TRIGRAM: 1.0, SearchLeg.VECTOR: 0.01
+        }))
+
+        async def slow_vector(*args):
+            await asyncio.sleep(1)
+            return ["late"]
+
+        with patch(f'{MODULE}.insight_precompute_service') as versions, \
+             patch(f'{MODULE}.redis_service') as redis, \
+             patch.object(service, '_full_text_leg', AsyncMock(return_value=["a", "b"])), \
+             patch.object(service, '_trigram_leg', AsyncMock(return_value=["b"])), \
+             patch.object(service, '_vector_leg', slow_vector), \
+             patch.object(service, '_hydrate', AsyncMock(return_value={"a": "entry-a", "b": "entry-b"})):
+            versions.get_content_version = AsyncMock(return_value=3)
+            redis.get = AsyncMock(return_value=None)
+            redis.set = AsyncMock(return_value=True)
+            result = await service.search("user-1", "Bad Day")
+
+        assert [item["entry"] for item in result["results"]] == ["entry-b", "entry-a"]
+        assert result["legs"]["vector"]["status"] == "timeout"
+        assert result["legs"]["full_text"]["status"] == "ok"
+        redis.set.assert_not_awaited()
+        assert service.stats["leg_timeouts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_ranking_skips_legs(self):
+        """Cache key includes the content version; a hit only hydrates"""
+        service = HybridSearchService()
+        cached = {"fused": [{"id": "a", "score": 0.03, "ranks": {"full_text": 1}}],
+                  "legs": {"full_text": {"status": "ok", "count": 1, "duration_ms": 1.0}}}
+
+        with patch(f'{MODULE}.insight_precompute_service') as versions, \
+             patch(f'{MODULE}.redis_service') as redis, \
+             patch.object(service, '_run_legs', AsyncMock()) as run_legs, \
+             patch.object(service, '_hydrate', AsyncMock(return_value={"a": "entry-a"})):
+            versions.get_content_version = AsyncMock(return_value=7)
+            redis.get = AsyncMock(return_value=cached)
+            result = await service.search("user-1", "bad day")
+
+        run_legs.assert_not_awaited()
+        assert result["cached"] is True
+        assert result["results"][0]["entry"] == "entry-a"
+        assert ":version:7" in redis.get.await_args.args[0]
+
+    @pytest.mark.asyncio
+    async def test_vector_query_is_filtered_to_the_user(self):
+        service = HybridSearchService()
+
+        with patch(f'{MODULE}.vector_service') as vectors:
+            vectors.search_entries = AsyncMock(return_value=[])
+            assert await service._vector_leg("user-1", "bad day", 50) == []
+
+        assert vectors.search_entries.await_args.kwargs == {"filters": {"user_id": "user-1"}, "raise_errors": True}
+
+    @pytest.mark.asyncio
+    async def test_failed_vector_store_marks_leg_failed(self):
+        service = HybridSearchService()
+
+        with patch(f'{MODULE}.vector_service') as vectors, \
+             patch(f'{MODULE}.insight_precompute_service') as versions, \
+             patch(f'{MODULE}.redis_service') as redis, \
+             patch.object(service, '_hydrate', AsyncMock(return_value={})):
+            vectors.search_entries = AsyncMock(side_effect=RuntimeError("chroma down"))
+            versions.get_content_version = AsyncMock(return_value=1)
+            redis.get = AsyncMock(return_value=None)
+            redis.set = AsyncMock(return_value=True)
+            result = await service.search("user-1", "bad day", legs=[SearchLeg.VECTOR])
+
+        assert result["legs"]["vector"]["status"] == "error"
+        redis.set.assert_not_awaited()
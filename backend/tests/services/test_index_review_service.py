@@ -0,0 +1,90 @@
+import pytest
+import sys
+import os
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from app.services.index_review_service import IndexReviewService, ReviewThresholds, build_report, index_writes
+
+
+def table_row(name="entries", inserts=5000, updates=5000, hot_updates=1000):
+    return {"table_name": name, "n_tup_ins": inserts, "n_tup_upd": updates, "n_tup_hot_upd": hot_updates,
+            "n_tup_del": 0, "n_live_tup": inserts, "heap_bytes": 8192 * 100, "options": ""}
+
+
+def index_row(name, scans, method="btree", size=8192, unique=False, primary=False, options=""):
+    return {"table_name": "entries", "index_name": name, "method": method, "idx_scan": scans, "idx_tup_read": scans,
+            "size_bytes": size, "is_unique": unique, "is_primary": primary, "options": options,
+            "definition": f"CREATE INDEX {name} ON entries"}
+
+
+class TestIndexReport:
+    """Test write cost and findings derived from index statistics"""
+
+    def test_index_writes_count_inserts_and_non_hot_updates(self):
+        assert index_writes(table_row(inserts=100, updates=50, hot_updates=20)) == 130
+
+    def test_unused_and_low_value_indexes_are_flagged(self):
+        report = build_report(
+            [
+                index_row("entries_pkey", 0, unique=True, primary=True),
+                index_row("ix_entries_analysis_gin", 0, method="gin", size=10 ** 6),
+                index_row("ix_entries_mood_sentiment", 5),
+                index_row("ix_entries_user_created", 90000),
+            ],
+            [table_row()]
+        )
+        findings = {index["index"]: index["findings"] for index in report["indexes"]}
+
+        assert report["drop_candidates"] == ["ix_entries_analysis_gin"]
+        # Constraint indexes are never drop candidates
+        assert findings["entries_pkey"] == []
+        assert findings["ix_entries_mood_sentiment"][0].startswith("low_value")
+        assert findings["ix_entries_user_created"] == []
+        # Written most and read least sorts first
+        assert [index["index"] for index in report["indexes"]][:2] == ["ix_entries_analysis_gin", "entries_pkey"]
+
+    def test_low_hot_ratio_and_fastupdate_off_are_flagged(self):
+        report = build_report(
+            [index_row("ix_entries_content_trgm", 500, method="gin", options="fastupdate=off")],
+            [table_row(updates=4000, hot_updates=400)]
+        )
+
+        assert report["tables"][0]["hot_ratio"] == pytest.approx(0.1)
+        assert report["tables"][0]["findings"][0].startswith("low_hot_ratio")
+        assert report["indexes"][0]["findings"][0].startswith("gin_fastupdate_off")
+
+    def test_quiet_tables_are_not_judged(self):
+        report = build_report([index_row("ix_entries_tags_gin", 0, method="gin")],
+                              [table_row(inserts=10, updates=0, hot_updates=0)],
+                              ReviewThresholds(min_table_writes=1000))
+
+        assert report["drop_candidates"] == []
+        assert report["tables"][0]["hot_ratio"] is None
+
+
+class TestGinPendingListFlush:
+    """Test deferred GIN maintenance"""
+
+    @pytest.mark.asyncio
+    async def test_every_gin_index_of_the_table_is_flushed(self):
+        listing = MagicMock()
+        listing.scalars.return_value.all.return_value = ["ix_entries_content_trgm", "ix_entries_search_vector"]
+        flushed_pages = MagicMock()
+        flushed_pages.scalar.return_value = 12
+        session = MagicMock()
+        session.execute = AsyncMock(side_effect=[listing, flushed_pages, flushed_pages])
+
+        @asynccontextmanager
+        async def get_session():
+            yield session
+
+        fake_database = MagicMock(engine=object(), get_session=get_session)
+        with patch("app.services.index_review_service.database", fake_database):
+            flushed = await IndexReviewService().flush_gin_pending_lists("entries")
+
+        assert flushed == {"ix_entries_content_trgm": 12, "ix_entries_search_vector": 12}
+        assert session.execute.await_args_list[1].args[1] == {"index": "ix_entries_content_trgm"}
@@ -0,0 +1,178 @@
+import pytest
+import sys
+import os
+import time
+from unittest.mock import patch, AsyncMock
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from app.services.insight_precompute_service import (
+    InsightPrecomputeService, SnapshotSchedule, SnapshotType
+)
+
+MODULE = 'app.services.insight_precompute_service'
+
+
+class TestInsightPrecomputeService:
+    """Test snapshot freshness and activity-weighted scheduling"""
+
+    def test_refresh_interval_is_activity_weighted(self):
+        """More recent entries shorten the interval, bounded by min/max"""
+        service = InsightPrecomputeService(SnapshotSchedule(min_interval_seconds=600, max_interval_seconds=86400))
+
+        assert service.refresh_interval(0) == 86400
+        assert service.refresh_interval(3) == 21600
+        assert service.refresh_interval(10_000) == 600
+        assert service.refresh_interval(1) > service.refresh_interval(5)
+
+    @pytest.mark.asyncio
+    async def test_get_snapshot_missing(self):
+        """Missing snapshots return None and count as misses"""
+        service = InsightPrecomputeService()
+
+        with patch(f'{MODULE}.unified_cache_service') as cache:
+            cache.get_ai_analysis_result = AsyncMock(return_value=None)
+            assert await service.get_snapshot("user-1", SnapshotType.PERSONALITY) is None
+
+        assert service.stats["snapshot_misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_get_snapshot_marks_stale_on_version_change(self):
+        """A snapshot computed at an older content version is served but flagged stale"""
+        service = InsightPrecomputeService()
+        snapshot = {
+            "type": "personality",
+            "data": {"traits": ["curious"]},
+            "content_version": 3,
+            "computed_at": "2025-01-01T00:00:00",
+            "computed_at_epoch": time.time() - 120
+        }
+
+        with patch(f'{MODULE}.unified_cache_service') as cache, \
+             patch(f'{MODULE}.redis_service') as redis:
+            cache.get_ai_analysis_result = AsyncMock(return_value=dict(snapshot))
+            redis.get = AsyncMock(return_value=4)
+            result = await service.get_snapshot("user-1", SnapshotType.PERSONALITY)
+
+        assert result["data"] == {"traits": ["curious"]}
+        assert result["stale"] is True
+        assert result["current_version"] == 4
+        assert result["age_seconds"] >= 120
+        assert service.stats["stale_reads"] == 1
+
+    @pytest.mark.asyncio
+    async def test_get_snapshot_fresh_when_versions_match(self):
+        service = InsightPrecomputeService()
+        snapshot = {"data": [], "content_version": 7, "computed_at_epoch": time.time()}
+
+        with patch(f'{MODULE}.unified_cache_service') as cache, \
+             patch(f'{MODULE}.redis_service') as redis:
+            cache.get_ai_analysis_result = AsyncMock(return_value=snapshot)
+            redis.get = AsyncMock(return_value=7)
+            result = await service.get_snapshot("user-1", SnapshotType.TEMPORAL)
+
+        assert result["stale"] is False
+
+    @pytest.mark.asyncio
+    async def test_request_refresh_is_deduplicated(self):
+        """Only the first caller inside the lock window dispatches a task"""
+        service = InsightPrecomputeService()
+
+        with patch(f'{MODULE}.redis_service') as redis, \
+             patch('app.services.celery_service.dispatch_task', new_callable=AsyncMock) as dispatch:
+            redis.set_if_absent = AsyncMock(side_effect=[True, False])
+            assert await service.request_refresh("user-1") is True
+            assert await service.request_refresh("user-1") is False
+
+        dispatch.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_select_due_users(self):
+        """Users are due on version change, missing meta, or elapsed interval"""
+        service = InsightPrecomputeService(SnapshotSchedule(min_interval_seconds=60, max_interval_seconds=3600))
+        now = time.time()
+        metas = {
+            "psychology:snapshot_meta:user:fresh": {"content_version": 1, "computed_at_epoch": now},
+            "psychology:snapshot_meta:user:changed": {"content_version": 1, "computed_at_epoch": now},
+            "psychology:snapshot_meta:user:old": {"content_version": 1, "computed_at_epoch": now - 7200},
+        }
+        versions = {"fresh": 1, "changed": 2, "old": 1, "new": 0}
+
+        async def fake_get(key):
+            return metas.get(key)
+
+        with patch(f'{MODULE}.redis_service') as redis, \
+             patch.object(service, 'get_active_users', AsyncMock(return_value={"fresh": 1, "changed": 1, "old": 1, "new": 1})), \
+             patch.object(service, 'get_content_version', AsyncMock(side_effect=lambda u: versions[u])):
+            redis.get = AsyncMock(side_effect=fake_get)
+            due = await service.select_due_users()
+
+        assert sorted(due) == ["changed", "new", "old"]
+
+
+class TestWorkerRun:
+    """Test the connections a Celery worker run opens and closes"""
+
+    @pytest.mark.asyncio
+    async def test_refresh_runs_between_initialize_and_close(self):
+        from app.services.unified_database_service import UnifiedDatabaseService
+
+        service = InsightPrecomputeService()
+        unified = UnifiedDatabaseService()
+        calls = []
+
+        async def initialize():
+            calls.append("initialize")
+
+        async def refresh(user_id, force=False):
+            calls.append("refresh")
+            return {"status": "refreshed"}
+
+        with patch('app.services.unified_database_service.database') as database, \
+             patch('app.services.unified_database_service.redis_service') as redis, \
+             patch('app.services.unified_database_service.service_registry'), \
+             patch.object(service, 'refresh_user', side_effect=refresh):
+            database.initialize = AsyncMock(side_effect=initialize)
+            database.close = AsyncMock(side_effect=lambda: calls.append("close"))
+            redis.initialize = AsyncMock()
+            redis.close = AsyncMock()
+            result = await unified.run_in_task(service.refresh_user("user-1"))
+
+            assert result == {"status": "refreshed"}
+            assert calls == ["initialize", "refresh", "close"]
+            redis.close.assert_awaited_once()
+
+            # A failed run still releases its connections
+            with patch.object(service, 'refresh_user', AsyncMock(side_effect=RuntimeError("boom"))):
+                with pytest.raises(RuntimeError):
+                    await unified.run_in_task(service.refresh_user("user-1"))
+            assert calls[-1] == "close"
+            assert unified._initialized is False
+
+    def test_run_in_task_refuses_worker_threads(self):
+        """Threads of one process would share the engine and Redis client across event loops"""
+        import asyncio
+        import threading
+        from app.services.unified_database_service import UnifiedDatabaseService
+
+        unified = UnifiedDatabaseService()
+        errors = []
+
+        async def work():
+            return "done"
+
+        def run():
+            try:
+                asyncio.run(unified.run_in_task(work()))
+            except RuntimeError as e:
+                errors.append(str(e))
+
+        with patch('app.services.unified_database_service.database') as database:
+            database.initialize = AsyncMock()
+            thread = threading.Thread(target=run)
+            thread.start()
+            thread.join()
+
+        assert errors and "prefork" in errors[0]
+        database.initialize.assert_not_called()
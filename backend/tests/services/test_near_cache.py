@@ -0,0 +1,154 @@
+import pytest
+import sys
+import os
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from app.services.near_cache import MISSING, NearCache, NearCachePolicy
+from app.services.redis_service import RedisService
+from tests.services.test_redis_batching import FakeRedisClient
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_near_cache(clock=None, max_entries=2, ttl_seconds=10) -> NearCache:
+    near_cache = NearCache(
+        {"session:data": NearCachePolicy(max_entries=max_entries, ttl_seconds=ttl_seconds)},
+        clock=clock or FakeClock(),
+    )
+    near_cache.active = True
+    return near_cache
+
+
+class PublishingRedisClient(FakeRedisClient):
+    """Fake client that also records pub/sub publishes"""
+
+    def __init__(self):
+        super().__init__()
+        self.published = []
+
+    def run(self, command, *args, **kwargs):
+        if command == "publish":
+            self.published.append(args)
+            return 0
+        return super().run(command, *args, **kwargs)
+
+
+def make_service(client: FakeRedisClient) -> RedisService:
+    service = RedisService()
+    service.redis_client = client
+    service._batcher = None
+    service._initialized = True
+    service.near_cache = make_near_cache(max_entries=10)
+    return service
+
+
+class TestNearCache:
+    """Test the in-process LRU tier"""
+
+    def test_only_configured_domains_are_held(self):
+        near_cache = make_near_cache()
+        near_cache.put("session:data:1", b"1")
+        near_cache.put("user:data:1", b"2")
+
+        assert near_cache.get("session:data:1") == b"1"
+        assert near_cache.get("user:data:1") is MISSING
+
+    def test_least_recently_used_entry_is_evicted(self):
+        near_cache = make_near_cache()
+        near_cache.put("session:data:1", b"1")
+        near_cache.put("session:data:2", b"2")
+        near_cache.get("session:data:1")
+        near_cache.put("session:data:3", b"3")
+
+        assert near_cache.get("session:data:2") is MISSING
+        assert near_cache.get("session:data:1") == b"1"
+        assert near_cache.stats["evictions"] == 1
+
+    def test_entries_expire_after_domain_ttl(self):
+        clock = FakeClock()
+        near_cache = make_near_cache(clock)
+        near_cache.put("session:data:1", b"1")
+
+        clock.now = 10.0
+        assert near_cache.get("session:data:1") is MISSING
+        assert near_cache.stats["expirations"] == 1
+
+    def test_inactive_cache_serves_nothing(self):
+        near_cache = make_near_cache()
+        near_cache.put("session:data:1", b"1")
+        near_cache.active = False
+
+        assert near_cache.get("session:data:1") is MISSING
+
+    def test_read_that_raced_an_invalidation_is_not_stored(self):
+        near_cache = make_near_cache()
+        generation = near_cache.generation
+        near_cache.invalidate("session:data:1")
+        near_cache.put("session:data:1", b"stale", generation)
+
+        assert near_cache.get("session:data:1") is MISSING
+
+    def test_messages_from_other_workers_are_applied(self):
+        near_cache = make_near_cache()
+        other = make_near_cache()
+        near_cache.put("session:data:1", b"1")
+        near_cache.put("session:data:2", b"2")
+
+        near_cache.apply_message(near_cache.invalidation_message(key="session:data:1"))
+        assert near_cache.get("session:data:1") == b"1"
+
+        near_cache.apply_message(other.invalidation_message(pattern="session:data:*"))
+        assert near_cache.get("session:data:1") is MISSING
+        assert near_cache.get("session:data:2") is MISSING
+        assert near_cache.stats["messages_received"] == 1
+
+
+class TestRedisServiceNearCache:
+    """Test the near tier in front of the shared Redis client"""
+
+    @pytest.mark.asyncio
+    async def test_repeated_reads_skip_redis(self):
+        client = PublishingRedisClient()
+        service = make_service(client)
+        client.data["session:data:1"] = b'{"messages": 2}'
+
+        first = await service.get("session:data:1")
+        first["messages"] = 99
+        second = await service.get("session:data:1")
+
+        assert second == {"messages": 2}
+        assert client.round_trips == 1
+        stats = service.get_near_cache_stats()
+        assert stats["near_hits"] == 1
+        assert stats["far_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_locally_and_publish(self):
+        client = PublishingRedisClient()
+        service = make_service(client)
+        client.data["session:data:1"] = b'{"messages": 2}'
+        await service.get("session:data:1")
+
+        await service.set("session:data:1", {"messages": 3}, ttl=60)
+
+        assert await service.get("session:data:1") == {"messages": 3}
+        assert len(client.published) == 1
+        assert '"session:data:1"' in client.published[0][1]
+
+    @pytest.mark.asyncio
+    async def test_keys_outside_near_domains_are_not_published(self):
+        client = PublishingRedisClient()
+        service = make_service(client)
+
+        await service.set("user:data:1", {"a": 1}, ttl=60)
+        await service.delete("user:data:1")
+
+        assert client.published == []
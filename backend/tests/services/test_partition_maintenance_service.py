@@ -0,0 +1,140 @@
+import pytest
+import sys
+import os
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from app.models.enhanced_models import ChatMessage
+from app.services.partition_maintenance_service import (
+    CHAT_SESSION_COUNTS_SQL, PartitionedTable, PartitionMaintenanceService, add_months, create_partition_sql,
+    expired_partitions, month_start
+)
+
+NOW = datetime(2026, 10, 18, 12, 30, tzinfo=timezone.utc)
+
+
+class FakeConnection:
+    """Records executed SQL and serves the partition listing"""
+
+    def __init__(self, partitions, fail_on=()):
+        self.partitions = partitions
+        self.fail_on = fail_on
+        self.statements = []
+
+    async def execution_options(self, **options):
+        self.options = options
+        return self
+
+    async def execute(self, statement, params=None):
+        sql = str(statement).strip()
+        self.statements.append(sql)
+        if any(fragment in sql for fragment in self.fail_on):
+            raise RuntimeError("canceling statement due to lock timeout")
+        if sql.startswith("SELECT child.relname"):
+            return [SimpleNamespace(name=name, detach_pending=pending, is_default=name.endswith("_default"))
+                    for name, pending in self.partitions.items()]
+        return None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+async def run_with(conn, table):
+    engine = SimpleNamespace(connect=lambda: conn, begin=lambda: conn)
+    service = PartitionMaintenanceService(tables=[table])
+    with patch("app.services.partition_maintenance_service.database", SimpleNamespace(engine=engine)):
+        return await service.run_maintenance(now=NOW)
+
+
+class TestPartitionCalendar:
+    """Test month arithmetic and retention selection"""
+
+    def test_months_roll_over_years(self):
+        october = month_start(NOW)
+
+        assert october == datetime(2026, 10, 1, tzinfo=timezone.utc)
+        assert add_months(october, 3) == datetime(2027, 1, 1, tzinfo=timezone.utc)
+        assert add_months(october, -10) == datetime(2025, 12, 1, tzinfo=timezone.utc)
+
+    def test_partition_bounds_cover_one_utc_month(self):
+        sql = create_partition_sql("chat_messages", datetime(2026, 12, 1, tzinfo=timezone.utc))
+
+        assert "chat_messages_p2026_12 PARTITION OF chat_messages" in sql
+        assert "FROM ('2026-12-01T00:00:00+00:00') TO ('2027-01-01T00:00:00+00:00')" in sql
+
+    def test_only_whole_months_past_retention_expire(self):
+        table = PartitionedTable("chat_messages", retention_months=12)
+        names = ["chat_messages_p2025_09", "chat_messages_p2025_10", "chat_messages_default", "entries_p2020_01"]
+
+        assert expired_partitions(table, names, NOW) == ["chat_messages_p2025_09"]
+        assert expired_partitions(PartitionedTable("chat_messages"), names, NOW) == []
+
+
+class TestPartitionMaintenance:
+    """Test partition creation and detach-and-drop retention"""
+
+    @pytest.mark.asyncio
+    async def test_missing_future_partitions_are_created(self):
+        conn = FakeConnection({"chat_messages_p2026_10": False, "chat_messages_p2026_11": False})
+
+        results = await run_with(conn, PartitionedTable("chat_messages", premake_months=2))
+
+        assert results["chat_messages"]["created"] == ["chat_messages_p2026_12"]
+        assert conn.options == {"isolation_level": "AUTOCOMMIT"}
+        assert conn.statements[0].startswith("SET lock_timeout")
+
+    @pytest.mark.asyncio
+    async def test_expired_partitions_detach_concurrently_then_drop(self):
+        conn = FakeConnection({"chat_messages_p2025_08": False, "chat_messages_p2025_09": True})
+
+        results = await run_with(conn, PartitionedTable("chat_messages", retention_months=12, premake_months=0))
+
+        assert results["chat_messages"]["dropped"] == ["chat_messages_p2025_08", "chat_messages_p2025_09"]
+        assert "ALTER TABLE chat_messages DETACH PARTITION chat_messages_p2025_08 CONCURRENTLY" in conn.statements
+        # An interrupted concurrent detach is finished, not restarted
+        assert "ALTER TABLE chat_messages DETACH PARTITION chat_messages_p2025_09 FINALIZE" in conn.statements
+        assert "DROP TABLE chat_messages_p2025_08" in conn.statements
+        assert not any(sql.startswith("DELETE") for sql in conn.statements)
+
+    @pytest.mark.asyncio
+    async def test_default_partition_forces_plain_detach_and_failures_are_skipped(self):
+        conn = FakeConnection(
+            {"chat_messages_p2025_07": False, "chat_messages_p2025_08": False, "chat_messages_default": False},
+            fail_on=("chat_messages_p2025_07",)
+        )
+
+        results = await run_with(conn, PartitionedTable("chat_messages", retention_months=12, premake_months=0))
+
+        assert results["chat_messages"]["dropped"] == ["chat_messages_p2025_08"]
+        assert "ALTER TABLE chat_messages DETACH PARTITION chat_messages_p2025_08" in conn.statements
+        assert "DROP TABLE chat_messages_p2025_07" not in conn.statements
+
+
+    @pytest.mark.asyncio
+    async def test_session_counts_are_corrected_before_the_drop(self):
+        conn = FakeConnection({"chat_messages_p2025_08": False})
+        table = PartitionedTable("chat_messages", retention_months=12, premake_months=0,
+                                 before_drop_sql=CHAT_SESSION_COUNTS_SQL)
+
+        await run_with(conn, table)
+
+        update = next(index for index, sql in enumerate(conn.statements) if sql.startswith("UPDATE chat_sessions"))
+        assert "FROM chat_messages_p2025_08 GROUP BY session_id" in conn.statements[update]
+        assert conn.statements[update + 1] == "DROP TABLE chat_messages_p2025_08"
+
+
+class TestPartitionedModel:
+    """Test the chat_messages table definition"""
+
+    def test_partition_key_is_part_of_primary_key(self):
+        table = ChatMessage.__table__
+
+        assert [column.name for column in table.primary_key.columns] == ["id", "timestamp"]
+        assert table.dialect_options["postgresql"]["partition_by"] == "RANGE (timestamp)"
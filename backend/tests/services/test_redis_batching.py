@@ -0,0 +1,166 @@
+import pytest
+import asyncio
+import sys
+import os
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from app.services.redis_batching import RedisCommandBatcher
+from app.services.redis_service import RedisService
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.queued = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.queued = []
+
+    def __getattr__(self, command):
+        def queue(*args, **kwargs):
+            self.queued.append((command, args, kwargs))
+            return self
+        return queue
+
+    async def execute(self, raise_on_error=True):
+        self.client.round_trips += 1
+        results = []
+        for command, args, kwargs in self.queued:
+            try:
+                results.append(self.client.run(command, *args, **kwargs))
+            except Exception as e:
+                if raise_on_error:
+                    raise
+                results.append(e)
+        return results
+
+
+class FakeRedisClient:
+    """In-memory client that counts network round trips"""
+
+    def __init__(self):
+        self.data = {}
+        self.round_trips = 0
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def run(self, command, *args, **kwargs):
+        if command == "get":
+            return self.data.get(args[0])
+        if command == "setex":
+            key, _, value = args
+            self.data[key] = value.encode() if isinstance(value, str) else value
+            return True
+        if command == "mget":
+            return [self.data.get(key) for key in args[0]]
+        if command == "delete":
+            return sum(1 for key in args if self.data.pop(key, None) is not None)
+        if command == "expire":
+            return args[0] in self.data
+        raise ValueError(f"unsupported command {command}")
+
+    def __getattr__(self, command):
+        async def call(*args, **kwargs):
+            self.round_trips += 1
+            return self.run(command, *args, **kwargs)
+        return call
+
+
+def make_service(client: FakeRedisClient, auto_batching: bool = True) -> RedisService:
+    service = RedisService()
+    service.redis_client = client
+    service._batcher = RedisCommandBatcher(client) if auto_batching else None
+    service._initialized = True
+    return service
+
+
+class TestRedisCommandBatcher:
+    """Test coalescing of concurrent commands into pipelines"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_commands_share_one_round_trip(self):
+        client = FakeRedisClient()
+        client.data = {"a": b"1", "b": b"2"}
+        batcher = RedisCommandBatcher(client)
+
+        results = await asyncio.gather(
+            batcher.execute("get", "a"),
+            batcher.execute("get", "b"),
+            batcher.execute("setex", "c", 60, "3"),
+            batcher.execute("delete", "a"),
+        )
+
+        assert results == [b"1", b"2", True, 1]
+        assert client.round_trips == 1
+        assert batcher.get_stats()["largest_batch"] == 4
+
+    @pytest.mark.asyncio
+    async def test_sequential_commands_are_sent_directly(self):
+        client = FakeRedisClient()
+        batcher = RedisCommandBatcher(client)
+
+        await batcher.execute("setex", "a", 60, "1")
+        assert await batcher.execute("get", "a") == b"1"
+
+        assert client.round_trips == 2
+        assert batcher.get_stats()["commands_per_round_trip"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_failing_command_only_fails_its_caller(self):
+        client = FakeRedisClient()
+        batcher = RedisCommandBatcher(client)
+
+        results = await asyncio.gather(
+            batcher.execute("setex", "a", 60, "1"),
+            batcher.execute("hgetall", "a"),
+            return_exceptions=True,
+        )
+
+        assert results[0] is True
+        assert isinstance(results[1], ValueError)
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_early(self):
+        client = FakeRedisClient()
+        batcher = RedisCommandBatcher(client, max_batch_size=2)
+
+        await asyncio.gather(*(batcher.execute("get", f"k{i}") for i in range(5)))
+
+        assert client.round_trips == 3
+
+
+class TestRedisServiceBatching:
+    """Test cache service traffic per round trip"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_service_calls_are_coalesced(self):
+        client = FakeRedisClient()
+        service = make_service(client)
+
+        await asyncio.gather(
+            service.set("session:1", {"messages": 2}, ttl=60),
+            service.set("activity:1", 123.0, ttl=60),
+            service.expire("session:0", 60),
+        )
+        session, activity = await asyncio.gather(service.get("session:1"), service.get("activity:1"))
+
+        assert session == {"messages": 2}
+        assert activity == 123.0
+        assert client.round_trips == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_apis_use_one_round_trip_each(self):
+        client = FakeRedisClient()
+        service = make_service(client, auto_batching=False)
+
+        assert await service.set_many({"a": {"x": 1}, "b": "text"}, ttl=60)
+        assert await service.get_many(["a", "b", "missing"]) == {"a": {"x": 1}, "b": "text"}
+        assert await service.delete_many(["a", "b"]) == 2
+
+        assert client.round_trips == 3
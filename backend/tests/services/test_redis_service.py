@@ -0,0 +1,88 @@
+import pytest
+import asyncio
+import sys
+import os
+from unittest.mock import AsyncMock, patch
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.core.config import RedisSettings
+from app.core.exceptions import CacheException
+from app.services.redis_service import CommandLatencyHistogram, RedisService
+
+
+def make_service(**overrides) -> RedisService:
+    options = {"url": "redis://localhost:1/0", "reconnect_backoff_base": 0.01, "auto_batching": False}
+    options.update(overrides)
+    return RedisService(RedisSettings(**options))
+
+
+class TestCommandLatencyHistogram:
+    """Test per-command latency buckets"""
+
+    def test_percentiles_use_bucket_bounds(self):
+        histogram = CommandLatencyHistogram()
+        for duration_ms in [0.1] * 90 + [3.0] * 9 + [2500.0]:
+            histogram.observe(duration_ms)
+
+        stats = histogram.to_dict()
+        assert stats["count"] == 100
+        assert stats["p50_ms"] == 0.25
+        assert stats["p95_ms"] == 5.0
+        assert stats["max_ms"] == 2500.0
+        assert stats["buckets"]["overflow"] == 1
+
+
+class TestRedisService:
+    """Test connection management of the shared Redis client"""
+
+    @pytest.mark.asyncio
+    async def test_unavailable_service_serves_misses_without_io(self):
+        service = make_service()
+
+        assert await service.get("key") is None
+        assert await service.set("key", {"a": 1}) is False
+        assert await service.get_many(["key"]) == {}
+        assert service.get_command_latency() == {}
+
+    @pytest.mark.asyncio
+    async def test_lost_connection_reconnects_with_backoff(self):
+        service = make_service()
+        service.redis_client = AsyncMock()
+        service.redis_client.get.side_effect = RedisConnectionError("connection reset")
+        service._initialized = True
+
+        attempts = []
+
+        async def connect():
+            attempts.append(len(attempts))
+            if len(attempts) == 1:
+                raise OSError("refused")
+            service._initialized = True
+
+        with patch.object(service, "_connect", connect):
+            assert await service.get("key") is None
+            assert not service.is_available
+            await asyncio.wait_for(service._reconnect_task, timeout=1)
+
+        assert len(attempts) == 2
+        assert service.is_available
+        assert service._reconnects == 1
+        assert service.get_command_latency()["get"]["errors"] == 1
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_initialize_keeps_retrying_until_closed(self):
+        service = make_service()
+
+        with patch.object(service, "_connect", AsyncMock(side_effect=OSError("refused"))) as connect:
+            with pytest.raises(CacheException):
+                await service.initialize()
+            await asyncio.sleep(0.05)
+            await service.close()
+
+        assert connect.await_count >= 2
+        assert service._reconnect_task is None
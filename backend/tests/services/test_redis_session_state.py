@@ -0,0 +1,114 @@
+import pytest
+import asyncio
+import hashlib
+import sys
+import os
+from datetime import datetime
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from redis.exceptions import NoScriptError
+
+from app.services.redis_batching import RedisCommandBatcher
+from app.services.redis_service import RedisService, RedisSessionService
+from tests.services.test_redis_batching import FakeRedisClient
+
+
+class FakeScriptingRedisClient(FakeRedisClient):
+    """Fake client with hashes and an emulation of the session update script"""
+
+    def __init__(self):
+        super().__init__()
+        self.loaded_scripts = set()
+
+    def run(self, command, *args, **kwargs):
+        if command == "hset":
+            self.data.setdefault(args[0], {}).update(
+                {field.encode(): value.encode() for field, value in kwargs["mapping"].items()}
+            )
+            return len(kwargs["mapping"])
+        if command == "hgetall":
+            return dict(self.data.get(args[0], {}))
+        if command == "hmget":
+            record = self.data.get(args[0], {})
+            return [record.get(field.encode()) for field in args[1:]]
+        if command == "exists":
+            return int(args[0] in self.data)
+        if command == "evalsha":
+            if args[0] not in self.loaded_scripts:
+                raise NoScriptError("NOSCRIPT")
+            return self._update_session(*args[1:])
+        if command == "eval":
+            self.loaded_scripts.add(hashlib.sha1(args[0].encode('utf-8')).hexdigest())
+            return self._update_session(*args[1:])
+        return super().run(command, *args, **kwargs)
+
+    def _update_session(self, numkeys, key, ttl, counter, increment, *pairs):
+        record = self.data.get(key)
+        if record is None:
+            return None
+        count = 0
+        if counter:
+            count = int(record.get(counter.encode(), b"0")) + int(increment)
+            record[counter.encode()] = str(count).encode()
+        for field, value in zip(pairs[::2], pairs[1::2]):
+            record[field.encode()] = value.encode()
+        return count
+
+
+def make_session_service(client, auto_batching=True) -> RedisSessionService:
+    service = RedisService()
+    service.redis_client = client
+    service._batcher = RedisCommandBatcher(client) if auto_batching else None
+    service._initialized = True
+    return RedisSessionService(service)
+
+
+class TestRedisSessionState:
+    """Test hash-backed session state"""
+
+    @pytest.mark.asyncio
+    async def test_fields_round_trip_with_types_and_projection(self):
+        sessions = make_session_service(FakeScriptingRedisClient())
+
+        await sessions.store_session("s1", {"title": "42", "message_count": 3, "last_activity": None})
+
+        assert await sessions.get_session("s1") == {"title": "42", "message_count": 3, "last_activity": None}
+        assert await sessions.get_session("s1", fields=["message_count", "missing"]) == {"message_count": 3}
+        assert await sessions.get_session("other") is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_messages_are_all_counted(self):
+        client = FakeScriptingRedisClient()
+        sessions = make_session_service(client)
+        await sessions.store_session("s1", {"message_count": 0})
+
+        counts = await asyncio.gather(*(
+            sessions.record_message("s1", "user", datetime(2025, 8, 1)) for _ in range(20)
+        ))
+
+        assert sorted(counts) == list(range(1, 21))
+        state = await sessions.get_session("s1", fields=["message_count", "last_message_role"])
+        assert state == {"message_count": 20, "last_message_role": "user"}
+
+    @pytest.mark.asyncio
+    async def test_uncached_session_is_not_partially_created(self):
+        client = FakeScriptingRedisClient()
+        sessions = make_session_service(client, auto_batching=False)
+
+        assert await sessions.record_message("s1", "user", datetime(2025, 8, 1)) is None
+        assert await sessions.update_session("s1", {"status": "active"}) is False
+        assert "session_state:s1" not in client.data
+
+    @pytest.mark.asyncio
+    async def test_script_source_is_sent_only_once(self):
+        client = FakeScriptingRedisClient()
+        sessions = make_session_service(client, auto_batching=False)
+        await sessions.store_session("s1", {"message_count": 0})
+
+        await sessions.record_message("s1", "user", datetime(2025, 8, 1))
+        round_trips = client.round_trips
+        await sessions.record_message("s1", "assistant", datetime(2025, 8, 1))
+
+        assert client.round_trips == round_trips + 1
@@ -432,5 +432,51 @@ class TestEntriesAPI:
         
         print("✓ Concurrent entry creation test passed")
 
+class TestEntryRevisionAccess:
+    """Test that revision history is only served to the entry's owner"""
+
+    @staticmethod
+    def stored_entry(owner, deleted_at=None):
+        return Mock(user_id=owner, deleted_at=deleted_at, version=3)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("stored", [
+        None,
+        Mock(user_id="someone-else", deleted_at=None, version=3),
+        Mock(user_id="user-1", deleted_at="2026-10-01T00:00:00", version=3),
+    ])
+    async def test_history_is_hidden_unless_the_caller_owns_the_live_entry(self, stored):
+        from fastapi import HTTPException
+        from app.api.entries import get_entry_revisions, get_entry_version
+
+        current_user = Mock(id="user-1")
+        with patch('app.api.entries.unified_db_service') as mock_db_service, \
+             patch('app.api.entries.entry_revision_service') as mock_revisions:
+            mock_db_service.get_entry = AsyncMock(return_value=stored)
+            mock_revisions.get_version = AsyncMock(return_value="old text")
+            mock_revisions.list_revisions = AsyncMock(return_value=[])
+
+            for call in (get_entry_revisions("entry-1", current_user),
+                         get_entry_version("entry-1", 1, current_user)):
+                with pytest.raises(HTTPException) as error:
+                    await call
+                assert error.value.status_code == 404
+
+        mock_revisions.get_version.assert_not_awaited()
+        mock_revisions.list_revisions.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_owner_reads_an_old_version(self):
+        from app.api.entries import get_entry_version
+
+        with patch('app.api.entries.unified_db_service') as mock_db_service, \
+             patch('app.api.entries.entry_revision_service') as mock_revisions:
+            mock_db_service.get_entry = AsyncMock(return_value=self.stored_entry("user-1"))
+            mock_revisions.get_version = AsyncMock(return_value="old text")
+
+            result = await get_entry_version("entry-1", 1, Mock(id="user-1"))
+
+        assert result == {"entry_id": "entry-1", "version": 1, "content": "old text"}
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
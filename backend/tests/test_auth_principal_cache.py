@@ -0,0 +1,117 @@
+import pytest
+import sys
+import os
+import uuid
+from datetime import datetime
+from unittest.mock import patch, AsyncMock
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.auth.models import AuthUser, UserRole
+from app.auth.principal_cache import PrincipalCache
+
+MODULE = 'app.auth.principal_cache'
+
+
+def make_principal(user_id: str) -> dict:
+    return PrincipalCache._to_data(AuthUser(
+        id=uuid.UUID(user_id), username="casey", email="casey@example.com",
+        password_hash="$2b$12$secret", is_active=True, is_verified=True, is_superuser=False,
+        role=UserRole.USER, failed_login_attempts=0, timezone="UTC", language="en",
+        created_at=datetime(2025, 1, 1, 9, 30), updated_at=datetime(2025, 1, 2, 9, 30)
+    ))
+
+
+class FakeRedis:
+    """Minimal stand-in for redis_service"""
+
+    def __init__(self):
+        self.store = {}
+        self.is_available = True
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ttl=None):
+        self.store[key] = value
+        return True
+
+    async def increment(self, key, amount=1):
+        self.store[key] = int(self.store.get(key, 0)) + amount
+        return self.store[key]
+
+
+class TestPrincipalCache:
+    """Test two-tier principal caching and security-version invalidation"""
+
+    def test_round_trip_excludes_credentials(self):
+        user_id = str(uuid.uuid4())
+        data = make_principal(user_id)
+        user = PrincipalCache._to_user(data)
+
+        assert "password_hash" not in data
+        assert user.id == uuid.UUID(user_id)
+        assert user.role is UserRole.USER
+        assert user.created_at == datetime(2025, 1, 1, 9, 30)
+        assert user.password_hash is None
+
+    @pytest.mark.asyncio
+    async def test_local_then_redis_hits_avoid_database(self):
+        user_id = str(uuid.uuid4())
+        cache = PrincipalCache(max_entries=100, local_ttl=30, redis_ttl=300)
+        redis = FakeRedis()
+
+        with patch(f'{MODULE}.redis_service', redis), \
+             patch.object(cache, '_load_from_db', AsyncMock(return_value=make_principal(user_id))) as load:
+            first = await cache.get_principal(user_id)
+            second = await cache.get_principal(user_id)
+            cache.clear_local()
+            third = await cache.get_principal(user_id)
+
+        assert load.await_count == 1
+        assert first is not second  # Each request gets its own instance
+        assert third.username == "casey"
+        stats = cache.get_stats()
+        assert stats["local_hits"] == 1
+        assert stats["redis_hits"] == 1
+        assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+    @pytest.mark.asyncio
+    async def test_version_bump_invalidates_immediately(self):
+        user_id = str(uuid.uuid4())
+        cache = PrincipalCache(max_entries=100, local_ttl=30, redis_ttl=300)
+        other_process = PrincipalCache(max_entries=100, local_ttl=30, redis_ttl=300)
+        redis = FakeRedis()
+        active = make_principal(user_id)
+        deactivated = {**active, "is_active": False}
+
+        with patch(f'{MODULE}.redis_service', redis), \
+             patch.object(cache, '_load_from_db', AsyncMock(side_effect=[active, deactivated])) as load:
+            assert (await cache.get_principal(user_id)).is_active is True
+            await other_process.bump_security_version(user_id)
+            assert (await cache.get_principal(user_id)).is_active is False
+
+        assert load.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_bypasses_cache_without_redis(self):
+        user_id = str(uuid.uuid4())
+        cache = PrincipalCache(max_entries=100, local_ttl=30, redis_ttl=300)
+        redis = FakeRedis()
+        redis.is_available = False
+
+        with patch(f'{MODULE}.redis_service', redis), \
+             patch.object(cache, '_load_from_db', AsyncMock(return_value=make_principal(user_id))) as load:
+            await cache.get_principal(user_id)
+            await cache.get_principal(user_id)
+
+        assert load.await_count == 2
+        assert cache.stats["bypassed"] == 2
+
+    @pytest.mark.asyncio
+    async def test_invalid_user_id_is_rejected(self):
+        cache = PrincipalCache()
+        with patch.object(cache, '_load_from_db', AsyncMock()) as load:
+            assert await cache.get_principal("not-a-uuid") is None
+        load.assert_not_awaited()
@@ -0,0 +1,81 @@
+import pytest
+import sys
+import os
+
+import numpy as np
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.corpus import CorpusConfig, SyntheticCorpus, DEFAULT_USER_ID
+from benchmarks.fakes import FakeAIBackends, FakeLatency, FakeModelLoader, _LatencySource
+from benchmarks.harness import compare_reports, summarize_latencies
+
+
+def report(p50, p95, p99, rps):
+    return {"scenarios": {"entries_list": {
+        "latency_ms": {"p50": p50, "p95": p95, "p99": p99},
+        "throughput_rps": rps
+    }}}
+
+
+class TestSyntheticCorpus:
+    """Test deterministic corpus generation"""
+
+    def test_same_seed_same_rows(self):
+        first = list(SyntheticCorpus(CorpusConfig(entries=50, seed=7)).entries())
+        second = list(SyntheticCorpus(CorpusConfig(entries=50, seed=7)).entries())
+        other = list(SyntheticCorpus(CorpusConfig(entries=50, seed=8)).entries())
+
+        assert [(e["id"], e["content"], e["user_id"]) for e in first] == \
+               [(e["id"], e["content"], e["user_id"]) for e in second]
+        assert [e["id"] for e in first] != [e["id"] for e in other]
+
+    def test_default_user_owns_data(self):
+        corpus = SyntheticCorpus(CorpusConfig(users=5, entries=100, sessions=10))
+
+        assert corpus.user_ids()[0] == DEFAULT_USER_ID
+        assert any(e["user_id"] == DEFAULT_USER_ID for e in corpus.entries())
+        assert any(s["user_id"] == DEFAULT_USER_ID for s in corpus.sessions())
+
+
+class TestFakeBackends:
+    """Test fake AI models"""
+
+    def test_embeddings_are_deterministic_and_normalized(self):
+        model = FakeAIBackends(FakeLatency.zero()).embedding_model("fake")
+        vectors = model.encode(["anxious about work", "anxious about work", "proud of cooking"])
+
+        assert np.allclose(vectors[0], vectors[1])
+        assert np.isclose(np.linalg.norm(vectors[0]), 1.0)
+        assert float(vectors[0] @ vectors[2]) < float(vectors[0] @ vectors[1])
+
+    @pytest.mark.asyncio
+    async def test_loader_returns_pipeline_shaped_outputs(self):
+        loader = FakeModelLoader(_LatencySource(FakeLatency.zero()))
+        classifier = await loader("emotion_classifier", {"model_type": "text-classification",
+                                                         "task": "emotion-analysis"})
+        zero_shot = await loader("zero_shot_classifier", {"model_type": "zero-shot-classification"})
+
+        scores = classifier("I feel fine")[0]
+        assert {"label", "score"} <= set(scores[0])
+        assert sum(s["score"] for s in scores) == pytest.approx(1.0)
+        assert set(zero_shot("I feel fine", ["a", "b"])) >= {"labels", "scores"}
+
+
+class TestReports:
+    """Test report summaries and comparisons"""
+
+    def test_percentiles(self):
+        summary = summarize_latencies([float(i) for i in range(1, 101)])
+
+        assert summary["p50"] == 50.0
+        assert summary["p99"] == 99.0
+        assert summary["max"] == 100.0
+
+    def test_compare_flags_regressions(self):
+        baseline = report(10, 20, 30, 100)
+
+        assert compare_reports(baseline, report(10.5, 21, 31, 98))["regressions"] == []
+        assert compare_reports(baseline, report(10, 20, 40, 100))["regressions"] == ["entries_list"]
+        assert compare_reports(baseline, report(10, 20, 30, 80))["regressions"] == ["entries_list"]
@@ -0,0 +1,61 @@
+import pytest
+import sys
+import os
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.revisions import (
+    EditWorkload, EditWorkloadConfig, RevisionBenchmark, RevisionBenchmarkConfig, compare_strategies
+)
+
+SMALL_WORKLOAD = EditWorkloadConfig(entries=2, sessions_per_entry=3, saves_per_session=8, initial_sentences=10)
+
+
+class TestEditWorkload:
+    """Test deterministic autosave sequences"""
+
+    def test_same_seed_same_saves(self):
+        first = list(EditWorkload(SMALL_WORKLOAD).saves(0))
+        second = list(EditWorkload(SMALL_WORKLOAD).saves(0))
+
+        assert first == second
+        assert first != list(EditWorkload(SMALL_WORKLOAD).saves(1))
+        assert len(first) == SMALL_WORKLOAD.saves_per_entry
+
+    def test_sessions_are_apart_and_text_grows(self):
+        workload = EditWorkload(SMALL_WORKLOAD)
+        saves = list(workload.saves(0))
+
+        gap = saves[SMALL_WORKLOAD.saves_per_session][0] - saves[SMALL_WORKLOAD.saves_per_session - 1][0]
+        assert gap.total_seconds() > 3600
+        assert saves[0][0] > workload.created_at(0)
+        assert len(saves[-1][1]) > len(workload.initial_content(0))
+
+
+class TestRevisionBenchmark:
+    """Test the strategy comparison end to end on SQLite"""
+
+    def test_savings_compare_delta_with_full_copy(self):
+        savings = compare_strategies({
+            "overwrite": {"wal_bytes": 1000},
+            "full_copy": {"history_bytes": 10000, "history_relation_bytes": 20000, "wal_bytes": 11000},
+            "delta": {"history_bytes": 500, "history_relation_bytes": None, "wal_bytes": 2000}
+        })
+
+        assert savings == {"history_bytes_ratio": 0.05, "history_relation_bytes_ratio": None,
+                           "wal_bytes_ratio": 0.1818, "history_wal_overhead_ratio": 0.1}
+
+    @pytest.mark.asyncio
+    async def test_every_stored_version_replays(self):
+        config = RevisionBenchmarkConfig(workload=SMALL_WORKLOAD, coalesce_seconds=30, snapshot_interval=4)
+        async with RevisionBenchmark(config) as benchmark:
+            report = await benchmark.run()
+
+        delta, full_copy = report["strategies"]["delta"], report["strategies"]["full_copy"]
+        assert full_copy["history_rows"] == SMALL_WORKLOAD.entries * SMALL_WORKLOAD.saves_per_entry
+        assert 0 < delta["history_rows"] < full_copy["history_rows"]
+        assert delta["snapshots"] > 0
+        assert delta["replay"]["versions"] == delta["history_rows"]
+        assert delta["replay"]["mismatches"] == 0
+        assert report["savings"]["history_bytes_ratio"] < 0.2
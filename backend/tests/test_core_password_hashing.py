@@ -0,0 +1,62 @@
+import pytest
+import asyncio
+import sys
+import os
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.core.password_hashing import PasswordHashPool, PasswordHashingOverloadedError
+
+
+class TestPasswordHashPool:
+    """Test bcrypt offloading and admission control"""
+
+    @pytest.mark.asyncio
+    async def test_hash_and_verify_in_worker_process(self):
+        pool = PasswordHashPool(max_workers=1, max_pending=4)
+        try:
+            hashed = await pool.hash_password("Sunny-Day-42")
+
+            assert hashed.startswith("$2b$")
+            assert await pool.verify_password("Sunny-Day-42", hashed) is True
+            assert await pool.verify_password("wrong", hashed) is False
+            assert pool.pending == 0
+            assert pool.stats["completed"] == 3
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_event_loop_keeps_running_during_hash(self):
+        """Loop ticks keep flowing while bcrypt runs in the pool"""
+        pool = PasswordHashPool(max_workers=1, max_pending=4)
+        try:
+            await pool.start()
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            ticker_task = asyncio.create_task(ticker())
+            await pool.hash_password("Sunny-Day-42")
+            ticker_task.cancel()
+
+            assert ticks > 5
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_in_flight_limit_reached(self):
+        pool = PasswordHashPool(max_workers=2, max_pending=2)
+        pool._pending = 2
+
+        with pytest.raises(PasswordHashingOverloadedError) as exc_info:
+            await pool.verify_password("password", "$2b$12$invalid")
+
+        assert exc_info.value.retry_after >= 1
+        assert pool.stats["rejected"] == 1
+        assert pool.stats["submitted"] == 0
+        assert pool._executor is None
@@ -0,0 +1,110 @@
+import pytest
+import pytest_asyncio
+import sys
+import os
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.query_profiler import QueryBudgetExceeded, QueryProfiler, QueryProfilingStage, fingerprint
+from app.core.request_pipeline import RequestPipelineMiddleware
+
+
+@pytest_asyncio.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    yield engine
+    await engine.dispose()
+
+
+def build_app(engine, profiler: QueryProfiler):
+    app = FastAPI()
+
+    @app.get("/items")
+    async def list_items(n: int = 1):
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1 AS listing"))
+            # One lookup per item: the N+1 shape
+            for item_id in range(n):
+                await conn.execute(text("SELECT :item_id AS item"), {"item_id": item_id})
+        return {"items": n}
+
+    app.add_middleware(RequestPipelineMiddleware, stages=[QueryProfilingStage(profiler)])
+    return app
+
+
+async def get(app, path: str) -> httpx.Response:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path)
+
+
+class TestFingerprint:
+    """Test statement normalization"""
+
+    def test_values_and_parameters_are_stripped(self):
+        assert fingerprint("SELECT * FROM entries WHERE id = $1::UUID AND mood = 'happy' LIMIT 20") == \
+               "SELECT * FROM entries WHERE id = ?::UUID AND mood = ? LIMIT ?"
+        assert fingerprint("SELECT x FROM t WHERE a = :a_1 AND b = %(b_1)s") == \
+               fingerprint("SELECT x FROM t WHERE a = ? AND b = %s")
+
+    def test_in_lists_and_multi_row_values_collapse(self):
+        assert fingerprint("SELECT id FROM entries WHERE id IN ($1::UUID, $2::UUID, $3::UUID)") == \
+               fingerprint("SELECT id FROM entries WHERE id IN ($1::UUID)")
+        assert fingerprint("INSERT INTO t (a, b) VALUES (?, ?), (?, ?)") == "INSERT INTO t (a, b) VALUES (...)"
+
+    def test_identifiers_keep_their_digits(self):
+        assert "entries_1.title" in fingerprint("SELECT entries_1.title FROM entries AS entries_1")
+
+
+class TestQueryProfiler:
+    """Test statement statistics, N+1 detection and query budgets"""
+
+    @pytest.mark.asyncio
+    async def test_statistics_per_fingerprint(self, engine):
+        profiler = QueryProfiler(slow_query_threshold_ms=0)
+        profiler.instrument(engine.sync_engine)
+
+        await get(build_app(engine, profiler), "/items?n=3")
+
+        stats = {entry["fingerprint"]: entry for entry in profiler.get_statistics()["statements"]}
+        assert stats["SELECT ? AS item"]["count"] == 3
+        assert stats["SELECT ? AS listing"]["count"] == 1
+        assert stats["SELECT ? AS item"]["p95_ms"] <= stats["SELECT ? AS item"]["max_ms"]
+        assert len(profiler.get_slow_queries()) == 4
+
+    @pytest.mark.asyncio
+    async def test_repeated_statement_in_one_request_is_flagged(self, engine):
+        profiler = QueryProfiler(n_plus_one_threshold=5)
+        profiler.instrument(engine.sync_engine)
+        app = build_app(engine, profiler)
+
+        await get(app, "/items?n=5")
+        assert profiler.get_n_plus_one_incidents() == []
+
+        await get(app, "/items?n=6")
+        incident = profiler.get_n_plus_one_incidents()[0]
+        assert incident["route"] == "/items"
+        assert incident["fingerprint"] == "SELECT ? AS item"
+        assert incident["executions"] == 6
+        assert incident["request_queries"] == 7
+
+    @pytest.mark.asyncio
+    async def test_query_budget_fails_the_offending_request(self, engine):
+        profiler = QueryProfiler()
+        profiler.instrument(engine.sync_engine)
+        app = build_app(engine, profiler)
+
+        with profiler.query_budget(max_queries=3) as budget:
+            await get(app, "/items?n=2")
+        assert [usage.total for usage in budget.requests] == [3]
+
+        with pytest.raises(QueryBudgetExceeded, match=r"/items: 4x SELECT \? AS item"):
+            with profiler.query_budget(max_per_fingerprint=3):
+                await get(app, "/items?n=1")
+                await get(app, "/items?n=4")
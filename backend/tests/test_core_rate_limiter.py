@@ -0,0 +1,121 @@
+import pytest
+import sys
+import os
+import time
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.core.rate_limiter import DistributedRateLimiter, RateLimitPolicy
+
+
+class FakeBucketScript:
+    """Python twin of the Lua token bucket"""
+
+    def __init__(self, fail: bool = False):
+        self.buckets = {}
+        self.calls = 0
+        self.fail = fail
+
+    async def __call__(self, keys, args):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("redis down")
+        capacity, rate, cost, want = (float(a) for a in args)
+        now = time.monotonic()
+        tokens, ts = self.buckets.get(keys[0], (capacity, now))
+        tokens = min(capacity, tokens + max(0.0, now - ts) * rate)
+        granted, retry_after = 0.0, 0.0
+        if tokens >= cost:
+            granted = min(tokens, want)
+            tokens -= granted
+        else:
+            retry_after = (cost - tokens) / rate
+        self.buckets[keys[0]] = (tokens, now)
+        return [str(granted), str(tokens), str(retry_after)]
+
+
+class FakeRedisService:
+    def __init__(self, script: FakeBucketScript, available: bool = True):
+        self.is_available = available
+        self.redis_client = self
+        self.script = script
+
+    def register_script(self, source):
+        return self.script
+
+
+def make_limiter(policies, fail: bool = False, available: bool = True):
+    script = FakeBucketScript(fail=fail)
+    limiter = DistributedRateLimiter(policies, redis_service=FakeRedisService(script, available))
+    return limiter, script
+
+
+class TestDistributedRateLimiter:
+    """Test token bucket policies, local leases and fail-open behaviour"""
+
+    @pytest.mark.asyncio
+    async def test_local_lease_avoids_redis_round_trips(self):
+        limiter, script = make_limiter([RateLimitPolicy("ip", capacity=100, refill_per_second=1, lease=5)])
+
+        for _ in range(6):
+            assert (await limiter.check({"ip": "10.0.0.1"}, "/api/v1/entries")).allowed
+
+        assert script.calls == 1
+        assert limiter.stats["local_grants"] == 5
+
+    @pytest.mark.asyncio
+    async def test_denial_reports_retry_after_and_is_cached_locally(self):
+        limiter, script = make_limiter([RateLimitPolicy("ip", capacity=2, refill_per_second=0.5)])
+
+        assert (await limiter.check({"ip": "10.0.0.1"}, "/x")).allowed
+        assert (await limiter.check({"ip": "10.0.0.1"}, "/x")).allowed
+        denied = await limiter.check({"ip": "10.0.0.1"}, "/x")
+        again = await limiter.check({"ip": "10.0.0.1"}, "/x")
+
+        assert not denied.allowed
+        assert denied.policy == "ip"
+        assert denied.retry_after_header == "2"
+        assert not again.allowed
+        assert script.calls == 3  # The repeat denial was answered locally
+
+    @pytest.mark.asyncio
+    async def test_route_cost_weights(self):
+        policy = RateLimitPolicy("user", capacity=20, refill_per_second=0.01, key_by=("user",),
+                                 route_costs={"/api/v1/ai/": 10})
+        limiter, _ = make_limiter([policy])
+
+        assert (await limiter.check({"user": "u1"}, "/api/v1/ai/analyze")).allowed
+        assert (await limiter.check({"user": "u1"}, "/api/v1/ai/analyze")).allowed
+        assert not (await limiter.check({"user": "u1"}, "/api/v1/ai/analyze")).allowed
+        # Another user has their own bucket
+        assert (await limiter.check({"user": "u2"}, "/api/v1/ai/analyze")).allowed
+
+    @pytest.mark.asyncio
+    async def test_policy_selection_by_identity(self):
+        policies = [
+            RateLimitPolicy("user", capacity=1, refill_per_second=0.01, key_by=("user",)),
+            RateLimitPolicy("ip", capacity=1, refill_per_second=0.01, key_by=("ip",), anonymous_only=True),
+        ]
+        limiter, _ = make_limiter(policies)
+
+        assert (await limiter.check({"user": None, "ip": "1.1.1.1"}, "/x")).allowed
+        anonymous = await limiter.check({"user": None, "ip": "1.1.1.1"}, "/x")
+        # Same IP, but authenticated requests use the user policy only
+        authenticated = await limiter.check({"user": "u1", "ip": "1.1.1.1"}, "/x")
+
+        assert anonymous.policy == "ip" and not anonymous.allowed
+        assert authenticated.allowed
+
+    @pytest.mark.asyncio
+    async def test_fails_open_without_redis(self):
+        policy = RateLimitPolicy("ip", capacity=1, refill_per_second=0.01)
+        for limiter, _ in (make_limiter([policy], fail=True), make_limiter([policy], available=False)):
+            for _ in range(3):
+                decision = await limiter.check({"ip": "10.0.0.1"}, "/x")
+                assert decision.allowed and decision.fail_open
+            assert limiter.stats["fail_open"] == 3
+
+    def test_unknown_dimension_rejected(self):
+        with pytest.raises(ValueError):
+            RateLimitPolicy("bad", capacity=1, refill_per_second=1, key_by=("tenant",))
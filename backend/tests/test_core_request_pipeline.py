@@ -0,0 +1,133 @@
+import pytest
+import asyncio
+import sys
+import os
+from unittest.mock import patch, AsyncMock
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+
+from app.core.rate_limiter import RateLimitDecision
+from app.core.request_pipeline import RequestPipelineMiddleware
+from app.core.request_tracing import RequestTracingStage
+from app.core.security_middleware import SecurityHeadersStage, SecurityLoggingStage, RateLimitingStage
+
+
+class CountingLimiter:
+    """Allows the first `limit` checks, then denies"""
+
+    policies = []
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.calls = 0
+
+    async def check(self, identity, path):
+        self.calls += 1
+        if self.calls > self.limit:
+            return RateLimitDecision(allowed=False, policy="ip", retry_after=12.5)
+        return RateLimitDecision(allowed=True, policy="ip", remaining=self.limit - self.calls)
+
+
+def build_app(requests_allowed: int = 100):
+    app = FastAPI()
+    tracer = RequestTracingStage(enable_detailed_logging=False)
+
+    @app.get("/items/{item_id}")
+    async def read_item(item_id: str, request: Request):
+        return {"item_id": item_id, "request_id": request.state.request_id,
+                "nonce": request.state.csp_nonce}
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"chunk-{i}\n"
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    app.add_middleware(RequestPipelineMiddleware, stages=[
+        tracer, SecurityHeadersStage(), SecurityLoggingStage(), RateLimitingStage(CountingLimiter(requests_allowed))
+    ])
+    return app, tracer
+
+
+async def asgi_get(app, path: str):
+    """Drive the ASGI app directly and capture every sent message"""
+    messages = []
+    scope = {"type": "http", "method": "GET", "path": path, "raw_path": path.encode(),
+             "query_string": b"", "headers": [], "client": ("127.0.0.1", 5000),
+             "server": ("test", 80), "scheme": "http", "http_version": "1.1", "root_path": ""}
+
+    request_sent = False
+
+    async def receive():
+        nonlocal request_sent
+        if request_sent:
+            # Like a server: block until disconnect, which never comes here
+            await asyncio.Event().wait()
+        request_sent = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    return messages
+
+
+class TestRequestPipeline:
+    """Test the single-pass ASGI middleware pipeline"""
+
+    @pytest.mark.asyncio
+    async def test_one_request_id_and_security_headers(self):
+        app, tracer = build_app()
+        with patch('app.core.request_tracing.performance_monitor') as monitor:
+            monitor.record_timing = AsyncMock()
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+                response = await client.get("/items/42")
+
+        body = response.json()
+        assert response.headers["x-request-id"] == body["request_id"]
+        assert f"'nonce-{body['nonce']}'" in response.headers["content-security-policy"]
+        assert response.headers["x-frame-options"] == "DENY"
+        assert tracer.get_trace_by_id(body["request_id"]).status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_metrics_use_route_template(self):
+        app, tracer = build_app()
+        with patch('app.core.request_tracing.performance_monitor') as monitor:
+            monitor.record_timing = AsyncMock()
+            await asgi_get(app, "/items/1")
+            await asgi_get(app, "/items/2")
+            await asgi_get(app, "/nope")
+
+        names = [call.args[0] for call in monitor.record_timing.await_args_list]
+        assert names == ["request_GET_/items/{item_id}", "request_GET_/items/{item_id}", "request_GET_unmatched"]
+
+    @pytest.mark.asyncio
+    async def test_streaming_response_is_not_buffered(self):
+        app, _ = build_app()
+        with patch('app.core.request_tracing.performance_monitor') as monitor:
+            monitor.record_timing = AsyncMock()
+            messages = await asgi_get(app, "/stream")
+
+        chunks = [m["body"] for m in messages if m["type"] == "http.response.body" and m.get("body")]
+        assert chunks == [b"chunk-0\n", b"chunk-1\n", b"chunk-2\n"]
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_short_circuits_with_headers(self):
+        app, _ = build_app(requests_allowed=1)
+        with patch('app.core.request_tracing.performance_monitor') as monitor:
+            monitor.record_timing = AsyncMock()
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+                assert (await client.get("/items/1")).status_code == 200
+                limited = await client.get("/items/1")
+
+        assert limited.status_code == 429
+        assert limited.headers["retry-after"] == "13"
+        assert "x-request-id" in limited.headers
+        assert limited.headers["x-content-type-options"] == "nosniff"
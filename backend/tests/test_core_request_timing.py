@@ -0,0 +1,95 @@
+import pytest
+import asyncio
+import sys
+import os
+from unittest.mock import patch
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.request_pipeline import RequestPipelineMiddleware
+from app.core.request_timing import (
+    SPAN_CACHE, SPAN_DB, get_request_timings, instrument_engine, record_span, timing_span
+)
+from app.core.request_tracing import RequestTracingStage
+
+
+def build_app(engine=None, **tracer_options):
+    app = FastAPI()
+    tracer = RequestTracingStage(enable_detailed_logging=False, **tracer_options)
+
+    @app.get("/work")
+    async def work():
+        record_span(SPAN_CACHE, 2.0)
+
+        async def model_call():
+            with timing_span("model.emotion_classifier"):
+                await asyncio.sleep(0.01)
+
+        # Child tasks report into the same request breakdown
+        await asyncio.gather(model_call(), model_call())
+        if engine is not None:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+        return {"ok": True}
+
+    app.add_middleware(RequestPipelineMiddleware, stages=[tracer])
+    return app
+
+
+def parse_server_timing(header: str) -> dict:
+    spans = {}
+    for metric in header.split(", "):
+        name, *params = metric.split(";")
+        spans[name] = dict(param.split("=", 1) for param in params)
+    return spans
+
+
+class TestRequestTimings:
+    """Test request-scoped span collection and the Server-Timing header"""
+
+    def test_spans_outside_a_request_are_ignored(self):
+        record_span(SPAN_DB, 5.0)
+        with timing_span(SPAN_CACHE):
+            pass
+
+        assert get_request_timings() is None
+
+    @pytest.mark.asyncio
+    async def test_server_timing_header_aggregates_spans(self):
+        engine = create_async_engine("sqlite+aiosqlite://")
+        instrument_engine(engine.sync_engine)
+        try:
+            transport = httpx.ASGITransport(app=build_app(engine))
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.get("/work")
+        finally:
+            await engine.dispose()
+
+        spans = parse_server_timing(response.headers["server-timing"])
+        assert spans["cache"] == {"dur": "2.0", "desc": '"1x"'}
+        assert spans["model.emotion_classifier"]["desc"] == '"2x"'
+        assert float(spans["model.emotion_classifier"]["dur"]) >= 20
+        assert spans["db"]["desc"] == '"1x"'
+        assert float(spans["total"]["dur"]) >= 10
+        assert get_request_timings() is None
+
+    @pytest.mark.asyncio
+    async def test_slow_requests_are_logged_with_breakdown(self):
+        app = build_app(enable_server_timing=False, slow_request_threshold_ms=0, slow_request_sample_rate=1.0)
+
+        with patch("app.core.request_tracing.logger") as mock_logger:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.get("/work")
+
+        assert "server-timing" not in response.headers
+        extra = mock_logger.warning.call_args.kwargs["extra"]
+        assert extra["route"] == "/work"
+        assert extra["timings"]["model.emotion_classifier"]["count"] == 2
+        assert list(extra["timings"])[0] == "model.emotion_classifier"
@@ -0,0 +1,104 @@
+import pytest
+import sys
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from sqlalchemy.dialects import postgresql
+
+from app.models.enhanced_models import SESSION_START_SKEW, ChatMessage
+from app.repositories.session_repository import SessionRepository
+
+
+def make_row(session_id, message_id=None, content=None, timestamp=None, **overrides):
+    created = datetime(2025, 8, 1, tzinfo=timezone.utc)
+    row = {
+        "id": session_id,
+        "session_type": "free_chat",
+        "title": None,
+        "description": None,
+        "status": "active",
+        "created_at": created,
+        "updated_at": created,
+        "last_activity": created,
+        "message_count": 2,
+        "tags": None,
+        "session_metadata": None,
+        "message_id": message_id,
+        "content": content,
+        "role": "user",
+        "timestamp": timestamp,
+        "message_metadata": None,
+    }
+    row.update(overrides)
+    return row
+
+
+def make_repository(rows):
+    result = MagicMock()
+    result.mappings.return_value = rows
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=result)
+    return SessionRepository(db), db
+
+
+class TestSessionListQuery:
+    """Test the single-query session list with latest messages"""
+
+    @pytest.mark.asyncio
+    async def test_sessions_and_messages_load_in_one_lateral_query(self):
+        repository, db = make_repository([])
+
+        await repository.get_user_sessions_with_recent_messages("user-1", limit=20, message_count=3, status="active")
+
+        assert db.execute.await_count == 1
+        sql = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "LEFT OUTER JOIN LATERAL" in sql
+        assert "ORDER BY chat_messages.timestamp DESC" in sql
+        assert "chat_sessions.status = " in sql
+        # Lets the planner prune partitions older than each session, with
+        # room for app/database clock skew
+        assert "chat_messages.timestamp >= page.created_at - %(created_at_1)s" in sql
+
+    @pytest.mark.asyncio
+    async def test_rows_are_grouped_per_session(self):
+        first, second = uuid.uuid4(), uuid.uuid4()
+        now = datetime(2025, 8, 1, tzinfo=timezone.utc)
+        repository, _ = make_repository([
+            make_row(first, uuid.uuid4(), "older", now),
+            make_row(first, uuid.uuid4(), "newer", now + timedelta(minutes=1)),
+            make_row(second),
+        ])
+
+        sessions = await repository.get_user_sessions_with_recent_messages("user-1")
+
+        assert [session["id"] for session in sessions] == [first, second]
+        assert [msg["content"] for msg in sessions[0]["recent_messages"]] == ["older", "newer"]
+        assert sessions[1]["recent_messages"] == []
+
+
+    @pytest.mark.asyncio
+    async def test_recent_messages_are_bounded_by_session_start(self):
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = []
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=result)
+
+        await SessionRepository(db).get_recent_messages("session-1", count=5)
+
+        sql = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "chat_messages.timestamp >= (SELECT chat_sessions.created_at" in sql
+        assert "chat_sessions.id = %(id_1)s::UUID) - %(param_1)s" in sql
+
+    def test_session_start_bound_tolerates_clock_skew(self):
+        created_at = datetime(2025, 8, 1, tzinfo=timezone.utc)
+
+        bound = ChatMessage.session_start_bound(created_at).compile(dialect=postgresql.dialect())
+
+        # A greeting stamped a little before the database clock's created_at is still found
+        assert bound.params["timestamp_1"] == created_at - SESSION_START_SKEW
+        assert SESSION_START_SKEW > timedelta(0)